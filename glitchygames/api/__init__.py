@@ -29,6 +29,9 @@ Client Usage:
 
     # Save to a directory
     glitchygames-client "16x16 red heart" -o ./sprites
+
+    # Generate one sprite per line of a file, four requests at a time
+    glitchygames-client --batch prompts.txt --concurrency 4 -o ./sprites
 """
 
 from glitchygames.api.main import app, create_app, run
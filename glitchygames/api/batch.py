@@ -0,0 +1,251 @@
+"""Concurrent batch submission of API requests over one pooled connection.
+
+Every job in a batch shares a single keep-alive ``httpx.AsyncClient``, at most
+``concurrency`` requests are in flight at once, and transient failures
+(connection errors, timeouts, overloaded or restarting servers) are retried
+with exponential backoff. Jobs that must not run twice, such as sprite
+generations, are only retried when the server cannot have acted on them. A
+job's payload can be built when the job starts, so one unreadable input fails
+only its own job. The transport can be swapped for an ``httpx.ASGITransport``
+to run a batch against an in-process app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, response_from_bundle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+LOG = logging.getLogger('glitchygames.api.batch')
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Responses that say "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# The subset that also means the request was turned away rather than run, so
+# retrying a non-idempotent job cannot make the server do the work twice
+UNPROCESSED_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Transport errors raised before the request reached the server
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently a failed batch job is retried.
+
+    Attributes:
+        attempts: Total tries per job, including the first
+        backoff: Delay in seconds before the first retry; doubles each retry
+        max_backoff: Upper bound for any single delay in seconds
+
+    """
+
+    attempts: int = 3
+    backoff: float = 1.0
+    max_backoff: float = 30.0
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Get the delay before retrying after a failed attempt.
+
+        Args:
+            attempt: The 1-based attempt that just failed
+            retry_after: The server's Retry-After header, if it sent one
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        """
+        delay = self.backoff * 2 ** (attempt - 1)
+        if retry_after is not None:
+            # An HTTP-date Retry-After is ignored; the exponential delay stands in
+            with contextlib.suppress(ValueError):
+                delay = max(delay, float(retry_after))
+        return min(delay, self.max_backoff)
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One request in a batch.
+
+    Attributes:
+        label: What the job is for (a prompt or file path), used in logs and results
+        path: Endpoint path relative to the server URL
+        payload: JSON request body, or a function that builds it when the job starts
+        timeout: Request timeout in seconds
+        idempotent: Whether sending the request twice is harmless; other jobs are
+            only retried on UNPROCESSED_STATUS_CODES and UNSENT_ERRORS
+
+    """
+
+    label: str
+    path: str
+    payload: dict[str, Any] | Callable[[], dict[str, Any]]
+    timeout: float
+    idempotent: bool = True
+
+    @property
+    def retryable_status_codes(self) -> frozenset[int]:
+        """The HTTP statuses after which this job may be sent again."""
+        return RETRYABLE_STATUS_CODES if self.idempotent else UNPROCESSED_STATUS_CODES
+
+    def may_retry_error(self, error: httpx.TransportError) -> bool:
+        """Check whether this job may be sent again after a transport error.
+
+        Args:
+            error: The error the last attempt raised
+
+        Returns:
+            bool: True if a retry cannot make the server run the request twice.
+
+        """
+        return self.idempotent or isinstance(error, UNSENT_ERRORS)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The outcome of a batch job.
+
+    Attributes:
+        job: The job that was submitted
+        response: The decoded JSON response, if the request succeeded
+        error: Why the request failed, if it did
+        attempts: How many times the request was sent
+
+    """
+
+    job: BatchJob
+    response: dict[str, Any] | None = None
+    error: str | None = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request got a successful HTTP response."""
+        return self.error is None
+
+
+async def submit_batch(  # noqa: PLR0913
+    jobs: Iterable[BatchJob],
+    server_url: str,
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    retry: RetryPolicy | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+) -> list[BatchResult]:
+    """Submit jobs concurrently over one pooled client.
+
+    A failing job never aborts the batch; its error is recorded in its result.
+
+    Args:
+        jobs: The requests to send
+        server_url: Base URL of the API server
+        concurrency: Most requests in flight at once
+        retry: Retry policy for transient failures (default: RetryPolicy())
+        transport: Transport override, e.g. httpx.ASGITransport for an in-process app
+        on_result: Called with each result as soon as its job finishes, so
+            finished work can be kept even if the batch is interrupted later
+
+    Returns:
+        list[BatchResult]: One result per job, in job order.
+
+    Raises:
+        ValueError: If concurrency or the retry attempts are less than 1.
+
+    """
+    retry = retry or RetryPolicy()
+    if concurrency < 1:
+        message = f'Batch concurrency must be at least 1, got {concurrency}'
+        raise ValueError(message)
+    if retry.attempts < 1:
+        message = f'A batch job needs at least 1 attempt, got {retry.attempts}'
+        raise ValueError(message)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def run(job: BatchJob) -> BatchResult:
+        result = await _submit(client, semaphore, job, retry)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    async with httpx.AsyncClient(base_url=server_url, limits=limits, transport=transport) as client:
+        return list(await asyncio.gather(*(run(job) for job in jobs)))
+
+
+async def _submit(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    job: BatchJob,
+    retry: RetryPolicy,
+) -> BatchResult:
+    """Send one job, retrying transient failures.
+
+    The concurrency slot is released while backing off so other jobs can use it.
+
+    Returns:
+        BatchResult: The job's outcome.
+
+    """
+    try:
+        payload = job.payload() if callable(job.payload) else job.payload
+    except (OSError, ValueError) as e:
+        return BatchResult(job, error=f'{type(e).__name__}: {e}')
+
+    error = ''
+    for attempt in range(1, retry.attempts + 1):
+        retry_after = None
+        async with semaphore:
+            try:
+                response = await client.post(job.path, json=payload, timeout=job.timeout)
+            except httpx.TransportError as e:
+                error = f'{type(e).__name__}: {e}'
+                if not job.may_retry_error(e):
+                    return BatchResult(job, error=error, attempts=attempt)
+            else:
+                if response.status_code not in job.retryable_status_codes:
+                    return _result_from_response(job, response, attempt)
+                error = f'HTTP {response.status_code}'
+                retry_after = response.headers.get('retry-after')
+
+        if attempt < retry.attempts:
+            delay = retry.delay(attempt, retry_after)
+            LOG.warning('%s failed (%s), retrying in %.1fs', job.label, error, delay)
+            await asyncio.sleep(delay)
+
+    return BatchResult(job, error=error, attempts=retry.attempts)
+
+
+def _result_from_response(job: BatchJob, response: httpx.Response, attempts: int) -> BatchResult:
+    """Build the result of a final, non-retryable response.
+
+    Returns:
+        BatchResult: The decoded response, or the reason it is unusable.
+
+    """
+    if response.is_error:
+        error = f'HTTP {response.status_code}: {response.text}'
+        return BatchResult(job, error=error, attempts=attempts)
+    if response.headers.get('content-type') == FRAME_BUNDLE_MEDIA_TYPE:
+        try:
+            return BatchResult(
+                job, response=response_from_bundle(response.content), attempts=attempts
+            )
+        except ValueError as e:
+            return BatchResult(job, error=f'Invalid frame bundle: {e}', attempts=attempts)
+    try:
+        return BatchResult(job, response=response.json(), attempts=attempts)
+    except ValueError as e:
+        return BatchResult(job, error=f'Invalid JSON response: {e}', attempts=attempts)
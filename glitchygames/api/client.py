@@ -1,7 +1,9 @@
 """CLI client for the GlitchyGames Sprite Generation API."""
 
 import argparse
+import asyncio
 import base64
+import functools
 import io
 import json
 import logging
@@ -13,7 +15,16 @@ from typing import Any
 import httpx
 from apng import APNG, PNG
 
+from glitchygames.api.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchJob,
+    BatchResult,
+    RetryPolicy,
+    submit_batch,
+)
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, response_from_bundle
 from glitchygames.tools.ascii_renderer import ASCIIRenderer
+from glitchygames.tools.terminal_preview import TerminalAnimationPreview
 
 LOG = logging.getLogger('glitchygames.api.client')
 
@@ -22,6 +33,24 @@ DEFAULT_OUTPUT_FORMATS = ['toml', 'png']
 
 MAX_FILE_NUMBERING_ATTEMPTS = 1000
 
+# Times each animation plays with --animate-preview, and the frame interval
+# used when the TOML does not give one
+ANIMATION_PREVIEW_LOOPS = 3
+DEFAULT_PREVIEW_FRAME_INTERVAL = 0.5
+
+GENERATE_PATH = '/sprites/generate'
+EXTRACT_FRAMES_PATH = '/sprites/extract-frames'
+
+# Request timeouts in seconds; generation waits on a language model
+GENERATE_TIMEOUT = 300.0
+EXTRACT_TIMEOUT = 60.0
+
+# Retries for each batch request after its first attempt fails
+DEFAULT_BATCH_RETRIES = 2
+
+# Generated PNGs are requested as a binary frame bundle rather than base64 JSON
+GENERATE_FRAME_ENCODING = 'bundle'
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for the CLI client.
@@ -37,7 +66,7 @@ def create_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         'prompt',
-        nargs='?',  # Optional when using --extract-frames
+        nargs='?',  # Optional when using --extract-frames or a batch mode
         help='Text description of the sprite to generate',
     )
 
@@ -47,6 +76,35 @@ def create_parser() -> argparse.ArgumentParser:
         help='Extract frames from an APNG file instead of generating a sprite',
     )
 
+    batch_modes = parser.add_mutually_exclusive_group()
+
+    batch_modes.add_argument(
+        '--batch',
+        metavar='PROMPTS_FILE',
+        help="Generate a sprite for each line of a file ('-' for stdin) into --output-path",
+    )
+
+    batch_modes.add_argument(
+        '--batch-extract',
+        metavar='APNG_PATH',
+        nargs='+',
+        help='Extract frames from several APNG files into --output-path',
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f'Most batch requests in flight at once (default: {DEFAULT_BATCH_CONCURRENCY})',
+    )
+
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=DEFAULT_BATCH_RETRIES,
+        help=f'Retries for a failed batch request (default: {DEFAULT_BATCH_RETRIES})',
+    )
+
     parser.add_argument(
         '--server-url',
         default=DEFAULT_SERVER_URL,
@@ -57,9 +115,12 @@ def create_parser() -> argparse.ArgumentParser:
         '--output-format',
         '-f',
         action='append',
-        choices=['toml', 'png'],
+        choices=['toml', 'png', 'atlas'],
         dest='output_formats',
-        help='Output format (can be specified multiple times). Default: toml and png',
+        help=(
+            'Output format (can be specified multiple times). atlas packs every frame '
+            'into one PNG with a JSON frame manifest. Default: toml and png'
+        ),
     )
 
     parser.add_argument(
@@ -121,6 +182,12 @@ def create_parser() -> argparse.ArgumentParser:
         ),
     )
 
+    parser.add_argument(
+        '--animate-preview',
+        action='store_true',
+        help='Play animations in place in the terminal instead of printing every frame',
+    )
+
     parser.add_argument(
         '--verbose',
         '-v',
@@ -138,40 +205,21 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def extract_apng_frames(
-    server_url: str,
-    apng_path: str,
-) -> dict[str, Any]:
-    """Extract frames and metadata from an APNG file.
+def build_extract_payload(apng_path: str) -> dict[str, Any]:
+    """Build the request body for an APNG frame extraction.
 
     Args:
-        server_url: Base URL of the API server
         apng_path: Path to the APNG file
 
     Returns:
-        API response with frames and metadata
+        The JSON payload for the extract-frames endpoint
 
     """
-    url = f'{server_url.rstrip("/")}/sprites/extract-frames'
-
-    # Read and encode the APNG file
     apng_bytes = Path(apng_path).read_bytes()
-    apng_base64 = base64.b64encode(apng_bytes).decode('utf-8')
-
-    payload = {
-        'apng_base64': apng_base64,
-    }
-
-    LOG.debug('Sending extract request to %s', url)
+    return {'apng_base64': base64.b64encode(apng_bytes).decode('utf-8')}
 
-    with httpx.Client(timeout=60.0) as client:
-        response = client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
 
-
-def generate_sprite(  # noqa: PLR0913
-    server_url: str,
+def build_generate_payload(  # noqa: PLR0913
     prompt: str,
     output_formats: list[str],
     *,
@@ -184,12 +232,11 @@ def generate_sprite(  # noqa: PLR0913
     png_scale: int = 1,
     model: str | None = None,
 ) -> dict[str, Any]:
-    """Generate a sprite via the API.
+    """Build the request body for a sprite generation.
 
     Args:
-        server_url: Base URL of the API server
         prompt: Text description of the sprite
-        output_formats: List of output formats ('toml', 'png')
+        output_formats: List of output formats ('toml', 'png', 'atlas')
         output_path: Directory to save files (optional)
         width: Sprite width in pixels (optional)
         height: Sprite height in pixels (optional)
@@ -200,19 +247,18 @@ def generate_sprite(  # noqa: PLR0913
         model: AI model override in aisuite format (e.g., 'anthropic:claude-sonnet-4-5')
 
     Returns:
-        API response as a dictionary
+        The JSON payload for the generate endpoint
 
     """
-    url = f'{server_url.rstrip("/")}/sprites/generate'
-
     # Default frame_count to 1
     effective_frame_count = frame_count or 1
 
-    payload: dict[str, str | list[str] | int | float] = {
+    payload: dict[str, Any] = {
         'prompt': prompt,
         'output_format': output_formats,
         'png_scale': png_scale,
         'frame_count': effective_frame_count,
+        'frame_encoding': GENERATE_FRAME_ENCODING,
     }
 
     if output_path:
@@ -228,20 +274,124 @@ def generate_sprite(  # noqa: PLR0913
     if model:
         payload['model'] = model
 
+    return payload
+
+
+def _post_json(
+    url: str,
+    payload: dict[str, Any],
+    timeout: float,
+    client: httpx.Client | None,
+) -> dict[str, Any]:
+    """POST a JSON payload and decode the JSON or frame bundle response.
+
+    Args:
+        url: Endpoint URL
+        payload: JSON request body
+        timeout: Request timeout in seconds
+        client: Shared client to send the request on; a one-off client if None
+
+    Returns:
+        The decoded response; PNGs from a frame bundle are kept as raw bytes
+
+    """
+    if client is None:
+        with httpx.Client(timeout=timeout) as one_off_client:
+            return _post_json(url, payload, timeout, one_off_client)
+
+    response = client.post(url, json=payload, timeout=timeout)
+    response.raise_for_status()
+    if response.headers.get('content-type') == FRAME_BUNDLE_MEDIA_TYPE:
+        return response_from_bundle(response.content)
+    return response.json()
+
+
+def extract_apng_frames(
+    server_url: str,
+    apng_path: str,
+    *,
+    client: httpx.Client | None = None,
+) -> dict[str, Any]:
+    """Extract frames and metadata from an APNG file.
+
+    Args:
+        server_url: Base URL of the API server
+        apng_path: Path to the APNG file
+        client: Keep-alive client to reuse across calls (optional)
+
+    Returns:
+        API response with frames and metadata
+
+    """
+    url = f'{server_url.rstrip("/")}{EXTRACT_FRAMES_PATH}'
+    payload = build_extract_payload(apng_path)
+
+    LOG.debug('Sending extract request to %s', url)
+
+    return _post_json(url, payload, EXTRACT_TIMEOUT, client)
+
+
+def generate_sprite(  # noqa: PLR0913
+    server_url: str,
+    prompt: str,
+    output_formats: list[str],
+    *,
+    output_path: str | None = None,
+    width: int | None = None,
+    height: int | None = None,
+    frame_count: int | None = None,
+    film_strip_count: int | None = None,
+    animation_duration: float | None = None,
+    png_scale: int = 1,
+    model: str | None = None,
+    client: httpx.Client | None = None,
+) -> dict[str, Any]:
+    """Generate a sprite via the API.
+
+    Args:
+        server_url: Base URL of the API server
+        prompt: Text description of the sprite
+        output_formats: List of output formats ('toml', 'png', 'atlas')
+        output_path: Directory to save files (optional)
+        width: Sprite width in pixels (optional)
+        height: Sprite height in pixels (optional)
+        frame_count: Number of frames per animation (default: 1)
+        film_strip_count: Number of film strips to create (optional)
+        animation_duration: Duration of animation in seconds (optional)
+        png_scale: Scale factor for PNG output
+        model: AI model override in aisuite format (e.g., 'anthropic:claude-sonnet-4-5')
+        client: Keep-alive client to reuse across calls (optional)
+
+    Returns:
+        API response as a dictionary
+
+    """
+    url = f'{server_url.rstrip("/")}{GENERATE_PATH}'
+    payload = build_generate_payload(
+        prompt,
+        output_formats,
+        output_path=output_path,
+        width=width,
+        height=height,
+        frame_count=frame_count,
+        film_strip_count=film_strip_count,
+        animation_duration=animation_duration,
+        png_scale=png_scale,
+        model=model,
+    )
+
     LOG.debug('Sending request to %s', url)
     LOG.debug(f'Payload: {json.dumps(payload, indent=2)}')
 
-    with httpx.Client(timeout=300.0) as client:
-        response = client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
+    return _post_json(url, payload, GENERATE_TIMEOUT, client)
 
 
-def display_sprite_ascii(toml_content: str) -> None:
+def display_sprite_ascii(toml_content: str, *, animate: bool = False) -> None:
     """Display the sprite as colorized ASCII art in the terminal.
 
     Args:
         toml_content: TOML content of the sprite
+        animate: Play each animation in place instead of printing every frame
 
     """
     try:
@@ -258,6 +408,10 @@ def display_sprite_ascii(toml_content: str) -> None:
 
                 print(f'\n=== Animation: {anim_name} ({len(frames)} frames) ===')  # noqa: T201
 
+                if animate:
+                    _play_animation_preview(renderer, animation, colors)
+                    continue
+
                 for frame_index, frame in enumerate(frames):
                     pixels = frame.get('pixels', '')
                     if pixels:
@@ -278,14 +432,24 @@ def display_sprite_ascii(toml_content: str) -> None:
         LOG.warning('Could not render ASCII preview: %s', e)
 
 
+def _png_bytes(frame: str | bytes) -> bytes:
+    """Get a PNG's bytes from a base64 string (JSON) or raw bytes (frame bundle).
+
+    Returns:
+        The PNG bytes
+
+    """
+    return frame if isinstance(frame, bytes) else base64.b64decode(frame)
+
+
 def create_apng_from_frames(
-    frames_base64: list[str],
+    frames: list[str] | list[bytes],
     frame_delay_ms: int = 100,
 ) -> bytes:
-    """Create an APNG (Animated PNG) from a list of base64-encoded PNG frames.
+    """Create an APNG (Animated PNG) from a list of PNG frames.
 
     Args:
-        frames_base64: List of base64-encoded PNG frame data
+        frames: PNG frames, as base64 strings or raw bytes
         frame_delay_ms: Delay between frames in milliseconds
 
     Returns:
@@ -294,8 +458,8 @@ def create_apng_from_frames(
     """
     apng = APNG()
 
-    for frame_base64 in frames_base64:
-        frame_bytes = base64.b64decode(frame_base64)
+    for frame in frames:
+        frame_bytes = _png_bytes(frame)
         # Create PNG from bytes (apng library lacks type stubs)
         png: PNG = PNG.from_bytes(frame_bytes)
         # Add frame with delay (delay is in milliseconds, APNG uses delay/delay_den)
@@ -373,7 +537,7 @@ def find_available_directory(base_dir: Path) -> Path:
 
 
 def _save_extracted_frames(  # noqa: PLR0913
-    frame_entries: list[tuple[str, str, str, str]],
+    frame_entries: list[tuple[str, str, str, str | bytes]],
     extracted_dir: Path,
     *,
     frame_count: int,
@@ -384,7 +548,8 @@ def _save_extracted_frames(  # noqa: PLR0913
     """Save individual extracted frames as PNGs with metadata.
 
     Args:
-        frame_entries: List of (frame_name, animation_index_str, frame_index_str, base64_data)
+        frame_entries: List of (frame_name, animation_index_str, frame_index_str, png_data),
+            the PNG data being a base64 string or raw bytes
         extracted_dir: Directory to save frames into
         frame_count: Total number of frames (for metadata)
         frame_delay_ms: Frame delay in ms (for metadata)
@@ -398,9 +563,9 @@ def _save_extracted_frames(  # noqa: PLR0913
     from PIL import Image, PngImagePlugin
 
     saved_paths: list[str] = []
-    for frame_name, animation_index_str, frame_index_str, frame_base64 in frame_entries:
+    for frame_name, animation_index_str, frame_index_str, frame_data in frame_entries:
         frame_path = extracted_dir / f'{frame_name}.png'
-        frame_image = Image.open(io.BytesIO(base64.b64decode(frame_base64)))
+        frame_image = Image.open(io.BytesIO(_png_bytes(frame_data)))
 
         # Upscale using nearest-neighbor to keep pixels crisp
         if extract_scale > 1:
@@ -443,9 +608,10 @@ def save_files_locally(  # noqa: PLR0913
     - The .toml file
     - The .apng file (if animated)
     - An 'extracted' subdirectory with individual frame PNGs (upscaled nearest-neighbor)
+    - The .atlas.png frame atlas and its .atlas.json manifest (if requested)
 
     Args:
-        response: API response dictionary
+        response: API response dictionary, from JSON or a frame bundle
         output_path: Base directory to save files
         output_formats: List of requested output formats
         animation_duration: Total animation duration in seconds (for APNG timing)
@@ -478,9 +644,12 @@ def save_files_locally(  # noqa: PLR0913
         saved_files.append(str(toml_path))
         LOG.info('Saved TOML: %s', toml_path)
 
-    # Save APNG and extracted frames if animation frames are available
-    if response.get('all_frames_png_base64'):
-        frames: list[str] = response['all_frames_png_base64']
+    # Save APNG and extracted frames if animation frames are available; a frame
+    # bundle carries them as raw bytes, a JSON response as base64
+    frames: list[str] | list[bytes] = response.get('all_frames_png') or response.get(
+        'all_frames_png_base64'
+    )
+    if frames:
         rendered_frames: list[dict[str, Any]] = response.get('rendered_frames', [])
         frame_count = len(frames)
 
@@ -502,8 +671,10 @@ def save_files_locally(  # noqa: PLR0913
         extracted_dir.mkdir(exist_ok=True)
 
         if rendered_frames:
-            # Use rendered_frames for proper animation-#-frame-#.png naming
-            frame_entries: list[tuple[str, str, str, str]] = [
+            # Use rendered_frames for proper animation-#-frame-#.png naming; the
+            # server lists them in the same order as the frames and no longer
+            # repeats the frame data in them
+            frame_entries: list[tuple[str, str, str, str | bytes]] = [
                 (
                     (
                         f'animation-{info.get("animation_index", 0)}'
@@ -511,15 +682,14 @@ def save_files_locally(  # noqa: PLR0913
                     ),
                     str(info.get('animation_index', 0)),
                     str(info.get('frame_index', 0)),
-                    str(info.get('png_base64', '')),
+                    info.get('png_base64') or frame,
                 )
-                for info in rendered_frames
+                for info, frame in zip(rendered_frames, frames, strict=False)
             ]
         else:
             # Fallback to old naming if rendered_frames not available
             frame_entries = [
-                (f'animation-0-frame-{i}', '0', str(i), frame_base64)
-                for i, frame_base64 in enumerate(frames)
+                (f'animation-0-frame-{i}', '0', str(i), frame) for i, frame in enumerate(frames)
             ]
 
         saved_files.extend(
@@ -536,16 +706,39 @@ def save_files_locally(  # noqa: PLR0913
         LOG.info('Saved %s frames to: %s (scale: %sx)', frame_count, extracted_dir, extract_scale)
 
     # Save single PNG if requested, available, and no animation frames
-    elif 'png' in output_formats and response.get('png_base64'):
+    elif 'png' in output_formats and (response.get('png_bytes') or response.get('png_base64')):
         png_path = sprite_dir / f'{safe_name}.png'
-        png_bytes = base64.b64decode(response['png_base64'])
-        png_path.write_bytes(png_bytes)
+        png_path.write_bytes(response.get('png_bytes') or _png_bytes(response['png_base64']))
         saved_files.append(str(png_path))
         LOG.info('Saved PNG: %s', png_path)
 
+    # Save the frame atlas and its manifest if requested and available
+    if 'atlas' in output_formats and response.get('atlas_png_base64'):
+        saved_files.extend(_save_atlas(response, sprite_dir, safe_name))
+
     return saved_files
 
 
+def _save_atlas(response: dict[str, Any], sprite_dir: Path, safe_name: str) -> list[str]:
+    """Save a response's frame atlas PNG and its JSON manifest.
+
+    Args:
+        response: API response dictionary carrying atlas_png_base64 and atlas_manifest
+        sprite_dir: The sprite's output directory
+        safe_name: Sanitized sprite name used for the filenames
+
+    Returns:
+        The atlas and manifest file paths
+
+    """
+    atlas_path = sprite_dir / f'{safe_name}.atlas.png'
+    atlas_path.write_bytes(_png_bytes(response['atlas_png_base64']))
+    manifest_path = sprite_dir / f'{safe_name}.atlas.json'
+    manifest_path.write_text(json.dumps(response.get('atlas_manifest'), indent=2), encoding='utf-8')
+    LOG.info('Saved atlas: %s', atlas_path)
+    return [str(atlas_path), str(manifest_path)]
+
+
 def _log_extraction_metadata(response: dict[str, Any]) -> None:
     """Log metadata from an APNG extraction response.
 
@@ -666,11 +859,41 @@ def _handle_extract_frames(parsed_args: argparse.Namespace) -> int:
         return _process_extraction_response(response, parsed_args, apng_path)
 
 
-def _log_generation_results(response: dict[str, Any]) -> None:
+def _play_animation_preview(
+    renderer: ASCIIRenderer,
+    animation: dict[str, Any],
+    colors: dict[str, tuple[int, int, int, int]],
+) -> None:
+    """Play one TOML animation in place, redrawing only the cells that change.
+
+    Args:
+        renderer: The renderer that styles the pixel glyphs
+        animation: One [[animation]] table of the sprite TOML
+        colors: Color mapping dictionary with RGBA tuples
+
+    """
+    frame_interval = animation.get('frame_interval', DEFAULT_PREVIEW_FRAME_INTERVAL)
+    frames = [
+        (frame['pixels'], frame.get('frame_interval', frame_interval))
+        for frame in animation.get('frame', [])
+        if frame.get('pixels')
+    ]
+    if not frames:
+        return
+
+    preview = TerminalAnimationPreview(renderer)
+    try:
+        preview.play(frames, colors, loops=ANIMATION_PREVIEW_LOOPS)
+    finally:
+        preview.close()
+
+
+def _log_generation_results(response: dict[str, Any], *, animate: bool = False) -> None:
     """Log metadata about a successfully generated sprite.
 
     Args:
         response: The generation API response
+        animate: Play the ASCII preview's animations in place
 
     """
     LOG.info(f'Generated sprite: {response.get("sprite_name")}')
@@ -681,7 +904,7 @@ def _log_generation_results(response: dict[str, Any]) -> None:
 
     # Display colorized ASCII preview of the sprite
     if response.get('toml_content'):
-        display_sprite_ascii(response['toml_content'])
+        display_sprite_ascii(response['toml_content'], animate=animate)
 
 
 def _handle_generate_sprite(parsed_args: argparse.Namespace, output_formats: list[str]) -> int:
@@ -716,7 +939,7 @@ def _handle_generate_sprite(parsed_args: argparse.Namespace, output_formats: lis
         LOG.error(f'Generation failed: {response.get("error", "Unknown error")}')
         return 1
 
-    _log_generation_results(response)
+    _log_generation_results(response, animate=parsed_args.animate_preview)
 
     # Save files locally if output_path specified
     if parsed_args.output_path:
@@ -742,6 +965,169 @@ def _handle_generate_sprite(parsed_args: argparse.Namespace, output_formats: lis
     return 0
 
 
+def _read_batch_prompts(batch_file: str) -> list[str]:
+    """Read one prompt per line, skipping blank lines and # comments.
+
+    Args:
+        batch_file: Path to the prompts file, or '-' for stdin
+
+    Returns:
+        The prompts in file order
+
+    """
+    text = sys.stdin.read() if batch_file == '-' else Path(batch_file).read_text(encoding='utf-8')
+    prompts = (line.strip() for line in text.splitlines())
+    return [prompt for prompt in prompts if prompt and not prompt.startswith('#')]
+
+
+def _build_batch_jobs(parsed_args: argparse.Namespace, output_formats: list[str]) -> list[BatchJob]:
+    """Build the batch requests named on the command line.
+
+    Args:
+        parsed_args: Parsed command line arguments
+        output_formats: List of requested output formats
+
+    Returns:
+        One job per APNG file with --batch-extract, otherwise one per prompt
+
+    """
+    if parsed_args.batch_extract:
+        # Each file is read when its job starts, so an unreadable one fails alone
+        return [
+            BatchJob(
+                apng_path,
+                EXTRACT_FRAMES_PATH,
+                functools.partial(build_extract_payload, apng_path),
+                EXTRACT_TIMEOUT,
+            )
+            for apng_path in parsed_args.batch_extract
+        ]
+
+    return [
+        BatchJob(
+            prompt,
+            GENERATE_PATH,
+            build_generate_payload(
+                prompt,
+                output_formats,
+                width=parsed_args.width,
+                height=parsed_args.height,
+                frame_count=parsed_args.frame_count,
+                film_strip_count=parsed_args.film_strip_count,
+                animation_duration=parsed_args.animation_duration,
+                png_scale=parsed_args.png_scale,
+                model=parsed_args.animation_language_model,
+            ),
+            GENERATE_TIMEOUT,
+            # A retried generation could bill the language model twice
+            idempotent=False,
+        )
+        for prompt in _read_batch_prompts(parsed_args.batch)
+    ]
+
+
+def _save_batch_result(
+    result: BatchResult,
+    parsed_args: argparse.Namespace,
+    output_formats: list[str],
+) -> bool:
+    """Save the output of one finished batch job.
+
+    Args:
+        result: The job's outcome
+        parsed_args: Parsed command line arguments
+        output_formats: List of requested output formats
+
+    Returns:
+        True if the job succeeded and its files were saved
+
+    """
+    response = result.response
+    if response is None or not response.get('success'):
+        error = result.error or (response or {}).get('error', 'Unknown error')
+        LOG.error('Failed: %s: %s', result.job.label, error)
+        return False
+
+    if result.job.path == EXTRACT_FRAMES_PATH:
+        _save_apng_extracted_frames(response, parsed_args.output_path, result.job.label)
+        return True
+
+    LOG.info(f'Generated sprite: {response.get("sprite_name")} ({result.job.label})')
+    save_files_locally(
+        response=response,
+        output_path=parsed_args.output_path,
+        output_formats=output_formats,
+        animation_duration=parsed_args.animation_duration,
+        extract_scale=parsed_args.extract_scale,
+        model_used=parsed_args.animation_language_model,
+    )
+    return True
+
+
+def _handle_batch(parsed_args: argparse.Namespace, output_formats: list[str]) -> int:
+    """Handle the --batch and --batch-extract commands.
+
+    All requests share one keep-alive connection pool and run concurrently.
+    Each job's output is saved as soon as it finishes, so an interrupted
+    batch keeps everything that completed before the interruption.
+
+    Args:
+        parsed_args: Parsed command line arguments
+        output_formats: List of requested output formats
+
+    Returns:
+        Exit code (0 if every job succeeded, 1 otherwise)
+
+    """
+    jobs = _build_batch_jobs(parsed_args, output_formats)
+    if not jobs:
+        LOG.error('Nothing to submit: the batch is empty')
+        return 1
+
+    saved: list[bool] = []
+
+    def save(result: BatchResult) -> None:
+        try:
+            saved.append(_save_batch_result(result, parsed_args, output_formats))
+        except OSError:
+            LOG.exception('Could not save the output of %s', result.job.label)
+            saved.append(False)
+
+    LOG.info(f'Submitting {len(jobs)} requests ({parsed_args.concurrency} at a time)')
+    asyncio.run(
+        submit_batch(
+            jobs,
+            parsed_args.server_url,
+            concurrency=parsed_args.concurrency,
+            retry=RetryPolicy(attempts=parsed_args.retries + 1),
+            on_result=save,
+        ),
+    )
+
+    succeeded = sum(saved)
+    LOG.info(f'Batch finished: {succeeded} succeeded, {len(saved) - succeeded} failed')
+    return 0 if succeeded == len(saved) else 1
+
+
+def _is_batch_mode(parser: argparse.ArgumentParser, parsed_args: argparse.Namespace) -> bool:
+    """Check whether a batch command was given and its options are usable.
+
+    Args:
+        parser: The parser, used to report invalid options
+        parsed_args: Parsed command line arguments
+
+    Returns:
+        True if --batch or --batch-extract was given
+
+    """
+    batch_mode = bool(parsed_args.batch or parsed_args.batch_extract)
+    if batch_mode and not parsed_args.output_path:
+        parser.error('--batch and --batch-extract require --output-path')
+    if parsed_args.concurrency < 1 or parsed_args.retries < 0:
+        parser.error('--concurrency must be at least 1 and --retries at least 0')
+    return batch_mode
+
+
 def main(args: list[str] | None = None) -> int:
     """Run the CLI client.
 
@@ -767,14 +1153,18 @@ def main(args: list[str] | None = None) -> int:
     if parsed_args.extract_frames:
         return _handle_extract_frames(parsed_args)
 
+    batch_mode = _is_batch_mode(parser, parsed_args)
+
     # Validate that prompt is provided for generation
-    if not parsed_args.prompt:
-        parser.error('prompt is required unless using --extract-frames')
+    if not parsed_args.prompt and not batch_mode:
+        parser.error('prompt is required unless using --extract-frames or a batch mode')
 
     # Use default output formats if none specified
     output_formats = parsed_args.output_formats or DEFAULT_OUTPUT_FORMATS
 
     try:
+        if batch_mode:
+            return _handle_batch(parsed_args, output_formats)
         return _handle_generate_sprite(parsed_args, output_formats)
     except httpx.ConnectError:
         LOG.error(f'Could not connect to server at {parsed_args.server_url}')  # noqa: TRY400
@@ -0,0 +1,145 @@
+"""Length-prefixed binary bundles of rendered sprite frames.
+
+A frame bundle carries a sprite generation response with its PNGs as raw
+bytes instead of base64 strings, so every frame is sent exactly once:
+
+    magic (4 bytes) | version (1 byte) | header length (4 bytes, big-endian)
+    header (UTF-8 JSON: the response without image data)
+    sprite PNG length (4 bytes) | sprite PNG bytes (length 0 if not rendered)
+    frame length (4 bytes) | frame PNG bytes    -- once per header['rendered_frames']
+
+The module only depends on the standard library so the CLI client can decode
+bundles without the server's dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+FRAME_BUNDLE_MEDIA_TYPE = 'application/x-glitchygames-frame-bundle'
+FRAME_BUNDLE_MAGIC = b'GGFB'
+FRAME_BUNDLE_VERSION = 1
+
+_PREAMBLE = struct.Struct('>4sBI')
+_LENGTH = struct.Struct('>I')
+
+_BAD_MAGIC_MSG = 'Not a frame bundle'
+_BAD_VERSION_MSG = 'Unsupported frame bundle version {version}'
+_TRUNCATED_MSG = 'Frame bundle is truncated'
+_MISSING_FRAMES_MSG = 'Frame bundle has {found} frames but its header lists {expected}'
+_TRAILING_DATA_MSG = 'Frame bundle has data after the {expected} frames its header lists'
+
+
+@dataclass
+class FrameBundle:
+    """A decoded frame bundle.
+
+    Attributes:
+        header: The response fields that were sent as JSON
+        png_bytes: PNG bytes of the first/current frame (if rendered)
+        frames: PNG bytes of each animation frame, in header['rendered_frames'] order
+
+    """
+
+    header: dict[str, Any]
+    png_bytes: bytes | None = None
+    frames: list[bytes] = field(default_factory=list)
+
+
+def encode_frame_bundle(
+    header: dict[str, Any],
+    png_bytes: bytes | None,
+    frames: Sequence[bytes],
+) -> bytes:
+    """Encode a response header and its PNGs into a frame bundle.
+
+    Args:
+        header: JSON-serializable response fields (without image data)
+        png_bytes: PNG bytes of the first/current frame, or None
+        frames: PNG bytes of each animation frame
+
+    Returns:
+        The encoded bundle
+
+    """
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    parts = [
+        _PREAMBLE.pack(FRAME_BUNDLE_MAGIC, FRAME_BUNDLE_VERSION, len(header_bytes)),
+        header_bytes,
+    ]
+    for blob in (png_bytes or b'', *frames):
+        parts.extend((_LENGTH.pack(len(blob)), blob))
+    return b''.join(parts)
+
+
+def decode_frame_bundle(data: bytes) -> FrameBundle:
+    """Decode a frame bundle.
+
+    Args:
+        data: The encoded bundle
+
+    Returns:
+        The decoded bundle
+
+    Raises:
+        ValueError: If the data is not a complete frame bundle of a supported
+            version, or its frames do not match header['rendered_frames'].
+
+    """
+    view = memoryview(data)
+    if len(view) < _PREAMBLE.size:
+        raise ValueError(_TRUNCATED_MSG)
+
+    magic, version, header_length = _PREAMBLE.unpack_from(view)
+    if magic != FRAME_BUNDLE_MAGIC:
+        raise ValueError(_BAD_MAGIC_MSG)
+    if version != FRAME_BUNDLE_VERSION:
+        raise ValueError(_BAD_VERSION_MSG.format(version=version))
+
+    offset = _PREAMBLE.size + header_length
+    if offset > len(view):
+        raise ValueError(_TRUNCATED_MSG)
+    header = json.loads(bytes(view[_PREAMBLE.size : offset]))
+
+    # The sprite PNG, then one blob per listed frame, then nothing
+    expected = len(header.get('rendered_frames') or [])
+    blobs: list[bytes] = []
+    for index in range(1 + expected):
+        if index and offset == len(view):
+            raise ValueError(_MISSING_FRAMES_MSG.format(found=index - 1, expected=expected))
+        if offset + _LENGTH.size > len(view):
+            raise ValueError(_TRUNCATED_MSG)
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        if offset + length > len(view):
+            raise ValueError(_TRUNCATED_MSG)
+        blobs.append(bytes(view[offset : offset + length]))
+        offset += length
+
+    if offset != len(view):
+        raise ValueError(_TRAILING_DATA_MSG.format(expected=expected))
+    return FrameBundle(header=header, png_bytes=blobs[0] or None, frames=blobs[1:])
+
+
+def response_from_bundle(data: bytes) -> dict[str, Any]:
+    """Decode a frame bundle into the response fields a JSON reply would carry.
+
+    The PNGs stay raw bytes: the sprite PNG is under 'png_bytes' and the
+    animation frames are under 'all_frames_png', in header['rendered_frames']
+    order.
+
+    Args:
+        data: The encoded bundle
+
+    Returns:
+        The response fields
+
+    """
+    bundle = decode_frame_bundle(data)
+    return {**bundle.header, 'png_bytes': bundle.png_bytes, 'all_frames_png': bundle.frames}
@@ -1,6 +1,9 @@
 """Pydantic models for the GlitchyGames API."""
 
 from glitchygames.api.models.sprite_models import (
+    FRAME_ENCODING_BASE64,
+    FRAME_ENCODING_BUNDLE,
+    OUTPUT_FORMAT_ATLAS,
     OUTPUT_FORMAT_PNG,
     OUTPUT_FORMAT_TOML,
     VALID_OUTPUT_FORMATS,
@@ -15,6 +18,9 @@ from glitchygames.api.models.sprite_models import (
 )
 
 __all__ = [
+    'FRAME_ENCODING_BASE64',
+    'FRAME_ENCODING_BUNDLE',
+    'OUTPUT_FORMAT_ATLAS',
     'OUTPUT_FORMAT_PNG',
     'OUTPUT_FORMAT_TOML',
     'VALID_OUTPUT_FORMATS',
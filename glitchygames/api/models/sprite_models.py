@@ -1,17 +1,24 @@
 """Pydantic models for sprite generation API endpoints."""
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
 # Valid output format values
 OUTPUT_FORMAT_TOML = 'toml'
 OUTPUT_FORMAT_PNG = 'png'
-VALID_OUTPUT_FORMATS = [OUTPUT_FORMAT_TOML, OUTPUT_FORMAT_PNG]
+OUTPUT_FORMAT_ATLAS = 'atlas'
+VALID_OUTPUT_FORMATS = [OUTPUT_FORMAT_TOML, OUTPUT_FORMAT_PNG, OUTPUT_FORMAT_ATLAS]
+
+# Valid frame encoding values
+FRAME_ENCODING_BASE64 = 'base64'
+FRAME_ENCODING_BUNDLE = 'bundle'
 
 # Validation error messages
-_OUTPUT_FORMAT_EMPTY_MSG = "output_format must contain at least one format ('toml' or 'png')"
-_OUTPUT_FORMAT_INVALID_MSG = "Invalid format '{fmt}'. Must be 'toml' or 'png'"
+_OUTPUT_FORMAT_EMPTY_MSG = (
+    "output_format must contain at least one format ('toml', 'png' or 'atlas')"
+)
+_OUTPUT_FORMAT_INVALID_MSG = "Invalid format '{fmt}'. Must be 'toml', 'png' or 'atlas'"
 
 
 class SpriteGenerationRequest(BaseModel):
@@ -24,8 +31,9 @@ class SpriteGenerationRequest(BaseModel):
         frame_count: Number of frames per animation (for animated sprites)
         film_strip_count: Number of film strips/animations to create
         animation_duration: Duration of animation in seconds
-        output_format: List of output formats to include ('toml', 'png', or both)
+        output_format: List of output formats to include ('toml', 'png' and/or 'atlas')
         png_scale: Scale factor for PNG output (1-10)
+        frame_encoding: How rendered PNGs are returned ('base64' JSON or binary 'bundle')
 
     """
 
@@ -66,9 +74,12 @@ class SpriteGenerationRequest(BaseModel):
         le=60,
         description='Duration of animation in seconds (0-60).',
     )
-    output_format: list[Literal['toml', 'png']] = Field(
+    output_format: list[Literal['toml', 'png', 'atlas']] = Field(
         default=['toml', 'png'],
-        description="List of output formats: ['toml'], ['png'], or ['toml', 'png']",
+        description=(
+            "List of output formats: any of 'toml', 'png', and 'atlas' (every frame "
+            'packed into one PNG with a frame-rect manifest)'
+        ),
         json_schema_extra={'example': ['toml', 'png']},
     )
     png_scale: int = Field(
@@ -77,6 +88,13 @@ class SpriteGenerationRequest(BaseModel):
         le=10,
         description='Scale factor for PNG output (1-10)',
     )
+    frame_encoding: Literal['base64', 'bundle'] = Field(
+        default='base64',
+        description=(
+            "How rendered PNGs are returned: 'base64' strings in the JSON response, or "
+            "'bundle' for a length-prefixed binary frame bundle with each frame sent once"
+        ),
+    )
     output_path: str | None = Field(
         default=None,
         description=(
@@ -117,8 +135,9 @@ class SpriteRefinementRequest(BaseModel):
     Attributes:
         prompt: Text description of how to modify the sprite
         current_toml: Current sprite TOML content to refine
-        output_format: List of output formats to include ('toml', 'png', or both)
+        output_format: List of output formats to include ('toml', 'png' and/or 'atlas')
         png_scale: Scale factor for PNG output (1-10)
+        frame_encoding: How rendered PNGs are returned ('base64' JSON or binary 'bundle')
         output_path: Directory to save output files (optional)
 
     """
@@ -135,9 +154,12 @@ class SpriteRefinementRequest(BaseModel):
         min_length=1,
         description='Current sprite TOML content to refine',
     )
-    output_format: list[Literal['toml', 'png']] = Field(
+    output_format: list[Literal['toml', 'png', 'atlas']] = Field(
         default=['toml', 'png'],
-        description="List of output formats: ['toml'], ['png'], or ['toml', 'png']",
+        description=(
+            "List of output formats: any of 'toml', 'png', and 'atlas' (every frame "
+            'packed into one PNG with a frame-rect manifest)'
+        ),
         json_schema_extra={'example': ['toml', 'png']},
     )
     png_scale: int = Field(
@@ -146,6 +168,13 @@ class SpriteRefinementRequest(BaseModel):
         le=10,
         description='Scale factor for PNG output (1-10)',
     )
+    frame_encoding: Literal['base64', 'bundle'] = Field(
+        default='base64',
+        description=(
+            "How rendered PNGs are returned: 'base64' strings in the JSON response, or "
+            "'bundle' for a length-prefixed binary frame bundle with each frame sent once"
+        ),
+    )
     output_path: str | None = Field(
         default=None,
         description="Directory to save output files. Created if it doesn't exist.",
@@ -178,7 +207,8 @@ class RenderedFrameInfo(BaseModel):
     Attributes:
         animation_index: Index of the animation (film strip) this frame belongs to
         frame_index: Index of the frame within its animation
-        png_base64: Base64-encoded PNG data for this frame
+        png_base64: Base64-encoded PNG data for this frame (omitted in a frame
+            bundle, which carries the raw bytes instead)
 
     """
 
@@ -190,8 +220,8 @@ class RenderedFrameInfo(BaseModel):
         ...,
         description='Index of the frame within its animation',
     )
-    png_base64: str = Field(
-        ...,
+    png_base64: str | None = Field(
+        default=None,
         description='Base64-encoded PNG data for this frame',
     )
 
@@ -210,6 +240,8 @@ class SpriteGenerationResponse(BaseModel):
         png_base64: Base64-encoded PNG of first/current frame (if output_format includes PNG)
         all_frames_png_base64: List of base64 PNGs for all frames (if frame_count > 1)
         rendered_frames: List of frames with animation/frame indices (if frame_count > 1)
+        atlas_png_base64: Base64-encoded atlas PNG of every frame (if output_format includes atlas)
+        atlas_manifest: Atlas size and frame rectangles (if output_format includes atlas)
         saved_files: List of file paths that were saved (if output_path was specified)
         error: Error message (if success=False)
 
@@ -255,6 +287,14 @@ class SpriteGenerationResponse(BaseModel):
         default=None,
         description='List of frames with animation/frame indices (if frame_count > 1)',
     )
+    atlas_png_base64: str | None = Field(
+        default=None,
+        description='Base64-encoded PNG with every distinct frame packed into one image',
+    )
+    atlas_manifest: dict[str, Any] | None = Field(
+        default=None,
+        description='Atlas size and the rectangle of every frame, in animation order',
+    )
     saved_files: list[str] | None = Field(
         default=None,
         description='List of file paths that were saved (if output_dir was specified)',
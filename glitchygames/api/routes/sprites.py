@@ -13,13 +13,18 @@ if TYPE_CHECKING:
 
     import apng as apng_types
 
-from fastapi import APIRouter, HTTPException
+    from glitchygames.services.renderer_service import AtlasResult, RenderResult
+
+from fastapi import APIRouter, HTTPException, Response
 
 from glitchygames.api.dependencies import (
     get_renderer_service,
     get_sprite_generation_service,
 )
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, encode_frame_bundle
 from glitchygames.api.models import (
+    FRAME_ENCODING_BUNDLE,
+    OUTPUT_FORMAT_ATLAS,
     OUTPUT_FORMAT_PNG,
     OUTPUT_FORMAT_TOML,
     ApngExtractRequest,
@@ -32,6 +37,7 @@ from glitchygames.api.models import (
 )
 from glitchygames.services import (
     AIProviderError,
+    RenderedFrame,
     RendererService,
     SpriteGenerationService,
 )
@@ -65,8 +71,9 @@ def _save_sprite_files(  # noqa: PLR0913
     *,
     toml_content: str | None,
     png_bytes: bytes | None,
-    rendered_frames: list[RenderedFrameInfo] | None,
+    rendered_frames: Sequence[RenderedFrame] | None,
     output_format: Sequence[str],
+    atlas_result: AtlasResult | None = None,
 ) -> list[str]:
     """Save sprite files to the specified directory.
 
@@ -75,8 +82,9 @@ def _save_sprite_files(  # noqa: PLR0913
         sprite_name: Name of the sprite (used for filenames)
         toml_content: TOML content to save (if any)
         png_bytes: PNG bytes to save (if any)
-        rendered_frames: List of RenderedFrameInfo with animation/frame indices
+        rendered_frames: Rendered animation frames with their raw PNG bytes
         output_format: List of requested output formats
+        atlas_result: Rendered atlas to save with its manifest (if any)
 
     Returns:
         List of saved file paths
@@ -129,37 +137,53 @@ def _save_sprite_files(  # noqa: PLR0913
 
     # Save animation frames if provided (using animation-#-frame-#.png naming)
     if rendered_frames:
-        for frame_info in rendered_frames:
-            frame_bytes = base64.b64decode(frame_info.png_base64)
+        for rendered_frame in rendered_frames:
             frame_path = save_dir / (
-                f'animation-{frame_info.animation_index}-frame-{frame_info.frame_index}.png'
+                f'animation-{rendered_frame.animation_index}-frame-{rendered_frame.frame_index}.png'
             )
-            frame_path.write_bytes(frame_bytes)
+            frame_path.write_bytes(rendered_frame.png_bytes)
             saved_files.append(str(frame_path))
             LOG.info('Saved frame: %s', frame_path)
 
+    # Save the atlas and its frame-rect manifest if requested
+    if OUTPUT_FORMAT_ATLAS in output_format and atlas_result and atlas_result.png_bytes:
+        atlas_path = save_dir / f'{safe_name}.atlas.png'
+        atlas_path.write_bytes(atlas_result.png_bytes)
+        manifest_path = save_dir / f'{safe_name}.atlas.json'
+        manifest_path.write_text(atlas_result.manifest_json(), encoding='utf-8')
+        saved_files.extend([str(atlas_path), str(manifest_path)])
+        LOG.info('Saved atlas: %s', atlas_path)
+
     return saved_files
 
 
-def _render_png_to_response(
+def _render_png_to_response(  # noqa: PLR0913
     renderer_service: RendererService,
     response: SpriteGenerationResponse,
     toml_content: str,
     *,
     png_scale: int,
     frame_count: int,
-) -> bytes | None:
+    frame_encoding: str,
+) -> RenderResult | None:
     """Render PNG frames and populate the response object.
 
+    With the default base64 encoding each frame is placed in
+    all_frames_png_base64 and in its rendered_frames entry, as existing
+    clients expect. The bundle encoding sends the raw bytes from the render
+    result instead, so rendered_frames only carries the animation/frame
+    indices, in the same order.
+
     Args:
         renderer_service: The renderer service instance
         response: The response object to populate
         toml_content: TOML content to render
         png_scale: Scale factor for PNG output
         frame_count: Number of frames (>1 triggers multi-frame rendering)
+        frame_encoding: Requested frame encoding ('base64' or 'bundle')
 
     Returns:
-        Raw PNG bytes for the first frame, or None if rendering failed
+        The render result, or None if rendering failed
 
     """
     render_all_frames = frame_count > 1
@@ -167,18 +191,22 @@ def _render_png_to_response(
         toml_content,
         scale=png_scale,
         render_all_frames=render_all_frames,
+        encode_base64=frame_encoding != FRAME_ENCODING_BUNDLE,
     )
     if not render_result.success:
         LOG.warning(f'PNG rendering failed: {render_result.error}')
         return None
 
-    response.png_base64 = render_result.png_base64
     response.width = render_result.width
     response.height = render_result.height
-
-    if render_all_frames and render_result.all_frames_png_base64:
-        response.all_frames_png_base64 = render_result.all_frames_png_base64
-        # Convert rendered_frames to API model
+    if frame_encoding != FRAME_ENCODING_BUNDLE:
+        response.png_base64 = render_result.png_base64
+
+    if render_all_frames and render_result.rendered_frames:
+        if frame_encoding != FRAME_ENCODING_BUNDLE:
+            response.all_frames_png_base64 = [
+                rf.png_base64 for rf in render_result.rendered_frames if rf.png_base64 is not None
+            ]
         response.rendered_frames = [
             RenderedFrameInfo(
                 animation_index=rf.animation_index,
@@ -188,15 +216,106 @@ def _render_png_to_response(
             for rf in render_result.rendered_frames
         ]
 
-    return render_result.png_bytes
+    return render_result
 
 
-@router.post('/generate')
-async def generate_sprite(request: SpriteGenerationRequest) -> SpriteGenerationResponse:
+def _render_atlas_to_response(
+    renderer_service: RendererService,
+    response: SpriteGenerationResponse,
+    toml_content: str | None,
+    *,
+    output_format: Sequence[str],
+    png_scale: int,
+) -> AtlasResult | None:
+    """Render the sprite's frames into an atlas and populate the response object.
+
+    The atlas is a single PNG, so it is sent base64-encoded with its manifest
+    in either frame encoding.
+
+    Args:
+        renderer_service: The renderer service instance
+        response: The response object to populate
+        toml_content: TOML content to render
+        output_format: List of requested output formats
+        png_scale: Scale factor for the frames in the atlas
+
+    Returns:
+        The atlas result, or None if no atlas was requested or rendering failed
+
+    """
+    if OUTPUT_FORMAT_ATLAS not in output_format or not toml_content:
+        return None
+
+    atlas_result = renderer_service.render_atlas_from_toml(toml_content, scale=png_scale)
+    if not atlas_result.success or atlas_result.png_bytes is None:
+        LOG.warning(f'Atlas rendering failed: {atlas_result.error}')
+        return None
+
+    response.atlas_png_base64 = base64.b64encode(atlas_result.png_bytes).decode('utf-8')
+    response.atlas_manifest = atlas_result.manifest
+    return atlas_result
+
+
+def _only_format_render_error(
+    output_format: Sequence[str],
+    render_result: RenderResult | None,
+    atlas_result: AtlasResult | None,
+) -> str | None:
+    """Report a failed render when it was the only requested output format.
+
+    Args:
+        output_format: List of requested output formats
+        render_result: The PNG render result, or None if it failed or was not requested
+        atlas_result: The atlas result, or None if it failed or was not requested
+
+    Returns:
+        The error message, or None if the response can still be sent
+
+    """
+    if output_format == [OUTPUT_FORMAT_PNG] and render_result is None:
+        return 'PNG rendering failed'
+    if output_format == [OUTPUT_FORMAT_ATLAS] and atlas_result is None:
+        return 'Atlas rendering failed'
+    return None
+
+
+def _finish_response(
+    response: SpriteGenerationResponse,
+    render_result: RenderResult | None,
+    frame_encoding: str,
+) -> SpriteGenerationResponse | Response:
+    """Return the response in the requested frame encoding.
+
+    Args:
+        response: The populated response object
+        render_result: The render result, or None if nothing was rendered
+        frame_encoding: Requested frame encoding ('base64' or 'bundle')
+
+    Returns:
+        The response object, or a frame bundle carrying it with raw PNG bytes
+
+    """
+    if frame_encoding != FRAME_ENCODING_BUNDLE:
+        return response
+
+    png_bytes = render_result.png_bytes if render_result else None
+    frames = [rf.png_bytes for rf in render_result.rendered_frames] if render_result else []
+    if not response.rendered_frames:
+        frames = []
+    return Response(
+        content=encode_frame_bundle(response.model_dump(mode='json'), png_bytes, frames),
+        media_type=FRAME_BUNDLE_MEDIA_TYPE,
+    )
+
+
+@router.post('/generate', response_model=SpriteGenerationResponse)
+async def generate_sprite(request: SpriteGenerationRequest) -> SpriteGenerationResponse | Response:
     """Generate a new sprite from a text prompt.
 
     This endpoint uses AI to generate a sprite based on the provided text
-    description. The sprite can be returned as TOML, PNG, or both.
+    description. The sprite can be returned as TOML, PNG, a packed frame
+    atlas, or any combination of them. With frame_encoding='bundle', a
+    successful response is sent as a binary frame bundle instead of JSON.
 
     Args:
         request: Sprite generation request with prompt and options
@@ -245,21 +364,30 @@ async def generate_sprite(request: SpriteGenerationRequest) -> SpriteGenerationR
             response.toml_content = result.toml_content
 
         # Render PNG if requested
-        png_bytes = None
+        render_result = None
         if OUTPUT_FORMAT_PNG in request.output_format and result.toml_content:
-            png_bytes = _render_png_to_response(
+            render_result = _render_png_to_response(
                 renderer_service,
                 response,
                 result.toml_content,
                 png_scale=request.png_scale,
                 frame_count=result.frame_count,
+                frame_encoding=request.frame_encoding,
             )
-            # Only fail if PNG was the only requested format and rendering failed
-            if png_bytes is None and request.output_format == [OUTPUT_FORMAT_PNG]:
-                return SpriteGenerationResponse(
-                    success=False,
-                    error='PNG rendering failed',
-                )
+
+        # Render the atlas if requested
+        atlas_result = _render_atlas_to_response(
+            renderer_service,
+            response,
+            result.toml_content,
+            output_format=request.output_format,
+            png_scale=request.png_scale,
+        )
+
+        # Only fail if the one requested image format failed to render
+        render_error = _only_format_render_error(request.output_format, render_result, atlas_result)
+        if render_error:
+            return SpriteGenerationResponse(success=False, error=render_error)
 
         # Save files if output_path is specified
         if request.output_path and result.sprite_name:
@@ -267,9 +395,12 @@ async def generate_sprite(request: SpriteGenerationRequest) -> SpriteGenerationR
                 output_path=request.output_path,
                 sprite_name=result.sprite_name,
                 toml_content=response.toml_content,
-                png_bytes=png_bytes,
-                rendered_frames=response.rendered_frames,
+                png_bytes=render_result.png_bytes if render_result else None,
+                rendered_frames=render_result.rendered_frames
+                if render_result and response.rendered_frames
+                else None,
                 output_format=request.output_format,
+                atlas_result=atlas_result,
             )
             response.saved_files = saved_files
     except AIProviderError as e:
@@ -285,15 +416,17 @@ async def generate_sprite(request: SpriteGenerationRequest) -> SpriteGenerationR
             detail=f'Internal server error: {e}',
         ) from e
     else:
-        return response
+        return _finish_response(response, render_result, request.frame_encoding)
 
 
-@router.post('/refine')
-async def refine_sprite(request: SpriteRefinementRequest) -> SpriteGenerationResponse:
+@router.post('/refine', response_model=SpriteGenerationResponse)
+async def refine_sprite(request: SpriteRefinementRequest) -> SpriteGenerationResponse | Response:
     """Refine an existing sprite based on a text prompt.
 
     This endpoint uses AI to modify an existing sprite based on the provided
-    instructions. The original sprite is provided as TOML content.
+    instructions. The original sprite is provided as TOML content. With
+    frame_encoding='bundle', a successful response is sent as a binary frame
+    bundle instead of JSON.
 
     Args:
         request: Sprite refinement request with prompt, current TOML, and options
@@ -335,21 +468,30 @@ async def refine_sprite(request: SpriteRefinementRequest) -> SpriteGenerationRes
             response.toml_content = result.toml_content
 
         # Render PNG if requested
-        png_bytes = None
+        render_result = None
         if OUTPUT_FORMAT_PNG in request.output_format and result.toml_content:
-            png_bytes = _render_png_to_response(
+            render_result = _render_png_to_response(
                 renderer_service,
                 response,
                 result.toml_content,
                 png_scale=request.png_scale,
                 frame_count=result.frame_count,
+                frame_encoding=request.frame_encoding,
             )
-            # Only fail if PNG was the only requested format and rendering failed
-            if png_bytes is None and request.output_format == [OUTPUT_FORMAT_PNG]:
-                return SpriteGenerationResponse(
-                    success=False,
-                    error='PNG rendering failed',
-                )
+
+        # Render the atlas if requested
+        atlas_result = _render_atlas_to_response(
+            renderer_service,
+            response,
+            result.toml_content,
+            output_format=request.output_format,
+            png_scale=request.png_scale,
+        )
+
+        # Only fail if the one requested image format failed to render
+        render_error = _only_format_render_error(request.output_format, render_result, atlas_result)
+        if render_error:
+            return SpriteGenerationResponse(success=False, error=render_error)
 
         # Save files if output_path is specified
         if request.output_path and result.sprite_name:
@@ -357,9 +499,12 @@ async def refine_sprite(request: SpriteRefinementRequest) -> SpriteGenerationRes
                 output_path=request.output_path,
                 sprite_name=result.sprite_name,
                 toml_content=response.toml_content,
-                png_bytes=png_bytes,
-                rendered_frames=response.rendered_frames,
+                png_bytes=render_result.png_bytes if render_result else None,
+                rendered_frames=render_result.rendered_frames
+                if render_result and response.rendered_frames
+                else None,
                 output_format=request.output_format,
+                atlas_result=atlas_result,
             )
             response.saved_files = saved_files
     except AIProviderError as e:
@@ -375,7 +520,7 @@ async def refine_sprite(request: SpriteRefinementRequest) -> SpriteGenerationRes
             detail=f'Internal server error: {e}',
         ) from e
     else:
-        return response
+        return _finish_response(response, render_result, request.frame_encoding)
 
 
 def _extract_single_frame(
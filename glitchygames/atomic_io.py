@@ -0,0 +1,54 @@
+"""Crash-safe file replacement.
+
+A file written in place is left truncated or half-written if the process dies
+or the machine loses power part way through. atomic_text_file() writes to a
+temporary file next to the target instead, syncs it to disk, and only then
+renames it over the target, so readers see either the old contents or the new
+ones.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import secrets
+import shutil
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@contextlib.contextmanager
+def atomic_text_file(filename: str | Path) -> Iterator[IO[str]]:
+    """Open a temporary file that replaces filename once it is written.
+
+    The data is flushed and fsynced before the rename, so a crash right after
+    the rename cannot leave an empty file behind. If writing fails, the
+    temporary file is removed and filename is left untouched. An existing
+    file's permissions are kept.
+
+    Args:
+        filename: The file to write
+
+    Yields:
+        The temporary file, open for writing text.
+
+    """
+    path = Path(filename)
+    # Created with open() rather than mkstemp() so the file gets the usual
+    # umask-based permissions instead of 0600
+    temp_path = path.with_name(f'.{path.name}.{secrets.token_hex(4)}.tmp')
+    try:
+        with temp_path.open('x', encoding='utf-8') as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        if path.exists():
+            shutil.copymode(path, temp_path)
+        temp_path.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
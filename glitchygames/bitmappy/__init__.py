@@ -6,9 +6,11 @@ Re-exports all public names from submodules for backwards compatibility.
 from __future__ import annotations
 
 # Extracted modules (canonical imports)
+from .ai_cache import AIResponseCache, make_cache_key
 from .ai_manager import AIManager
 from .ai_worker import run_ai_worker
 from .animated_canvas import AnimatedCanvasSprite
+from .autosave import AutosaveManager
 
 # Supporting modules
 from .canvas_interfaces import (
@@ -25,6 +27,8 @@ from .canvas_interfaces import (
 from .constants import (
     AI_BASE_DELAY,
     AI_CAPABILITY_RESPONSE_FIELD_COUNT,
+    AI_CONTROL_CANCEL,
+    AI_CONTROL_FORGET,
     AI_MAX_CONTEXT_SIZE,
     AI_MAX_DELAY,
     AI_MAX_INPUT_TOKENS,
@@ -34,9 +38,14 @@ from .constants import (
     AI_MODEL,
     AI_MODEL_DOWNLOAD_TIMEOUT,
     AI_QUEUE_SIZE,
+    AI_REQUEST_CANCELLED,
+    AI_RESPONSE_CACHE_DIR,
     AI_TIMEOUT,
     AI_TRAINING_SINGLE_FRAME_EXAMPLE_COUNT,
     AI_VALIDATION_MAX_RETRIES,
+    AI_WORKER_POLL_INTERVAL,
+    AI_WORKER_POOL_SIZE,
+    AUTOSAVE_DIR,
     COLOR_QUANTIZATION_GROUP_DISTANCE_THRESHOLD,
     CONTROLLER_ACCEL_JUMP_LEVEL1,
     CONTROLLER_ACCEL_JUMP_LEVEL2,
@@ -130,6 +139,7 @@ from .indicators import (
 )
 from .models import (
     AIRequest,
+    AIRequestPriority,
     AIRequestState,
     AIResponse,
     GGUnhandledMenuItemError,
@@ -147,6 +157,8 @@ from .utils import SPRITE_CONFIG_DIR, detect_file_format, resource_path
 __all__ = [
     'AI_BASE_DELAY',
     'AI_CAPABILITY_RESPONSE_FIELD_COUNT',
+    'AI_CONTROL_CANCEL',
+    'AI_CONTROL_FORGET',
     'AI_MAX_CONTEXT_SIZE',
     'AI_MAX_DELAY',
     'AI_MAX_INPUT_TOKENS',
@@ -156,10 +168,15 @@ __all__ = [
     'AI_MODEL',
     'AI_MODEL_DOWNLOAD_TIMEOUT',
     'AI_QUEUE_SIZE',
+    'AI_REQUEST_CANCELLED',
+    'AI_RESPONSE_CACHE_DIR',
     'AI_TIMEOUT',
     'AI_TRAINING_SINGLE_FRAME_EXAMPLE_COUNT',
     'AI_VALIDATION_MAX_RETRIES',
+    'AI_WORKER_POLL_INTERVAL',
+    'AI_WORKER_POOL_SIZE',
     'ANIMATION_NAME_MAX_LENGTH',
+    'AUTOSAVE_DIR',
     'COLOR_QUANTIZATION_GROUP_DISTANCE_THRESHOLD',
     'CONTROLLER_ACCEL_JUMP_LEVEL1',
     'CONTROLLER_ACCEL_JUMP_LEVEL2',
@@ -195,12 +212,15 @@ __all__ = [
     'TRANSPARENT_GLYPH',
     'AIManager',
     'AIRequest',
+    'AIRequestPriority',
     'AIRequestState',
     'AIResponse',
+    'AIResponseCache',
     'AnimatedCanvasInterface',
     'AnimatedCanvasRenderer',
     'AnimatedCanvasSprite',
     'AnimatedSpriteSerializer',
+    'AutosaveManager',
     'BitmapEditorScene',
     'BitmapPixelSprite',
     'BitmappyMultiControllerEnhancements',
@@ -260,6 +280,7 @@ __all__ = [
     'get_onion_skinning_manager',
     'load_ai_training_data',
     'main',
+    'make_cache_key',
     'parse_toml_robustly',
     'resource_path',
     'run_ai_worker',
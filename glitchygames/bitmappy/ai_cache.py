@@ -0,0 +1,166 @@
+"""Content-addressed on-disk cache for AI sprite generation responses.
+
+Responses are keyed by a SHA-256 digest of the model name, the message list sent
+to the model, and the training examples selected for the request. Identical
+requests therefore map to the same cache entry and can be served without a
+round-trip through the AI worker or the model.
+
+Entries are stored as one JSON file per key under ``<cache_dir>/<key[:2]>/`` and
+are written atomically (temp file + rename), so the editor process and the AI
+worker process can safely share the same directory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glitchygames.atomic_io import atomic_text_file
+
+from .models import AIResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+LOG = logging.getLogger('game.tools.bitmappy.ai_cache')
+LOG.addHandler(logging.NullHandler())
+
+# Content returned by the worker when aisuite is unavailable; never worth caching
+_AI_UNAVAILABLE_CONTENT = 'AI features not available'
+
+
+def make_cache_key(
+    model: str,
+    messages: Sequence[dict[str, str]],
+    training_examples: Sequence[dict[str, Any]] | None = None,
+) -> str:
+    """Build a content-addressed cache key for an AI request.
+
+    Args:
+        model: The model identifier (e.g. ``'anthropic:claude-sonnet-4-5'``).
+        messages: The chat messages sent to the model.
+        training_examples: The training examples selected for the request.
+
+    Returns:
+        A hex SHA-256 digest uniquely identifying the request content.
+
+    """
+    payload = {
+        'model': model,
+        'messages': list(messages),
+        'training_examples': list(training_examples or []),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class AIResponseCache:
+    """Persistent, content-addressed store of AI responses.
+
+    All filesystem errors are logged and swallowed: the cache is an optimization
+    and must never break the AI request path.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries. Created lazily on first write.
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key.
+
+        Returns:
+            Path: The entry's JSON file path.
+
+        """
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def get(self, key: str) -> AIResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key().
+
+        Returns:
+            The cached AIResponse, or None on a miss or unreadable entry.
+
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+            content = entry['content']
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError, ValueError, KeyError, TypeError:
+            LOG.warning('Discarding unreadable AI cache entry: %s', path)
+            self.discard(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        LOG.debug('AI cache hit: %s', key)
+        return AIResponse(content=content)
+
+    def put(self, key: str, response: AIResponse, *, model: str | None = None) -> bool:
+        """Store a response if it is cacheable.
+
+        Only successful responses with content are stored; errors and the
+        "AI features not available" placeholder are skipped.
+
+        Args:
+            key: Cache key from make_cache_key().
+            response: The response to store.
+            model: Optional model name recorded alongside the entry for inspection.
+
+        Returns:
+            True if the response was written to the cache.
+
+        """
+        if response.error is not None or not response.content:
+            return False
+        if response.content.strip().rstrip('.') == _AI_UNAVAILABLE_CONTENT:
+            return False
+
+        path = self._entry_path(key)
+        entry = {'model': model, 'created': time.time(), 'content': response.content}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_text_file(path) as temp_file:
+                json.dump(entry, temp_file)
+        except OSError:
+            LOG.exception('Failed to write AI cache entry %s', path)
+            return False
+
+        LOG.debug('AI cache store: %s', key)
+        return True
+
+    def discard(self, key: str) -> None:
+        """Remove a cache entry if present.
+
+        Args:
+            key: Cache key from make_cache_key().
+
+        """
+        with contextlib.suppress(OSError):
+            self._entry_path(key).unlink()
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a cache entry exists for key.
+
+        Returns:
+            True if an entry file exists.
+
+        """
+        return isinstance(key, str) and self._entry_path(key).is_file()
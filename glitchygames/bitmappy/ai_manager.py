@@ -10,7 +10,7 @@ import contextlib
 import logging
 import multiprocessing
 import tempfile
-import time
+import uuid
 from pathlib import Path
 from queue import Empty
 from typing import TYPE_CHECKING, Any
@@ -28,23 +28,31 @@ from glitchygames.ai import (
 from glitchygames.color import (
     RGB_COMPONENT_COUNT,
 )
+from glitchygames.performance.tracing import tracer
 from glitchygames.sprites import (
     SPRITE_GLYPHS,
     SpriteFactory,
 )
 from glitchygames.sprites.constants import DEFAULT_FILE_FORMAT
 
+from .ai_cache import AIResponseCache, make_cache_key
 from .ai_worker import build_retry_prompt, run_ai_worker, select_relevant_training_examples
 from .constants import (
+    AI_CONTROL_CANCEL,
+    AI_CONTROL_FORGET,
+    AI_MODEL,
+    AI_REQUEST_CANCELLED,
+    AI_RESPONSE_CACHE_DIR,
     AI_TRAINING_SINGLE_FRAME_EXAMPLE_COUNT,
     AI_VALIDATION_MAX_RETRIES,
+    AI_WORKER_POOL_SIZE,
     DEBUG_LOG_FIRST_N_PIXELS,
     MAGENTA_TRANSPARENT,
     MAX_COLORS_FOR_AI_TRAINING,
     TRANSPARENT_GLYPH,
     ai_training_state,
 )
-from .models import AIRequest, AIRequestState, AIResponse, MockEvent
+from .models import AIRequest, AIRequestPriority, AIRequestState, AIResponse, MockEvent
 from .toml_processing import (
     build_color_to_glyph_mapping,
     build_pixel_string_from_pixels,
@@ -62,14 +70,27 @@ class AIManager:
     """Manages AI sprite generation for the Bitmappy editor.
 
     Handles AI request/response processing, training example gathering,
-    sprite loading from AI-generated content, and AI worker lifecycle.
+    sprite loading from AI-generated content, and the AI worker pool lifecycle.
+
+    Requests are scheduled on two lanes: interactive requests (prompts typed by
+    the user) and background requests (batch generation that only warms the
+    response cache). Submitting a new interactive request cancels any older
+    interactive request that is still pending.
     """
 
-    def __init__(self, editor: EditorContext) -> None:
+    def __init__(
+        self,
+        editor: EditorContext,
+        pool_size: int = AI_WORKER_POOL_SIZE,
+        prefetch_path: str | Path | None = None,
+    ) -> None:
         """Initialize the AIManager.
 
         Args:
             editor: The editor context providing access to shared state.
+            pool_size: Number of AI worker processes to start; 0 disables AI.
+            prefetch_path: File of prompts (one per line) to generate on the
+                background lane at startup, or None to prefetch nothing.
 
         """
         self.editor = editor
@@ -77,39 +98,184 @@ class AIManager:
         self.log.addHandler(logging.NullHandler())
 
         # AI state
+        self.pool_size = max(0, pool_size)
+        self.prefetch_path = Path(prefetch_path) if prefetch_path is not None else None
         self.pending_ai_requests: dict[str, Any] = {}
         self.ai_request_queue: multiprocessing.Queue[AIRequest] | None = None
+        self.ai_background_queue: multiprocessing.Queue[AIRequest] | None = None
         self.ai_response_queue: multiprocessing.Queue[tuple[str, AIResponse]] | None = None
-        self.ai_process: multiprocessing.Process | None = None
+        self.ai_control_queues: list[multiprocessing.Queue[tuple[str, str]]] = []
+        self.ai_processes: list[multiprocessing.Process] = []
         self.last_successful_sprite_content: str | None = None
         self.last_conversation_history: list[dict[str, str]] | None = None
 
+        # Response cache and request coalescing
+        self.response_cache: AIResponseCache | None = AIResponseCache(AI_RESPONSE_CACHE_DIR)
+        self.in_flight_requests: dict[str, str] = {}  # cache key -> leading request ID
+        self.coalesced_requests: dict[str, list[str]] = {}  # leading request ID -> followers
+
+        # Scheduling and cancellation
+        self.outstanding_requests: dict[str, AIRequestPriority] = {}  # request ID -> lane
+        self.cancelled_requests: set[str] = set()
+
     def setup(self) -> None:
-        """Initialize AI processing components and start the worker process."""
+        """Initialize AI processing components and start the worker pool."""
+        if self.pool_size == 0:
+            self.log.info('AI worker pool disabled')
+            return
+
         # Check if we are in the main process
         if multiprocessing.current_process().name == 'MainProcess':
-            self.log.info('Initializing AI worker process...')
+            self.log.info(f'Initializing AI worker pool ({self.pool_size} workers)...')
 
             try:
                 self.ai_request_queue = multiprocessing.Queue()
+                self.ai_background_queue = multiprocessing.Queue()
                 self.ai_response_queue = multiprocessing.Queue()
 
-                self.ai_process = multiprocessing.Process(
-                    target=run_ai_worker,
-                    args=(self.ai_request_queue, self.ai_response_queue),
-                    daemon=True,
-                )
-
-                self.ai_process.start()
-                self.log.info(f'AI worker process started with PID: {self.ai_process.pid}')
+                cache_dir = self.response_cache.cache_dir if self.response_cache else None
+                for worker_index in range(self.pool_size):
+                    control_queue: multiprocessing.Queue[tuple[str, str]] = multiprocessing.Queue()
+                    # Keep the first worker free for interactive requests when pooling
+                    background_queue = (
+                        None
+                        if worker_index == 0 and self.pool_size > 1
+                        else self.ai_background_queue
+                    )
+                    process = multiprocessing.Process(
+                        target=run_ai_worker,
+                        args=(
+                            self.ai_request_queue,
+                            self.ai_response_queue,
+                            cache_dir,
+                            background_queue,
+                            control_queue,
+                        ),
+                        name=f'AIWorker-{worker_index}',
+                        daemon=True,
+                    )
+                    process.start()
+                    self.ai_control_queues.append(control_queue)
+                    self.ai_processes.append(process)
+                    self.log.info(f'AI worker process started with PID: {process.pid}')
 
             except OSError, RuntimeError:
-                self.log.exception('Error initializing AI worker process')
+                self.log.exception('Error initializing AI worker pool')
+                self._cleanup_ai_process()
                 self.ai_request_queue = None
+                self.ai_background_queue = None
                 self.ai_response_queue = None
-                self.ai_process = None
+                self.ai_control_queues = []
+                self.ai_processes = []
         else:
             self.log.warning('Not in main process, AI processing not available')
+            return
+
+        if self.prefetch_path is not None and self.ai_request_queue:
+            self.prefetch_prompts(self.prefetch_path)
+
+    def prefetch_prompts(self, path: Path) -> None:
+        """Queue every prompt in a file on the background lane.
+
+        Blank lines and lines starting with '#' are skipped.
+
+        Args:
+            path: A text file with one sprite description per line.
+
+        """
+        try:
+            lines = path.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            self.log.exception(f'Could not read AI prefetch prompts from {path}')
+            return
+
+        prompts = [line.strip() for line in lines]
+        prompts = [prompt for prompt in prompts if prompt and not prompt.startswith('#')]
+        self.log.info(f'Prefetching {len(prompts)} AI prompts from {path}')
+        for prompt in prompts:
+            self.submit_background_request(prompt)
+
+    def get_queue_depth(self) -> dict[str, int]:
+        """Report how many submitted requests are awaiting a response, per lane.
+
+        Returns:
+            Mapping of lane name ('interactive', 'background') to request count.
+
+        """
+        depth = dict.fromkeys((priority.value for priority in AIRequestPriority), 0)
+        for priority in self.outstanding_requests.values():
+            depth[priority.value] += 1
+        return depth
+
+    def cancel_request(self, request_id: str) -> None:
+        """Cancel a pending request and any requests coalesced onto it.
+
+        Queued work is skipped by the workers; a response that is already being
+        generated is discarded when it arrives.
+
+        Args:
+            request_id: The AI request identifier to cancel.
+
+        """
+        request_ids = [request_id, *self.coalesced_requests.pop(request_id, [])]
+        for cancelled_id in request_ids:
+            self.pending_ai_requests.pop(cancelled_id, None)
+            for followers in self.coalesced_requests.values():
+                if cancelled_id in followers:
+                    followers.remove(cancelled_id)
+        self._release_in_flight_request(request_id)
+
+        if request_id not in self.outstanding_requests:
+            return
+
+        self.cancelled_requests.add(request_id)
+        self._send_control(AI_CONTROL_CANCEL, request_id)
+        self.log.info(f'Cancelled AI request {request_id}')
+
+    def _send_control(self, action: str, request_id: str) -> None:
+        """Send a control notice to every worker.
+
+        Args:
+            action: AI_CONTROL_CANCEL or AI_CONTROL_FORGET.
+            request_id: The AI request identifier it applies to.
+
+        """
+        for control_queue in self.ai_control_queues:
+            try:
+                control_queue.put((action, request_id))
+            except OSError, ValueError:
+                self.log.exception('Error sending AI control notice')
+
+    def _cancel_superseded_requests(self, keep: str | None = None) -> None:
+        """Cancel every pending interactive request except keep.
+
+        Args:
+            keep: A request ID to leave running (an identical in-flight request).
+
+        """
+        for request_id, request_state in list(self.pending_ai_requests.items()):
+            if request_id == keep or request_id not in self.pending_ai_requests:
+                continue
+            if request_state.priority is AIRequestPriority.INTERACTIVE:
+                self.cancel_request(request_id)
+
+    def _enqueue_ai_request(self, request: AIRequest) -> None:
+        """Put a request on the queue for its priority lane.
+
+        Args:
+            request: The request to enqueue.
+
+        """
+        queue = (
+            self.ai_background_queue
+            if request.priority is AIRequestPriority.BACKGROUND and self.ai_background_queue
+            else self.ai_request_queue
+        )
+        assert queue is not None
+        queue.put(request)
+        self.outstanding_requests[request.request_id] = request.priority
+        if tracer.ai:
+            tracer.emit('ai', 'AI queue depth: %s', self.get_queue_depth())
 
     def check_responses(self) -> None:
         """Check for AI responses from the worker process (called from update loop)."""
@@ -120,12 +286,50 @@ class AIManager:
             while True:
                 request_id, response = self.ai_response_queue.get_nowait()
                 self.log.info(f'Received AI response for request {request_id}')
-                self._process_ai_response(request_id, response)
+                self.outstanding_requests.pop(request_id, None)
+                if request_id in self.cancelled_requests or response.error == AI_REQUEST_CANCELLED:
+                    self.cancelled_requests.discard(request_id)
+                    # No worker will see this request again; clear it everywhere
+                    self._send_control(AI_CONTROL_FORGET, request_id)
+                    self.log.info(f'Discarding response for cancelled AI request {request_id}')
+                    continue
+                self._release_in_flight_request(request_id)
+                self._dispatch_ai_response(request_id, response)
+                self._process_coalesced_responses(request_id, response)
         except Empty:
             pass
         except OSError, ValueError, AttributeError, TypeError:
             self.log.exception('Error checking AI responses')
 
+    def _release_in_flight_request(self, request_id: str) -> None:
+        """Stop routing identical new requests onto a request that has responded.
+
+        Args:
+            request_id: The AI request identifier that received a response.
+
+        """
+        for cache_key, leader_id in list(self.in_flight_requests.items()):
+            if leader_id == request_id:
+                del self.in_flight_requests[cache_key]
+
+    def _process_coalesced_responses(self, request_id: str, response: AIResponse) -> None:
+        """Deliver a response to every request coalesced onto request_id.
+
+        Followers are held back while the leading request is still retrying,
+        so they receive its final response.
+
+        Args:
+            request_id: The leading AI request identifier.
+            response: The response received for the leading request.
+
+        """
+        if request_id in self.pending_ai_requests:
+            return
+
+        for follower_id in self.coalesced_requests.pop(request_id, []):
+            self.log.info(f'Delivering coalesced AI response to request {follower_id}')
+            self._dispatch_ai_response(follower_id, response)
+
     def cleanup(self) -> None:
         """Shut down AI worker and clean up resources."""
         self._shutdown_ai_worker()
@@ -257,7 +461,8 @@ class AIManager:
                 f'Sprite loaded - serialized for AI context ({len(last_sprite_content)} chars,'
                 f' {anim_count} animations, {frame_count} frames)',
             )
-            self.log.debug(f'Serialized sprite preview:\n{last_sprite_content[:500]}')
+            if tracer.ai:
+                tracer.emit('ai', 'Serialized sprite preview:\n%s', last_sprite_content[:500])
         except OSError, ValueError, AttributeError, TypeError:
             self.log.exception('Failed to serialize sprite')
             self.log.warning('Will use standard generation mode instead')
@@ -265,15 +470,17 @@ class AIManager:
         else:
             return (True, last_sprite_content, conversation_history)
 
-    def _submit_ai_request(
+    def _submit_ai_request(  # noqa: PLR0913
         self,
         text: str,
         messages: list[dict[str, str]],
         relevant_examples: list[dict[str, Any]],
         conversation_history: list[dict[str, str]] | None,
         last_sprite_content: str | None,
+        *,
+        priority: AIRequestPriority = AIRequestPriority.INTERACTIVE,
     ) -> None:
-        """Submit an AI sprite generation request to the worker process.
+        """Submit an AI sprite generation request to the worker pool.
 
         Args:
             text: The original user prompt.
@@ -281,16 +488,17 @@ class AIManager:
             relevant_examples: Training examples for context.
             conversation_history: Prior conversation for refinement.
             last_sprite_content: Last sprite TOML content for refinement.
+            priority: The scheduling lane for the request.
 
         """
+        interactive = priority is AIRequestPriority.INTERACTIVE
         try:
-            request_id = str(time.time())
-
-            request = AIRequest(prompt=str(messages), request_id=request_id, messages=messages)
-            self.log.info(f'Submitting AI request: {request}')
+            request_id = uuid.uuid4().hex
+            cache_key = make_cache_key(AI_MODEL, messages, relevant_examples)
 
-            assert self.ai_request_queue is not None
-            self.ai_request_queue.put(request)
+            # A new prompt supersedes older interactive work, unless it is identical
+            if interactive:
+                self._cancel_superseded_requests(keep=self.in_flight_requests.get(cache_key))
 
             self.pending_ai_requests[request_id] = AIRequestState(
                 original_prompt=text,
@@ -298,16 +506,106 @@ class AIManager:
                 training_examples=relevant_examples,
                 conversation_history=conversation_history,
                 last_sprite_content=last_sprite_content,
+                cache_key=cache_key,
+                priority=priority,
             )
 
-            if hasattr(self.editor, 'debug_text'):
+            # Serve identical requests from the cache without touching the worker
+            cached_response = self.response_cache.get(cache_key) if self.response_cache else None
+            if cached_response is not None:
+                self.log.info(f'Serving AI request {request_id} from response cache')
+                self._dispatch_ai_response(request_id, cached_response)
+                return
+
+            if self._coalesce_ai_request(request_id, cache_key, priority):
+                return
+
+            request = AIRequest(
+                prompt=str(messages),
+                request_id=request_id,
+                messages=messages,
+                cache_key=cache_key if self.response_cache else None,
+                priority=priority,
+            )
+            self.log.info(f'Submitting AI request: {request}')
+
+            self._enqueue_ai_request(request)
+            self.in_flight_requests[cache_key] = request_id
+
+            if interactive and hasattr(self.editor, 'debug_text'):
                 self.editor.debug_text.text = f'Processing AI request... (ID: {request_id})'
 
         except AttributeError, OSError, ValueError:
             self.log.exception('Error submitting AI request')
-            if hasattr(self.editor, 'debug_text'):
+            if interactive and hasattr(self.editor, 'debug_text'):
                 self.editor.debug_text.text = 'Error: Failed to submit AI request'
 
+    def _coalesce_ai_request(
+        self,
+        request_id: str,
+        cache_key: str,
+        priority: AIRequestPriority,
+    ) -> bool:
+        """Attach a request to an identical request that is still in flight.
+
+        Interactive requests are never attached to a background request, since
+        that would leave them waiting behind the background lane.
+
+        Args:
+            request_id: The new AI request identifier.
+            cache_key: The new request's response cache key.
+            priority: The new request's scheduling lane.
+
+        Returns:
+            True if the request was coalesced and must not be enqueued.
+
+        """
+        leader_id = self.in_flight_requests.get(cache_key)
+        if leader_id is None or leader_id not in self.pending_ai_requests:
+            return False
+
+        leader_priority = self.pending_ai_requests[leader_id].priority
+        if priority is AIRequestPriority.INTERACTIVE and leader_priority is not priority:
+            return False
+
+        self.log.info(f'Coalescing AI request {request_id} onto in-flight {leader_id}')
+        self.coalesced_requests.setdefault(leader_id, []).append(request_id)
+        if priority is AIRequestPriority.INTERACTIVE and hasattr(self.editor, 'debug_text'):
+            self.editor.debug_text.text = f'Processing AI request... (ID: {leader_id})'
+        return True
+
+    def submit_background_request(self, text: str) -> None:
+        """Queue a sprite generation prompt on the background lane.
+
+        Background responses are not loaded into the canvas; they populate the
+        response cache so a later interactive request for the same prompt is
+        answered immediately.
+
+        Args:
+            text: The sprite description to generate.
+
+        """
+        if not self.ai_request_queue:
+            self.log.error('AI request queue is not available')
+            return
+
+        relevant_examples = select_relevant_training_examples(text)
+        messages = build_sprite_generation_messages(
+            user_request=text.strip(),
+            training_examples=relevant_examples,
+            max_examples=3,
+            include_size_hint=True,
+            include_animation_hint=True,
+        )
+        self._submit_ai_request(
+            text,
+            messages,
+            relevant_examples,
+            None,
+            None,
+            priority=AIRequestPriority.BACKGROUND,
+        )
+
     def on_text_submit_event(self, text: str) -> None:
         """Handle text submission from MultiLineTextBox."""
         self.log.info(f"AI Sprite Generation Request: '{text}'")
@@ -320,7 +618,7 @@ class AIManager:
                 self.editor.debug_text.text = 'AI processing not available'
             return
 
-        if hasattr(self, 'ai_process') and self.ai_process and not self.ai_process.is_alive():
+        if self.ai_processes and not any(process.is_alive() for process in self.ai_processes):
             self.log.error('AI process is not alive')
             if hasattr(self.editor, 'debug_text'):
                 self.editor.debug_text.text = 'AI process not available'
@@ -356,6 +654,20 @@ class AIManager:
             last_sprite_content,
         )
 
+    def _dispatch_ai_response(self, request_id: str, response: AIResponse) -> None:
+        """Route a response to background completion or interactive processing.
+
+        Args:
+            request_id: The AI request identifier.
+            response: The response received for the request.
+
+        """
+        request_state = self.pending_ai_requests.get(request_id)
+        if request_state is not None and request_state.priority is AIRequestPriority.BACKGROUND:
+            self._finish_background_request(request_id, response)
+        else:
+            self._process_ai_response(request_id, response)
+
     def _process_ai_response(self, request_id: str, response: AIResponse) -> None:
         """Process an AI response with automatic validation-driven retry."""
         self.log.info(f'Got AI response for request {request_id}')
@@ -384,48 +696,13 @@ class AIManager:
         if not is_valid:
             self.log.warning(f'AI response validation failed: {validation_error}')
 
+            # Never replay an invalid response from the cache
+            if self.response_cache and request_state.cache_key:
+                self.response_cache.discard(request_state.cache_key)
+
             # Check if we can retry
             if request_state.retry_count < AI_VALIDATION_MAX_RETRIES:
-                # Trigger retry with targeted prompt
-                request_state.retry_count += 1
-                request_state.last_error = validation_error
-
-                self.log.info(
-                    'Retrying request (attempt'
-                    f' {request_state.retry_count + 1}/{AI_VALIDATION_MAX_RETRIES + 1})',
-                )
-
-                # Build retry prompt with specific corrections
-                retry_prompt = build_retry_prompt(request_state.original_prompt, validation_error)
-
-                # Rebuild messages with retry prompt
-                messages = build_sprite_generation_messages(
-                    user_request=retry_prompt,
-                    training_examples=request_state.training_examples,
-                    max_examples=3,
-                    include_size_hint=True,
-                    include_animation_hint=True,
-                )
-
-                # Create new request with same ID
-                retry_request = AIRequest(
-                    prompt=str(messages),
-                    request_id=request_id,  # Reuse same ID
-                    messages=messages,
-                )
-
-                # Submit retry
-                assert self.ai_request_queue is not None
-                self.ai_request_queue.put(retry_request)
-
-                # Update UI
-                if hasattr(self.editor, 'debug_text'):
-                    self.editor.debug_text.text = (
-                        f'Retrying with corrections... (attempt'
-                        f' {request_state.retry_count + 1}/{AI_VALIDATION_MAX_RETRIES + 1})\n'
-                        f'Error: {validation_error}'
-                    )
-
+                self._submit_validation_retry(request_id, request_state, validation_error)
                 # DON'T delete from pending_ai_requests - we're retrying
                 return
             # Max retries reached, load anyway and show error
@@ -445,6 +722,87 @@ class AIManager:
         if request_id in self.pending_ai_requests:
             del self.pending_ai_requests[request_id]
 
+    def _finish_background_request(self, request_id: str, response: AIResponse) -> None:
+        """Complete a background request without touching the canvas.
+
+        The worker has already stored a successful response in the cache; an
+        invalid one is evicted so it is not served to a later interactive request.
+
+        Args:
+            request_id: The AI request identifier.
+            response: The response received for the request.
+
+        """
+        request_state = self.pending_ai_requests.pop(request_id)
+        if response.content is None:
+            self.log.warning(f'Background AI request {request_id} failed: {response.error}')
+            return
+
+        is_valid, validation_error = validate_ai_response(response.content)
+        if not is_valid and self.response_cache and request_state.cache_key:
+            self.log.warning(f'Background AI response invalid: {validation_error}')
+            self.response_cache.discard(request_state.cache_key)
+            return
+
+        self.log.info(f'Background AI request {request_id} completed')
+
+    def _submit_validation_retry(
+        self,
+        request_id: str,
+        request_state: AIRequestState,
+        validation_error: str,
+    ) -> None:
+        """Resubmit a request whose response failed validation with a targeted prompt.
+
+        Args:
+            request_id: The AI request identifier (reused for the retry).
+            request_state: The tracked state of the request.
+            validation_error: The validation error from the previous response.
+
+        """
+        # Trigger retry with targeted prompt
+        request_state.retry_count += 1
+        request_state.last_error = validation_error
+
+        self.log.info(
+            'Retrying request (attempt'
+            f' {request_state.retry_count + 1}/{AI_VALIDATION_MAX_RETRIES + 1})',
+        )
+
+        # Build retry prompt with specific corrections
+        retry_prompt = build_retry_prompt(request_state.original_prompt, validation_error)
+
+        # Rebuild messages with retry prompt
+        messages = build_sprite_generation_messages(
+            user_request=retry_prompt,
+            training_examples=request_state.training_examples,
+            max_examples=3,
+            include_size_hint=True,
+            include_animation_hint=True,
+        )
+
+        # Create new request with same ID
+        retry_cache_key = make_cache_key(AI_MODEL, messages, request_state.training_examples)
+        request_state.cache_key = retry_cache_key
+        retry_request = AIRequest(
+            prompt=str(messages),
+            request_id=request_id,  # Reuse same ID
+            messages=messages,
+            cache_key=retry_cache_key if self.response_cache else None,
+            priority=request_state.priority,
+        )
+
+        # Submit retry
+        self._enqueue_ai_request(retry_request)
+
+        # Update UI
+        if hasattr(self.editor, 'debug_text'):
+            self.editor.debug_text.text = (
+                f'Retrying with corrections... (attempt'
+                f' {request_state.retry_count + 1}/{AI_VALIDATION_MAX_RETRIES + 1})\n'
+                f'Error: {validation_error}'
+            )
+
     def _log_ai_response_content(self, content: str) -> None:
         """Log AI response content for debugging."""
         # Count animations and frames in response
@@ -691,12 +1049,13 @@ class AIManager:
                 return False
 
             pixels = self.editor.canvas.pixels
-            self.log.debug(f'Checking frame content: {len(pixels)} pixels')
             if not pixels:
                 self.log.debug('No pixels found, returning False')
                 return False
 
-            # Check if any pixel is not magenta (255, 0, 255)
+            # Check if any pixel is not magenta (255, 0, 255). Without tracing
+            # the first one settles it; with tracing, count them all.
+            trace = tracer.ai
             non_magenta_count = 0
             for i, pixel in enumerate(pixels):
                 color = (
@@ -706,12 +1065,18 @@ class AIManager:
                 )
                 if color != (255, 0, 255):
                     non_magenta_count += 1
+                    if not trace:
+                        break
                     if non_magenta_count <= DEBUG_LOG_FIRST_N_PIXELS:
-                        self.log.debug(f'Found non-magenta pixel {i}: {color}')
-
-            self.log.debug(
-                f'Found {non_magenta_count} non-magenta pixels out of {len(pixels)} total',
-            )
+                        tracer.emit('ai', 'Found non-magenta pixel %d: %s', i, color)
+
+            if trace:
+                tracer.emit(
+                    'ai',
+                    'Found %d non-magenta pixels out of %d total',
+                    non_magenta_count,
+                    len(pixels),
+                )
         except AttributeError, TypeError, IndexError:
             self.log.exception('Error checking frame content')
             return False
@@ -1219,56 +1584,66 @@ pixels = \"\"\"
         return cleaned or content
 
     def _shutdown_ai_worker(self) -> None:
-        """Signal AI worker to shut down."""
+        """Signal every AI worker in the pool to shut down."""
         if hasattr(self, 'ai_request_queue') and self.ai_request_queue:
             try:
-                self.log.info('Sending shutdown signal to AI worker...')
-                self.ai_request_queue.put(None, timeout=1.0)  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]  # Sentinel for shutdown
+                self.log.info('Sending shutdown signal to AI workers...')
+                for _ in range(max(1, len(self.ai_processes))):
+                    self.ai_request_queue.put(None, timeout=1.0)  # type: ignore[arg-type] # ty: ignore[invalid-argument-type]  # Sentinel for shutdown
                 self.log.info('Shutdown signal sent successfully')
             except OSError, ValueError:
                 self.log.exception('Error sending shutdown signal')
 
     def _cleanup_ai_process(self) -> None:
-        """Clean up AI process."""
-        if not hasattr(self, 'ai_process') or not self.ai_process:
-            return
+        """Clean up all AI worker processes."""
+        for process in getattr(self, 'ai_processes', []):
+            self._cleanup_single_ai_process(process)
+
+    def _cleanup_single_ai_process(self, process: multiprocessing.Process) -> None:
+        """Join, terminate or kill one AI worker process.
 
+        Args:
+            process: The worker process to clean up.
+
+        """
         try:
             self.log.info('Waiting for AI process to finish...')
-            self.ai_process.join(timeout=2.0)  # Increased timeout
-            if self.ai_process.is_alive():
+            process.join(timeout=2.0)  # Increased timeout
+            if process.is_alive():
                 self.log.info('AI process still alive, terminating...')
-                self.ai_process.terminate()
-                self.ai_process.join(timeout=1.0)  # Longer timeout for terminate
-                if self.ai_process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)  # Longer timeout for terminate
+                if process.is_alive():
                     self.log.info('AI process still alive, force killing...')
-                    self.ai_process.kill()  # Force kill if still alive
-                    self.ai_process.join(timeout=0.5)  # Final cleanup
+                    process.kill()  # Force kill if still alive
+                    process.join(timeout=0.5)  # Final cleanup
             self.log.info('AI process cleanup completed')
         except OSError, RuntimeError, AttributeError:
             self.log.exception('Error during AI process cleanup')
         finally:
             # Ensure process is cleaned up
-            if hasattr(self, 'ai_process') and self.ai_process:
-                try:
-                    if self.ai_process.is_alive():
-                        self.log.info('Force killing remaining AI process...')
-                        self.ai_process.kill()
-                except OSError, AttributeError, RuntimeError:
-                    self.log.debug('Error during final AI process cleanup (ignored)')
+            try:
+                if process.is_alive():
+                    self.log.info('Force killing remaining AI process...')
+                    process.kill()
+            except OSError, AttributeError, RuntimeError:
+                self.log.debug('Error during final AI process cleanup (ignored)')
 
     def _cleanup_queues(self) -> None:
         """Clean up AI queues."""
-        if hasattr(self, 'ai_request_queue') and self.ai_request_queue:
-            try:
-                self.ai_request_queue.close()
-                self.log.info('AI request queue closed')
-            except OSError, ValueError:
-                self.log.exception('Error closing request queue')
-
-        if hasattr(self, 'ai_response_queue') and self.ai_response_queue:
+        queues = {
+            'request': getattr(self, 'ai_request_queue', None),
+            'background': getattr(self, 'ai_background_queue', None),
+            'response': getattr(self, 'ai_response_queue', None),
+        }
+        for index, control_queue in enumerate(getattr(self, 'ai_control_queues', [])):
+            queues[f'control {index}'] = control_queue
+
+        for name, queue in queues.items():
+            if not queue:
+                continue
             try:
-                self.ai_response_queue.close()
-                self.log.info('AI response queue closed')
+                queue.close()
+                self.log.info(f'AI {name} queue closed')
             except OSError, ValueError:
-                self.log.exception('Error closing response queue')
+                self.log.exception(f'Error closing {name} queue')
@@ -11,13 +11,17 @@ import logging
 import operator
 import time
 from http import HTTPStatus
+from queue import Empty
 from typing import TYPE_CHECKING, Any
 
 from glitchygames.ai import get_sprite_size_hint
 
+from .ai_cache import AIResponseCache
 from .constants import (
     AI_BASE_DELAY,
     AI_CAPABILITY_RESPONSE_FIELD_COUNT,
+    AI_CONTROL_CANCEL,
+    AI_CONTROL_FORGET,
     AI_MAX_CONTEXT_SIZE,
     AI_MAX_DELAY,
     AI_MAX_INPUT_TOKENS,
@@ -26,7 +30,9 @@ from .constants import (
     AI_MAX_TRAINING_EXAMPLES,
     AI_MODEL,
     AI_MODEL_DOWNLOAD_TIMEOUT,
+    AI_REQUEST_CANCELLED,
     AI_TIMEOUT,
+    AI_WORKER_POLL_INTERVAL,
     MODEL_DOWNLOAD_TIME_THRESHOLD_SECONDS,
     SPRITE_ASPECT_RATIO_TOLERANCE,
     ai_training_state,
@@ -50,6 +56,7 @@ except ImportError:
 if TYPE_CHECKING:
     import multiprocessing
     from collections.abc import Callable
+    from pathlib import Path
 
 
 def _setup_ai_worker_logging() -> logging.Logger:
@@ -615,6 +622,34 @@ def _process_ai_request(request: AIRequest, client: Any, log: logging.Logger) ->
         raise
 
 
+def _process_ai_request_cached(
+    request: AIRequest,
+    client: Any,
+    log: logging.Logger,
+    cache: AIResponseCache | None,
+) -> AIResponse:
+    """Serve a request from the response cache, falling back to the model.
+
+    Cache hits return without touching the AI client. Successful model
+    responses are stored for subsequent identical requests.
+
+    Returns:
+        AIResponse: The result.
+
+    """
+    if cache is None or not request.cache_key:
+        return _process_ai_request(request, client, log)
+
+    cached_response = cache.get(request.cache_key)
+    if cached_response is not None:
+        log.info('Serving AI request %s from response cache', request.request_id)
+        return cached_response
+
+    ai_response = _process_ai_request(request, client, log)
+    cache.put(request.cache_key, ai_response, model=AI_MODEL)
+    return ai_response
+
+
 def _score_size_match(requested_size: tuple[int, int], example: dict[str, Any]) -> int:
     """Score how well an example's size matches the requested size.
 
@@ -876,15 +911,85 @@ def _extract_response_content(response: object, log: logging.Logger) -> AIRespon
     return AIResponse(content=content)  # type: ignore[arg-type]
 
 
+def _next_ai_request(
+    request_queue: multiprocessing.Queue[AIRequest | None],
+    background_queue: multiprocessing.Queue[AIRequest] | None,
+) -> AIRequest | None:
+    """Take the next request, preferring the interactive lane over the background lane.
+
+    Args:
+        request_queue: Interactive request queue (also carries the shutdown sentinel).
+        background_queue: Background request queue, or None if this worker is interactive-only.
+
+    Returns:
+        The next request, or None when a shutdown signal was received.
+
+    """
+    if background_queue is None:
+        return request_queue.get()
+
+    while True:
+        try:
+            return request_queue.get(timeout=AI_WORKER_POLL_INTERVAL)
+        except Empty:
+            pass
+        try:
+            return background_queue.get_nowait()
+        except Empty:
+            continue
+
+
+def _drain_cancellations(
+    control_queue: multiprocessing.Queue[tuple[str, str]] | None,
+    cancelled: set[str],
+) -> None:
+    """Apply all pending control notices to the set of cancelled request IDs.
+
+    A cancel notice adds its request ID; a forget notice, sent once the
+    manager has seen the cancelled request answered, removes it again.
+
+    Args:
+        control_queue: This worker's control queue, or None if cancellation is disabled.
+        cancelled: Set of cancelled request IDs to update.
+
+    """
+    if control_queue is None:
+        return
+
+    while True:
+        try:
+            action, request_id = control_queue.get_nowait()
+        except Empty:
+            return
+        if action == AI_CONTROL_CANCEL:
+            cancelled.add(request_id)
+        elif action == AI_CONTROL_FORGET:
+            cancelled.discard(request_id)
+
+
 def run_ai_worker(
     request_queue: multiprocessing.Queue[AIRequest | None],
     response_queue: multiprocessing.Queue[tuple[str, AIResponse]],
+    cache_dir: str | Path | None = None,
+    background_queue: multiprocessing.Queue[AIRequest] | None = None,
+    control_queue: multiprocessing.Queue[tuple[str, str]] | None = None,
 ) -> None:
     """Worker process for handling AI requests.
 
+    Several workers may share the same queues to form a pool. Interactive
+    requests are always taken before background requests, and requests
+    cancelled on control_queue are skipped and answered with a cancellation
+    error instead of being sent to the model. A cancelled ID stays in the
+    set until the manager says to forget it, since a request ID can be
+    resubmitted (e.g. a validation retry) once its cancellation is handled.
+
     Args:
-        request_queue: Queue to receive requests from
+        request_queue: Queue to receive interactive requests (and the shutdown signal) from
         response_queue: Queue to send responses to
+        cache_dir: Directory of the shared AI response cache, or None to disable caching
+        background_queue: Queue of background requests, or None for an interactive-only worker
+        control_queue: Queue of (action, request ID) control notices, or None to
+            disable cancellation
 
     Raises:
         ImportError: If aisuite cannot be imported.
@@ -895,6 +1000,8 @@ def run_ai_worker(
 
     """
     log = _setup_ai_worker_logging()
+    cache = AIResponseCache(cache_dir) if cache_dir is not None else None
+    cancelled: set[str] = set()
 
     try:
         client = _initialize_ai_client(log)
@@ -903,7 +1010,7 @@ def run_ai_worker(
         request = None
         while True:
             try:
-                request = request_queue.get()
+                request = _next_ai_request(request_queue, background_queue)
                 request_count += 1
                 log.info('Processing AI request #%s', request_count)
 
@@ -911,7 +1018,15 @@ def run_ai_worker(
                     log.info('Received shutdown signal, closing AI worker')
                     break
 
-                ai_response = _process_ai_request(request, client, log)
+                _drain_cancellations(control_queue, cancelled)
+                if request.request_id in cancelled:
+                    log.info('Skipping cancelled AI request %s', request.request_id)
+                    response_queue.put(
+                        (request.request_id, AIResponse(content=None, error=AI_REQUEST_CANCELLED)),
+                    )
+                    continue
+
+                ai_response = _process_ai_request_cached(request, client, log, cache)
                 response_data = (request.request_id, ai_response)
                 response_queue.put(response_data)
                 log.info('Response sent successfully')
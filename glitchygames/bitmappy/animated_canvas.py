@@ -7,8 +7,10 @@ from typing import TYPE_CHECKING, Any, Self, override
 import pygame
 
 from glitchygames.color import RGBA_COMPONENT_COUNT
+from glitchygames.performance.tracing import tracer
 from glitchygames.sprites import BitmappySprite, SpriteFactory
 from glitchygames.sprites.animated import AnimatedSprite, SpriteFrame
+from glitchygames.sprites.animation_clock import AnimationClock
 from glitchygames.sprites.constants import DEFAULT_FILE_FORMAT
 
 from .canvas_interfaces import (
@@ -21,6 +23,7 @@ from .constants import (
     LOG,
     MIN_PIXEL_DISPLAY_SIZE,
 )
+from .pixel_ops import shift_pixel_buffer, surface_from_pixels
 from .pixel_sprite import BitmapPixelSprite
 from .utils import detect_file_format
 
@@ -207,25 +210,13 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
 
         """
         frame_width = len(frame_pixels) // self.pixels_tall if self.pixels_tall > 0 else 0
-        transparent = (255, 0, 255)
-        panned_pixels: list[tuple[int, ...]] = []
-
-        for y in range(self.pixels_tall):
-            for x in range(self.pixels_across):
-                source_x = x - self.pan_offset_x
-                source_y = y - self.pan_offset_y
-
-                if not (0 <= source_x < frame_width and 0 <= source_y < self.pixels_tall):
-                    panned_pixels.append(transparent)
-                    continue
-
-                source_index = source_y * frame_width + source_x
-                if source_index < len(frame_pixels):
-                    panned_pixels.append(frame_pixels[source_index])
-                else:
-                    panned_pixels.append(transparent)
-
-        return panned_pixels
+        return shift_pixel_buffer(
+            frame_pixels,
+            self.pixels_across,
+            self.pixels_tall,
+            (self.pan_offset_x, self.pan_offset_y),
+            source_width=frame_width,
+        )
 
     def _pan_frame_data(self) -> None:
         """Pan the frame data directly by shifting pixels within the frame."""
@@ -245,7 +236,8 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
             return
 
         frame_pixels = frame.get_pixel_data()
-        panned_pixels = self._compute_panned_pixels(frame_pixels)
+        with tracer.span('canvas', 'pan_frame_data'):
+            panned_pixels = self._compute_panned_pixels(frame_pixels)
 
         frame.set_pixel_data(panned_pixels)
         self.pixels = panned_pixels.copy()
@@ -257,7 +249,13 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
             if cache_key in self.animated_sprite._surface_cache:  # type: ignore[reportPrivateUsage]
                 del self.animated_sprite._surface_cache[cache_key]  # type: ignore[reportPrivateUsage]
 
-        self.log.debug(f'Frame data panned: offset=({self.pan_offset_x}, {self.pan_offset_y})')
+        if tracer.canvas:
+            tracer.emit(
+                'canvas',
+                'Frame data panned: offset=(%s, %s)',
+                self.pan_offset_x,
+                self.pan_offset_y,
+            )
 
     def _initialize_simple_panning(self) -> None:
         """Initialize the simple panning system for the canvas."""
@@ -290,32 +288,25 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
             return
 
         # Create panned view by shifting pixels
-        panned_pixels: list[tuple[int, ...]] = []
-
-        for y in range(self.pixels_tall):
-            for x in range(self.pixels_across):
-                # Calculate source coordinates (where to read from in original)
-                source_x = x - frame_state['pan_x']
-                source_y = y - frame_state['pan_y']
-
-                # Check if source is within bounds
-                if 0 <= source_x < self.pixels_across and 0 <= source_y < self.pixels_tall:
-                    source_index = source_y * self.pixels_across + source_x
-                    if source_index < len(frame_state['original_pixels']):
-                        panned_pixels.append(frame_state['original_pixels'][source_index])
-                    else:
-                        panned_pixels.append((255, 0, 255))  # Transparent
-                else:
-                    panned_pixels.append((255, 0, 255))  # Transparent
+        panned_pixels = shift_pixel_buffer(
+            frame_state['original_pixels'],
+            self.pixels_across,
+            self.pixels_tall,
+            (frame_state['pan_x'], frame_state['pan_y']),
+        )
 
         # Update canvas pixels with panned view
         self.pixels = panned_pixels
         self.dirty_pixels = [True] * len(self.pixels)
 
-        self.log.debug(
-            f'Applied panning view for {frame_key}: offset=({frame_state["pan_x"]},'
-            f' {frame_state["pan_y"]})',
-        )
+        if tracer.canvas:
+            tracer.emit(
+                'canvas',
+                'Applied panning view for %s: offset=(%s, %s)',
+                frame_key,
+                frame_state['pan_x'],
+                frame_state['pan_y'],
+            )
 
     def reset_panning(self) -> None:
         """Reset panning for the current frame."""
@@ -418,16 +409,8 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
                 # Static sprite - get pixels directly
                 if hasattr(self.animated_sprite, 'get_pixel_data'):
                     pixels = self.animated_sprite.get_pixel_data()  # type: ignore[union-attr] # ty: ignore[call-non-callable]
-                    self.log.debug(
-                        f'Got pixels from animated_sprite.get_pixel_data(): {len(pixels)} pixels, '  # type: ignore[arg-type]
-                        f'first few: {pixels[:5]}',
-                    )
                 elif hasattr(self.animated_sprite, 'pixels'):
                     pixels = self.animated_sprite.pixels.copy()  # type: ignore[union-attr] # ty: ignore[unresolved-attribute]
-                    self.log.debug(
-                        f'Got pixels from animated_sprite.pixels: {len(pixels)} pixels, '  # type: ignore[arg-type]
-                        f'first few: {pixels[:5]}',
-                    )
 
             # Animated sprite with frames
             current_animation = self.current_animation
@@ -444,10 +427,6 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
                 frame = self.animated_sprite._animations[current_animation][current_frame]  # type: ignore[reportPrivateUsage]
                 if hasattr(frame, 'get_pixel_data'):
                     pixels = frame.get_pixel_data()
-                    self.log.debug(
-                        f'Got pixels from frame.get_pixel_data(): {len(pixels)} pixels, '
-                        f'first few: {pixels[:5]}',
-                    )
                 else:
                     self.log.warning('Frame has no get_pixel_data method')
             else:
@@ -460,9 +439,8 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
         # Fallback to static pixels
         if not pixels:
             pixels = self.pixels.copy()
-            self.log.debug(
-                f'Using fallback canvas pixels: {len(pixels)} pixels, first few: {pixels[:5]}',
-            )
+
+        tracer.emit('canvas', 'Current frame pixels: %d', len(pixels))  # type: ignore[arg-type]
 
         # Ensure all pixels are RGBA format
         rgba_pixels: list[tuple[int, int, int, int]] = []
@@ -899,8 +877,16 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
         )
 
     def update_animation(self, dt: float) -> None:
-        """Update the animated sprite with delta time."""
+        """Update the animated sprite with delta time.
+
+        The sprite is not in the scene's all_sprites, so it is attached to the
+        scene's AnimationClock here; once attached, the clock advances it and
+        AnimatedSprite.update() leaves it alone.
+        """
         if hasattr(self, 'animated_sprite') and self.animated_sprite:
+            clock = getattr(self.parent_scene, 'animation_clock', None)
+            if isinstance(clock, AnimationClock) and self.animated_sprite not in clock:
+                clock.add(self.animated_sprite)
             self.animated_sprite.update(dt)
 
     @override
@@ -908,10 +894,10 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
         """Update the canvas sprite."""
         # Animation timing is handled by the scene's update_animation method
 
-        # Force redraw if dirty
+        # Force redraw if dirty; the dirty flag is left for the draw pass, which
+        # blits the new image and clears it
         if self.dirty:
             self.force_redraw()
-            self.dirty = 0
 
     def force_redraw(self) -> None:
         """Force a complete redraw of the canvas."""
@@ -1046,6 +1032,7 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
         for i, pixel in enumerate(frame.pixels):
             if i < width * height:
                 frame._image.set_at((i % width, i // width), pixel)  # type: ignore[reportPrivateUsage]
+        frame.revision = getattr(frame, 'revision', 0) + 1
 
         # Clear stale flag since image is now up to date
         if hasattr(frame, '_image_stale'):
@@ -1098,7 +1085,9 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
 
             self.dirty = 1
             if hasattr(self, 'parent_scene') and self.parent_scene:
-                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update()  # type: ignore[reportPrivateUsage]
+                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update(  # type: ignore[reportPrivateUsage]
+                    self.current_animation, self.current_frame
+                )
 
     def _flush_batched_drag_pixels(self) -> None:
         """Apply all batched pixel changes from a drag operation to the sprite frame."""
@@ -1184,7 +1173,9 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
                 self._update_animated_sprite_frame()
 
             if hasattr(self, 'parent_scene') and self.parent_scene:
-                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update()  # type: ignore[reportPrivateUsage]
+                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update(  # type: ignore[reportPrivateUsage]
+                    self.current_animation, self.current_frame
+                )
 
         self._cleanup_drag_state()
         self.dirty = 1
@@ -1238,7 +1229,9 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
 
             # Notify parent scene to update film strips
             if hasattr(self, 'parent_scene') and self.parent_scene:
-                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update()  # type: ignore[reportPrivateUsage]
+                self.parent_scene.film_strip_coordinator._update_film_strips_for_pixel_update(  # type: ignore[reportPrivateUsage]
+                    self.current_animation, self.current_frame
+                )
 
             # Update the animated sprite's frame data
             if hasattr(self, 'animated_sprite'):
@@ -1854,20 +1847,7 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
             A new Surface with canvas pixels rendered, with alpha support.
 
         """
-        surface = pygame.Surface((self.pixels_across, self.pixels_tall), pygame.SRCALPHA)
-        magenta_keys = {(255, 0, 255), (255, 0, 255, 255)}
-        for y in range(self.pixels_tall):
-            for x in range(self.pixels_across):
-                pixel_num = y * self.pixels_across + x
-                if pixel_num >= len(self.pixels):
-                    continue
-                color = self.pixels[pixel_num]
-                # Handle transparency key specially - keep it opaque
-                if color in magenta_keys:
-                    surface.set_at((x, y), (255, 0, 255, 255))
-                else:
-                    surface.set_at((x, y), color)
-        return surface
+        return surface_from_pixels(self.pixels, self.pixels_across, self.pixels_tall)
 
     def _update_animated_sprite_frame(self) -> None:
         """Update the animated sprite's current frame with canvas data."""
@@ -1894,7 +1874,9 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
         frame.image = self._build_surface_from_canvas_pixels()
 
         if hasattr(self, 'parent_scene') and self.parent_scene:
-            self.parent_scene.film_strip_coordinator.update_film_strips_for_animated_sprite_update()
+            self.parent_scene.film_strip_coordinator.update_film_strips_for_animated_sprite_update(
+                current_anim, current_frame
+            )
 
     def get_canvas_surface(self) -> pygame.Surface:
         """Get the current canvas surface for the film strip.
@@ -2061,7 +2043,8 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
                 self._store_original_frame_data_for_frame(frame_key)
 
             # Apply panning transformation to show panned view
-            self._apply_panning_view_for_frame(frame_key)
+            with tracer.span('canvas', 'apply_panning_view'):
+                self._apply_panning_view_for_frame(frame_key)
             self.dirty = 1
         else:
             self.log.debug('Cannot pan to (%s, %s) - out of bounds.', new_pan_x, new_pan_y)
@@ -2078,23 +2061,12 @@ class AnimatedCanvasSprite(BitmappySprite):  # noqa: PLR0904
             return
 
         # Create panned view by shifting pixels
-        panned_pixels: list[tuple[int, ...]] = []
-
-        for y in range(self.pixels_tall):
-            for x in range(self.pixels_across):
-                # Calculate source coordinates (where to read from in original)
-                source_x = x - self.pan_offset_x
-                source_y = y - self.pan_offset_y
-
-                # Check if source is within bounds
-                if 0 <= source_x < self.pixels_across and 0 <= source_y < self.pixels_tall:
-                    source_index = source_y * self.pixels_across + source_x
-                    if source_index < len(self._original_frame_pixels):
-                        panned_pixels.append(self._original_frame_pixels[source_index])
-                    else:
-                        panned_pixels.append((255, 0, 255))  # Transparent
-                else:
-                    panned_pixels.append((255, 0, 255))  # Transparent
+        panned_pixels = shift_pixel_buffer(
+            self._original_frame_pixels,
+            self.pixels_across,
+            self.pixels_tall,
+            (self.pan_offset_x, self.pan_offset_y),
+        )
 
         # Update canvas pixels with panned view
         self.pixels = panned_pixels
@@ -0,0 +1,334 @@
+"""Crash-safe autosave for the Bitmappy editor.
+
+Connects an EditJournal to the undo/redo system so that every edit is journaled
+as it is applied, takes a compacting snapshot of the document every few hundred
+edits or whenever the canvas gets a new sprite, and on startup restores a
+session that did not exit cleanly. Extracted as a subsystem manager in the same
+way as FileIOManager and AIManager.
+
+Every editor journals into its own session directory under the autosave
+directory and holds an operating-system lock on the session's lock file, next
+to the directory, while it runs. The lock is released when the process exits,
+however it exits, so a session that can be locked and still has a journal
+belongs to an editor that crashed; a session that cannot be locked belongs to
+an editor that is still running and is left alone.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import secrets
+import sys
+import time
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+import pygame
+
+from glitchygames.sprites.animated import AnimatedSprite, SpriteFrame
+
+from .history.journal import (
+    DEFAULT_SNAPSHOT_EVERY,
+    EditJournal,
+    SpriteDocument,
+    command_record,
+    has_journal,
+    recover_document,
+)
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from .history.commands import UndoRedoCommand
+    from .protocols import EditorContext
+
+# Where a recovered session is written before it is loaded into the canvas
+RECOVERED_SPRITE_FILENAME = 'recovered.toml'
+
+# Suffix of the file, beside each session directory, that its editor holds locked
+LOCK_SUFFIX = '.lock'
+
+
+def document_from_canvas(canvas: Any) -> SpriteDocument:
+    """Copy the canvas sprite into a journal document.
+
+    Only the pixel lists are copied (colors are immutable tuples), so this is
+    cheap enough to run on the UI thread; encoding happens on the writer thread.
+
+    Args:
+        canvas: The editor's AnimatedCanvasSprite.
+
+    Returns:
+        The document.
+
+    """
+    animations = {
+        name: [{'duration': frame.duration, 'pixels': frame.get_pixel_data()} for frame in frames]
+        for name, frames in canvas.animated_sprite._animations.items()  # type: ignore[reportPrivateUsage]
+    }
+
+    # Single-pixel edits land in the canvas buffer before the frame's pixel list
+    frames = animations.get(canvas.current_animation)
+    if (
+        frames
+        and 0 <= canvas.current_frame < len(frames)
+        and len(canvas.pixels) == canvas.pixels_across * canvas.pixels_tall
+        and not canvas.is_panning_active()
+    ):
+        frames[canvas.current_frame]['pixels'] = list(canvas.pixels)
+
+    return {'width': canvas.pixels_across, 'height': canvas.pixels_tall, 'animations': animations}
+
+
+def sprite_from_document(document: SpriteDocument) -> AnimatedSprite:
+    """Build an AnimatedSprite from a journal document.
+
+    Args:
+        document: A document from recover_document().
+
+    Returns:
+        The sprite, with one SpriteFrame per document frame.
+
+    """
+    size = (document['width'], document['height'])
+    sprite = AnimatedSprite()
+    sprite.name = 'recovered'
+    for name, frames in document['animations'].items():
+        sprite_frames = []
+        for frame in frames:
+            sprite_frame = SpriteFrame(surface=pygame.Surface(size), duration=frame['duration'])
+            sprite_frame.set_pixel_data([tuple(color) for color in frame['pixels']])
+            sprite_frames.append(sprite_frame)
+        sprite.add_animation(name, sprite_frames)
+    return sprite
+
+
+class SessionLock:
+    """An exclusive, non-blocking lock on an autosave session directory.
+
+    The lock file lives beside the directory rather than in it, so a new
+    session is locked before its directory exists and no other editor can find
+    the directory unlocked.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the lock.
+
+        Args:
+            directory: The session directory to lock.
+
+        """
+        self.directory = directory
+        self.path = directory.with_name(f'{directory.name}{LOCK_SUFFIX}')
+        self._file: IO[str] | None = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this lock currently holds the directory."""
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """Lock the directory unless another editor holds it.
+
+        Returns:
+            True if the lock was taken, False if it is held elsewhere.
+
+        """
+        lock_file = self.path.open('w', encoding='utf-8')
+        try:
+            if sys.platform == 'win32':
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        """Release the lock; closing the file drops it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Delete the session, whose journal must already be gone, and then the lock."""
+        with contextlib.suppress(OSError):
+            (self.directory / RECOVERED_SPRITE_FILENAME).unlink()
+        with contextlib.suppress(OSError):
+            self.directory.rmdir()
+        self.release()
+        with contextlib.suppress(OSError):
+            self.path.unlink()
+
+
+class AutosaveManager:
+    """Journal the editor's edits and restore them after a crash."""
+
+    def __init__(
+        self,
+        editor: EditorContext,
+        directory: str | Path,
+        *,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ) -> None:
+        """Initialize the AutosaveManager.
+
+        Args:
+            editor: The editor context providing access to shared state.
+            directory: Directory holding one session directory per editor.
+            snapshot_every: Edits between compacting snapshots.
+
+        """
+        self.editor = editor
+        self.directory = Path(directory)
+        self.snapshot_every = snapshot_every
+        self.journal: EditJournal | None = None
+        self.lock: SessionLock | None = None
+        self.log = logging.getLogger('game.tools.bitmappy.autosave')
+        self.log.addHandler(logging.NullHandler())
+        self._journaled_sprite: AnimatedSprite | None = None
+
+    def start(self) -> None:
+        """Claim a session, restoring one that did not exit cleanly, then start journaling."""
+        try:
+            session, orphaned = self._claim_session()
+        except OSError:
+            self.log.exception('Could not start an autosave session in %s', self.directory)
+            return
+
+        self.journal = EditJournal(session, snapshot_every=self.snapshot_every)
+        if orphaned:
+            self._restore_session()
+        self.editor.undo_redo_manager.set_command_callback(self.on_command)
+        self._snapshot()
+
+    def on_command(
+        self,
+        command: UndoRedoCommand,
+        undo: bool,  # noqa: FBT001 - matches the UndoRedoManager command callback
+        frame: tuple[str, int] | None,
+    ) -> None:
+        """Journal a command the undo/redo system just applied.
+
+        Args:
+            command: The command.
+            undo: True if the command was undone.
+            frame: The command's (animation, frame), or None for global commands.
+
+        """
+        if self.journal is None or self._journaled_sprite is None:
+            return
+        try:
+            record = command_record(command, undo=undo, frame=frame or self._editing_frame())
+        except AttributeError, KeyError, TypeError, ValueError:
+            self.log.exception('Could not journal %s', command.description)
+            return
+        if record is not None:
+            self.journal.append(record)
+
+    def update(self) -> None:
+        """Take a snapshot when one is due or the canvas has a different sprite."""
+        sprite = getattr(getattr(self.editor, 'canvas', None), 'animated_sprite', None)
+        if sprite is None or self.journal is None:
+            return
+        if sprite is not self._journaled_sprite or self.journal.snapshot_due:
+            self._snapshot()
+
+    def close(self) -> None:
+        """Stop journaling and remove the session after a clean exit."""
+        self.editor.undo_redo_manager.set_command_callback(None)
+        if self.journal is not None:
+            self.journal.close(discard=True)
+        if self.lock is not None:
+            self.lock.discard()
+            self.lock = None
+        self.journal = None
+        self._journaled_sprite = None
+
+    def _claim_session(self) -> tuple[Path, bool]:
+        """Lock the newest orphaned session directory, or create a new one.
+
+        Unlocked directories without a journal are leftovers and are removed.
+
+        Returns:
+            The locked session directory, and whether it holds an orphaned journal.
+
+        Raises:
+            OSError: If a new session directory cannot be created and locked.
+
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sessions = [path for path in self.directory.iterdir() if path.is_dir()]
+        sessions.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        for session in sessions:
+            lock = SessionLock(session)
+            if not lock.acquire():
+                continue  # Another editor is running this session
+            if has_journal(session):
+                self.lock = lock
+                return session, True
+            lock.discard()
+
+        name = f'{time.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}-{secrets.token_hex(2)}'
+        session = self.directory / name
+        lock = SessionLock(session)
+        if not lock.acquire():
+            message = f'Autosave session {session} is already in use'
+            raise OSError(message)
+        session.mkdir()
+        self.lock = lock
+        return session, False
+
+    def _editing_frame(self) -> tuple[str, int] | None:
+        """Get the frame that canvas edits currently apply to.
+
+        Returns:
+            The canvas's (animation, frame), or None without a canvas.
+
+        """
+        canvas = getattr(self.editor, 'canvas', None)
+        if canvas is None:
+            return None
+        return (canvas.current_animation, canvas.current_frame)
+
+    def _snapshot(self) -> None:
+        """Queue a snapshot of the canvas sprite, starting the journal if needed."""
+        canvas = getattr(self.editor, 'canvas', None)
+        sprite = getattr(canvas, 'animated_sprite', None)
+        if sprite is None or self.journal is None:
+            return
+        try:
+            document = document_from_canvas(canvas)
+        except AttributeError, IndexError, KeyError, TypeError, pygame.error:
+            self.log.exception('Could not snapshot the canvas for autosave')
+            return
+
+        if self._journaled_sprite is None:
+            self.journal.start(document)
+        else:
+            self.journal.snapshot(document)
+        self._journaled_sprite = sprite
+
+    def _restore_session(self) -> None:
+        """Replay the orphaned session's journal and load the result into the canvas."""
+        assert self.journal is not None
+        document = recover_document(self.journal.directory)
+        if document is None:
+            return
+
+        path = self.journal.directory / RECOVERED_SPRITE_FILENAME
+        try:
+            sprite_from_document(document).save(str(path), 'toml')
+        except OSError, KeyError, TypeError, ValueError, pygame.error:
+            self.log.exception('Could not write the recovered sprite')
+            return
+
+        self.log.info('Restoring unsaved work from %s', path)
+        self.editor.canvas.on_load_file_event(str(path))
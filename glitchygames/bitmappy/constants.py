@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from pathlib import Path
 from typing import Any
 
 from glitchygames.sprites import BitmappySprite
@@ -66,6 +68,12 @@ AI_VALIDATION_MAX_RETRIES = 2  # Maximum retries for AI response validation
 AI_MODEL: str = 'anthropic:claude-sonnet-4-5'
 AI_TIMEOUT = 600  # Seconds to wait for AI response (10 minutes for ollama models)
 AI_QUEUE_SIZE = 10
+AI_WORKER_POOL_SIZE = 2  # Worker processes; the first is reserved for interactive requests
+AI_WORKER_POLL_INTERVAL = 0.1  # Seconds a worker waits for interactive work before background
+AI_REQUEST_CANCELLED = 'Request cancelled'  # Error reported for skipped (cancelled) requests
+# Control-queue notices: skip a request, or stop tracking a handled cancellation
+AI_CONTROL_CANCEL = 'cancel'
+AI_CONTROL_FORGET = 'forget'
 AI_MAX_CONTEXT_SIZE = 65536  # Total context window size
 AI_MAX_INPUT_TOKENS = 8192  # Maximum tokens for INPUT (prompts, examples)
 AI_MAX_OUTPUT_TOKENS = 64000  # Maximum tokens for OUTPUT (AI response, large sprites)
@@ -79,6 +87,23 @@ AI_MAX_DELAY = 60.0  # Maximum delay between retries
 # Model download timeout (much longer for initial model download)
 AI_MODEL_DOWNLOAD_TIMEOUT = 1800  # 30 minutes for model download
 
+# On-disk AI response cache (set GLITCHYGAMES_AI_CACHE_DIR to relocate it)
+AI_RESPONSE_CACHE_DIR = Path(
+    os.environ.get(
+        'GLITCHYGAMES_AI_CACHE_DIR',
+        Path.home() / '.cache' / 'glitchygames' / 'ai_responses',
+    ),
+)
+
+# Crash-recovery journals for unsaved edits, one locked session directory per
+# running editor (set GLITCHYGAMES_AUTOSAVE_DIR to relocate them)
+AUTOSAVE_DIR = Path(
+    os.environ.get(
+        'GLITCHYGAMES_AUTOSAVE_DIR',
+        Path.home() / '.cache' / 'glitchygames' / 'bitmappy_autosave',
+    ),
+)
+
 # AI training state (module-level global)
 ai_training_state: dict[str, list[dict[str, Any]] | str | None] = {
     'data': [],
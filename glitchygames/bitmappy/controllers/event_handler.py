@@ -244,11 +244,12 @@ class ControllerEventHandler:  # noqa: PLR0904
             event (pygame.event.Event): The controller button down event.
 
         """
-        # Scan for controllers and update manager
-        self.editor.multi_controller_manager.scan_for_controllers()
+        # A controller whose device event arrived while another scene was
+        # active is picked up on its first button press
+        instance_id = event.instance_id
+        self.editor.multi_controller_manager.track_controller(instance_id)
 
         # Get controller info
-        instance_id = event.instance_id
         controller_info = self.editor.multi_controller_manager.get_controller_info(instance_id)
 
         if not controller_info:
@@ -313,6 +314,32 @@ class ControllerEventHandler:  # noqa: PLR0904
         if strategy is not None:
             strategy.handle_button_up(controller_id, event.button)
 
+    # ──────────────────────────────────────────────────────────────────────
+    # Device hot-plug handling
+    # ──────────────────────────────────────────────────────────────────────
+
+    def on_device_added_event(self, event: events.HashableEvent) -> None:
+        """Track a controller from a JOYDEVICEADDED or CONTROLLERDEVICEADDED event.
+
+        Args:
+            event (pygame.event.Event): The device added event.
+
+        """
+        instance_id = self.editor.multi_controller_manager.handle_device_added(
+            event.device_index,
+        )
+        self.log.debug(f'Controller device added: instance {instance_id}')
+
+    def on_device_removed_event(self, event: events.HashableEvent) -> None:
+        """Stop tracking a controller from a JOYDEVICEREMOVED or CONTROLLERDEVICEREMOVED event.
+
+        Args:
+            event (pygame.event.Event): The device removed event.
+
+        """
+        self.editor.multi_controller_manager.handle_device_removed(event.instance_id)
+        self.log.debug(f'Controller device removed: instance {event.instance_id}')
+
     # ──────────────────────────────────────────────────────────────────────
     # Joystick event handling
     # ──────────────────────────────────────────────────────────────────────
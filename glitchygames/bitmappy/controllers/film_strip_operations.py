@@ -457,19 +457,16 @@ class FilmStripOperations:
         # For now, we'll use a placeholder position
         position = (100 + controller_id * 50, 100)
 
-        # Add or update visual indicator
-        if controller_id not in self.handler.editor.visual_collision_manager.indicators:
-            self.handler.editor.visual_collision_manager.add_controller_indicator(
-                controller_id,
-                controller_info.instance_id,
-                controller_info.color,
-                position,
-            )
-        else:
-            self.handler.editor.visual_collision_manager.update_controller_position(
-                controller_id,
-                position,
-            )
+        # Add or move the visual indicator
+        from glitchygames.bitmappy.indicators.collision import LocationType
+
+        self.handler.editor.optimized_visual_collision_manager.place_controller_indicator(
+            controller_id,
+            controller_info.instance_id,
+            controller_info.color,
+            position,
+            LocationType.FILM_STRIP,
+        )
 
     # ------------------------------------------------------------------
     # Onion skinning and frame visibility
@@ -745,7 +742,6 @@ class FilmStripOperations:
             f'DEBUG: Found {len(active_controllers)} active controllers to preserve',
         )
 
-        self.handler.editor.multi_controller_manager.scan_for_controllers()
         controller_count = len(self.handler.editor.multi_controller_manager.controllers)
         self.handler.log.debug(f'DEBUG: Found {controller_count} controllers in manager')
 
@@ -6,6 +6,7 @@ visual distinction.
 
 Features:
 - Automatic controller assignment on first button press
+- Event-driven hot-plug tracking from device added/removed events
 - Controller reconnection handling
 - Status tracking and display
 - Event routing to appropriate controllers
@@ -82,8 +83,6 @@ class MultiControllerManager:
         self.assigned_controllers: dict[int, int] = {}  # instance_id -> controller_id
         self.next_controller_id = 0
         self.next_color_index = 0  # Track color assignment order
-        self.last_scan_time = 0
-        self.scan_interval = 1.0  # seconds
         self._initialized = True
 
         LOG.debug('MultiControllerManager singleton initialized')
@@ -101,18 +100,16 @@ class MultiControllerManager:
         return cls._instance
 
     def scan_for_controllers(self) -> list[int]:
-        """Scan for connected controllers and return list of instance IDs.
+        """Resynchronize the controller set with every connected device.
+
+        This probes each joystick index, so it is meant for one-off
+        resynchronization. Hot-plugging is tracked from device events by
+        handle_device_added() and handle_device_removed().
 
         Returns:
             List of controller instance IDs that are connected
 
         """
-        current_time = time.time()
-        if current_time - self.last_scan_time < self.scan_interval:
-            return list(self.controllers.keys())
-
-        self.last_scan_time = current_time
-
         # Get all connected controllers
         connected_instance_ids: list[int] = []
         for i in range(pygame.joystick.get_count()):
@@ -132,11 +129,51 @@ class MultiControllerManager:
 
         # Add new controllers
         for instance_id in connected_instance_ids:
-            if instance_id not in self.controllers:
-                self._handle_controller_connect(instance_id)
+            self.track_controller(instance_id)
 
         return connected_instance_ids
 
+    def handle_device_added(self, device_index: int) -> int | None:
+        """Track the controller from a JOYDEVICEADDED or CONTROLLERDEVICEADDED event.
+
+        pygame reports a game controller through both events, so adding the
+        same device twice is harmless.
+
+        Args:
+            device_index: The device index from the event
+
+        Returns:
+            The controller's instance ID, or None if the device is already gone
+
+        """
+        try:
+            instance_id = pygame.joystick.Joystick(device_index).get_instance_id()
+        except pygame.error:
+            LOG.debug('Device %s disappeared before it could be tracked', device_index)
+            return None
+
+        self.track_controller(instance_id)
+        return instance_id
+
+    def handle_device_removed(self, instance_id: int) -> None:
+        """Forget the controller from a JOYDEVICEREMOVED or CONTROLLERDEVICEREMOVED event.
+
+        Args:
+            instance_id: The controller instance ID from the event
+
+        """
+        self._handle_controller_disconnect(instance_id)
+
+    def track_controller(self, instance_id: int) -> None:
+        """Start tracking a connected controller if it is not tracked yet.
+
+        Args:
+            instance_id: The controller instance ID
+
+        """
+        if instance_id not in self.controllers:
+            self._handle_controller_connect(instance_id)
+
     def _handle_controller_connect(self, instance_id: int) -> None:
         """Handle a new controller connection."""
         controller_id = self._get_next_controller_id()
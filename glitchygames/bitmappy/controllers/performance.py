@@ -14,6 +14,8 @@ from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from glitchygames.bitmappy.indicators.collision import LocationType
+
 if TYPE_CHECKING:
     from glitchygames.bitmappy.controllers.manager import MultiControllerManager
     from glitchygames.bitmappy.controllers.selection import ControllerSelection
@@ -288,6 +290,7 @@ class OptimizedVisualCollisionManager:
         instance_id: int,
         color: tuple[int, int, int],
         position: tuple[int, int],
+        location_type: LocationType = LocationType.FILM_STRIP,
     ) -> None:
         """Add controller indicator with performance optimization.
 
@@ -296,12 +299,22 @@ class OptimizedVisualCollisionManager:
             instance_id: Instance ID
             color: Color tuple
             position: Position tuple
+            location_type: Location type for the indicator
 
         """
         start_time = time.time()
 
+        # A pending move for this controller is superseded by the new indicator
+        self.pending_updates.pop(controller_id, None)
+
         # Use base manager
-        self.base_manager.add_controller_indicator(controller_id, instance_id, color, position)
+        self.base_manager.add_controller_indicator(
+            controller_id,
+            instance_id,
+            color,
+            position,
+            location_type,
+        )
 
         # Cache position if enabled
         if self.enable_caching:
@@ -347,6 +360,65 @@ class OptimizedVisualCollisionManager:
         duration = time.time() - start_time
         self.performance_monitor.record_operation('update_controller_position', duration)
 
+    def place_controller_indicator(
+        self,
+        controller_id: int,
+        instance_id: int,
+        color: tuple[int, int, int],
+        position: tuple[int, int],
+        location_type: LocationType,
+    ) -> None:
+        """Show a controller's indicator at a position, reusing it if possible.
+
+        A controller that already has an indicator in this location is moved,
+        which is throttled and only regroups the positions it left and joined.
+        Otherwise its old indicator is replaced.
+
+        Args:
+            controller_id: Controller ID
+            instance_id: Instance ID
+            color: Color tuple
+            position: Position tuple
+            location_type: Location type for the indicator
+
+        """
+        indicator = self.base_manager.indicators.get(controller_id)
+        if (
+            indicator is None
+            or indicator.location_type != location_type
+            or indicator.color != color
+            or indicator.instance_id != instance_id
+        ):
+            self.base_manager.remove_controller_indicator(controller_id)
+            self.add_controller_indicator(
+                controller_id,
+                instance_id,
+                color,
+                position,
+                location_type,
+            )
+            return
+
+        if self.pending_updates.get(controller_id, indicator.position) == position:
+            return
+        self.update_controller_position(controller_id, position)
+
+    def flush_pending_updates(self) -> None:
+        """Apply the moves held back by the update throttle.
+
+        Call once per frame, before drawing, so the last move of a controller
+        that has stopped is not left pending.
+        """
+        if not self.pending_updates:
+            return
+
+        pending, self.pending_updates = self.pending_updates, {}
+        for controller_id, position in pending.items():
+            self.base_manager.update_controller_position(controller_id, position)
+            if self.enable_caching:
+                self.position_cache.set_position(controller_id, 'default', 0, position)
+        self.last_update_time = time.time()
+
     def optimize_positioning(self) -> None:
         """Optimize positioning with performance monitoring."""
         start_time = time.time()
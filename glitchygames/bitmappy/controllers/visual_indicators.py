@@ -40,6 +40,10 @@ class VisualIndicators:
         """
         self.handler = handler
 
+        # What the slider indicator sprites were last built from, so they are
+        # only recreated when a controller joins, leaves or recolors
+        self._slider_layout: tuple[object, ...] | None = None
+
     # ------------------------------------------------------------------
     # Canvas visual indicator update
     # ------------------------------------------------------------------
@@ -62,14 +66,11 @@ class VisualIndicators:
             return
 
         # Update visual indicator
-        if hasattr(self.handler.editor, 'visual_collision_manager'):
-            # Remove old indicator
-            self.handler.editor.visual_collision_manager.remove_controller_indicator(controller_id)
-
-            # Add new canvas indicator
+        if hasattr(self.handler.editor, 'optimized_visual_collision_manager'):
             from glitchygames.bitmappy.indicators.collision import LocationType
 
-            self.handler.editor.visual_collision_manager.add_controller_indicator(
+            # Moves the existing canvas indicator instead of rebuilding it
+            self.handler.editor.optimized_visual_collision_manager.place_controller_indicator(
                 controller_id,
                 controller_info.instance_id,
                 controller_info.color,
@@ -183,18 +184,16 @@ class VisualIndicators:
             location_type: The LocationType for the indicator.
 
         """
-        if not hasattr(self.handler.editor, 'visual_collision_manager'):
-            self.handler.log.debug('DEBUG: No visual_collision_manager found')
+        if not hasattr(self.handler.editor, 'optimized_visual_collision_manager'):
+            self.handler.log.debug('DEBUG: No optimized_visual_collision_manager found')
             return
 
         self.handler.log.debug(
             f'DEBUG: Adding new indicator for controller {controller_id} at {position} with'
             f' location type {location_type}',
         )
-        # Remove any existing indicator for this controller first
-        self.handler.editor.visual_collision_manager.remove_controller_indicator(controller_id)
-        # Add new indicator for the new mode
-        self.handler.editor.visual_collision_manager.add_controller_indicator(
+        # Replaces the controller's indicator from its previous mode
+        self.handler.editor.optimized_visual_collision_manager.place_controller_indicator(
             controller_id,
             controller_info.instance_id,
             controller_info.color,
@@ -282,27 +281,8 @@ class VisualIndicators:
 
     def render_visual_indicators(self) -> None:
         """Render visual indicators for multi-controller system."""
-        # Initialize controller selections if needed
-        if not hasattr(self.handler.editor, 'controller_selections'):
-            self.handler.editor.controller_selections = {}
-
-        # Initialize mode switcher if needed
-        if not hasattr(self.handler.editor, 'mode_switcher'):
-            from glitchygames.bitmappy.controllers.modes import ModeSwitcher
-
-            self.handler.editor.mode_switcher = ModeSwitcher()
-
-        # Initialize multi-controller manager if needed
-        if not hasattr(self.handler.editor, 'multi_controller_manager'):
-            from glitchygames.bitmappy.controllers.manager import MultiControllerManager
-
-            self.handler.editor.multi_controller_manager = MultiControllerManager()
-
-        # Scan for new controllers
-        if hasattr(self.handler.editor, 'multi_controller_manager'):
-            self.handler.editor.multi_controller_manager.scan_for_controllers()
-
-        # Register any new controllers
+        # The manager tracks hot-plugging from device events, so only
+        # controllers it already knows about need registering here
         self._register_new_controllers()
 
         # Get the screen surface
@@ -310,6 +290,10 @@ class VisualIndicators:
         if not screen:
             return
 
+        # Apply indicator moves held back by the throttle this frame
+        if hasattr(self.handler.editor, 'optimized_visual_collision_manager'):
+            self.handler.editor.optimized_visual_collision_manager.flush_pending_updates()
+
         # Update all slider indicators with collision avoidance
         self._update_all_slider_indicators()
 
@@ -418,17 +402,60 @@ class VisualIndicators:
 
     def _update_all_slider_indicators(self) -> None:
         """Update all slider indicators with collision avoidance."""
+        slider_groups = self._group_controllers_by_slider()
+
+        # The sprites only depend on who is on which slider and where the
+        # sliders are, so keep them while neither has changed
+        layout = self._get_slider_layout(slider_groups)
+        expected_ids = {
+            controller['controller_id']
+            for controllers in slider_groups.values()
+            for controller in controllers
+        }
+        if layout == self._slider_layout and expected_ids == set(self.handler.slider_indicators):
+            return
+        self._slider_layout = layout
+
         # Clear all existing slider indicators
         for controller_id in list(self.handler.slider_indicators.keys()):
             self._remove_slider_indicator(controller_id)
 
-        slider_groups = self._group_controllers_by_slider()
-
         # Create indicators for each slider with collision avoidance
         for slider_mode, controllers in slider_groups.items():
             if controllers and len(controllers) > 0:
                 self._create_slider_indicators_with_collision_avoidance(slider_mode, controllers)
 
+    def _get_slider_layout(
+        self,
+        slider_groups: dict[str, list[dict[str, Any]]],
+    ) -> tuple[object, ...]:
+        """Summarize what the slider indicator sprites are built from.
+
+        Args:
+            slider_groups: Controllers grouped by slider mode.
+
+        Returns:
+            A hashable snapshot of each slider's controllers and rect.
+
+        """
+        slider_attributes = {
+            'r_slider': 'red_slider',
+            'g_slider': 'green_slider',
+            'b_slider': 'blue_slider',
+        }
+        layout: list[object] = []
+        for slider_mode, controllers in slider_groups.items():
+            slider = getattr(self.handler.editor, slider_attributes[slider_mode], None)
+            rect = getattr(slider, 'rect', None)
+            layout.append((
+                slider_mode,
+                tuple(rect) if isinstance(rect, pygame.Rect | pygame.FRect) else None,
+                tuple(
+                    (controller['controller_id'], controller['color']) for controller in controllers
+                ),
+            ))
+        return tuple(layout)
+
     def _group_controllers_by_slider(
         self,
     ) -> dict[str, list[dict[str, Any]]]:
@@ -574,26 +601,37 @@ class VisualIndicators:
     # ------------------------------------------------------------------
 
     def _update_film_strip_controller_selections(self) -> None:
-        """Update film strip controller selections for all animations."""
-        self.handler.film_strip_controller_selections.clear()
+        """Update film strip controller selections for all animations.
 
-        if not hasattr(self.handler.editor, 'controller_selections'):
-            return
+        The shared dictionary is only rewritten when a selection changed.
+        """
+        film_strip_selections: dict[str, dict[int, dict[str, Any]]] = {}
 
-        selections = self.handler.editor.controller_selections
-        for controller_id, controller_selection in selections.items():
-            self._process_film_strip_controller_selection(controller_id, controller_selection)
+        if hasattr(self.handler.editor, 'controller_selections'):
+            selections = self.handler.editor.controller_selections
+            for controller_id, controller_selection in selections.items():
+                self._process_film_strip_controller_selection(
+                    controller_id,
+                    controller_selection,
+                    film_strip_selections,
+                )
+
+        if film_strip_selections != self.handler.film_strip_controller_selections:
+            self.handler.film_strip_controller_selections.clear()
+            self.handler.film_strip_controller_selections.update(film_strip_selections)
 
     def _process_film_strip_controller_selection(
         self,
         controller_id: int,
         controller_selection: ControllerSelection,
+        film_strip_selections: dict[str, dict[int, dict[str, Any]]],
     ) -> None:
         """Process a single controller selection for film strip mode.
 
         Args:
             controller_id: The controller ID.
             controller_selection: The controller selection object.
+            film_strip_selections: The selections being collected, by animation.
 
         """
         if not controller_selection.is_active():
@@ -617,10 +655,7 @@ class VisualIndicators:
             return
 
         # Group by animation
-        if animation not in self.handler.film_strip_controller_selections:
-            self.handler.film_strip_controller_selections[animation] = {}
-
-        self.handler.film_strip_controller_selections[animation][controller_id] = {
+        film_strip_selections.setdefault(animation, {})[controller_id] = {
             'controller_id': controller_id,
             'frame': frame,
             'color': controller_info.color,
@@ -637,17 +672,16 @@ class VisualIndicators:
 
         canvas_controllers = self._collect_canvas_controllers()
 
-        if canvas_controllers:
-            self.handler.canvas_controller_indicators = canvas_controllers
-            if hasattr(self.handler.editor.canvas, 'canvas_interface'):
-                self.handler.editor.canvas.canvas_interface.controller_indicators = (  # type: ignore[attr-defined] # ty: ignore[invalid-assignment]
-                    canvas_controllers
-                )
-            self.handler.editor.canvas.force_redraw()
-        else:
-            self.handler.canvas_controller_indicators = []
-            if hasattr(self.handler.editor.canvas, 'canvas_interface'):
-                self.handler.editor.canvas.canvas_interface.controller_indicators = []  # type: ignore[attr-defined] # ty: ignore[invalid-assignment]
+        # The canvas only needs redrawing when an indicator moved, appeared or left
+        if canvas_controllers == self.handler.canvas_controller_indicators:
+            return
+
+        self.handler.canvas_controller_indicators = canvas_controllers
+        if hasattr(self.handler.editor.canvas, 'canvas_interface'):
+            self.handler.editor.canvas.canvas_interface.controller_indicators = (  # type: ignore[attr-defined] # ty: ignore[invalid-assignment]
+                canvas_controllers
+            )
+        self.handler.editor.canvas.force_redraw()
 
     def _collect_canvas_controllers(self) -> list[dict[str, Any]]:
         """Collect all active controllers in canvas mode with their positions.
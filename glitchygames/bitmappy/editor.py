@@ -29,12 +29,16 @@ from glitchygames.ui.dialogs import (
 
 from .ai_manager import AIManager
 from .animated_canvas import AnimatedCanvasSprite  # noqa: TC001 - re-exported for test imports
+from .autosave import AutosaveManager
 from .constants import (
+    AI_WORKER_POOL_SIZE,
+    AUTOSAVE_DIR,
     LOG,
     MIN_FILM_STRIPS_FOR_PANEL_POSITIONING,
 )
 from .controllers.event_handler import ControllerEventHandler
 from .controllers.manager import MultiControllerManager
+from .controllers.performance import OptimizedVisualCollisionManager
 from .editor_setup import EditorSetup
 from .file_io import FileIOManager
 from .film_strip_coordinator import FilmStripCoordinator
@@ -258,18 +262,30 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
 
         self.mode_switcher = ModeSwitcher()
         self.visual_collision_manager = VisualCollisionManager()
+        # Live indicator updates go through the wrapper, which coalesces moves
+        # and is flushed once per frame when the indicators are rendered
+        self.optimized_visual_collision_manager = OptimizedVisualCollisionManager(
+            self.visual_collision_manager,
+        )
 
         # Selected frame visibility toggle for canvas comparison
         self.selected_frame_visible = True
 
         # Initialize extracted subsystem managers
         self._file_io = FileIOManager(self)
-        self._ai_integration = AIManager(self)
+        self._ai_integration = AIManager(
+            self,
+            pool_size=options.get('ai_workers', AI_WORKER_POOL_SIZE),
+            prefetch_path=options.get('ai_prefetch'),
+        )
         self._slider_manager = SliderManager(self)
         self._frame_operations = FrameOperationManager(self)
         self.controller_handler = ControllerEventHandler(self)
         self.mode_switcher.set_handler(self.controller_handler)
         self.film_strip_coordinator = FilmStripCoordinator(self)
+        self._autosave = (
+            AutosaveManager(self, options['autosave_dir']) if options.get('autosave_dir') else None
+        )
 
         # Set up all components via the setup delegate
         self._setup.setup_menu_bar()
@@ -322,6 +338,18 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
             self.log.info(f'Unhandled Menu Item: {event.menu.name}')
         self.dirty = 1
 
+    @override
+    def on_voice_command_event(self: Self, event: events.HashableEvent) -> None:
+        """Run a recognized voice command on the main thread.
+
+        Args:
+            event (pygame.event.Event): The pygame event.
+
+        """
+        voice_manager = getattr(self, 'voice_manager', None)
+        if voice_manager is not None:
+            voice_manager.on_voice_command_event(event)
+
     # NB: Keepings this around causes GG-7 not to manifest... curious.
     # This function is extraneous now that on_new_canvas_dialog_event exists.
     #
@@ -844,6 +872,8 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
         """Set up the bitmap editor scene."""
         super().setup()
         self._ai_integration.setup()
+        if self._autosave is not None:
+            self._autosave.start()
 
     def _update_animated_canvas(self) -> None:
         """Update the animated canvas with delta time, film strips, and frame transitions."""
@@ -905,6 +935,9 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
         # Check for AI responses
         self._ai_integration.check_responses()
 
+        if self._autosave is not None:
+            self._autosave.update()
+
     def _cleanup_voice_recognition(self) -> None:
         """Clean up voice recognition resources.
 
@@ -941,6 +974,9 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
 
         self._ai_integration.cleanup()
 
+        if self._autosave is not None:
+            self._autosave.close()
+
         # Clean up voice recognition
         self._cleanup_voice_recognition()
 
@@ -1363,6 +1399,30 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
             help='print the game version and exit',
         )
         parser.add_argument('-s', '--size', default='32x32')
+        parser.add_argument(
+            '--ai-workers',
+            type=int,
+            default=AI_WORKER_POOL_SIZE,
+            help='number of AI worker processes, 0 to disable AI (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--ai-prefetch',
+            metavar='PROMPTS_FILE',
+            help='generate the prompts in this file (one per line) in the background '
+            'so later requests for them are answered from the cache',
+        )
+        parser.add_argument(
+            '--autosave-dir',
+            default=str(AUTOSAVE_DIR),
+            help='directory for the crash-recovery journal (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--no-autosave',
+            dest='autosave_dir',
+            action='store_const',
+            const=None,
+            help='do not journal edits for crash recovery',
+        )
 
     @override
     def _handle_scene_key_events(self, event: events.HashableEvent) -> None:
@@ -1574,6 +1634,26 @@ class BitmapEditorScene(Scene):  # noqa: PLR0904
         """Handle controller axis motion events by delegating to ControllerEventHandler."""
         self.controller_handler.on_controller_axis_motion_event(event)
 
+    @override
+    def on_joy_device_added_event(self, event: events.HashableEvent) -> None:
+        """Handle joystick hot-plug events by delegating to ControllerEventHandler."""
+        self.controller_handler.on_device_added_event(event)
+
+    @override
+    def on_joy_device_removed_event(self, event: events.HashableEvent) -> None:
+        """Handle joystick unplug events by delegating to ControllerEventHandler."""
+        self.controller_handler.on_device_removed_event(event)
+
+    @override
+    def on_controller_device_added_event(self, event: events.HashableEvent) -> None:
+        """Handle controller hot-plug events by delegating to ControllerEventHandler."""
+        self.controller_handler.on_device_added_event(event)
+
+    @override
+    def on_controller_device_removed_event(self, event: events.HashableEvent) -> None:
+        """Handle controller unplug events by delegating to ControllerEventHandler."""
+        self.controller_handler.on_device_removed_event(event)
+
 
 def main() -> None:
     """Run the main function.
@@ -273,6 +273,20 @@ class FilmStripWidget:  # noqa: PLR0904
         if hasattr(self, 'film_strip_sprite') and self.film_strip_sprite:
             self.film_strip_sprite.dirty = 1
 
+    def invalidate_frame(self, animation: str, frame_index: int | None = None) -> None:
+        """Rebuild one frame's thumbnail on the next render.
+
+        Cheaper than a layout update when only a frame's pixels changed: the
+        other thumbnails are drawn from the renderer's cache.
+
+        Args:
+            animation: The animation whose frame changed.
+            frame_index: The frame that changed, or None for the whole animation.
+
+        """
+        self.renderer.invalidate_thumbnail(animation, frame_index)
+        self.mark_dirty()
+
     # ---- Forwarding methods for backward compatibility ----
     # These preserve the existing external API so callers don't need to change.
 
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 import pygame
 
+from glitchygames.performance.tracing import tracer
 from glitchygames.sprites.animated import AnimatedSprite, SpriteFrame
 
 from .constants import (
@@ -1072,18 +1073,25 @@ class FilmStripCoordinator:  # noqa: PLR0904
 
         """
         if not hasattr(self.editor, 'film_strip_sprites') or not self.editor.film_strip_sprites:
-            self.log.debug('No film strip sprites available for mouse pos %s', mouse_pos)
+            if tracer.film_strip:
+                tracer.emit('film_strip', 'No film strip sprites for mouse pos %s', mouse_pos)
             return False
 
         # Check if mouse is within any film strip sprite bounds
         for anim_name, film_strip_sprite in self.editor.film_strip_sprites.items():
             if film_strip_sprite.rect.collidepoint(mouse_pos):
-                self.log.debug(
-                    f"Mouse {mouse_pos} is in film strip '{anim_name}' at {film_strip_sprite.rect}",
-                )
+                if tracer.film_strip:
+                    tracer.emit(
+                        'film_strip',
+                        "Mouse %s is in film strip '%s' at %s",
+                        mouse_pos,
+                        anim_name,
+                        film_strip_sprite.rect,
+                    )
                 return True
 
-        self.log.debug('Mouse %s is not in any film strip area', mouse_pos)
+        if tracer.film_strip:
+            tracer.emit('film_strip', 'Mouse %s is not in any film strip area', mouse_pos)
         return False
 
     def handle_film_strip_drag_scroll(self, mouse_y: int) -> None:
@@ -1284,13 +1292,17 @@ class FilmStripCoordinator:  # noqa: PLR0904
                 if strip == film_strip_widget:
                     strip_name = name
                     break
-        LOG.debug(
-            f"BitmapEditorScene: Frame selected - {animation}[{frame}] in strip '{strip_name}'",
-        )
+        if tracer.film_strip:
+            tracer.emit(
+                'film_strip',
+                "BitmapEditorScene: Frame selected - %s[%s] in strip '%s'",
+                animation,
+                frame,
+                strip_name,
+            )
 
         # Update canvas to show the selected frame
         if hasattr(self.editor, 'canvas') and self.editor.canvas:
-            LOG.debug(f'BitmapEditorScene: Updating canvas to show {animation}[{frame}]')
             self.editor.canvas.show_frame(animation, frame)
 
         # Store global selection state
@@ -1797,11 +1809,12 @@ class FilmStripCoordinator:  # noqa: PLR0904
 
     def switch_to_film_strip(self, animation_name: str, frame: int = 0) -> None:
         """Switch to a specific film strip and frame, deselecting the previous one."""
-        LOG.debug(f'BitmapEditorScene: Switching to film strip {animation_name}[{frame}]')
+        tracer.emit(
+            'film_strip', 'BitmapEditorScene: Switching to film strip %s[%s]', animation_name, frame
+        )
 
         # Deselect the current strip if there is one
         if hasattr(self, 'selected_strip') and self.selected_strip:
-            LOG.debug('BitmapEditorScene: Deselecting current strip')
             self.selected_strip.is_selected = False
             self.selected_strip.current_animation = ''
             self.selected_strip.current_frame = 0
@@ -1849,9 +1862,8 @@ class FilmStripCoordinator:  # noqa: PLR0904
             if hasattr(self.editor, 'canvas') and self.editor.canvas:
                 self.editor.canvas.show_frame(animation_name, frame)
 
-            LOG.debug(f'BitmapEditorScene: Selected strip {animation_name} with frame {frame}')
         else:
-            LOG.debug(f'BitmapEditorScene: Film strip {animation_name} not found')
+            tracer.emit('film_strip', 'BitmapEditorScene: Film strip %s not found', animation_name)
 
     def scroll_to_current_animation(self) -> None:
         """Scroll the film strip view to show the selected animation.
@@ -2088,30 +2100,25 @@ class FilmStripCoordinator:  # noqa: PLR0904
 
     def update_film_strips_for_frame(self, animation: str, frame: int) -> None:
         """Update film strips when frame changes."""
-        self.log.debug(
-            '_update_film_strips_for_frame called: animation=%s, frame=%s',
-            animation,
-            frame,
-        )
+        if tracer.film_strip:
+            tracer.emit(
+                'film_strip',
+                'update_film_strips_for_frame: animation=%s, frame=%s',
+                animation,
+                frame,
+            )
         if hasattr(self.editor, 'film_strips') and self.editor.film_strips:
-            strip_keys = list(self.editor.film_strips.keys())
-            self.log.debug(f'Found {len(self.editor.film_strips)} film strips: {strip_keys}')
             # Update the film strip for the current animation
             if animation in self.editor.film_strips:
                 film_strip = self.editor.film_strips[animation]
-                self.log.debug('Updating film strip for animation %s', animation)
                 # Directly update the selection without triggering handlers to avoid infinite loops
                 film_strip.current_animation = animation
                 film_strip.current_frame = frame
                 film_strip.update_scroll_for_frame(frame)
                 film_strip.update_layout()
                 film_strip.mark_dirty()
-                self.log.debug(
-                    f'Film strip updated: current_animation={film_strip.current_animation},'
-                    f' current_frame={film_strip.current_frame}',
-                )
-            else:
-                self.log.debug('Animation %s not found in film strips', animation)
+            elif tracer.film_strip:
+                tracer.emit('film_strip', 'Animation %s not found in film strips', animation)
 
             # Mark visible film strip sprites as dirty
             if hasattr(self.editor, 'film_strip_sprites') and self.editor.film_strip_sprites:
@@ -2119,8 +2126,39 @@ class FilmStripCoordinator:  # noqa: PLR0904
                     if film_strip_sprite.visible:
                         film_strip_sprite.dirty = 1
 
-    def _update_film_strips_for_pixel_update(self) -> None:
-        """Update visible film strips when pixel data changes."""
+    def invalidate_film_strip_frame(self, animation: str, frame: int | None = None) -> bool:
+        """Redraw only the film strip thumbnail for one animation frame.
+
+        Args:
+            animation: The animation whose frame changed.
+            frame: The frame that changed, or None for the whole animation.
+
+        Returns:
+            bool: True if the animation has a film strip.
+
+        """
+        film_strip = getattr(self.editor, 'film_strips', {}).get(animation)
+        if film_strip is None:
+            return False
+        if tracer.film_strip:
+            tracer.emit('film_strip', 'Invalidating thumbnail %s[%s]', animation, frame)
+        film_strip.invalidate_frame(animation, frame)
+        return True
+
+    def _update_film_strips_for_pixel_update(
+        self, animation: str | None = None, frame: int | None = None
+    ) -> None:
+        """Update visible film strips when pixel data changes.
+
+        Args:
+            animation: The animation that was edited. If given, only that
+                animation's strip is redrawn; otherwise every visible strip is.
+            frame: The frame that was edited, or None for the whole animation.
+
+        """
+        if animation is not None and self.invalidate_film_strip_frame(animation, frame):
+            return
+
         film_strip_sprites = getattr(self.editor, 'film_strip_sprites', {})
 
         for strip_name, film_strip in getattr(self.editor, 'film_strips', {}).items():
@@ -2131,8 +2169,21 @@ class FilmStripCoordinator:  # noqa: PLR0904
 
         # Film strip animated sprites should use original animation frames, not canvas content
 
-    def update_film_strips_for_animated_sprite_update(self) -> None:
-        """Update visible film strips when animated sprite frame data changes."""
+    def update_film_strips_for_animated_sprite_update(
+        self, animation: str | None = None, frame: int | None = None
+    ) -> None:
+        """Update visible film strips when animated sprite frame data changes.
+
+        Args:
+            animation: The animation whose frame data changed. If given, only
+                that thumbnail is rebuilt and no layout update is done, since
+                the frame count is unchanged.
+            frame: The frame that changed, or None for the whole animation.
+
+        """
+        if animation is not None and self.invalidate_film_strip_frame(animation, frame):
+            return
+
         film_strip_sprites = getattr(self.editor, 'film_strip_sprites', {})
 
         for strip_name, film_strip in getattr(self.editor, 'film_strips', {}).items():
@@ -21,6 +21,22 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger('game.tools.film_strip')
 
+# (source image, frame revision, thumbnail width, thumbnail height)
+type ThumbnailStamp = tuple[pygame.Surface, int, int, int]
+
+
+def _same_stamp(cached: ThumbnailStamp, current: ThumbnailStamp) -> bool:
+    """Return True if a cached thumbnail was built from the current frame image.
+
+    The source image is compared by identity: frames get a new surface when
+    they are replaced, and bump their revision when redrawn in place.
+
+    Returns:
+        bool: True if the cached thumbnail is still valid.
+
+    """
+    return cached[0] is current[0] and cached[1:] == current[1:]
+
 
 class FilmStripRendering:  # noqa: PLR0904
     """Delegate providing rendering/drawing methods for FilmStripWidget."""
@@ -34,6 +50,29 @@ class FilmStripRendering:  # noqa: PLR0904
         """
         self.widget = widget
 
+        # Scaled, magenta-keyed frame images by (animation, frame index), with
+        # the stamp they were built from: the source image, its revision, and
+        # the thumbnail size
+        self.thumbnail_images: dict[
+            tuple[str, int],
+            tuple[ThumbnailStamp, pygame.Surface, tuple[int, int]],
+        ] = {}
+
+    def invalidate_thumbnail(self, animation: str, frame_index: int | None = None) -> None:
+        """Drop cached thumbnail images so they are rebuilt on the next render.
+
+        Args:
+            animation: The animation whose thumbnails changed.
+            frame_index: The frame that changed, or None for every frame of
+                the animation.
+
+        """
+        if frame_index is not None:
+            self.thumbnail_images.pop((animation, frame_index), None)
+            return
+        for key in [key for key in self.thumbnail_images if key[0] == animation]:
+            del self.thumbnail_images[key]
+
     def render_frame_thumbnail(
         self,
         frame: SpriteFrame,
@@ -57,7 +96,12 @@ class FilmStripRendering:  # noqa: PLR0904
         frame_img = self.get_frame_image_for_rendering(frame, is_selected=is_selected)
 
         if frame_img:
-            self._draw_scaled_image(frame_surface, frame_img)
+            self._draw_scaled_image(
+                frame_surface,
+                frame_img,
+                cache_key=(animation_name, frame_index),
+                revision=getattr(frame, 'revision', 0),
+            )
         else:
             self.draw_placeholder(frame_surface)
 
@@ -219,8 +263,36 @@ class FilmStripRendering:  # noqa: PLR0904
 
         return frame_img
 
-    def _draw_scaled_image(self, frame_surface: pygame.Surface, frame_img: pygame.Surface) -> None:
-        """Draw a scaled image onto the frame surface."""
+    def _draw_scaled_image(
+        self,
+        frame_surface: pygame.Surface,
+        frame_img: pygame.Surface,
+        *,
+        cache_key: tuple[str, int] | None = None,
+        revision: int = 0,
+    ) -> None:
+        """Draw a scaled image onto the frame surface.
+
+        Args:
+            frame_surface: The thumbnail surface to draw on.
+            frame_img: The frame's full-size image.
+            cache_key: The (animation, frame index) to cache the scaled image
+                under, or None to skip the cache.
+            revision: The frame's revision, so in-place redraws are noticed.
+
+        """
+        stamp: ThumbnailStamp = (
+            frame_img,
+            revision,
+            self.widget.frame_width,
+            self.widget.frame_height,
+        )
+        cached = self.thumbnail_images.get(cache_key) if cache_key is not None else None
+        if cached is not None and _same_stamp(cached[0], stamp):
+            _, rgba_surface, offset = cached
+            frame_surface.blit(rgba_surface, offset)
+            return
+
         # Calculate scaling to fit within the frame area (leaving some padding)
         max_width = self.widget.frame_width - 8  # Leave 4px padding on each side
         max_height = self.widget.frame_height - 8  # Leave 4px padding on top/bottom
@@ -241,6 +313,9 @@ class FilmStripRendering:  # noqa: PLR0904
         rgba_surface = self.convert_magenta_to_transparent(scaled_image)
         frame_surface.blit(rgba_surface, (x_offset, y_offset))
 
+        if cache_key is not None:
+            self.thumbnail_images[cache_key] = (stamp, rgba_surface, (x_offset, y_offset))
+
     @staticmethod
     def convert_magenta_to_transparent(surface: pygame.Surface) -> pygame.Surface:
         """Convert magenta (255, 0, 255) pixels to transparent in a surface.
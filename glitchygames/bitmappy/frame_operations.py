@@ -11,14 +11,17 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-import pygame
-
 from .constants import (
     PIXEL_CHANGE_DEBOUNCE_SECONDS,
 )
 from .history.commands import FramePasteCommand
+from .pixel_ops import surface_from_pixels
 
 if TYPE_CHECKING:
+    import pygame
+
+    from glitchygames.sprites.animated import SpriteFrame
+
     from .protocols import EditorContext
 
 
@@ -52,36 +55,32 @@ class FrameOperationManager:
         """Build a pygame Surface from the current canvas pixel data.
 
         Returns:
-            A new SRCALPHA surface with the canvas pixels rendered onto it.
+            A new SRCALPHA surface holding the canvas pixels.
 
         """
-        surface = pygame.Surface(
-            (self.editor.canvas.pixels_across, self.editor.canvas.pixels_tall),
-            pygame.SRCALPHA,
-        )
-        for y in range(self.editor.canvas.pixels_tall):
-            for x in range(self.editor.canvas.pixels_across):
-                pixel_num = y * self.editor.canvas.pixels_across + x
-                if pixel_num < len(self.editor.canvas.pixels):
-                    color = self.editor.canvas.pixels[pixel_num]
-                    surface.set_at((x, y), color)
-        return surface
+        canvas = self.editor.canvas
+        return surface_from_pixels(canvas.pixels, canvas.pixels_across, canvas.pixels_tall)
 
     # ──────────────────────────────────────────────────────────────────────
     # Panning commit
     # ──────────────────────────────────────────────────────────────────────
 
-    def _commit_panned_frame_pixels(self, current_animation: str, current_frame: int) -> None:
+    def _commit_panned_frame_pixels(
+        self, current_animation: str, current_frame: int
+    ) -> SpriteFrame | None:
         """Commit panned pixel data to the animation frame and its surface.
 
         Args:
             current_animation: Name of the current animation.
             current_frame: Index of the current frame.
 
+        Returns:
+            The committed frame, or None if it has no pixel buffer.
+
         """
         frame = self.editor.canvas.animated_sprite._animations[current_animation][current_frame]  # type: ignore[reportPrivateUsage]
         if not hasattr(frame, 'pixels'):
-            return
+            return None
 
         # The current self.editor.canvas.pixels already has the panned view
         frame.pixels = list(self.editor.canvas.pixels)
@@ -93,13 +92,22 @@ class FrameOperationManager:
             current_animation,
             current_frame,
         )
+        return frame
+
+    def _commit_panned_film_strip_frame(
+        self, current_animation: str, current_frame: int, committed_frame: SpriteFrame
+    ) -> None:
+        """Point the film strip's copy of the frame at the committed buffer.
 
-    def _commit_panned_film_strip_frame(self, current_animation: str, current_frame: int) -> None:
-        """Commit panned pixel data to the film strip's animation frame.
+        Film strips usually share their frames with the canvas sprite, in
+        which case there is nothing to do. Otherwise the film strip frame
+        shares the committed frame's pixel list and surface rather than
+        copying and rebuilding them.
 
         Args:
             current_animation: Name of the current animation.
             current_frame: Index of the current frame.
+            committed_frame: The canvas sprite's frame that was just committed.
 
         """
         if not (
@@ -120,13 +128,11 @@ class FrameOperationManager:
 
         # Update the film strip's animated sprite frame data
         film_strip_frame = film_strip.animated_sprite._animations[current_animation][current_frame]  # type: ignore[reportPrivateUsage]
-        if not hasattr(film_strip_frame, 'pixels'):
+        if film_strip_frame is committed_frame or not hasattr(film_strip_frame, 'pixels'):
             return
 
-        film_strip_frame.pixels = list(self.editor.canvas.pixels)
-
-        # Also update the film strip frame's image surface with alpha support
-        film_strip_frame.image = self._build_surface_from_canvas_pixels()
+        film_strip_frame.pixels = committed_frame.pixels
+        film_strip_frame.image = committed_frame.image
         self.log.debug(
             'Updated film strip animated sprite frame %s[%s] with pixels and image',
             current_animation,
@@ -168,11 +174,14 @@ class FrameOperationManager:
             self.log.debug('Panned buffer committed, panning state preserved for continued panning')
             return
 
-        self._commit_panned_frame_pixels(current_animation, current_frame)
-        self._commit_panned_film_strip_frame(current_animation, current_frame)
+        committed_frame = self._commit_panned_frame_pixels(current_animation, current_frame)
+        if committed_frame is not None:
+            self._commit_panned_film_strip_frame(current_animation, current_frame, committed_frame)
 
         # Update the film strip to reflect the pixel data changes
-        self.editor.film_strip_coordinator.update_film_strips_for_animated_sprite_update()
+        self.editor.film_strip_coordinator.update_film_strips_for_animated_sprite_update(
+            current_animation, current_frame
+        )
         self.log.debug('Updated film strip for frame %s[%s]', current_animation, current_frame)
 
     # ──────────────────────────────────────────────────────────────────────
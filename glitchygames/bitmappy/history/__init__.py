@@ -17,6 +17,7 @@ from .commands import (
     FrameSelectionCommand,
     UndoRedoCommand,
 )
+from .journal import EditJournal, apply_record, command_record, recover_document
 from .operations import (
     CanvasOperationTracker,
     ControllerPositionOperationTracker,
@@ -35,6 +36,7 @@ __all__ = [
     'ControllerPositionCommand',
     'ControllerPositionOperationTracker',
     'CrossAreaOperationTracker',
+    'EditJournal',
     'FilmStripOperationTracker',
     'FloodFillCommand',
     'FrameAddCommand',
@@ -48,4 +50,7 @@ __all__ = [
     'PixelChange',
     'UndoRedoCommand',
     'UndoRedoManager',
+    'apply_record',
+    'command_record',
+    'recover_document',
 ]
@@ -0,0 +1,542 @@
+"""Append-only edit journal for crash recovery in the Bitmappy editor.
+
+Every command that changes the sprite is reduced to a small, self-contained
+record of its effect (which pixels became which color, which frame moved where)
+and appended to ``journal.jsonl`` by a background thread. Periodically the whole
+document is written to ``snapshot.json`` and the journal is truncated, so replay
+after a crash only has to apply the edits made since the last snapshot.
+
+A document is plain JSON-friendly data::
+
+    {
+        'width': 32,
+        'height': 32,
+        'animations': {
+            'walk': [{'duration': 0.5, 'pixels': [[255, 0, 255], ...]}, ...],
+        },
+    }
+
+Pixels are row-major, one RGB or RGBA color per pixel.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glitchygames.atomic_io import atomic_text_file
+
+from .commands import (
+    AnimationAddCommand,
+    AnimationDeleteCommand,
+    BrushStrokeCommand,
+    FloodFillCommand,
+    FrameAddCommand,
+    FrameDeleteCommand,
+    FramePasteCommand,
+    FrameReorderCommand,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .commands import UndoRedoCommand
+
+LOG = logging.getLogger(__name__)
+LOG.addHandler(logging.NullHandler())
+
+JOURNAL_FILENAME = 'journal.jsonl'
+SNAPSHOT_FILENAME = 'snapshot.json'
+
+# Journal records between compacting snapshots
+DEFAULT_SNAPSHOT_EVERY = 200
+
+type SpriteDocument = dict[str, Any]
+type JournalRecord = dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Commands -> records
+# ---------------------------------------------------------------------------
+
+
+def _frame_record(frame_data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a command's serialised frame to the document's frame shape.
+
+    Returns:
+        The frame's duration and a copy of its pixels.
+
+    """
+    return {
+        'duration': frame_data.get('duration', 1.0),
+        'pixels': list(frame_data.get('pixels') or []),
+    }
+
+
+def _pixels_record(
+    frame: tuple[str, int] | None,
+    pixels: list[tuple[int, int, tuple[int, ...]]],
+) -> JournalRecord | None:
+    if frame is None:
+        LOG.warning('Not journaling a pixel edit with no frame to apply it to')
+        return None
+    animation, frame_index = frame
+    return {'op': 'pixels', 'animation': animation, 'frame': frame_index, 'pixels': pixels}
+
+
+def _brush_stroke_record(
+    command: BrushStrokeCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,
+) -> JournalRecord | None:
+    return _pixels_record(
+        frame,
+        [(x, y, old if undo else new) for x, y, old, new in command.pixels],
+    )
+
+
+def _flood_fill_record(
+    command: FloodFillCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,
+) -> JournalRecord | None:
+    color = command.old_color if undo else command.new_color
+    return _pixels_record(frame, [(x, y, color) for x, y in command.affected_pixels])
+
+
+def _frame_paste_record(
+    command: FramePasteCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    return {
+        'op': 'frame',
+        'animation': command.animation,
+        'frame': command.frame,
+        'duration': command.old_duration if undo else command.new_duration,
+        'pixels': list(command.old_pixels if undo else command.new_pixels),
+    }
+
+
+def _insert_or_delete_frame(
+    command: FrameAddCommand | FrameDeleteCommand,
+    *,
+    insert: bool,
+) -> JournalRecord:
+    record: JournalRecord = {
+        'op': 'insert_frame' if insert else 'delete_frame',
+        'animation': command.animation_name,
+        'frame': command.frame_index,
+    }
+    if insert:
+        record['data'] = _frame_record(command.frame_data)
+    return record
+
+
+def _frame_add_record(
+    command: FrameAddCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    return _insert_or_delete_frame(command, insert=not undo)
+
+
+def _frame_delete_record(
+    command: FrameDeleteCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    return _insert_or_delete_frame(command, insert=undo)
+
+
+def _frame_reorder_record(
+    command: FrameReorderCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    source, destination = command.old_index, command.new_index
+    if undo:
+        source, destination = destination, source
+    return {
+        'op': 'move_frame',
+        'animation': command.animation_name,
+        'source': source,
+        'destination': destination,
+    }
+
+
+def _add_or_delete_animation(
+    command: AnimationAddCommand | AnimationDeleteCommand,
+    *,
+    add: bool,
+) -> JournalRecord:
+    record: JournalRecord = {
+        'op': 'add_animation' if add else 'delete_animation',
+        'animation': command.animation_name,
+    }
+    if add:
+        record['frames'] = [
+            _frame_record(frame_data) for frame_data in command.animation_data.get('frames', [])
+        ]
+    return record
+
+
+def _animation_add_record(
+    command: AnimationAddCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    return _add_or_delete_animation(command, add=not undo)
+
+
+def _animation_delete_record(
+    command: AnimationDeleteCommand,
+    *,
+    undo: bool,
+    frame: tuple[str, int] | None,  # noqa: ARG001
+) -> JournalRecord:
+    return _add_or_delete_animation(command, add=undo)
+
+
+_RECORD_BUILDERS: dict[type, Callable[..., JournalRecord | None]] = {
+    BrushStrokeCommand: _brush_stroke_record,
+    FloodFillCommand: _flood_fill_record,
+    FramePasteCommand: _frame_paste_record,
+    FrameAddCommand: _frame_add_record,
+    FrameDeleteCommand: _frame_delete_record,
+    FrameReorderCommand: _frame_reorder_record,
+    AnimationAddCommand: _animation_add_record,
+    AnimationDeleteCommand: _animation_delete_record,
+}
+
+
+def command_record(
+    command: UndoRedoCommand,
+    *,
+    undo: bool = False,
+    frame: tuple[str, int] | None = None,
+) -> JournalRecord | None:
+    """Describe the change a command made to the document.
+
+    Args:
+        command: The command that was executed, redone, or undone.
+        undo: True if the command was undone rather than executed.
+        frame: The (animation, frame) a canvas edit was applied to.
+
+    Returns:
+        The journal record, or None if the command does not change the document
+        (selection, controller, and copy commands).
+
+    """
+    builder = _RECORD_BUILDERS.get(type(command))
+    if builder is None:
+        return None
+    return builder(command, undo=undo, frame=frame)
+
+
+# ---------------------------------------------------------------------------
+# Records -> document
+# ---------------------------------------------------------------------------
+
+
+def apply_record(document: SpriteDocument, record: JournalRecord) -> None:
+    """Apply one journal record to a document in place.
+
+    Args:
+        document: The document to change.
+        record: A record produced by command_record().
+
+    A record naming an animation, frame, or pixel the document lacks raises
+    KeyError or IndexError.
+
+    Raises:
+        IndexError: If a frame would be inserted past the end of its animation.
+        ValueError: If the record's operation is unknown.
+
+    """
+    animations = document['animations']
+    op = record['op']
+    if op == 'pixels':
+        pixels = animations[record['animation']][record['frame']]['pixels']
+        width = document['width']
+        for x, y, color in record['pixels']:
+            pixels[y * width + x] = color
+    elif op == 'frame':
+        frame = animations[record['animation']][record['frame']]
+        frame['pixels'] = list(record['pixels'])
+        frame['duration'] = record['duration']
+    elif op == 'insert_frame':
+        frames = animations.setdefault(record['animation'], [])
+        if record['frame'] > len(frames):
+            raise IndexError(record['frame'])
+        frames.insert(record['frame'], _frame_record(record['data']))
+    elif op == 'delete_frame':
+        del animations[record['animation']][record['frame']]
+    elif op == 'move_frame':
+        frames = animations[record['animation']]
+        frames.insert(record['destination'], frames.pop(record['source']))
+    elif op == 'add_animation':
+        animations[record['animation']] = [_frame_record(frame) for frame in record['frames']]
+    elif op == 'delete_animation':
+        del animations[record['animation']]
+    else:
+        message = f'Unknown journal operation: {op!r}'
+        raise ValueError(message)
+
+
+def recover_document(directory: str | Path) -> SpriteDocument | None:
+    """Rebuild the document from the last snapshot and the journal after it.
+
+    A torn final line (the process died mid-write) ends the replay; records that
+    no longer apply are logged and skipped.
+
+    Args:
+        directory: The journal directory.
+
+    Returns:
+        The recovered document, or None if there is no readable snapshot.
+
+    """
+    directory = Path(directory)
+    try:
+        snapshot = json.loads((directory / SNAPSHOT_FILENAME).read_text(encoding='utf-8'))
+        document: SpriteDocument = snapshot['document']
+        snapshot_sequence: int = snapshot['sequence']
+    except FileNotFoundError:
+        return None
+    except OSError, ValueError, KeyError, TypeError:
+        LOG.exception('Unreadable autosave snapshot in %s', directory)
+        return None
+
+    replayed = 0
+    with (
+        contextlib.suppress(FileNotFoundError),
+        (directory / JOURNAL_FILENAME).open(encoding='utf-8') as journal,
+    ):
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                LOG.warning('Stopping replay at a torn journal record')
+                break
+            if record['sequence'] <= snapshot_sequence:
+                continue
+            try:
+                apply_record(document, record)
+            except KeyError, IndexError, TypeError, ValueError:
+                LOG.warning('Skipping journal record %s that no longer applies', record)
+                continue
+            replayed += 1
+
+    LOG.info('Recovered autosave from %s (%d edits replayed)', directory, replayed)
+    return document
+
+
+def _last_sequence(directory: Path) -> int:
+    """Find the highest sequence number already used in a journal directory.
+
+    Returns:
+        The last record's or snapshot's sequence number, 0 if there is none.
+
+    """
+    last = 0
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        snapshot = json.loads((directory / SNAPSHOT_FILENAME).read_text(encoding='utf-8'))
+        last = snapshot['sequence']
+    with (
+        contextlib.suppress(OSError),
+        (directory / JOURNAL_FILENAME).open(encoding='utf-8') as journal,
+    ):
+        for line in journal:
+            try:
+                last = max(last, json.loads(line)['sequence'])
+            except ValueError, KeyError, TypeError:
+                break
+    return last
+
+
+def has_journal(directory: str | Path) -> bool:
+    """Check whether a journal directory holds a session that was not closed.
+
+    Returns:
+        True if a snapshot is present.
+
+    """
+    return (Path(directory) / SNAPSHOT_FILENAME).is_file()
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------------------------
+
+
+class EditJournal:
+    """Write journal records and compacting snapshots from a background thread.
+
+    The UI thread only numbers records and queues them; encoding, writing, and
+    syncing to disk happen on the writer thread, which batches everything that
+    queued up while it was busy into one flush.
+    """
+
+    def __init__(
+        self, directory: str | Path, *, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY
+    ) -> None:
+        """Initialize the journal.
+
+        Args:
+            directory: Directory for the journal and snapshot files.
+            snapshot_every: Records between compacting snapshots.
+
+        """
+        self.directory = Path(directory)
+        self.snapshot_every = snapshot_every
+        self.sequence = 0
+        self._since_snapshot = 0
+        self._queue: queue.Queue[tuple[str, Any] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._journal_file: Any = None
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Whether enough records have been written to warrant a snapshot."""
+        return self._since_snapshot >= self.snapshot_every
+
+    def start(self, document: SpriteDocument) -> None:
+        """Start a session from a document, replacing any previous journal.
+
+        Args:
+            document: The document as it is now; becomes the first snapshot.
+
+        """
+        # Number on from any previous session so none of its leftover records
+        # can be mistaken for edits made after the new snapshot
+        self.sequence = max(self.sequence, _last_sequence(self.directory))
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name='bitmappy-autosave',
+                daemon=True,
+            )
+            self._thread.start()
+        self.snapshot(document)
+
+    def append(self, record: JournalRecord) -> None:
+        """Queue a record for the journal.
+
+        Args:
+            record: A record produced by command_record().
+
+        """
+        self.sequence += 1
+        self._since_snapshot += 1
+        self._queue.put(('record', {'sequence': self.sequence, **record}))
+
+    def snapshot(self, document: SpriteDocument) -> None:
+        """Queue a snapshot of the document, after which the journal is truncated.
+
+        The document must not be changed afterwards; pass a copy.
+
+        Args:
+            document: The document including every record appended so far.
+
+        """
+        self._since_snapshot = 0
+        self._queue.put(('snapshot', (self.sequence, document)))
+
+    def flush(self) -> None:
+        """Block until everything queued so far is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, *, discard: bool = False) -> None:
+        """Stop the writer thread.
+
+        Args:
+            discard: Also delete the journal and snapshot, e.g. on a clean exit.
+
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if discard:
+            for filename in (JOURNAL_FILENAME, SNAPSHOT_FILENAME):
+                with contextlib.suppress(OSError):
+                    (self.directory / filename).unlink()
+
+    # -- writer thread ------------------------------------------------------
+
+    def _run(self) -> None:
+        """Write queued items until the stop sentinel arrives."""
+        while True:
+            items = [self._queue.get()]
+            # Batch whatever else is already waiting into the same flush
+            with contextlib.suppress(queue.Empty):
+                while items[-1] is not None:
+                    items.append(self._queue.get_nowait())
+            try:
+                self._write(items)
+            except OSError, TypeError, ValueError:
+                LOG.exception('Failed to write the autosave journal')
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if items[-1] is None:
+                self._close_journal_file()
+                return
+
+    def _write(self, items: list[tuple[str, Any] | None]) -> None:
+        """Write a batch of records and snapshots, then sync the journal."""
+        for item in items:
+            if item is None:
+                break
+            kind, payload = item
+            if kind == 'snapshot':
+                self._write_snapshot(*payload)
+            else:
+                self._journal().write(json.dumps(payload, separators=(',', ':')) + '\n')
+        if self._journal_file is not None:
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+
+    def _journal(self) -> Any:
+        """Open the journal for appending if it is not open yet.
+
+        Returns:
+            The journal file.
+
+        """
+        if self._journal_file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._journal_file = (self.directory / JOURNAL_FILENAME).open('a', encoding='utf-8')
+        return self._journal_file
+
+    def _write_snapshot(self, sequence: int, document: SpriteDocument) -> None:
+        """Atomically replace the snapshot, then truncate the journal it covers."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with atomic_text_file(self.directory / SNAPSHOT_FILENAME) as temp_file:
+            json.dump({'sequence': sequence, 'document': document}, temp_file)
+
+        # Records up to `sequence` are in the snapshot now; a crash before this
+        # truncation is harmless because replay skips them by sequence number
+        self._close_journal_file()
+        (self.directory / JOURNAL_FILENAME).write_text('', encoding='utf-8')
+        LOG.debug('Wrote autosave snapshot at record %d', sequence)
+
+    def _close_journal_file(self) -> None:
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
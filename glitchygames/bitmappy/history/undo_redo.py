@@ -17,12 +17,17 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from glitchygames.bitmappy.history.commands import UndoRedoCommand
 
 LOG = logging.getLogger(__name__)
 
 MIN_UNDO_STACK_SIZE_FOR_COLLAPSE = 2
 
+# Observer of applied commands: (command, undone, (animation, frame) or None)
+type CommandCallback = Callable[[UndoRedoCommand, bool, tuple[str, int] | None], None]
+
 
 class OperationType(Enum):
     """Types of operations that can be undone/redone."""
@@ -141,6 +146,9 @@ class UndoRedoManager:  # noqa: PLR0904
         self._add_animation_callback: Any = None
         self._delete_animation_callback: Any = None
 
+        # Called as callback(command, undo, frame) after every command is applied
+        self._command_callback: CommandCallback | None = None
+
         LOG.debug('UndoRedoManager initialized with max_history=%s', max_history)
 
     # -- Query methods ------------------------------------------------------
@@ -266,6 +274,7 @@ class UndoRedoManager:  # noqa: PLR0904
         LOG.debug(
             f'Pushed command: {command.description} (undo stack size: {len(self.undo_stack)})',
         )
+        self._notify_command(command, undo=False)
 
     def push_frame_command(self, animation: str, frame: int, command: UndoRedoCommand) -> None:
         """Push a command onto a frame-specific undo stack.
@@ -285,6 +294,7 @@ class UndoRedoManager:  # noqa: PLR0904
 
         if not self.is_undoing and not self.is_redoing:
             self.frame_redo_stacks[frame_key].clear()
+            self._notify_command(command, undo=False, frame=frame_key)
 
         self.frame_undo_stacks[frame_key].append(command)
 
@@ -390,6 +400,7 @@ class UndoRedoManager:  # noqa: PLR0904
             if success:
                 self.redo_stack.append(command)
                 self.at_head_of_history = False
+                self._notify_command(command, undo=True)
                 LOG.debug(f'Successfully undone: {command.description}')
             else:
                 LOG.warning(f'Failed to undo: {command.description}')
@@ -422,6 +433,7 @@ class UndoRedoManager:  # noqa: PLR0904
                 self.undo_stack.append(command)
                 if not self.redo_stack:
                     self.at_head_of_history = True
+                self._notify_command(command, undo=False)
                 LOG.debug(f'Successfully redone: {command.description}')
             else:
                 LOG.warning(f'Failed to redo: {command.description}')
@@ -459,6 +471,7 @@ class UndoRedoManager:  # noqa: PLR0904
 
             if success:
                 self.frame_redo_stacks[frame_key].append(command)
+                self._notify_command(command, undo=True, frame=frame_key)
                 LOG.debug(f'Undid frame command for {animation}[{frame}]: {command.description}')
             else:
                 LOG.warning('Failed to undo frame command for %s[%s]', animation, frame)
@@ -500,6 +513,7 @@ class UndoRedoManager:  # noqa: PLR0904
 
             if success:
                 self.frame_undo_stacks[frame_key].append(command)
+                self._notify_command(command, undo=False, frame=frame_key)
                 LOG.debug(f'Redid frame command for {animation}[{frame}]: {command.description}')
             else:
                 LOG.warning('Failed to redo frame command for %s[%s]', animation, frame)
@@ -538,6 +552,20 @@ class UndoRedoManager:  # noqa: PLR0904
             'max_history': self.max_history,
         }
 
+    def set_command_callback(self, callback: CommandCallback | None) -> None:
+        """Set a callback that observes every command as it is applied.
+
+        The callback receives the command, whether it was undone (rather than
+        executed or redone), and the (animation, frame) key for frame-specific
+        commands or None for global ones. It is not called for commands pushed
+        while an undo or redo is in progress.
+
+        Args:
+            callback: The observer, or None to remove it.
+
+        """
+        self._command_callback = callback
+
     # -- Legacy callback setters (kept for backward-compatible tests) -------
 
     def set_pixel_change_callback(self, callback: Any) -> None:
@@ -617,6 +645,17 @@ class UndoRedoManager:  # noqa: PLR0904
 
     # -- Internal -----------------------------------------------------------
 
+    def _notify_command(
+        self,
+        command: UndoRedoCommand,
+        *,
+        undo: bool,
+        frame: tuple[str, int] | None = None,
+    ) -> None:
+        """Report an applied command to the command callback, if one is set."""
+        if self._command_callback is not None:
+            self._command_callback(command, undo, frame)
+
     def _optimize_frame_create_select_commands(self) -> None:
         """Collapse redundant frame-create + frame-select pairs.
 
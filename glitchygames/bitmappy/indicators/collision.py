@@ -97,6 +97,12 @@ class VisualCollisionManager:
         # Position cache for performance
         self.position_cache: dict[tuple[int, int], list[tuple[int, int]]] = {}
 
+        # Where each controller is filed in its location's collision groups, so
+        # a move only touches the group it left and the group it joined
+        self.indexed_positions: dict[LocationType, dict[int, tuple[int, int]]] = {
+            location_type: {} for location_type in LocationType
+        }
+
     def add_controller_indicator(
         self,
         controller_id: int,
@@ -164,8 +170,8 @@ class VisualCollisionManager:
         # Note: This will overwrite if same controller_id is used for different locations
         self.indicators[controller_id] = indicator
 
-        # Update collision groups for the specific location
-        self._update_collision_groups(location_type)
+        # File the indicator in the collision groups for its location
+        self._index_indicator(controller_id, location_type)
 
         LOG.debug(
             'Added %s indicator for controller %s at %s',
@@ -200,7 +206,7 @@ class VisualCollisionManager:
             # Remove from main indicators dict
             del self.indicators[controller_id]
 
-            self._update_collision_groups()
+            self._index_indicator(controller_id, location_type)
             LOG.debug('Removed indicator for controller %s', controller_id)
 
     def remove_controller_indicator_for_location(
@@ -223,8 +229,7 @@ class VisualCollisionManager:
         elif location_type == LocationType.SLIDER and controller_id in self.slider_indicators:
             del self.slider_indicators[controller_id]
 
-        # Update collision groups for the specific location
-        self._update_collision_groups(location_type)
+        self._index_indicator(controller_id, location_type)
 
         LOG.debug('Removed %s indicator for controller %s', location_type.value, controller_id)
 
@@ -237,8 +242,9 @@ class VisualCollisionManager:
 
         """
         if controller_id in self.indicators:
-            self.indicators[controller_id].position = new_position
-            self._update_collision_groups()
+            indicator = self.indicators[controller_id]
+            indicator.position = new_position
+            self._index_indicator(controller_id, indicator.location_type)
             LOG.debug('Updated position for controller %s to %s', controller_id, new_position)
 
     def get_controller_indicator(self, controller_id: int) -> VisualIndicator | None:
@@ -304,6 +310,8 @@ class VisualCollisionManager:
             return
 
         # Clear the appropriate collision groups
+        indexed_positions = self.indexed_positions[location_type]
+        indexed_positions.clear()
         if location_type == LocationType.FILM_STRIP:
             self.film_strip_collision_groups.clear()
             indicators_dict = self.film_strip_indicators
@@ -325,6 +333,7 @@ class VisualCollisionManager:
                 if position not in collision_groups:
                     collision_groups[position] = []
                 collision_groups[position].append(controller_id)
+                indexed_positions[controller_id] = position
 
         # Apply collision avoidance for groups with multiple indicators
         # Snapshot the items to avoid RuntimeError from concurrent dict modification
@@ -333,6 +342,84 @@ class VisualCollisionManager:
             if len(controller_ids) > 1:
                 self._apply_collision_avoidance(position, controller_ids, location_type)
 
+    def _index_indicator(self, controller_id: int, location_type: LocationType) -> None:
+        """Move one controller to the collision group for its current position.
+
+        Only the group the controller left and the group it joined are laid
+        out again; every other group keeps its offsets.
+
+        Args:
+            controller_id: Controller ID
+            location_type: Location type whose groups should be updated
+
+        """
+        indexed_positions = self.indexed_positions[location_type]
+        collision_groups = self._get_collision_groups_for_location(location_type)
+        indicator = self._get_indicators_for_location(location_type).get(controller_id)
+        new_position = indicator.position if indicator and indicator.is_visible else None
+        old_position = indexed_positions.get(controller_id)
+
+        if old_position == new_position:
+            if new_position is not None:
+                self._layout_collision_group(new_position, location_type)
+            return
+
+        if old_position is not None:
+            del indexed_positions[controller_id]
+            group = collision_groups.get(old_position)
+            if group is not None and controller_id in group:
+                group.remove(controller_id)
+            self._layout_collision_group(old_position, location_type)
+
+        if new_position is not None:
+            indexed_positions[controller_id] = new_position
+            collision_groups.setdefault(new_position, []).append(controller_id)
+            self._layout_collision_group(new_position, location_type)
+
+    def _layout_collision_group(
+        self,
+        position: tuple[int, int],
+        location_type: LocationType,
+    ) -> None:
+        """Apply offsets to the indicators sharing one position.
+
+        Args:
+            position: Base position of the group
+            location_type: Location type of the group
+
+        """
+        collision_groups = self._get_collision_groups_for_location(location_type)
+        controller_ids = collision_groups.get(position)
+        if not controller_ids:
+            collision_groups.pop(position, None)
+            return
+
+        if len(controller_ids) > 1:
+            self._apply_collision_avoidance(position, controller_ids, location_type)
+            return
+
+        # A lone indicator sits on its base position again
+        indicator = self._get_indicators_for_location(location_type).get(controller_ids[0])
+        if indicator is not None:
+            indicator.offset = (0, 0)
+
+    def _get_indicators_for_location(
+        self, location_type: LocationType
+    ) -> dict[int, VisualIndicator]:
+        """Get the indicator dictionary for a specific location type.
+
+        Returns:
+            dict[int, VisualIndicator]: The indicators tracked for the location.
+
+        """
+        if location_type == LocationType.FILM_STRIP:
+            return self.film_strip_indicators
+        if location_type == LocationType.CANVAS:
+            return self.canvas_indicators
+        if location_type == LocationType.SLIDER:
+            return self.slider_indicators
+        return self.indicators
+
     def _get_collision_groups_for_location(
         self,
         location_type: LocationType,
@@ -376,15 +463,7 @@ class VisualCollisionManager:
             offsets = self._calculate_offsets(len(controller_ids))
             self.position_cache[cache_key] = offsets
 
-        # Get the appropriate indicators dictionary
-        if location_type == LocationType.FILM_STRIP:
-            indicators_dict = self.film_strip_indicators
-        elif location_type == LocationType.CANVAS:
-            indicators_dict = self.canvas_indicators
-        elif location_type == LocationType.SLIDER:
-            indicators_dict = self.slider_indicators
-        else:
-            indicators_dict = self.indicators
+        indicators_dict = self._get_indicators_for_location(location_type)
 
         # Apply offsets to indicators
         for i, controller_id in enumerate(controller_ids):
@@ -483,8 +562,9 @@ class VisualCollisionManager:
 
         """
         if controller_id in self.indicators:
-            self.indicators[controller_id].is_visible = visible
-            self._update_collision_groups()
+            indicator = self.indicators[controller_id]
+            indicator.is_visible = visible
+            self._index_indicator(controller_id, indicator.location_type)
             LOG.debug('Set visibility for controller %s to %s', controller_id, visible)
 
     def set_indicator_color(self, controller_id: int, color: tuple[int, int, int]) -> None:
@@ -528,6 +608,10 @@ class VisualCollisionManager:
         self.indicators.clear()
         self.collision_groups.clear()
         self.position_cache.clear()
+        for location_type in LocationType:
+            self._get_indicators_for_location(location_type).clear()
+            self._get_collision_groups_for_location(location_type).clear()
+            self.indexed_positions[location_type].clear()
         LOG.debug('Cleared all indicators')
 
     def get_collision_summary(self) -> dict[str, Any]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel
@@ -18,6 +19,13 @@ class GGUnhandledMenuItemError(Exception):
     """Glitchy Games Unhandled Menu Item Error."""
 
 
+class AIRequestPriority(Enum):
+    """Scheduling lane for AI requests."""
+
+    INTERACTIVE = 'interactive'  # User-initiated edits, always served first
+    BACKGROUND = 'background'  # Batch generation, served when no interactive work is queued
+
+
 @dataclass
 class AIRequest:
     """Data structure for AI sprite generation requests."""
@@ -25,6 +33,8 @@ class AIRequest:
     prompt: str
     request_id: str
     messages: list[dict[str, str]]
+    cache_key: str | None = None  # Content hash for the on-disk response cache
+    priority: AIRequestPriority = AIRequestPriority.INTERACTIVE
 
 
 @dataclass
@@ -45,3 +55,5 @@ class AIRequestState:
     training_examples: list[dict[str, Any]] | None = None
     conversation_history: list[dict[str, str]] | None = None  # For multi-turn refinement
     last_sprite_content: str | None = None  # Last successfully generated sprite
+    cache_key: str | None = None  # Response cache key of the request currently in flight
+    priority: AIRequestPriority = AIRequestPriority.INTERACTIVE
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING
 
 import pygame
@@ -9,12 +10,89 @@ import pygame
 from glitchygames.color import MAX_COLOR_CHANNEL_VALUE, RGBA_COMPONENT_COUNT
 from glitchygames.sprites.animated import SpriteFrame
 
-from .constants import LOG
+from .constants import LOG, MAGENTA_TRANSPARENT
 
 if TYPE_CHECKING:
     from glitchygames.tools.ascii_renderer import ASCIIRenderer
 
 
+def shift_pixel_buffer(
+    pixels: list[tuple[int, ...]],
+    width: int,
+    height: int,
+    offset: tuple[int, int],
+    *,
+    source_width: int | None = None,
+) -> list[tuple[int, ...]]:
+    """Shift a row-major pixel buffer, filling uncovered pixels with transparency.
+
+    Whole row slices are copied instead of visiting every pixel, so panning
+    costs one slice per row rather than one bounds check per pixel.
+
+    Args:
+        pixels: Source pixels in row-major order.
+        width: Width of the shifted buffer.
+        height: Height of both buffers.
+        offset: Columns to shift right and rows to shift down; negative
+            values shift left and up.
+        source_width: Row stride of the source buffer, if it differs from width.
+
+    Returns:
+        A new width x height pixel list. Pixels shifted in from outside the
+        source, or past its end, are magenta.
+
+    """
+    if source_width is None:
+        source_width = width
+    offset_x, offset_y = offset
+
+    blank_row: list[tuple[int, ...]] = [MAGENTA_TRANSPARENT] * width
+    # Output columns that read from inside the source row
+    first_column = max(0, offset_x)
+    last_column = min(width, source_width + offset_x)
+
+    shifted: list[tuple[int, ...]] = []
+    for y in range(height):
+        source_y = y - offset_y
+        if not 0 <= source_y < height or first_column >= last_column:
+            shifted.extend(blank_row)
+            continue
+
+        row_start = source_y * source_width - offset_x
+        row = pixels[row_start + first_column : row_start + last_column]
+        shifted.extend(blank_row[:first_column])
+        shifted.extend(row)
+        # Pad short source buffers, then the uncovered right-hand columns
+        shifted.extend(blank_row[: last_column - first_column - len(row)])
+        shifted.extend(blank_row[last_column:])
+    return shifted
+
+
+def surface_from_pixels(pixels: list[tuple[int, ...]], width: int, height: int) -> pygame.Surface:
+    """Build an SRCALPHA surface from a row-major pixel buffer in a single copy.
+
+    RGB pixels are made opaque, including the magenta transparency key, and
+    pixels missing from a short buffer are left fully transparent.
+
+    Args:
+        pixels: RGB or RGBA pixels in row-major order.
+        width: Surface width in pixels.
+        height: Surface height in pixels.
+
+    Returns:
+        A new surface holding the pixels.
+
+    """
+    pixel_count = width * height
+    rgba = [
+        pixel if len(pixel) == RGBA_COMPONENT_COUNT else (*pixel, MAX_COLOR_CHANNEL_VALUE)
+        for pixel in pixels[:pixel_count]
+    ]
+    rgba.extend([(0, 0, 0, 0)] * (pixel_count - len(rgba)))
+    data = bytes(itertools.chain.from_iterable(rgba))
+    return pygame.image.frombytes(data, (width, height), 'RGBA')
+
+
 def _alpha_blend_pixel(
     source: tuple[int, ...],
     destination: tuple[int, ...],
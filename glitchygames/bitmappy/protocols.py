@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from glitchygames.bitmappy.animated_canvas import AnimatedCanvasSprite
     from glitchygames.bitmappy.controllers.manager import MultiControllerManager
     from glitchygames.bitmappy.controllers.modes import ModeSwitcher
+    from glitchygames.bitmappy.controllers.performance import OptimizedVisualCollisionManager
     from glitchygames.bitmappy.controllers.selection import ControllerSelection
     from glitchygames.bitmappy.film_strip import FilmStripWidget
     from glitchygames.bitmappy.film_strip_coordinator import FilmStripCoordinator
@@ -43,6 +44,7 @@ class EditorContext(Protocol):
     multi_controller_manager: MultiControllerManager
     mode_switcher: ModeSwitcher
     visual_collision_manager: VisualCollisionManager
+    optimized_visual_collision_manager: OptimizedVisualCollisionManager
     canvas_operation_tracker: CanvasOperationTracker
     controller_position_operation_tracker: ControllerPositionOperationTracker
     film_strip_operation_tracker: FilmStripOperationTracker
@@ -21,6 +21,11 @@ from glitchygames import events
 from glitchygames.color import PURPLE
 from glitchygames.events.app import AppEventManager
 from glitchygames.events.audio import AudioEventManager
+from glitchygames.events.axis import (
+    DEFAULT_AXIS_DEADZONE,
+    DEFAULT_AXIS_QUANTUM,
+    AxisConditioner,
+)
 from glitchygames.events.controller import ControllerEventManager
 from glitchygames.events.drop import DropEventManager
 from glitchygames.events.game import GameEventManager
@@ -31,6 +36,7 @@ from glitchygames.events.mouse import MouseEventManager
 from glitchygames.events.touch import TouchEventManager
 from glitchygames.events.window import WindowEventManager
 from glitchygames.fonts import FontManager
+from glitchygames.performance.tracing import TRACE_CATEGORIES, tracer
 from glitchygames.scenes import Scene, SceneManager
 from glitchygames.sprites import Sprite
 from glitchygames.timing import create_timer
@@ -39,6 +45,8 @@ if TYPE_CHECKING:
     from collections import OrderedDict
     from collections.abc import Callable
 
+    from glitchygames.performance.scene_benchmark import EventRecorder
+
 LOG: logging.Logger = logging.getLogger('game.engine')
 LOG.addHandler(logging.NullHandler())
 
@@ -146,6 +154,13 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
             type=float,
             default=0.0,
         )
+        group.add_argument(
+            '--simulation-hz',
+            help='run game logic in fixed steps at this rate and interpolate rendering '
+            '(default: 0, one variable step per frame)',
+            type=float,
+            default=0.0,
+        )
         group.add_argument(
             '--fps-log-interval-ms',
             help='how often to log the FPS counter in ms (default: 1000)',
@@ -297,6 +312,15 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
         else:
             GameEngine.OPTIONS['debug_events'] = False
 
+        # Trace the requested hot paths, or all of them when debugging or profiling
+        trace_categories = GameEngine.OPTIONS.get('trace')
+        if trace_categories is None and (
+            GameEngine.OPTIONS.get('profile')
+            or str(GameEngine.OPTIONS.get('log_level')).lower() == 'debug'
+        ):
+            trace_categories = TRACE_CATEGORIES
+        tracer.configure(trace_categories or ())
+
         options: dict[str, Any] = GameEngine.OPTIONS
 
         # Back propagate the options
@@ -430,6 +454,12 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
         self.joystick_count: int = 0
         self.timer: Any = None
 
+        # Axis motion is coalesced and filtered before it reaches the managers
+        self.axis_conditioner = AxisConditioner(
+            deadzone=options.get('axis_deadzone', DEFAULT_AXIS_DEADZONE),
+            quantum=options.get('axis_quantum', DEFAULT_AXIS_QUANTUM),
+        )
+
     def initialize_display(self: Self) -> None:
         """Initialize the display."""
         # Let's try to set a resolution to the most compatible for
@@ -850,6 +880,7 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
             raise RuntimeError(GAME_NOT_INITIALIZED_MSG)
 
         profiler = None
+        recorder = None
         try:
             if GameEngine.OPTIONS['profile']:
                 profiler = cProfile.Profile()
@@ -864,6 +895,8 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
 
             self._initialize_event_managers()
 
+            recorder = self._start_event_recording()
+
             self.scene_manager.switch_to_scene(self.game)
             # Initialize timer backend for draw-loop pacing (after options exist)
             try:
@@ -902,10 +935,43 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
             # Tests can override this behavior if needed
         finally:
             self._shutdown()
+            self._save_event_recording(recorder)
 
             if GameEngine.OPTIONS['profile'] and profiler is not None:
                 profiler.disable()
                 profiler.print_stats()
+                for line in tracer.report():
+                    self.log.info('Trace span %s', line)
+
+    def _start_event_recording(self: Self) -> EventRecorder | None:
+        """Start recording raw events if --record-events was given.
+
+        Returns:
+            EventRecorder | None: The recorder, or None when recording is off.
+
+        """
+        if not GameEngine.OPTIONS.get('record_events'):
+            return None
+
+        from glitchygames.performance.scene_benchmark import EventRecorder
+
+        recorder = EventRecorder()
+        recorder.attach(self)
+        return recorder
+
+    def _save_event_recording(self: Self, recorder: EventRecorder | None) -> None:
+        """Write the recorded event stream to the --record-events file.
+
+        Args:
+            recorder (EventRecorder | None): The recorder, or None when recording is off.
+
+        """
+        if recorder is None:
+            return
+
+        path = GameEngine.OPTIONS['record_events']
+        recorder.stream.save(path)
+        self.log.info(f'Recorded {len(recorder.stream)} frames of events to {path}')
 
     @classmethod
     def quit_game(cls) -> None:
@@ -953,14 +1019,16 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
         # Pass other events to the scene manager
         self.scene_manager.handle_event(event)
 
-    def process_events(self: Self) -> bool:
-        """Process events.
+    def _pump_events(self: Self) -> list[pygame.event.Event]:
+        """Drain the pygame event queue.
+
+        This is the single source of raw events for process_events(), so the
+        benchmark harness can record or replace the event stream here.
 
         Returns:
-            bool: True if the event was handled, False otherwise.
+            list[pygame.event.Event]: The pending events.
 
         """
-        event_was_handled = False
         # To use events in a different thread, use the fastevent package from pygame.
         # if you're using pygame < 2.2, you'll need to use pygame.fastevent.
         # if you're using pygame >= 2.2, you can use the new pygame.event.
@@ -970,9 +1038,17 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
         if self.USE_FASTEVENTS and hasattr(pygame, 'fastevent'):
             pump_events = pygame.fastevent.get  # type: ignore[attr-defined]
 
-        raw_events: list[pygame.event.Event] = cast(  # ty: ignore[redundant-cast]
-            'list[pygame.event.Event]', pump_events()
-        )
+        return cast('list[pygame.event.Event]', pump_events())  # ty: ignore[redundant-cast]
+
+    def process_events(self: Self) -> bool:
+        """Process events.
+
+        Returns:
+            bool: True if the event was handled, False otherwise.
+
+        """
+        event_was_handled = False
+        raw_events = self.axis_conditioner.condition(self._pump_events())
         for pygame_event in raw_events:
             # Support scenes processing pygame raw events, bypassing
             # the glitchygames.engine event processing altogether
@@ -1201,11 +1277,13 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             # MOUSEBUTTONDOWN  pos, button
-            self.log.debug(
-                'ENGINE: MOUSEBUTTONDOWN received:'
-                f' button={getattr(event, "button", None)},'
-                f' pos={getattr(event, "pos", None)}',
-            )
+            if tracer.events:
+                tracer.emit(
+                    'events',
+                    'ENGINE: MOUSEBUTTONDOWN received: button=%s, pos=%s',
+                    getattr(event, 'button', None),
+                    getattr(event, 'pos', None),
+                )
             self.mouse_manager.on_mouse_button_down_event(event)
             return True
 
@@ -1385,7 +1463,7 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
 
         return False
 
-    def process_game_event(self: Self, event: events.HashableEvent) -> bool:  # noqa: PLR0911
+    def process_game_event(self: Self, event: events.HashableEvent) -> bool:  # noqa: C901, PLR0911
         """Process a game event.
 
         Args:
@@ -1413,6 +1491,11 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
                 self.game_manager.on_menu_item_event(event)
                 return True
 
+            case events.VOICEEVENT:
+                # VOICEEVENT is pygame.USEREVENT + 4
+                self.game_manager.on_voice_command_event(event)
+                return True
+
             case pygame.ACTIVEEVENT:
                 # ACTIVEEVENT      gain, state
                 self.game_manager.on_active_event(event)
@@ -1496,7 +1579,9 @@ class GameEngine(events.EventManager):  # noqa: PLR0904
 
         if event.type not in self.UNIMPLEMENTED_EVENTS:
             self.log.debug(
-                f'(UNIMPLEMENTED) {pygame.event.event_name(event.type).upper()}: {event}',
+                '(UNIMPLEMENTED) %s: %s',
+                pygame.event.event_name(event.type).upper(),
+                event,
             )
             self.UNIMPLEMENTED_EVENTS.append(event.type)
 
@@ -28,6 +28,7 @@ from glitchygames.events.base import (
     MOUSE_EVENTS,
     TEXT_EVENTS,
     TOUCH_EVENTS,
+    VOICEEVENT,
     WINDOW_EVENTS,
     EventInterface,
     HashableEvent,
@@ -89,6 +90,7 @@ __all__ = [
     'MOUSE_EVENTS',
     'TEXT_EVENTS',
     'TOUCH_EVENTS',
+    'VOICEEVENT',
     'WINDOW_EVENTS',
     'AllEventStubs',
     'AllEvents',
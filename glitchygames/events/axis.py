@@ -0,0 +1,196 @@
+"""Axis-motion conditioning for joystick and controller events.
+
+Analog sticks report every tiny change, so a single frame can carry dozens of
+JOYAXISMOTION and CONTROLLERAXISMOTION events per device. Each of them would
+otherwise become a HashableEvent and walk the full proxy dispatch chain, even
+though handlers only care about where the stick ended up. The AxisConditioner
+sits between the raw event queue and dispatch: it keeps only the latest event
+for each device and axis, snaps values inside the deadzone to rest, drops
+changes smaller than the quantum, and keeps a polled state map so scenes can
+read axis positions without handling events at all.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, ClassVar, Self
+
+import pygame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+LOG: logging.Logger = logging.getLogger('game.events.axis')
+LOG.addHandler(logging.NullHandler())
+
+# Fraction of full scale around rest that is reported as exactly 0
+DEFAULT_AXIS_DEADZONE = 0.05
+
+# Smallest change, as a fraction of full scale, that is worth dispatching
+DEFAULT_AXIS_QUANTUM = 1 / 256
+
+# Full-scale magnitude of each axis event family's value
+AXIS_SCALE: dict[int, float] = {
+    pygame.JOYAXISMOTION: 1.0,
+    pygame.CONTROLLERAXISMOTION: 32767.0,
+}
+
+DEVICE_REMOVED_EVENTS = frozenset({pygame.JOYDEVICEREMOVED, pygame.CONTROLLERDEVICEREMOVED})
+
+# (event type, device id, axis)
+type AxisKey = tuple[int, int | None, int]
+
+INVALID_DEADZONE_MSG = 'Axis deadzone must be in [0, 1), got {deadzone}'
+INVALID_QUANTUM_MSG = 'Axis quantum must be in [0, 1), got {quantum}'
+
+
+def _device_id(event: pygame.event.Event) -> int | None:
+    """Return the id the event managers use to route an axis event.
+
+    Returns:
+        int | None: The event's instance_id, falling back to its joy index.
+
+    """
+    device_id = getattr(event, 'instance_id', None)
+    if device_id is None:
+        device_id = getattr(event, 'joy', None)
+    return device_id
+
+
+class AxisConditioner:
+    """Coalesce, deadzone and quantize axis-motion events before dispatch."""
+
+    log: ClassVar[logging.Logger] = LOG
+
+    def __init__(
+        self: Self,
+        deadzone: float = DEFAULT_AXIS_DEADZONE,
+        quantum: float = DEFAULT_AXIS_QUANTUM,
+    ) -> None:
+        """Initialize the conditioner.
+
+        Args:
+            deadzone (float): Fraction of full scale around rest that is
+                reported as 0.
+            quantum (float): Smallest change, as a fraction of full scale,
+                that is dispatched. Use 0 to dispatch every change.
+
+        Raises:
+            ValueError: If deadzone or quantum is outside [0, 1).
+
+        """
+        if not 0 <= deadzone < 1:
+            raise ValueError(INVALID_DEADZONE_MSG.format(deadzone=deadzone))
+        if not 0 <= quantum < 1:
+            raise ValueError(INVALID_QUANTUM_MSG.format(quantum=quantum))
+
+        self.deadzone = deadzone
+        self.quantum = quantum
+        # Last dispatched value of each axis, normalized to [-1, 1]
+        self.state: dict[AxisKey, float] = {}
+
+    def get_axis(
+        self: Self,
+        device_id: int,
+        axis: int,
+        event_type: int = pygame.CONTROLLERAXISMOTION,
+    ) -> float:
+        """Return the last dispatched position of an axis.
+
+        Args:
+            device_id (int): The device's instance id.
+            axis (int): The axis index.
+            event_type (int): The axis event family, CONTROLLERAXISMOTION or
+                JOYAXISMOTION.
+
+        Returns:
+            float: The axis position normalized to [-1, 1], or 0.0 if the axis
+                has not moved since the device was attached.
+
+        """
+        return self.state.get((event_type, device_id, axis), 0.0)
+
+    def condition(self: Self, raw_events: Iterable[pygame.event.Event]) -> list[pygame.event.Event]:
+        """Filter one frame's worth of raw events.
+
+        Only the last axis event for each device and axis survives, in the
+        position of that last event, so it is still ordered correctly against
+        button and device events. It is dropped if its conditioned value is
+        within one quantum of the value last dispatched. All other events pass
+        through untouched.
+
+        Args:
+            raw_events (Iterable[pygame.event.Event]): The events drained from
+                the pygame queue.
+
+        Returns:
+            list[pygame.event.Event]: The events to dispatch.
+
+        """
+        raw_events = list(raw_events)
+        last_index: dict[AxisKey, int] = {}
+        for index, event in enumerate(raw_events):
+            if event.type in AXIS_SCALE:
+                last_index[event.type, _device_id(event), event.axis] = index
+
+        conditioned: list[pygame.event.Event] = []
+        for index, event in enumerate(raw_events):
+            if event.type in DEVICE_REMOVED_EVENTS:
+                self.forget(event.instance_id)
+            elif event.type in AXIS_SCALE:
+                key = (event.type, _device_id(event), event.axis)
+                if last_index[key] != index:
+                    continue
+                axis_event = self._condition_axis(key, event)
+                if axis_event is not None:
+                    conditioned.append(axis_event)
+                continue
+            conditioned.append(event)
+        return conditioned
+
+    def forget(self: Self, device_id: int) -> None:
+        """Drop the polled state of a device that was removed.
+
+        Args:
+            device_id (int): The device's instance id.
+
+        """
+        for key in [key for key in self.state if key[1] == device_id]:
+            del self.state[key]
+
+    def _condition_axis(
+        self: Self,
+        key: AxisKey,
+        event: pygame.event.Event,
+    ) -> pygame.event.Event | None:
+        """Apply the deadzone and quantum to the surviving axis event.
+
+        Args:
+            key (AxisKey): The event's (type, device id, axis).
+            event (pygame.event.Event): The axis event.
+
+        Returns:
+            pygame.event.Event | None: The event to dispatch, with its value
+                snapped to 0 inside the deadzone, or None if the change is too
+                small to report.
+
+        """
+        value = event.value / AXIS_SCALE[event.type]
+        at_rest = abs(value) <= self.deadzone
+        if at_rest:
+            value = 0.0
+
+        # Rest and full deflection are always reported exactly
+        at_limit = at_rest or abs(value) >= 1.0
+        previous = self.state.get(key)
+        if previous is not None and (
+            value == previous or (not at_limit and abs(value - previous) < self.quantum)
+        ):
+            return None
+
+        self.state[key] = value
+        if at_rest and event.value:
+            # Don't touch the raw event; the recorder may be holding it
+            rest = type(event.value)(0)
+            return pygame.event.Event(event.type, {**event.dict, 'value': rest})
+        return event
@@ -107,6 +107,7 @@ def supported_events(like: str = '.*') -> list[int]:
 FPSEVENT = pygame.USEREVENT + 1
 GAMEEVENT = pygame.USEREVENT + 2
 MENUEVENT = pygame.USEREVENT + 3
+VOICEEVENT = pygame.USEREVENT + 4
 
 AUDIO_EVENTS = supported_events(like='AUDIO.*?')
 APP_EVENTS = supported_events(like='APP.*?')
@@ -135,7 +136,7 @@ GAME_EVENTS = list(
     - set(WINDOW_EVENTS),
 )
 
-GAME_EVENTS.extend([FPSEVENT, GAMEEVENT, MENUEVENT])
+GAME_EVENTS.extend([FPSEVENT, GAMEEVENT, MENUEVENT, VOICEEVENT])
 
 
 class GameOptionsProvider(Protocol):
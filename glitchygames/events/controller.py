@@ -16,6 +16,7 @@ import pygame
 import pygame._sdl2.controller
 
 from glitchygames.events import CONTROLLER_EVENTS, ControllerEvents, HashableEvent, ResourceManager
+from glitchygames.events.axis import DEFAULT_AXIS_DEADZONE, DEFAULT_AXIS_QUANTUM
 
 # Pygame has a bug where _sdl2 isn't visible in certain contexts
 pygame.controller = pygame._sdl2.controller  # type: ignore[attr-defined] # ty: ignore[unresolved-attribute]
@@ -290,6 +291,20 @@ class ControllerEventManager(ControllerEvents, ResourceManager):
             default='controller',
             help='Choose input event family to use (default: controller)',
         )
+        group.add_argument(
+            '--axis-deadzone',
+            type=float,
+            help='fraction of full scale around rest reported as 0 for analog axes'
+            f' (default: {DEFAULT_AXIS_DEADZONE})',
+            default=DEFAULT_AXIS_DEADZONE,
+        )
+        group.add_argument(
+            '--axis-quantum',
+            type=float,
+            help='smallest analog axis change, as a fraction of full scale, that is dispatched'
+            ' (default: 1/256)',
+            default=DEFAULT_AXIS_QUANTUM,
+        )
 
         return parser
 
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     import argparse
 
 from glitchygames.events import GameEvents, HashableEvent, ResourceManager
+from glitchygames.performance.tracing import TRACE_CATEGORIES, parse_trace_categories
 
 LOG = logging.getLogger(__name__)
 
@@ -94,6 +95,16 @@ class GameEventManager(ResourceManager, GameEvents):
             # USEREVENT        code
             self.game.on_user_event(event=event)
 
+        def on_voice_command_event(self: Self, event: HashableEvent) -> None:
+            """Handle voice command event.
+
+            Args:
+                event: The pygame event.
+
+            """
+            # VOICEEVENT is pygame.USEREVENT + 4
+            self.game.on_voice_command_event(event=event)
+
         def on_video_expose_event(self: Self, event: HashableEvent) -> None:
             """Handle video expose event.
 
@@ -242,6 +253,12 @@ class GameEventManager(ResourceManager, GameEvents):
         for proxy in self.proxies:
             proxy.on_user_event(event)
 
+    @override
+    def on_voice_command_event(self: Self, event: HashableEvent) -> None:
+        """Handle voice command event."""
+        for proxy in self.proxies:
+            proxy.on_voice_command_event(event)
+
     @override
     def on_video_expose_event(self: Self, event: HashableEvent) -> None:
         """Handle video expose event."""
@@ -287,5 +304,20 @@ class GameEventManager(ResourceManager, GameEvents):
             action='store_true',
             default=False,
         )
+        group.add_argument(
+            '--trace',
+            help='comma-separated hot-path trace categories to log'
+            f' ({", ".join(TRACE_CATEGORIES)}, or all);'
+            ' defaults to all at debug log level or with --profile',
+            metavar='CATEGORIES',
+            type=parse_trace_categories,
+            default=None,
+        )
+        group.add_argument(
+            '--record-events',
+            help='record the raw event stream to a JSON file for benchmark replay',
+            metavar='FILE',
+            default=None,
+        )
 
         return parser
@@ -657,6 +657,16 @@ class GameEvents(EventInterface):
         """
         # USEREVENT        code
 
+    @abc.abstractmethod
+    def on_voice_command_event(self: Self, event: HashableEvent) -> None:
+        """Handle voice command events.
+
+        Args:
+            event (HashableEvent): The event to handle.
+
+        """
+        # VOICEEVENT is pygame.USEREVENT + 4
+
     @abc.abstractmethod
     def on_video_expose_event(self: Self, event: HashableEvent) -> None:
         """Handle video expose events.
@@ -798,6 +808,16 @@ class GameEventStubs(EventInterface):
         # USEREVENT        code
         unhandled_event(self, event)
 
+    def on_voice_command_event(self: Self, event: HashableEvent) -> None:
+        """Handle voice command events.
+
+        Args:
+            event (HashableEvent): The event to handle.
+
+        """
+        # VOICEEVENT is pygame.USEREVENT + 4
+        unhandled_event(self, event)
+
     def on_video_expose_event(self: Self, event: HashableEvent) -> None:
         """Handle video expose events.
 
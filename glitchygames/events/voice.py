@@ -2,20 +2,29 @@
 
 This module provides voice recognition capabilities for the glitchygames engine,
 allowing users to control the application through voice commands.
+
+Recognition runs on a background thread, which only posts what it heard to
+the pygame event queue as a VOICEEVENT. Command callbacks run on the main
+thread when the scene forwards that event to on_voice_command_event(), so they
+can safely touch game state.
 """
 
 from __future__ import annotations
 
 import logging
+import re
 import threading
-import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import pygame
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-from glitchygames.events import ResourceManager
-from glitchygames.events.voice_backends import get_microphone_backend
+    from glitchygames.events.voice_backends import RecognizerBackend
+
+from glitchygames.events import VOICEEVENT, HashableEvent, ResourceManager
+from glitchygames.events.voice_backends import get_microphone_backend, get_recognizer_backend
 
 # Centralized logger for voice recognition
 LOG: logging.Logger = logging.getLogger('glitchygames.events.voice')
@@ -30,6 +39,14 @@ except ImportError:
     sr = None  # ty: ignore[invalid-assignment]
     SPEECH_RECOGNITION_AVAILABLE = False  # pyright: ignore[reportConstantRedefinition]
 
+# Seconds to wait before retrying after the recognizer fails; doubles on each
+# consecutive failure up to the maximum
+RECOGNIZER_RETRY_DELAY = 0.5
+RECOGNIZER_MAX_RETRY_DELAY = 8.0
+
+# Seconds to wait before listening again after a microphone error
+MICROPHONE_RETRY_DELAY = 1.0
+
 
 class VoiceEventManager(ResourceManager):
     """Manages voice recognition and command processing."""
@@ -57,11 +74,17 @@ class VoiceEventManager(ResourceManager):
             """Delegate register_command to the voice event manager."""
             self.game.register_command(phrase, callback)
 
-    def __init__(self, logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        recognizer_backend: str | None = None,
+    ) -> None:
         """Initialize the voice recognition manager.
 
         Args:
             logger: Optional logger instance. If None, creates a default logger.
+            recognizer_backend: The recognizer to use, e.g. 'keyword' or
+                'google'. If None, the best available backend is used.
 
         """
         super().__init__(game=self)
@@ -69,6 +92,9 @@ class VoiceEventManager(ResourceManager):
         self.is_listening = False
         self.listen_thread = None
         self.commands: dict[str, Callable[[], None]] = {}
+        # Read by the listener thread, so only ever replaced, never mutated
+        self._phrases: tuple[str, ...] = ()
+        self._partial_match: re.Pattern[str] | None = None
         self.stop_listening_event = threading.Event()
         # Provide a proxy for API symmetry with other event managers
         self.proxies = [VoiceEventManager.VoiceEventProxy(game=self)]
@@ -76,6 +102,10 @@ class VoiceEventManager(ResourceManager):
         # Initialize speech recognition components if available
         if SPEECH_RECOGNITION_AVAILABLE:
             self.recognizer: Any = sr.Recognizer()  # type: ignore[union-attr]
+            self.recognizer_backend: RecognizerBackend | None = get_recognizer_backend(
+                recognizer_backend
+            )
+            self.log.info('Voice recognizer selected: %s', self.recognizer_backend.name)
             self.microphone: Any = None
             # Select a backend microphone class
             mic_cls = get_microphone_backend()
@@ -86,6 +116,7 @@ class VoiceEventManager(ResourceManager):
                 self._setup_microphone()
         else:
             self.recognizer = None
+            self.recognizer_backend = None
             self.microphone = None
             self.log.warning('Speech recognition not available - voice commands disabled')
 
@@ -152,6 +183,11 @@ class VoiceEventManager(ResourceManager):
 
         """
         self.commands[phrase.lower()] = callback
+        self._phrases = tuple(self.commands)
+        # Longest phrases first, so the most specific command wins when
+        # several match at the same place in the utterance
+        alternatives = sorted(self._phrases, key=len, reverse=True)
+        self._partial_match = re.compile('|'.join(map(re.escape, alternatives)))
         self.log.info("Registered voice command: '%s'", phrase)
 
     def start_listening(self) -> None:
@@ -200,6 +236,8 @@ class VoiceEventManager(ResourceManager):
             self.log.error('Cannot start listen loop: microphone not available')
             return
 
+        retry_delay = RECOGNIZER_RETRY_DELAY
+
         # Open microphone once and keep it open for the duration
         with self.microphone as source:
             # Adjust for ambient noise once at the start
@@ -211,26 +249,75 @@ class VoiceEventManager(ResourceManager):
                     # Listen for audio with timeout
                     self.log.debug('Listening for voice input...')
                     audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=10)
-
-                    # Recognize speech
-                    try:
-                        text = self.recognizer.recognize_google(audio).lower()
-                        self.log.info("Recognized speech: '%s'", text)
-                        self._process_command(text)
-                    except sr.UnknownValueError:  # type: ignore[union-attr]
-                        # Speech was unintelligible, continue listening
-                        self.log.debug('Could not understand audio')
-                    except sr.RequestError:  # type: ignore[union-attr]
-                        self.log.error('Speech recognition service error')  # noqa: TRY400
-                        # Wait a bit before trying again
-                        time.sleep(2)
-
                 except sr.WaitTimeoutError:  # type: ignore[union-attr]
                     # Timeout is normal, continue listening
                     continue
                 except OSError:
                     self.log.error('Error in voice recognition loop')  # noqa: TRY400
-                    time.sleep(1)
+                    self.stop_listening_event.wait(MICROPHONE_RETRY_DELAY)
+                    continue
+
+                try:
+                    text = self.recognizer_backend.recognize(self.recognizer, audio, self._phrases)  # type: ignore[union-attr]
+                except sr.UnknownValueError:  # type: ignore[union-attr]
+                    # Speech was unintelligible, continue listening
+                    self.log.debug('Could not understand audio')
+                except sr.RequestError:  # type: ignore[union-attr]
+                    self.log.error(  # noqa: TRY400
+                        'Speech recognition service error, retrying in %.1fs', retry_delay
+                    )
+                    # Back off, but wake up immediately if we are stopped
+                    self.stop_listening_event.wait(retry_delay)
+                    retry_delay = min(retry_delay * 2, RECOGNIZER_MAX_RETRY_DELAY)
+                else:
+                    retry_delay = RECOGNIZER_RETRY_DELAY
+                    text = text.strip().lower()
+                    self.log.info("Recognized speech: '%s'", text)
+                    self._post_command(text)
+
+    def _post_command(self, text: str) -> None:
+        """Queue recognized text for dispatch on the main thread.
+
+        Args:
+            text: The recognized text (already lowercased)
+
+        """
+        try:
+            pygame.event.post(pygame.event.Event(VOICEEVENT, text=text))
+        except pygame.error:
+            self.log.exception("Could not post voice command '%s'", text)
+
+    def on_voice_command_event(self, event: HashableEvent) -> None:
+        """Run the command for a VOICEEVENT posted by the listener thread.
+
+        Scenes that use voice commands forward their on_voice_command_event()
+        here, so callbacks always run on the main thread.
+
+        Args:
+            event: The voice command event.
+
+        """
+        self._process_command(event.text)
+
+    def _match_command(self, text: str) -> str | None:
+        """Find the registered phrase for a recognized utterance.
+
+        Args:
+            text: The recognized text (already lowercased)
+
+        Returns:
+            The phrase equal to the text if there is one, otherwise the phrase
+            found earliest in the text, or None if no phrase matches.
+
+        """
+        if text in self.commands:
+            return text
+
+        if self._partial_match is None:
+            return None
+
+        match = self._partial_match.search(text)
+        return match.group() if match else None
 
     def _process_command(self, text: str) -> None:
         """Process a recognized voice command.
@@ -239,30 +326,24 @@ class VoiceEventManager(ResourceManager):
             text: The recognized text (already lowercased)
 
         """
-        # Check for exact matches first
-        if text in self.commands:
-            self.log.info("Executing voice command: '%s'", text)
-            try:
-                self.commands[text]()
-            except Exception:  # Arbitrary user callbacks can raise anything
-                self.log.exception("Error executing voice command '%s'", text)
+        command_phrase = self._match_command(text)
+        if command_phrase is None:
+            self.log.debug("No voice command found for: '%s'", text)
             return
 
-        # Check for partial matches (commands that contain the text)
-        for command_phrase, callback in self.commands.items():
-            if command_phrase in text:
-                self.log.info(
-                    "Executing partial match voice command: '%s' from '%s'",
-                    command_phrase,
-                    text,
-                )
-                try:
-                    callback()
-                except Exception:  # Arbitrary user callbacks can raise anything
-                    self.log.exception("Error executing voice command '%s'", command_phrase)
-                return
+        if command_phrase == text:
+            self.log.info("Executing voice command: '%s'", text)
+        else:
+            self.log.info(
+                "Executing partial match voice command: '%s' from '%s'",
+                command_phrase,
+                text,
+            )
 
-        self.log.debug("No voice command found for: '%s'", text)
+        try:
+            self.commands[command_phrase]()
+        except Exception:  # Arbitrary user callbacks can raise anything
+            self.log.exception("Error executing voice command '%s'", command_phrase)
 
     def is_available(self) -> bool:
         """Check if voice recognition is available.
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
-"""Voice microphone backend factory.
+"""Voice backend factories.
 
 Returns an AudioSource-compatible microphone class for speech_recognition,
-preferring miniaudio and falling back to PortAudio (via speech_recognition).
+preferring miniaudio and falling back to PortAudio (via speech_recognition),
+and the recognizer backend that turns captured audio into text.
 """
 
-from glitchygames.events.voice_backends.registry import get_microphone_backend
+from glitchygames.events.voice_backends.registry import (
+    get_microphone_backend,
+    get_recognizer_backend,
+)
+from glitchygames.events.voice_backends.voice_recognizers import (
+    GoogleRecognizer,
+    KeywordRecognizer,
+    RecognizerBackend,
+)
 
 __all__ = [
+    'GoogleRecognizer',
+    'KeywordRecognizer',
+    'RecognizerBackend',
     'get_microphone_backend',
+    'get_recognizer_backend',
 ]
@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
-"""Voice microphone backend registry.
+"""Voice backend registry.
 
 Provides factory functions for selecting the best available microphone backend
-for speech_recognition, preferring miniaudio and falling back to PortAudio.
+for speech_recognition, preferring miniaudio and falling back to PortAudio, and
+the recognizer backend that turns captured audio into text, preferring offline
+keyword spotting and falling back to the Google Web Speech API.
 """
 
 from __future__ import annotations
 
 import logging
 
+from glitchygames.events.voice_backends.voice_recognizers import (
+    GoogleRecognizer,
+    KeywordRecognizer,
+    RecognizerBackend,
+)
+
 LOG = logging.getLogger(__name__)
 
+# Recognizer backends by name, in order of preference
+RECOGNIZER_BACKENDS: dict[str, type[RecognizerBackend]] = {
+    KeywordRecognizer.name: KeywordRecognizer,
+    GoogleRecognizer.name: GoogleRecognizer,
+}
+
+UNKNOWN_RECOGNIZER_MSG = 'Unknown recognizer backend {name!r}; choose one of {choices}'
+UNAVAILABLE_RECOGNIZER_MSG = 'Recognizer backend {name!r} is not installed'
+
 
 def _try_import_miniaudio() -> type[object] | None:
     """Try to import the MiniaudioMicrophone backend.
@@ -93,3 +110,39 @@ def get_microphone_backend() -> type[object] | None:
         LOG.debug('voice_portaudio module not available')
 
     return None
+
+
+def get_recognizer_backend(name: str | None = None) -> RecognizerBackend:
+    """Return a recognizer backend instance.
+
+    Priority order when no name is given:
+    1) KeywordRecognizer (if pocketsphinx is installed)
+    2) GoogleRecognizer
+
+    Args:
+        name: The backend to use, e.g. 'keyword' or 'google'. If None, the
+            first available backend is used.
+
+    Returns:
+        RecognizerBackend: The recognizer backend.
+
+    Raises:
+        ValueError: If the named backend does not exist or is not installed.
+
+    """
+    if name is not None:
+        try:
+            backend_cls = RECOGNIZER_BACKENDS[name]
+        except KeyError:
+            message = UNKNOWN_RECOGNIZER_MSG.format(name=name, choices=list(RECOGNIZER_BACKENDS))
+            raise ValueError(message) from None
+        if not backend_cls.available():
+            raise ValueError(UNAVAILABLE_RECOGNIZER_MSG.format(name=name))
+        return backend_cls()
+
+    for backend_cls in RECOGNIZER_BACKENDS.values():
+        if backend_cls.available():
+            return backend_cls()
+        LOG.debug('%s recognizer not available, trying next backend', backend_cls.name)
+
+    return GoogleRecognizer()
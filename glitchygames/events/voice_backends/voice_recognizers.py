@@ -0,0 +1,113 @@
+"""Speech recognizer backends for the voice event manager.
+
+Each backend turns one utterance captured by speech_recognition into text.
+They raise speech_recognition's UnknownValueError when nothing was understood
+and RequestError when the engine itself failed, so the listen loop handles
+every backend the same way.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class RecognizerBackend(Protocol):
+    """Protocol for objects that turn captured audio into text."""
+
+    name: ClassVar[str]
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if the backend's dependencies are installed."""
+        ...
+
+    def recognize(self, recognizer: Any, audio: Any, phrases: Sequence[str]) -> str:
+        """Return the text spoken in the audio.
+
+        Args:
+            recognizer: The speech_recognition.Recognizer that captured the audio.
+            audio: The speech_recognition.AudioData to recognize.
+            phrases: The registered command phrases.
+
+        """
+        ...
+
+
+class GoogleRecognizer:
+    """Online recognizer using the Google Web Speech API."""
+
+    name: ClassVar[str] = 'google'
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True; the web API ships with speech_recognition.
+
+        Returns:
+            bool: Always True.
+
+        """
+        return True
+
+    def recognize(self, recognizer: Any, audio: Any, phrases: Sequence[str]) -> str:  # noqa: ARG002
+        """Send the audio to the web API and return the transcript.
+
+        Args:
+            recognizer: The speech_recognition.Recognizer that captured the audio.
+            audio: The speech_recognition.AudioData to recognize.
+            phrases: Unused; the web API transcribes free-form speech.
+
+        Returns:
+            str: The transcript.
+
+        """
+        return recognizer.recognize_google(audio)
+
+
+class KeywordRecognizer:
+    """Offline recognizer that only listens for the registered phrases.
+
+    Uses CMU Sphinx keyword spotting, so nothing leaves the machine and there
+    is no network round-trip per utterance.
+    """
+
+    name: ClassVar[str] = 'keyword'
+
+    def __init__(self, sensitivity: float = 0.8) -> None:
+        """Initialize the keyword recognizer.
+
+        Args:
+            sensitivity: How eagerly phrases are reported, from 0 (never) to
+                1 (on any similar sound).
+
+        """
+        self.sensitivity = sensitivity
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if pocketsphinx is installed.
+
+        Returns:
+            bool: True if the backend can be used.
+
+        """
+        return importlib.util.find_spec('pocketsphinx') is not None
+
+    def recognize(self, recognizer: Any, audio: Any, phrases: Sequence[str]) -> str:
+        """Spot the registered phrases in the audio.
+
+        Args:
+            recognizer: The speech_recognition.Recognizer that captured the audio.
+            audio: The speech_recognition.AudioData to recognize.
+            phrases: The registered command phrases to listen for. If empty,
+                Sphinx falls back to free-form recognition.
+
+        Returns:
+            str: The phrases that were heard.
+
+        """
+        keyword_entries = [(phrase, self.sensitivity) for phrase in phrases] or None
+        return recognizer.recognize_sphinx(audio, keyword_entries=keyword_entries)
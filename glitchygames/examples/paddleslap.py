@@ -27,6 +27,7 @@ from glitchygames.events.joystick import JoystickEventManager
 from glitchygames.fonts import FontManager
 from glitchygames.game_objects import BallSprite
 from glitchygames.game_objects.ball import BallSpawnMode, SpeedUpMode
+from glitchygames.game_objects.broad_phase import UniformGrid
 from glitchygames.game_objects.paddle import VerticalPaddle
 from glitchygames.game_objects.sounds import SFX
 from glitchygames.movement import Speed
@@ -52,6 +53,9 @@ MIN_TRAJECTORY_POSITIONS_FOR_CURVE = 5
 # Y trend threshold for detecting significant upward movement (negative = upward)
 UPWARD_CURVE_Y_TREND_THRESHOLD = -5
 
+# Broad-phase grid cell size in pixels (a few ball diameters)
+BROAD_PHASE_CELL_SIZE = 64
+
 
 class TextSprite(Sprite):
     """A sprite class for displaying text."""
@@ -254,9 +258,12 @@ class Game(Scene):
         self.last_ball_spawn_time = 0.0  # Track when we last spawned a ball
         self.ball_spawn_cooldown = 2.0  # Minimum 2 seconds between ball spawns
         # Per-pair collision cooldown to prevent duplicate collision processing
-        # when ball bounding boxes overlap across multiple consecutive frames.
-        # Maps (ball_id_1, ball_id_2) to remaining cooldown frames.
+        # when ball bounding boxes overlap across multiple consecutive steps.
+        # Maps (ball_id_1, ball_id_2) to remaining cooldown steps.
         self._ball_collision_cooldowns: dict[tuple[int, int], int] = {}
+        # Broad phases rebuilt every step so collision checks only visit nearby sprites
+        self.paddle_grid = UniformGrid(cell_size=BROAD_PHASE_CELL_SIZE)
+        self.ball_grid = UniformGrid(cell_size=BROAD_PHASE_CELL_SIZE)
         # Convert string argument to BallSpawnMode flag
         spawn_mode_str = self.options.get('ball_spawn_mode', 'paddle_only')
         if spawn_mode_str == 'paddle_only':
@@ -290,6 +297,7 @@ class Game(Scene):
             ball.collision_cooldowns = {}
             # Set up paddle collision callback for ball spawn (with speed limit check)
             ball.on_paddle_collision = self._spawn_new_ball_with_speed_check
+            ball.paddle_broad_phase = self.paddle_grid
             self.balls.append(ball)
 
         for ball in self.balls:
@@ -396,16 +404,26 @@ class Game(Scene):
             dt (float): The delta time.
 
         """
-        self.dt = dt
-        self.dt_timer += self.dt
+        super().dt_tick(dt)
 
         # Debug log ball positions and speeds before update
         for i, ball in enumerate(self.balls):
             if ball.alive():
                 self._debug_log_ball_trajectory(ball_index=i, ball=ball)
 
+        # Move the paddles first so balls collide against this frame's paddle positions
+        paddles = (self.player1, self.player2)
+        for paddle in paddles:
+            paddle.dt_tick(dt)
+        self.paddle_grid.rebuild(paddles)
+
         for sprite in self.all_sprites:
-            sprite.dt_tick(dt)
+            if sprite not in paddles:
+                sprite.dt_tick(dt)
+
+        # Resolve ball-to-ball collisions every step, so the outcome does not
+        # depend on the frame rate
+        self._handle_ball_collisions()
 
         # Debug log ball positions and speeds after update
         for i, ball in enumerate(self.balls):
@@ -445,9 +463,6 @@ class Game(Scene):
             # Paddle collision handling is now done in BallSprite._check_paddle_collisions()
             # The new system prevents clipping and triggers ball spawn via callback
 
-        # Check for ball-to-ball collisions
-        self._handle_ball_collisions()
-
         # Remove dead balls from our list
         balls_to_remove = [ball for ball in self.balls if not ball.alive()]
 
@@ -563,6 +578,7 @@ class Game(Scene):
         new_ball.collision_cooldowns = {}
         # Set up paddle collision callback for ball spawn (with speed limit check)
         new_ball.on_paddle_collision = self._spawn_new_ball_with_speed_check
+        new_ball.paddle_broad_phase = self.paddle_grid
 
         # Add to balls list and sprite group
         self.balls.append(new_ball)
@@ -623,7 +639,8 @@ class Game(Scene):
 
         Uses normal-decomposition for energy-conserving elastic collisions
         and per-pair cooldown to prevent duplicate collision processing when
-        bounding boxes overlap across multiple consecutive frames.
+        bounding boxes overlap across multiple consecutive steps. Only ball
+        pairs that share a broad-phase grid cell are tested.
 
         Args:
             None
@@ -631,56 +648,56 @@ class Game(Scene):
         """
         self._tick_collision_cooldowns()
 
-        # Number of frames to suppress re-detection after a collision
-        cooldown_frames = 10
-
-        # Check all pairs of balls for collisions
-        for i in range(len(self.balls)):
-            for j in range(i + 1, len(self.balls)):
-                # Skip pairs still in cooldown
-                pair_key = (id(self.balls[i]), id(self.balls[j]))
-                if pair_key in self._ball_collision_cooldowns:
-                    continue
-
-                ball1 = self.balls[i]
-                ball2 = self.balls[j]
-
-                dx, dy, distance, collision_distance = self._calculate_ball_distance(ball1, ball2)
-
-                # Skip if balls are too far apart or at exact same position
-                if distance > collision_distance or distance < SPEED_CHANGE_NOISE_FLOOR:
-                    continue
-
-                # Play collision sound
-                if hasattr(ball1, 'snd') and ball1.snd is not None:  # type: ignore[reportUnnecessaryComparison]
-                    ball1.snd.play()
-
-                # Collision normal (unit vector from ball1 center to ball2 center)
-                normal_x = dx / distance
-                normal_y = dy / distance
-
-                # Calculate relative velocity along collision normal
-                dvn = (ball2.speed.x - ball1.speed.x) * normal_x + (
-                    ball2.speed.y - ball1.speed.y
-                ) * normal_y
-
-                # Only skip if balls are clearly separating AND not overlapping
-                if dvn > 0 and distance >= collision_distance:
-                    continue
-
-                self._apply_elastic_collision(ball1, ball2, normal_x, normal_y)
-                self._cap_ball_speeds(ball1, ball2)
-                self._separate_overlapping_balls(
-                    ball1,
-                    ball2,
-                    normal_x=normal_x,
-                    normal_y=normal_y,
-                    collision_distance=collision_distance,
-                    distance=distance,
-                )
+        # Number of simulation steps to suppress re-detection after a collision
+        cooldown_steps = 10
+
+        # Check nearby pairs of balls for collisions
+        self.ball_grid.rebuild(self.balls)
+        candidate_pairs = cast(
+            'list[tuple[BallSprite, BallSprite]]', self.ball_grid.candidate_pairs()
+        )
+        for ball1, ball2 in candidate_pairs:
+            # Skip pairs still in cooldown
+            pair_key = (id(ball1), id(ball2))
+            if pair_key in self._ball_collision_cooldowns:
+                continue
+
+            dx, dy, distance, collision_distance = self._calculate_ball_distance(ball1, ball2)
+
+            # Skip if balls are too far apart or at exact same position
+            if distance > collision_distance or distance < SPEED_CHANGE_NOISE_FLOOR:
+                continue
+
+            # Play collision sound
+            if hasattr(ball1, 'snd') and ball1.snd is not None:  # type: ignore[reportUnnecessaryComparison]
+                ball1.snd.play()
+
+            # Collision normal (unit vector from ball1 center to ball2 center)
+            normal_x = dx / distance
+            normal_y = dy / distance
+
+            # Calculate relative velocity along collision normal
+            dvn = (ball2.speed.x - ball1.speed.x) * normal_x + (
+                ball2.speed.y - ball1.speed.y
+            ) * normal_y
+
+            # Only skip if balls are clearly separating AND not overlapping
+            if dvn > 0 and distance >= collision_distance:
+                continue
+
+            self._apply_elastic_collision(ball1, ball2, normal_x, normal_y)
+            self._cap_ball_speeds(ball1, ball2)
+            self._separate_overlapping_balls(
+                ball1,
+                ball2,
+                normal_x=normal_x,
+                normal_y=normal_y,
+                collision_distance=collision_distance,
+                distance=distance,
+            )
 
-                # Set cooldown for this pair to prevent duplicate processing
-                self._ball_collision_cooldowns[pair_key] = cooldown_frames
+            # Set cooldown for this pair to prevent duplicate processing
+            self._ball_collision_cooldowns[pair_key] = cooldown_steps
 
     def _tick_collision_cooldowns(self: Self) -> None:
         """Tick cooldowns: decrement all active cooldowns and remove expired ones."""
@@ -4,9 +4,10 @@
 This is a simple font manager that can be used to load fonts.
 """
 
-from glitchygames.fonts.font_manager import FontManager, GameFont
+from glitchygames.fonts.font_manager import FontManager, GameFont, GlyphAtlas
 
 __all__ = [
     'FontManager',
     'GameFont',
+    'GlyphAtlas',
 ]
@@ -6,6 +6,7 @@ This module contains the FontManager class for loading and managing fonts.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -74,6 +75,174 @@ from glitchygames.events import FontEvents, ResourceManager  # noqa: E402
 log = logging.getLogger('game.fonts')
 log.addHandler(logging.NullHandler())
 
+# Maximum number of rendered text surfaces (and text measurements) kept in the LRU caches
+RENDER_CACHE_SIZE = 512
+
+# Characters compared to decide whether a font is monospaced
+_MONOSPACE_PROBE = 'iW.M '
+
+type RenderCacheKey = tuple[Any, ...]
+
+
+def _font_state(font: GameFont) -> tuple[Any, ...]:
+    """Return the mutable font attributes that affect rendering.
+
+    pygame.freetype fonts can change size, style and antialiasing after creation,
+    so these are part of every cache key alongside the font object itself.
+
+    Returns:
+        tuple: The font's current (size, style, antialiased) values, where known.
+
+    """
+    size = getattr(font, 'size', None)
+    if callable(size):
+        # pygame.font.Font.size() is a measuring method, not a settable size
+        size = None
+    return (size, getattr(font, 'style', None), getattr(font, 'antialiased', None))
+
+
+def _render_uncached(
+    font: GameFont,
+    text: str,
+    color: tuple[int, ...],
+    background: tuple[int, ...] | None,
+    *,
+    antialias: bool,
+) -> pygame.Surface:
+    """Rasterize text with either font system.
+
+    Returns:
+        pygame.Surface: The rendered text.
+
+    """
+    if hasattr(font, 'render_to'):
+        # pygame.freetype.Font: render(text, fgcolor, bgcolor) -> (Surface, Rect)
+        render_result = font.render(text, color, background)
+    else:
+        # pygame.font.Font: render(text, antialias, color, background) -> Surface
+        render_result = font.render(text, antialias, color, background)  # type: ignore[arg-type]  # ty: ignore[invalid-argument-type]
+    return render_result[0] if isinstance(render_result, tuple) else render_result  # ty: ignore[invalid-return-type]
+
+
+class GlyphAtlas:
+    """Pre-rendered glyphs of a monospaced font, assembled into strings by blitting.
+
+    Rasterizing a glyph once and blitting it for every occurrence is much cheaper
+    than rasterizing whole strings that change often (counters, coordinates,
+    slider values). Only monospaced fonts are supported, since every glyph is
+    placed on a fixed advance.
+    """
+
+    def __init__(
+        self: Self,
+        font: GameFont,
+        color: tuple[int, ...],
+        *,
+        background: tuple[int, ...] | None = None,
+        antialias: bool = True,
+    ) -> None:
+        """Initialize the atlas.
+
+        Args:
+            font (GameFont): A monospaced font.
+            color (tuple): The glyph color.
+            background (tuple | None): The background color, or None for transparent.
+            antialias (bool): Whether to antialias glyphs (pygame.font only).
+
+        """
+        self.font = font
+        self.color = color
+        self.background = background
+        self.antialias = antialias
+        self.advance = GlyphAtlas.glyph_advance(font, ' ')
+        self._is_freetype = hasattr(font, 'render_to')
+        if self._is_freetype:
+            self.height: int = font.get_sized_height()  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+            self._ascender: int = font.get_sized_ascender()  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+        else:
+            self.height = font.get_linesize()
+            self._ascender = 0
+        self.glyphs: dict[str, pygame.Surface] = {}
+
+    @staticmethod
+    def glyph_advance(font: GameFont, char: str) -> int:
+        """Return the horizontal advance of a single character.
+
+        Returns:
+            int: The advance in pixels.
+
+        """
+        if hasattr(font, 'get_metrics'):
+            metrics = font.get_metrics(char)  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+            if metrics and metrics[0]:
+                return round(metrics[0][4])
+        return font.size(char)[0]
+
+    @classmethod
+    def is_monospace(cls, font: GameFont) -> bool:
+        """Check whether a font gives every probe character the same advance.
+
+        Returns:
+            bool: True if the font appears to be monospaced.
+
+        """
+        try:
+            advances = {cls.glyph_advance(font, char) for char in _MONOSPACE_PROBE}
+        except (AttributeError, TypeError, IndexError, pygame.error) as e:
+            log.debug('Cannot measure font for glyph atlas: %s', e)
+            return False
+        return len(advances) == 1
+
+    def _new_surface(self: Self, width: int) -> pygame.Surface:
+        """Create a line-height surface filled with the background.
+
+        Returns:
+            pygame.Surface: The blank surface.
+
+        """
+        surface = pygame.Surface((max(width, 1), self.height), pygame.SRCALPHA)
+        surface.fill(self.background if self.background is not None else (0, 0, 0, 0))
+        return surface
+
+    def glyph(self: Self, char: str) -> pygame.Surface:
+        """Return the cell surface for a character, rendering it on first use.
+
+        Returns:
+            pygame.Surface: A surface of one advance by one line height.
+
+        """
+        cell = self.glyphs.get(char)
+        if cell is not None:
+            return cell
+
+        if self._is_freetype:
+            cell = self._new_surface(self.advance)
+            if not char.isspace():
+                # Place the glyph's bounding box so its baseline sits on the ascender line
+                bounds = self.font.get_rect(char)
+                self.font.render_to(cell, (bounds.x, self._ascender - bounds.y), char, self.color)
+        else:
+            cell = _render_uncached(
+                self.font, char, self.color, self.background, antialias=self.antialias
+            )
+
+        self.glyphs[char] = cell
+        return cell
+
+    def render(self: Self, text: str) -> pygame.Surface:
+        """Assemble a string from cached glyphs.
+
+        Returns:
+            pygame.Surface: The rendered string, one advance per character.
+
+        """
+        surface = self._new_surface(self.advance * len(text))
+        surface.blits(
+            [(self.glyph(char), (index * self.advance, 0)) for index, char in enumerate(text)],
+            doreturn=False,
+        )
+        return surface
+
 
 class FontManager(ResourceManager):
     """A font manager for handling fonts in the game.
@@ -100,8 +269,11 @@ class FontManager(ResourceManager):
     """
 
     OPTIONS: ClassVar[dict[str, Any]] = {}
-    RENDER_CACHE: ClassVar[dict[str, Any]] = {}
+    # LRU caches of rendered text surfaces and text widths, shared by all widgets
+    RENDER_CACHE: ClassVar[OrderedDict[RenderCacheKey, pygame.Surface]] = OrderedDict()
+    MEASURE_CACHE: ClassVar[OrderedDict[RenderCacheKey, int]] = OrderedDict()
     _font_cache: ClassVar[dict[str, GameFont]] = {}
+    _glyph_atlases: ClassVar[dict[RenderCacheKey, GlyphAtlas | None]] = {}
 
     class FontProxy(FontEvents, ResourceManager):
         """A font proxy."""
@@ -330,6 +502,137 @@ class FontManager(ResourceManager):
         FontManager._font_cache[cache_key] = loaded_font
         return loaded_font
 
+    @classmethod
+    def render_text(  # noqa: PLR0913
+        cls,
+        font: GameFont,
+        text: str,
+        color: tuple[int, ...],
+        *,
+        background: tuple[int, ...] | None = None,
+        antialias: bool = True,
+        monospace: bool = False,
+    ) -> pygame.Surface:
+        """Render text through the shared LRU surface cache.
+
+        Surfaces are keyed by font, font size/style, color, background, antialias
+        and string, so widgets that redraw the same text every frame only
+        rasterize it once. The returned surface is shared and must not be
+        modified; blit it or copy it first.
+
+        Args:
+            font (GameFont): A pygame.font or pygame.freetype font.
+            text (str): The string to render.
+            color (tuple): The text color.
+            background (tuple | None): The background color, or None for transparent.
+            antialias (bool): Whether to antialias (pygame.font only; freetype fonts
+                use their own antialiased setting).
+            monospace (bool): Assemble cache misses from a glyph atlas when the font
+                is monospaced.
+
+        Returns:
+            pygame.Surface: The rendered text.
+
+        """
+        key = (
+            font,
+            _font_state(font),
+            text,
+            tuple(color),
+            tuple(background) if background is not None else None,
+            antialias,
+        )
+        cache = FontManager.RENDER_CACHE
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+
+        atlas = (
+            cls.glyph_atlas(font, color, background=background, antialias=antialias)
+            if monospace
+            else None
+        )
+        if atlas is not None:
+            surface = atlas.render(text)
+        else:
+            surface = _render_uncached(font, text, color, background, antialias=antialias)
+
+        cache[key] = surface
+        if len(cache) > RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+
+    @classmethod
+    def text_width(cls, font: GameFont, text: str) -> int:
+        """Measure the rendered width of text through the shared LRU cache.
+
+        Args:
+            font (GameFont): A pygame.font or pygame.freetype font.
+            text (str): The string to measure.
+
+        Returns:
+            int: The width in pixels.
+
+        """
+        key = (font, _font_state(font), text)
+        cache = FontManager.MEASURE_CACHE
+        width = cache.get(key)
+        if width is not None:
+            cache.move_to_end(key)
+            return width
+
+        # pygame.freetype.Font measures with get_rect(), pygame.font.Font with size()
+        width = font.get_rect(text).width if hasattr(font, 'get_rect') else font.size(text)[0]
+
+        cache[key] = width
+        if len(cache) > RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return width
+
+    @classmethod
+    def glyph_atlas(
+        cls,
+        font: GameFont,
+        color: tuple[int, ...],
+        *,
+        background: tuple[int, ...] | None = None,
+        antialias: bool = True,
+    ) -> GlyphAtlas | None:
+        """Get the shared glyph atlas for a monospaced font and color.
+
+        Args:
+            font (GameFont): The font to build glyphs from.
+            color (tuple): The glyph color.
+            background (tuple | None): The background color, or None for transparent.
+            antialias (bool): Whether to antialias glyphs (pygame.font only).
+
+        Returns:
+            GlyphAtlas | None: The atlas, or None if the font is not monospaced.
+
+        """
+        key = (
+            font,
+            _font_state(font),
+            tuple(color),
+            tuple(background) if background is not None else None,
+            antialias,
+        )
+        if key not in FontManager._glyph_atlases:
+            FontManager._glyph_atlases[key] = (
+                GlyphAtlas(font, color, background=background, antialias=antialias)
+                if GlyphAtlas.is_monospace(font)
+                else None
+            )
+        return FontManager._glyph_atlases[key]
+
+    @classmethod
+    def clear_render_cache(cls) -> None:
+        """Drop all cached text surfaces, measurements and glyph atlases."""
+        FontManager.RENDER_CACHE.clear()
+        FontManager.MEASURE_CACHE.clear()
+        FontManager._glyph_atlases.clear()
+
     @classmethod
     def get_font(
         cls,
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 from .ball import BallSprite
+from .broad_phase import UniformGrid
 from .paddle import BasePaddle, HorizontalPaddle, VerticalPaddle
-from .sounds import SFX, load_sound
+from .sounds import SFX, BankedSound, SoundBank, load_sound, sound_bank
 
 __all__ = [
     'SFX',
     'BallSprite',
+    'BankedSound',
     'BasePaddle',
     'HorizontalPaddle',
+    'SoundBank',
+    'UniformGrid',
     'VerticalPaddle',
     'load_sound',
+    'sound_bank',
 ]
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
     import logging
     from collections.abc import Callable
 
+    from glitchygames.game_objects.broad_phase import UniformGrid
+
 import pygame
 
 from glitchygames import game_objects
@@ -163,6 +165,8 @@ class SpeedUpMode:
 class BallSprite(Sprite):
     """Ball Sprite."""
 
+    INTERPOLATE = True
+
     def __init__(
         self: Self,
         *,
@@ -204,7 +208,7 @@ class BallSprite(Sprite):
         self.direction = 0
         self.speed = Speed(250.0, 125.0)  # 250 pixels/second horizontal, 125 pixels/second vertical
         if collision_sound:
-            self.snd = game_objects.load_sound(collision_sound)
+            self.snd = game_objects.sound_bank.get(collision_sound)
         self.color = WHITE
 
         # Configure boundary bouncing behavior
@@ -220,6 +224,9 @@ class BallSprite(Sprite):
         # Collision tracking (set by callers like PaddleSlap)
         self.collision_cooldowns: dict[str, float] = {}
         self.on_paddle_collision: Callable[[BallSprite], None] | None = None
+        # Broad phase holding the scene's paddles, rebuilt by the scene once per frame.
+        # When unset, every sprite in the ball's groups is scanned instead.
+        self.paddle_broad_phase: UniformGrid | None = None
 
         # Debug trajectory tracking (used for trajectory analysis)
         self._debug_positions: list[tuple[float, float, float, float]] = []
@@ -264,6 +271,7 @@ class BallSprite(Sprite):
         # Set position directly to rect, maintaining consistency
         self.rect.x = secrets.randbelow(700) + 50  # 50-749 range
         self.rect.y = secrets.randbelow(375) + 25  # 25-399 range
+        self.store_previous_position()
 
         # Direction of ball (in degrees) - avoid pure vertical movement
         # Use ranges that ensure horizontal movement
@@ -853,14 +861,22 @@ class BallSprite(Sprite):
             None
 
         """
-        # Get all paddle sprites from the same groups as this ball
-        paddle_sprites = [
-            sprite
-            for group in self.groups()
-            for sprite in group
-            if (hasattr(sprite, 'snd') or sprite.__class__.__name__.lower().find('paddle') != -1)
-            and sprite != self
-        ]
+        if self.paddle_broad_phase is not None:
+            # Only paddles sharing a grid cell with the ball can overlap it
+            paddle_sprites = [
+                sprite for sprite in self.paddle_broad_phase.query(self.rect) if sprite is not self
+            ]
+        else:
+            # Get all paddle sprites from the same groups as this ball
+            paddle_sprites = [
+                sprite
+                for group in self.groups()
+                for sprite in group
+                if (
+                    hasattr(sprite, 'snd') or sprite.__class__.__name__.lower().find('paddle') != -1
+                )
+                and sprite != self
+            ]
 
         # Check collision with each paddle
         for paddle in paddle_sprites:
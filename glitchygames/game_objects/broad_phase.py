@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Uniform-grid broad phase for sprite collision detection.
+
+The grid buckets sprites by the fixed-size cells their rects overlap, so
+collision checks only need to consider sprites that share a cell instead of
+every sprite in the scene. Rebuild the grid once per frame from the scene's
+sprite groups, then query it for nearby sprites or candidate pairs and run the
+exact (narrow phase) test only on those.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import pygame
+
+    from glitchygames.sprites import Sprite
+
+# Default cell size in pixels; a few times the size of a typical ball
+DEFAULT_CELL_SIZE = 64
+
+_CELL_SIZE_INVALID_MSG = 'cell_size must be positive, got {cell_size}'
+
+
+class UniformGrid:
+    """Uniform spatial hash of sprites keyed by grid cell."""
+
+    def __init__(self: Self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """Initialize an empty grid.
+
+        Args:
+            cell_size (int): The width and height of a grid cell in pixels.
+
+        Raises:
+            ValueError: If cell_size is not positive.
+
+        """
+        if cell_size <= 0:
+            raise ValueError(_CELL_SIZE_INVALID_MSG.format(cell_size=cell_size))
+
+        self.cell_size = cell_size
+        self._cells: defaultdict[tuple[int, int], list[Sprite]] = defaultdict(list)
+        # Insertion order of each sprite, used to report pairs in a stable order
+        self._order: dict[Sprite, int] = {}
+
+    def __len__(self: Self) -> int:
+        """Return the number of sprites in the grid.
+
+        Returns:
+            int: The sprite count.
+
+        """
+        return len(self._order)
+
+    def __contains__(self: Self, sprite: object) -> bool:
+        """Check whether a sprite is in the grid.
+
+        Returns:
+            bool: True if the sprite has been inserted since the last clear.
+
+        """
+        return sprite in self._order
+
+    def _cells_for_rect(self: Self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        """Yield the cells a rect overlaps.
+
+        The right and bottom edges are inclusive so rects that only touch
+        still share a cell.
+
+        Yields:
+            tuple[int, int]: Cell coordinates.
+
+        """
+        cell_size = self.cell_size
+        for cell_x in range(rect.left // cell_size, rect.right // cell_size + 1):
+            for cell_y in range(rect.top // cell_size, rect.bottom // cell_size + 1):
+                yield cell_x, cell_y
+
+    def clear(self: Self) -> None:
+        """Remove every sprite from the grid."""
+        self._cells.clear()
+        self._order.clear()
+
+    def insert(self: Self, sprite: Sprite) -> None:
+        """Add a sprite to every cell its rect overlaps.
+
+        Args:
+            sprite (Sprite): The sprite to add. Sprites without a rect are ignored.
+
+        """
+        if sprite.rect is None or sprite in self._order:
+            return
+
+        self._order[sprite] = len(self._order)
+        for cell in self._cells_for_rect(sprite.rect):
+            self._cells[cell].append(sprite)
+
+    def rebuild(self: Self, sprites: Iterable[Sprite]) -> None:
+        """Replace the grid contents with sprites at their current positions.
+
+        Args:
+            sprites (Iterable[Sprite]): The sprites to index, e.g. a sprite group.
+
+        """
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self: Self, rect: pygame.Rect) -> list[Sprite]:
+        """Find sprites whose cells overlap rect.
+
+        This is a conservative broad-phase test: every sprite that intersects
+        rect is returned, along with some that are merely nearby.
+
+        Args:
+            rect (pygame.Rect): The area to search.
+
+        Returns:
+            list[Sprite]: Nearby sprites in insertion order, without duplicates.
+
+        """
+        found: dict[Sprite, None] = {}
+        cells = self._cells
+        for cell in self._cells_for_rect(rect):
+            if cell in cells:
+                found.update(dict.fromkeys(cells[cell]))
+        return sorted(found, key=self._order.__getitem__)
+
+    def candidate_pairs(self: Self) -> list[tuple[Sprite, Sprite]]:
+        """Find every pair of sprites that share at least one cell.
+
+        Returns:
+            list[tuple[Sprite, Sprite]]: Pairs ordered by insertion order, each
+                reported once with the earlier-inserted sprite first.
+
+        """
+        order = self._order
+        pairs: set[tuple[int, int]] = set()
+        # Cells are filled in insertion order, so occupants are already sorted
+        for occupants in self._cells.values():
+            indices = [order[sprite] for sprite in occupants]
+            for i, first in enumerate(indices):
+                pairs.update((first, second) for second in indices[i + 1 :])
+
+        sprites = list(order)
+        return [(sprites[first], sprites[second]) for first, second in sorted(pairs)]
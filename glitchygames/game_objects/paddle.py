@@ -13,7 +13,7 @@ from glitchygames.movement import Horizontal, Vertical
 from glitchygames.movement.speed import Speed
 from glitchygames.sprites import Sprite
 
-from .sounds import load_sound
+from .sounds import sound_bank
 
 log = logging.getLogger('game.paddle')
 log.setLevel(logging.INFO)
@@ -22,6 +22,8 @@ log.setLevel(logging.INFO)
 class BasePaddle(Sprite):
     """Base Paddle class."""
 
+    INTERPOLATE = True
+
     def __init__(
         self: Self,
         axis: type[Horizontal | Vertical],
@@ -62,7 +64,7 @@ class BasePaddle(Sprite):
         self.image.convert()
         draw.rect(self.image, color, (0, 0, self.width, self.height))
         if collision_sound:
-            self.snd = load_sound(collision_sound)
+            self.snd = sound_bank.get(collision_sound)
         # Create Speed object based on axis type
         speed_obj = Speed(speed, 0) if axis is Horizontal else Speed(0, speed)
         self._move: Horizontal | Vertical = axis(speed_obj)
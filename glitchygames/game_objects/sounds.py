@@ -1,12 +1,41 @@
 #!/usr/bin/env python3
-"""Sounds."""
+"""Sounds.
+
+load_sound() decodes a sound file every time it is called. Sprites should get
+their sounds from the process-wide sound_bank instead, which decodes each file
+once and plays it through mixer channels reserved for its category. The bank
+also caps how many copies of a sound play at once and ignores retriggers that
+arrive within the same frame, so a burst of collisions costs a bounded number
+of voices.
+"""
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Self
 
 import pygame.mixer
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Mixer channels reserved for each sound category
+DEFAULT_CATEGORY_CHANNELS: dict[str, int] = {'sfx': 8}
+DEFAULT_CATEGORY = 'sfx'
+
+# Most copies of one sound that may play at the same time
+DEFAULT_MAX_VOICES = 3
+
+# Triggers of the same sound closer together than this (in seconds, about one
+# frame at 60 FPS) are dropped instead of stacking
+DEFAULT_RETRIGGER_INTERVAL = 0.02
+
+# Channels left unreserved for sounds played outside the bank
+UNRESERVED_CHANNELS = 8
+
+UNKNOWN_SOUND_CATEGORY_MSG = 'Unknown sound category {category!r}; choose from {choices}'
+
 
 class SFX:
     """Sound effects."""
@@ -18,6 +47,9 @@ class SFX:
 def load_sound(snd_file: str, volume: float = 0.25) -> pygame.mixer.Sound:
     """Load a sound file.
 
+    The file is read and decoded on every call; use sound_bank.get() for
+    sounds that are shared between sprites.
+
     Args:
         snd_file (str): The sound file to load.
         volume (float): The volume to set the sound to.
@@ -30,3 +62,175 @@ def load_sound(snd_file: str, volume: float = 0.25) -> pygame.mixer.Sound:
     sound = pygame.mixer.Sound(path)
     sound.set_volume(volume)
     return sound
+
+
+class BankedSound:
+    """A decoded sound shared through a SoundBank."""
+
+    __slots__ = ('bank', 'category', 'last_played', 'sound')
+
+    def __init__(self: Self, bank: SoundBank, sound: pygame.mixer.Sound, category: str) -> None:
+        """Initialize the banked sound.
+
+        Args:
+            bank (SoundBank): The bank that plays the sound.
+            sound (pygame.mixer.Sound): The decoded sound.
+            category (str): The sound category whose channels it plays on.
+
+        """
+        self.bank = bank
+        self.sound = sound
+        self.category = category
+        self.last_played = float('-inf')
+
+    def play(self: Self) -> pygame.mixer.Channel | None:
+        """Play the sound, subject to the bank's voice limits.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel playing the sound, or None
+                if the trigger was dropped.
+
+        """
+        return self.bank.play(self)
+
+    def stop(self: Self) -> None:
+        """Stop every copy of the sound that is playing."""
+        self.sound.stop()
+
+
+class SoundBank:
+    """Decode each sound once and limit how many play at the same time."""
+
+    def __init__(
+        self: Self,
+        category_channels: Mapping[str, int] | None = None,
+        max_voices: int = DEFAULT_MAX_VOICES,
+        retrigger_interval: float = DEFAULT_RETRIGGER_INTERVAL,
+    ) -> None:
+        """Initialize the sound bank.
+
+        Args:
+            category_channels (Mapping[str, int] | None): The number of mixer
+                channels to reserve for each sound category.
+            max_voices (int): The most copies of one sound that play at once.
+            retrigger_interval (float): Seconds within which repeated triggers
+                of a sound are dropped.
+
+        """
+        self.category_channels = dict(category_channels or DEFAULT_CATEGORY_CHANNELS)
+        self.max_voices = max_voices
+        self.retrigger_interval = retrigger_interval
+        self.sounds: dict[tuple[str, float, str], BankedSound] = {}
+        # Reserved channels by category, assigned when the first sound plays
+        self.channels: dict[str, list[pygame.mixer.Channel]] = {}
+
+    def get(
+        self: Self,
+        snd_file: str,
+        volume: float = 0.25,
+        category: str = DEFAULT_CATEGORY,
+    ) -> BankedSound:
+        """Get a shared sound, decoding it on first use.
+
+        Sounds are shared per file, volume, and category, so the same file
+        requested for another category plays on that category's channels.
+
+        Args:
+            snd_file (str): The sound file to load.
+            volume (float): The volume to set the sound to.
+            category (str): The sound category whose channels it plays on.
+
+        Returns:
+            BankedSound: The shared sound.
+
+        Raises:
+            ValueError: If the category has no reserved channels.
+
+        """
+        if category not in self.category_channels:
+            raise ValueError(
+                UNKNOWN_SOUND_CATEGORY_MSG.format(
+                    category=category,
+                    choices=', '.join(self.category_channels),
+                )
+            )
+
+        key = (snd_file, volume, category)
+        banked = self.sounds.get(key)
+        if banked is None:
+            banked = self.sounds[key] = BankedSound(self, load_sound(snd_file, volume), category)
+        return banked
+
+    def play(self: Self, banked: BankedSound) -> pygame.mixer.Channel | None:
+        """Play a banked sound on a free channel of its category.
+
+        The trigger is dropped if the sound was triggered within the
+        retrigger interval, if it is already playing on max_voices channels,
+        or if its category has no free channel.
+
+        Args:
+            banked (BankedSound): The sound to play.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel playing the sound, or None
+                if the trigger was dropped.
+
+        """
+        now = time.monotonic()
+        if now - banked.last_played < self.retrigger_interval:
+            return None
+        if not self._reserve_channels():
+            return None
+
+        free_channel = None
+        voices = 0
+        for channel in self.channels[banked.category]:
+            if channel.get_busy():
+                if channel.get_sound() is banked.sound:
+                    voices += 1
+            elif free_channel is None:
+                free_channel = channel
+        if free_channel is None or voices >= self.max_voices:
+            return None
+
+        free_channel.play(banked.sound)
+        banked.last_played = now
+        return free_channel
+
+    def clear(self: Self) -> None:
+        """Forget the decoded sounds and channel assignments."""
+        self.sounds.clear()
+        self.channels.clear()
+
+    def _reserve_channels(self: Self) -> bool:
+        """Reserve the categories' mixer channels if not done yet.
+
+        Reserved channels are never picked by Sound.play(), so sounds played
+        outside the bank cannot take them over.
+
+        Returns:
+            bool: True if the channels are available, False if the mixer is not
+                initialized.
+
+        """
+        if self.channels:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+
+        reserved = sum(self.category_channels.values())
+        pygame.mixer.set_num_channels(
+            max(pygame.mixer.get_num_channels(), reserved + UNRESERVED_CHANNELS)
+        )
+        pygame.mixer.set_reserved(reserved)
+
+        first = 0
+        for category, count in self.category_channels.items():
+            self.channels[category] = [
+                pygame.mixer.Channel(index) for index in range(first, first + count)
+            ]
+            first += count
+        return True
+
+
+sound_bank = SoundBank()
@@ -1,5 +1,27 @@
 """Performance management for glitchygames."""
 
 from .adaptive_clamping import AdaptiveClamping, performance_manager
+from .scene_benchmark import (
+    REFERENCE_WORKLOADS,
+    EventRecorder,
+    EventStream,
+    FixedStepClock,
+    SceneBenchmark,
+    Workload,
+)
+from .tracing import TRACE_CATEGORIES, Tracer, lazy, tracer
 
-__all__ = ['AdaptiveClamping', 'performance_manager']
+__all__ = [
+    'REFERENCE_WORKLOADS',
+    'TRACE_CATEGORIES',
+    'AdaptiveClamping',
+    'EventRecorder',
+    'EventStream',
+    'FixedStepClock',
+    'SceneBenchmark',
+    'Tracer',
+    'Workload',
+    'lazy',
+    'performance_manager',
+    'tracer',
+]
@@ -70,6 +70,8 @@ class AdaptiveClamping:
             self._fps_log_interval_ms: float | None = 1000.0  # Default 1 second
             self._current_scene = None
             self._target_fps = 0.0  # 0 means unlimited FPS
+            # Length of a fixed simulation step, or None for one variable step per frame
+            self._fixed_timestep: float | None = None
             # Percentage of frames to trim from both tails when summarizing FPS.
             self._trim_percent = 5.0
             # Sliding window configuration for low-RAM systems
@@ -96,6 +98,11 @@ class AdaptiveClamping:
         if len(self._dt_history) > DT_HISTORY_WINDOW:  # Keep last 60 frames
             self._dt_history.pop(0)
 
+        # A fixed simulation step is already constant; smoothing it toward
+        # 60 FPS would only change the game's speed
+        if self._fixed_timestep is not None:
+            return dt
+
         # Note: FPS tracking is now handled by FPS events, not here
         # This prevents double-counting and ensures we use the accurate FPS from pygame.clock
 
@@ -153,6 +160,15 @@ class AdaptiveClamping:
         """
         self._target_fps = target_fps
 
+    def set_fixed_timestep(self: Self, step: float | None) -> None:
+        """Set the fixed simulation step that dt values will have.
+
+        Args:
+            step (float | None): Step length in seconds, or None for a variable timestep.
+
+        """
+        self._fixed_timestep = step
+
     def set_trim_percent(self: Self, percent: float) -> None:
         """Set percentage of frames to trim from both tails for summaries.
 
@@ -0,0 +1,738 @@
+"""Headless, deterministic scene benchmark harness.
+
+Runs a Scene under the SceneManager with the dummy SDL video and audio drivers
+and a fixed-step clock, optionally replaying an event stream that was recorded
+from GameEngine.process_events(). Each frame is split into the same phases the
+SceneManager main loop uses (update, events, render, display) and each phase is
+timed separately, so a change to sprite updates, the event chain, or rendering
+can be measured on its own and compared run to run.
+
+Record a live session with the engine's --record-events option:
+
+    python -m glitchygames.examples.paddleslap --record-events session.json
+
+Then replay it headlessly:
+
+    with SceneBenchmark(Game, events=EventStream.load('session.json')) as harness:
+        harness.run(frames=len(harness.events))
+        print(harness.report())
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import pygame
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from types import TracebackType
+
+    from glitchygames.engine import GameEngine
+    from glitchygames.scenes import Scene, SceneManager
+
+LOG = logging.getLogger(__name__)
+
+# Simulated frame time for the fixed-step clock (60 FPS)
+DEFAULT_FIXED_DT = 1.0 / 60.0
+
+# SDL drivers that need neither a window system nor a sound card
+HEADLESS_SDL_DRIVERS = {'SDL_VIDEODRIVER': 'dummy', 'SDL_AUDIODRIVER': 'dummy'}
+
+# Keep per-frame logging out of the measurements unless asked for
+DEFAULT_BENCHMARK_ARGV = ('--log-level', 'warning')
+DEFAULT_BENCHMARK_LOG_LEVEL = logging.WARNING
+
+# Parent of the engine, scene, and game loggers
+GAME_LOGGER_NAME = 'game'
+
+# The frame phases reported by SceneBenchmark, in SceneManager loop order
+FRAME_PHASES = ('update', 'events', 'render', 'display')
+
+EVENT_STREAM_VERSION = 1
+
+_UNSUPPORTED_STREAM_VERSION_MSG = 'Unsupported event stream version: {version}'
+
+# Stroke session defaults for the Bitmappy reference workload
+STROKE_COUNT = 8
+STROKE_STEPS = 24
+
+# Fixed ball color for the paddleslap reference workload
+BALL_COLOR = (255, 255, 255)
+
+
+def use_headless_drivers() -> None:
+    """Select the dummy SDL video and audio drivers.
+
+    This must run before pygame initializes its display and mixer.
+    """
+    os.environ.update(HEADLESS_SDL_DRIVERS)
+
+
+class FixedStepClock:
+    """A clock that advances by the same delta time every frame."""
+
+    def __init__(self: Self, dt: float = DEFAULT_FIXED_DT) -> None:
+        """Initialize the clock.
+
+        Args:
+            dt (float): The simulated seconds per frame.
+
+        """
+        self.dt = dt
+        self.frame = 0
+        self.elapsed = 0.0
+
+    def tick(self: Self) -> float:
+        """Advance the clock by one frame.
+
+        Returns:
+            float: The delta time for the new frame.
+
+        """
+        self.frame += 1
+        self.elapsed = self.frame * self.dt
+        return self.dt
+
+
+def _to_json_value(value: object) -> object:
+    """Convert an event attribute to a JSON-compatible value.
+
+    Returns:
+        object: The converted value.
+
+    Raises:
+        TypeError: If the value cannot be represented in JSON.
+
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, tuple | list):
+        return [_to_json_value(item) for item in value]
+    raise TypeError(type(value).__name__)
+
+
+def _from_json_value(value: object) -> object:
+    """Convert a JSON value back to an event attribute.
+
+    Lists become tuples, matching how pygame reports positions and button states.
+
+    Returns:
+        object: The converted value.
+
+    """
+    if isinstance(value, list):
+        return tuple(_from_json_value(item) for item in value)
+    return value
+
+
+def serialize_event(event: pygame.event.Event) -> dict[str, Any]:
+    """Convert a pygame event to a JSON-compatible dict.
+
+    Attributes that cannot be represented in JSON (window handles, menu
+    objects, and so on) are dropped.
+
+    Args:
+        event (pygame.event.Event): The event to convert.
+
+    Returns:
+        dict[str, Any]: The event type and its serializable attributes.
+
+    """
+    attributes: dict[str, Any] = {}
+    for name, value in event.dict.items():
+        try:
+            attributes[name] = _to_json_value(value)
+        except TypeError:
+            LOG.debug('Dropping unserializable attribute %s from %s', name, event)
+    return {'type': event.type, 'attributes': attributes}
+
+
+def deserialize_event(data: dict[str, Any]) -> pygame.event.Event:
+    """Rebuild a pygame event from serialize_event() output.
+
+    Args:
+        data (dict[str, Any]): The serialized event.
+
+    Returns:
+        pygame.event.Event: The event.
+
+    """
+    attributes = {name: _from_json_value(value) for name, value in data['attributes'].items()}
+    return pygame.event.Event(data['type'], attributes)
+
+
+class EventStream:
+    """Raw pygame events grouped by the frame they were pumped in."""
+
+    def __init__(self: Self, frames: Iterable[list[dict[str, Any]]] = ()) -> None:
+        """Initialize the stream.
+
+        Args:
+            frames (Iterable[list[dict[str, Any]]]): Serialized events for each frame.
+
+        """
+        self.frames: list[list[dict[str, Any]]] = [list(frame) for frame in frames]
+
+    def __len__(self: Self) -> int:
+        """Return the number of recorded frames.
+
+        Returns:
+            int: The frame count.
+
+        """
+        return len(self.frames)
+
+    def append_frame(self: Self, frame_events: Iterable[pygame.event.Event]) -> None:
+        """Record the events pumped during one frame.
+
+        Args:
+            frame_events (Iterable[pygame.event.Event]): The events, in queue order.
+
+        """
+        self.frames.append([serialize_event(event) for event in frame_events])
+
+    def events_for_frame(self: Self, frame: int) -> list[pygame.event.Event]:
+        """Rebuild the events recorded for a frame.
+
+        Args:
+            frame (int): The zero-based frame index.
+
+        Returns:
+            list[pygame.event.Event]: The events, or an empty list past the end of the stream.
+
+        """
+        if frame >= len(self.frames):
+            return []
+        return [deserialize_event(data) for data in self.frames[frame]]
+
+    def to_json(self: Self) -> str:
+        """Serialize the stream.
+
+        Returns:
+            str: The stream as JSON.
+
+        """
+        return json.dumps({'version': EVENT_STREAM_VERSION, 'frames': self.frames})
+
+    @classmethod
+    def from_json(cls, text: str) -> EventStream:
+        """Deserialize a stream.
+
+        Args:
+            text (str): JSON produced by to_json().
+
+        Returns:
+            EventStream: The stream.
+
+        Raises:
+            ValueError: If the stream was written by an unsupported version.
+
+        """
+        data = json.loads(text)
+        version = data.get('version')
+        if version != EVENT_STREAM_VERSION:
+            raise ValueError(_UNSUPPORTED_STREAM_VERSION_MSG.format(version=version))
+        return cls(data['frames'])
+
+    def save(self: Self, path: Path | str) -> None:
+        """Write the stream to a JSON file.
+
+        Args:
+            path (Path | str): The destination file.
+
+        """
+        Path(path).write_text(self.to_json(), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: Path | str) -> EventStream:
+        """Read a stream from a JSON file.
+
+        Args:
+            path (Path | str): The source file.
+
+        Returns:
+            EventStream: The stream.
+
+        """
+        return cls.from_json(Path(path).read_text(encoding='utf-8'))
+
+
+class EventRecorder:
+    """Captures every event batch GameEngine.process_events() pumps."""
+
+    def __init__(self: Self) -> None:
+        """Initialize the recorder with an empty stream."""
+        self.stream = EventStream()
+
+    def attach(self: Self, engine: GameEngine) -> None:
+        """Start recording the engine's event batches.
+
+        Args:
+            engine (GameEngine): The engine to record from.
+
+        """
+        pump_events = engine._pump_events
+
+        def recording_pump() -> list[pygame.event.Event]:
+            raw_events = pump_events()
+            self.stream.append_frame(raw_events)
+            return raw_events
+
+        engine._pump_events = recording_pump  # ty: ignore[invalid-assignment]
+
+
+class EventPlayer:
+    """Feeds a recorded stream to GameEngine.process_events() one frame at a time."""
+
+    def __init__(self: Self, stream: EventStream) -> None:
+        """Initialize the player.
+
+        Args:
+            stream (EventStream): The events to replay.
+
+        """
+        self.stream = stream
+        self.frame = 0
+
+    def attach(self: Self, engine: GameEngine) -> None:
+        """Replace the engine's event source with the recorded stream.
+
+        Args:
+            engine (GameEngine): The engine to feed.
+
+        """
+        engine._pump_events = self.next_frame  # ty: ignore[invalid-assignment]
+
+    def next_frame(self: Self) -> list[pygame.event.Event]:
+        """Return the next frame's recorded events.
+
+        Anything posted to the live queue is discarded: events the game posts
+        to itself were captured in the recording, so passing them through as
+        well would deliver them twice.
+
+        Returns:
+            list[pygame.event.Event]: The events for this frame.
+
+        """
+        pygame.event.clear()
+        frame_events = self.stream.events_for_frame(self.frame)
+        self.frame += 1
+        return frame_events
+
+
+@dataclass
+class FrameTiming:
+    """Wall-clock seconds spent in each phase of one frame.
+
+    Attributes:
+        update: Time in SceneManager._update_scene (Scene.dt_tick)
+        events: Time in SceneManager._process_events (the event chain)
+        render: Time in SceneManager._render_scene (Scene.update and Scene.render)
+        display: Time in SceneManager._update_display
+
+    """
+
+    update: float
+    events: float
+    render: float
+    display: float
+
+    @property
+    def total(self: Self) -> float:
+        """Return the time spent in all phases.
+
+        Returns:
+            float: The frame time in seconds.
+
+        """
+        return self.update + self.events + self.render + self.display
+
+
+class SceneBenchmark:
+    """Drives a Scene frame by frame under the SceneManager and times each phase."""
+
+    def __init__(  # noqa: PLR0913
+        self: Self,
+        game: type[Scene],
+        *,
+        argv: Sequence[str] = (),
+        dt: float = DEFAULT_FIXED_DT,
+        events: EventStream | None = None,
+        prepare: Callable[[Scene], None] | None = None,
+        log_level: int = DEFAULT_BENCHMARK_LOG_LEVEL,
+    ) -> None:
+        """Initialize the harness.
+
+        Args:
+            game (type[Scene]): The scene class to run, as passed to GameEngine.
+            argv (Sequence[str]): Command line arguments for the engine and the game.
+            dt (float): The fixed delta time per frame.
+            events (EventStream | None): Events to replay; None replays an empty stream.
+            prepare (Callable[[Scene], None] | None): Called with the scene once it is
+                active, e.g. to place sprites deterministically.
+            log_level (int): Level for the game loggers while the harness is set up.
+                Some games raise it to DEBUG at import time, which would otherwise
+                dominate the measurements.
+
+        """
+        self.game = game
+        self.argv = [*DEFAULT_BENCHMARK_ARGV, *argv]
+        self.clock = FixedStepClock(dt)
+        self.events = events if events is not None else EventStream()
+        self.prepare = prepare
+        self.log_level = log_level
+        self._saved_log_level: int | None = None
+        self.engine: GameEngine | None = None
+        self.scene: Scene | None = None
+        self.timings: list[FrameTiming] = []
+
+    def __enter__(self: Self) -> Self:
+        """Set up the harness.
+
+        Returns:
+            Self: The harness.
+
+        """
+        self.setup()
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Tear down the harness."""
+        self.teardown()
+
+    @property
+    def scene_manager(self: Self) -> SceneManager:
+        """Return the engine's scene manager.
+
+        Returns:
+            SceneManager: The scene manager.
+
+        """
+        assert self.engine is not None
+        return self.engine.scene_manager
+
+    def setup(self: Self) -> None:
+        """Start the engine headlessly and make the scene active.
+
+        This mirrors GameEngine.start() up to, but not including, the main loop.
+        """
+        from glitchygames.engine import GameEngine
+        from glitchygames.scenes import SceneManager
+
+        use_headless_drivers()
+        SceneManager._reset()
+
+        game_logger = logging.getLogger(GAME_LOGGER_NAME)
+        self._saved_log_level = game_logger.level
+        game_logger.setLevel(self.log_level)
+
+        saved_argv = sys.argv
+        sys.argv = [self.game.NAME, *self.argv]
+        try:
+            with warnings.catch_warnings():
+                # The dummy driver has no accelerated renderer for SCALED windows
+                warnings.simplefilter('ignore')
+                engine = GameEngine(game=self.game)
+        finally:
+            sys.argv = saved_argv
+
+        self.scene = self.game(options=GameEngine.OPTIONS)
+        engine.game = self.scene
+        SceneManager.OPTIONS = GameEngine.OPTIONS
+        engine.scene_manager.game_engine = engine
+        engine._initialize_event_managers()
+        engine.scene_manager.switch_to_scene(self.scene)
+        self.engine = engine
+
+        if self.prepare is not None:
+            self.prepare(self.scene)
+
+        EventPlayer(self.events).attach(engine)
+
+    def teardown(self: Self) -> None:
+        """Clean up the active scene and release the scene manager."""
+        from glitchygames.scenes import SceneManager
+
+        if self.engine is not None:
+            self.scene_manager.terminate()
+            self.engine = None
+        SceneManager._reset()
+        if self._saved_log_level is not None:
+            logging.getLogger(GAME_LOGGER_NAME).setLevel(self._saved_log_level)
+            self._saved_log_level = None
+
+    def step(self: Self) -> FrameTiming:
+        """Run one frame.
+
+        Returns:
+            FrameTiming: The time spent in each phase of the frame.
+
+        """
+        scene_manager = self.scene_manager
+        scene_manager.dt = self.clock.tick()
+
+        start = time.perf_counter()
+        scene_manager._update_scene()
+        updated = time.perf_counter()
+        scene_manager._process_events()
+        processed = time.perf_counter()
+        scene_manager._render_scene()
+        rendered = time.perf_counter()
+        scene_manager._update_display()
+        displayed = time.perf_counter()
+
+        timing = FrameTiming(
+            update=updated - start,
+            events=processed - updated,
+            render=rendered - processed,
+            display=displayed - rendered,
+        )
+        self.timings.append(timing)
+
+        active_scene = scene_manager.active_scene
+        if (
+            active_scene is not None
+            and active_scene.next_scene is not None
+            and active_scene.next_scene != active_scene
+        ):
+            scene_manager.switch_to_scene(active_scene.next_scene)
+
+        return timing
+
+    @property
+    def running(self: Self) -> bool:
+        """Check whether the scene manager would keep looping.
+
+        Returns:
+            bool: False once the game quits or runs out of scenes.
+
+        """
+        scene_manager = self.scene_manager
+        return scene_manager.active_scene is not None and not scene_manager.quit_requested
+
+    def run(self: Self, frames: int) -> list[FrameTiming]:
+        """Run up to a number of frames, stopping early if the game quits.
+
+        Args:
+            frames (int): The number of frames to run.
+
+        Returns:
+            list[FrameTiming]: The timings of the frames that ran.
+
+        """
+        ran: list[FrameTiming] = []
+        for _ in range(frames):
+            if not self.running:
+                break
+            ran.append(self.step())
+        return ran
+
+    def report(self: Self) -> dict[str, Any]:
+        """Summarize the frame timings recorded so far.
+
+        Returns:
+            dict[str, Any]: The frame count, plus mean, median, and max milliseconds
+                for each phase and for the whole frame.
+
+        """
+        summary: dict[str, Any] = {'frames': len(self.timings)}
+        if not self.timings:
+            return summary
+
+        for phase in (*FRAME_PHASES, 'total'):
+            samples = [getattr(timing, phase) * 1000.0 for timing in self.timings]
+            summary[phase] = {
+                'mean_ms': statistics.fmean(samples),
+                'median_ms': statistics.median(samples),
+                'max_ms': max(samples),
+            }
+        return summary
+
+
+def stroke_session(
+    area: pygame.Rect,
+    *,
+    strokes: int = STROKE_COUNT,
+    steps: int = STROKE_STEPS,
+) -> EventStream:
+    """Build a stream of left-button drag strokes across an area.
+
+    Strokes alternate between the two diagonals and are spread evenly
+    across the area, one mouse event per frame.
+
+    Args:
+        area (pygame.Rect): The screen area to draw over, e.g. a canvas rect.
+        strokes (int): The number of strokes.
+        steps (int): The number of motion events per stroke.
+
+    Returns:
+        EventStream: The stroke session.
+
+    """
+    stream = EventStream()
+    left, top = area.left + 1, area.top + 1
+    width, height = area.width - 2, area.height - 2
+    for stroke in range(strokes):
+        offset = (stroke + 1) / (strokes + 1)
+        points = []
+        for step in range(steps + 1):
+            progress = step / steps
+            x = left + int(width * progress)
+            y = top + int(height * (offset * progress if stroke % 2 else 1 - offset * progress))
+            points.append((x, y))
+
+        stream.append_frame([
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': points[0], 'button': 1}),
+        ])
+        for previous, point in itertools.pairwise(points):
+            rel = (point[0] - previous[0], point[1] - previous[1])
+            stream.append_frame([
+                pygame.event.Event(
+                    pygame.MOUSEMOTION,
+                    {'pos': point, 'rel': rel, 'buttons': (1, 0, 0)},
+                ),
+            ])
+        stream.append_frame([
+            pygame.event.Event(pygame.MOUSEBUTTONUP, {'pos': points[-1], 'button': 1}),
+        ])
+    return stream
+
+
+@dataclass
+class Workload:
+    """A named, reproducible benchmark scenario.
+
+    Attributes:
+        name: Identifier used in benchmark reports
+        game: Returns the scene class to run (imported lazily)
+        frames: How many frames to run
+        argv: Command line arguments for the engine and the game
+        prepare: Called with the active scene before the first frame
+        build_events: Builds the event stream to replay from the active scene
+
+    """
+
+    name: str
+    game: Callable[[], type[Scene]]
+    frames: int
+    argv: list[str] = field(default_factory=list)
+    prepare: Callable[[Scene], None] | None = None
+    build_events: Callable[[Scene], EventStream] | None = None
+
+    def create(self: Self) -> SceneBenchmark:
+        """Create a harness for this workload.
+
+        Returns:
+            SceneBenchmark: A harness that has not been set up yet.
+
+        """
+        prepare = self.prepare
+        build_events = self.build_events
+        harness = SceneBenchmark(self.game(), argv=self.argv)
+
+        def prepare_scene(scene: Scene) -> None:
+            if prepare is not None:
+                prepare(scene)
+            if build_events is not None:
+                harness.events = build_events(scene)
+
+        harness.prepare = prepare_scene
+        return harness
+
+
+def _paddleslap_game() -> type[Scene]:
+    from glitchygames.examples.paddleslap import Game
+
+    return Game
+
+
+def _arrange_balls(scene: Scene) -> None:
+    """Lay the paddleslap balls out on a grid with fixed velocities.
+
+    Ball placement and color normally come from the secrets module, so they
+    are replaced here to make runs comparable. Balls bounce off every wall so
+    the population stays constant for the whole run.
+    """
+    balls = getattr(scene, 'balls', [])
+    columns = max(1, int(len(balls) ** 0.5))
+    rows = -(-len(balls) // columns)
+    margin = 40
+    for index, ball in enumerate(balls):
+        column, row = index % columns, index // columns
+        ball.rect.x = margin + (scene.screen_width - 2 * margin) * column // columns
+        ball.rect.y = margin + (scene.screen_height - 2 * margin) * row // rows
+        ball.speed.x = 250.0 if index % 2 else -250.0
+        ball.speed.y = 125.0 if index % 3 else -125.0
+        ball.bounce_left_right = True
+        ball.color = BALL_COLOR
+
+
+def paddleslap_workload(balls: int = 200, frames: int = 120) -> Workload:
+    """Create the paddleslap workload: many balls bouncing off walls, paddles, and each other.
+
+    Args:
+        balls (int): The number of balls.
+        frames (int): How many frames to run.
+
+    Returns:
+        Workload: The workload.
+
+    """
+    return Workload(
+        name=f'paddleslap-{balls}-balls',
+        game=_paddleslap_game,
+        frames=frames,
+        argv=['--balls', str(balls), '--ball-spawn-mode', 'none'],
+        prepare=_arrange_balls,
+    )
+
+
+def _bitmappy_game() -> type[Scene]:
+    from glitchygames.bitmappy.editor import BitmapEditorScene
+
+    return BitmapEditorScene
+
+
+def _canvas_strokes(scene: Scene) -> EventStream:
+    return stroke_session(scene.canvas.rect)  # type: ignore[attr-defined]
+
+
+def bitmappy_stroke_workload(size: str = '128x128') -> Workload:
+    """Create the Bitmappy workload: drag strokes across a large canvas.
+
+    Args:
+        size (str): The canvas size in pixels, as WIDTHxHEIGHT.
+
+    Returns:
+        Workload: The workload.
+
+    """
+    return Workload(
+        name=f'bitmappy-{size}-strokes',
+        game=_bitmappy_game,
+        frames=STROKE_COUNT * (STROKE_STEPS + 2),
+        argv=['--size', size, '--ai-workers', '0', '--no-autosave'],
+        build_events=_canvas_strokes,
+    )
+
+
+REFERENCE_WORKLOADS: dict[str, Callable[[], Workload]] = {
+    'paddleslap': paddleslap_workload,
+    'bitmappy-strokes': bitmappy_stroke_workload,
+}
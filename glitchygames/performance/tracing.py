@@ -0,0 +1,259 @@
+"""Category-gated tracing for hot paths.
+
+Debug logging on hot paths pays for building its messages even when DEBUG is
+off. The tracer exposes one boolean attribute per category instead, so a call
+site guarded with ``if tracer.sprites:`` costs a single attribute lookup while
+that category is disabled. Messages take %-style arguments, which logging only
+formats when a record is emitted, and lazy() defers payloads that are
+expensive to compute in the first place.
+
+Spans time a block of code under a category. Their totals are reported at
+exit when the engine runs with --profile.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, ClassVar, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from types import TracebackType
+
+LOG: logging.Logger = logging.getLogger('game.trace')
+LOG.addHandler(logging.NullHandler())
+
+TRACE_CATEGORIES = ('events', 'frames', 'sprites', 'canvas', 'film_strip', 'ai')
+
+UNKNOWN_CATEGORY_MSG = 'Unknown trace category {category!r}; choose from {choices}'
+
+# Returned by span() for disabled categories; nullcontext is reentrant
+_DISABLED_SPAN = contextlib.nullcontext()
+
+
+class Lazy:
+    """A trace argument that is only computed if the message is emitted."""
+
+    __slots__ = ('_function',)
+
+    def __init__(self: Self, function: Callable[[], object]) -> None:
+        """Initialize the lazy argument.
+
+        Args:
+            function (Callable[[], object]): Computes the value to log.
+
+        """
+        self._function = function
+
+    def __str__(self: Self) -> str:
+        """Compute and format the value.
+
+        Returns:
+            str: The value's str().
+
+        """
+        return str(self._function())
+
+    def __repr__(self: Self) -> str:
+        """Compute and format the value.
+
+        Returns:
+            str: The value's repr().
+
+        """
+        return repr(self._function())
+
+
+def lazy(function: Callable[[], object]) -> Lazy:
+    """Wrap a trace argument so it is only computed if the message is emitted.
+
+    Args:
+        function (Callable[[], object]): Computes the value to log.
+
+    Returns:
+        Lazy: The deferred argument.
+
+    """
+    return Lazy(function)
+
+
+class SpanStats:
+    """Accumulated timings for one traced span."""
+
+    __slots__ = ('count', 'max_ns', 'total_ns')
+
+    def __init__(self: Self) -> None:
+        """Initialize empty statistics."""
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class _Span:
+    """Context manager that adds its elapsed time to a SpanStats."""
+
+    __slots__ = ('_start_ns', '_stats')
+
+    def __init__(self: Self, stats: SpanStats) -> None:
+        self._stats = stats
+        self._start_ns = 0
+
+    def __enter__(self: Self) -> Self:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed_ns = time.perf_counter_ns() - self._start_ns
+        stats = self._stats
+        stats.count += 1
+        stats.total_ns += elapsed_ns
+        stats.max_ns = max(stats.max_ns, elapsed_ns)
+
+
+class Tracer:
+    """Category-gated trace messages and timing spans.
+
+    Each category in TRACE_CATEGORIES is a boolean attribute; check it before
+    building anything expensive:
+
+        if tracer.sprites:
+            tracer.emit('sprites', 'Loaded %s (%d rows)', name, len(rows))
+    """
+
+    log: ClassVar[logging.Logger] = LOG
+
+    events: bool
+    frames: bool
+    sprites: bool
+    canvas: bool
+    film_strip: bool
+    ai: bool
+
+    def __init__(self: Self) -> None:
+        """Initialize the tracer with every category disabled."""
+        self.loggers = {
+            category: logging.getLogger(f'game.trace.{category}') for category in TRACE_CATEGORIES
+        }
+        self.spans: dict[tuple[str, str], SpanStats] = {}
+        for category in TRACE_CATEGORIES:
+            setattr(self, category, False)
+
+    @property
+    def enabled_categories(self: Self) -> list[str]:
+        """The categories that are currently traced."""
+        return [category for category in TRACE_CATEGORIES if getattr(self, category)]
+
+    def configure(self: Self, categories: Iterable[str]) -> None:
+        """Trace exactly the given categories.
+
+        Args:
+            categories (Iterable[str]): The categories to enable.
+
+        """
+        enabled = set(categories)
+        for category in enabled:
+            _check_category(category)
+        for category in TRACE_CATEGORIES:
+            setattr(self, category, category in enabled)
+        if enabled:
+            self.log.info('Tracing enabled for: %s', ', '.join(self.enabled_categories))
+
+    def emit(self: Self, category: str, message: str, *args: object) -> None:
+        """Log a trace message if its category is enabled.
+
+        Args:
+            category (str): The trace category.
+            message (str): A %-style format string.
+            *args (object): The format arguments; wrap expensive ones in lazy().
+
+        """
+        if getattr(self, category):
+            self.loggers[category].debug(message, *args)
+
+    def span(self: Self, category: str, name: str) -> contextlib.AbstractContextManager[object]:
+        """Time a block of code if its category is enabled.
+
+        Args:
+            category (str): The trace category.
+            name (str): The span's name within the category.
+
+        Returns:
+            contextlib.AbstractContextManager[object]: The span to enter.
+
+        """
+        if not getattr(self, category):
+            return _DISABLED_SPAN
+
+        key = (category, name)
+        stats = self.spans.get(key)
+        if stats is None:
+            stats = self.spans[key] = SpanStats()
+        return _Span(stats)
+
+    def report(self: Self) -> list[str]:
+        """Summarize the recorded spans, most expensive first.
+
+        Returns:
+            list[str]: One line per span.
+
+        """
+        ranked = sorted(self.spans.items(), key=lambda item: item[1].total_ns, reverse=True)
+        return [
+            f'{category}.{name}: calls={stats.count}'
+            f' total={stats.total_ns / 1e6:.1f}ms'
+            f' mean={stats.total_ns / stats.count / 1e3:.1f}us'
+            f' max={stats.max_ns / 1e3:.1f}us'
+            for (category, name), stats in ranked
+        ]
+
+    def reset(self: Self) -> None:
+        """Discard the recorded spans."""
+        self.spans.clear()
+
+
+def _check_category(category: str) -> None:
+    """Reject names that are not trace categories.
+
+    Raises:
+        ValueError: If the category is unknown.
+
+    """
+    if category not in TRACE_CATEGORIES:
+        raise ValueError(
+            UNKNOWN_CATEGORY_MSG.format(category=category, choices=', '.join(TRACE_CATEGORIES))
+        )
+
+
+def parse_trace_categories(value: str) -> list[str]:
+    """Parse a --trace argument.
+
+    Args:
+        value (str): Comma-separated categories, or 'all'.
+
+    Returns:
+        list[str]: The categories to enable.
+
+    Raises:
+        argparse.ArgumentTypeError: If a category is unknown.
+
+    """
+    categories = [category.strip() for category in value.split(',') if category.strip()]
+    if 'all' in categories:
+        return list(TRACE_CATEGORIES)
+    try:
+        for category in categories:
+            _check_category(category)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+    return categories
+
+
+tracer = Tracer()
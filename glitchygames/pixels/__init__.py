@@ -2,6 +2,10 @@
 """Pixel data handling."""
 
 from glitchygames.pixels.pixel import (
+    decode_indexed,
+    decode_rgb_555,
+    decode_rgb_565,
+    decode_rgb_888,
     image_from_pixels,
     indexed_rgb_triplet_generator,
     pixels_from_data,
@@ -9,9 +13,14 @@ from glitchygames.pixels.pixel import (
     rgb_555_triplet_generator,
     rgb_565_triplet_generator,
     rgb_triplet_generator,
+    surface_from_rgb,
 )
 
 __all__ = [
+    'decode_indexed',
+    'decode_rgb_555',
+    'decode_rgb_565',
+    'decode_rgb_888',
     'image_from_pixels',
     'indexed_rgb_triplet_generator',
     'pixels_from_data',
@@ -19,4 +28,5 @@ __all__ = [
     'rgb_555_triplet_generator',
     'rgb_565_triplet_generator',
     'rgb_triplet_generator',
+    'surface_from_rgb',
 ]
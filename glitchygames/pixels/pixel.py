@@ -9,157 +9,147 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, cast
 
+import numpy as np
 import pygame
 
+from glitchygames.color import RGB_COMPONENT_COUNT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
 LOG = logging.getLogger('game.pixels')
 LOG.addHandler(logging.NullHandler())
 
+# (shift, bits) of the red, green and blue fields in a packed 16-bit pixel.
+# The 555 layout keeps the historical decoding: the low bit is ignored and
+# blue comes from bits 1-5.
+RGB_555_LAYOUT = ((11, 5), (6, 5), (1, 5))
+RGB_565_LAYOUT = ((11, 5), (5, 6), (0, 5))
 
-def indexed_rgb_triplet_generator(
-    pixel_data: Iterable[tuple[tuple[int, int, int], ...]],
-) -> Iterator[tuple[int, int, int]]:
-    """Yield (R, G, B) pixel tuples from a buffer of pixel tuples.
+type PackedPixelData = bytes | bytearray | memoryview | Iterable[tuple[int, ...]]
 
-    Yields:
-        tuple[int, int, int]: An (R, G, B) color tuple for each pixel datum.
 
-    """
-    try:
-        for datum in pixel_data:
-            yield datum[0]
-    except StopIteration:
-        pass
+def _packed_values(pixel_data: PackedPixelData) -> np.ndarray:
+    """Get packed 16-bit pixels as an integer array.
 
+    Args:
+        pixel_data: Little-endian 16-bit raw data, or the 1-tuples produced by
+            struct.iter_unpack('<H', ...)
 
-def rgb_555_triplet_generator(
-    pixel_data: Iterable[tuple[int, ...]],
-) -> Iterator[tuple[int, int, int]]:
-    """Yield (R, G, B) pixel tuples for 555 formated color data.
+    Returns:
+        np.ndarray: One integer per pixel.
 
-    Yields:
-        tuple[int, int, int]: An (R, G, B) color tuple extracted from 555 packed data.
+    Raises:
+        ValueError: If raw data has an odd number of bytes.
 
     """
-    try:
-        # Construct RGB triplets.
-        for packed_rgb_triplet in pixel_data:
-            # struct unpacks as a 1 element tuple.
-            rgb_data = bin(packed_rgb_triplet[0])
+    if isinstance(pixel_data, (bytes, bytearray, memoryview)):
+        if len(pixel_data) % 2:
+            message = f'Pixel data length ({len(pixel_data)}) is not divisible by 2'
+            raise ValueError(message)
+        return np.frombuffer(pixel_data, dtype='<u2').astype(np.uint32)
+    return np.fromiter((datum[0] for datum in pixel_data), dtype=np.uint32)
 
-            # binary conversions start with 0b, so chop that off.
-            rgb_data = rgb_data[2:]
 
-            # Pad the data out.
-            pad_bits = 16 - len(rgb_data)
-            pad_data = '0' * pad_bits
+def _expand_channels(values: np.ndarray, layout: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """Expand packed pixels into 8-bit RGB channels.
 
-            rgb_data = pad_data + rgb_data
+    Each field is shifted up to 8 bits and, unless it is zero, has its low
+    bits filled in so a full field maps to 255.
 
-            LOG.info('Padded %s bits (now %s)', pad_bits, rgb_data)
-
-            # red is 5 bits
-            red = int(rgb_data[0:5] + '000', 2)
+    Args:
+        values: Packed pixels
+        layout: (shift, bits) of the red, green and blue fields
 
-            if red:
-                red += 7
+    Returns:
+        np.ndarray: A (pixels, 3) uint8 array.
 
-            # green is 6 bits
-            green = int(rgb_data[5:10] + '000', 2)
+    """
+    rgb = np.empty((values.size, 3), dtype=np.uint8)
+    for channel, (shift, bits) in enumerate(layout):
+        field = (values >> shift) & ((1 << bits) - 1)
+        fill = (1 << (8 - bits)) - 1
+        rgb[:, channel] = (field << (8 - bits)) | np.where(field != 0, fill, 0)
+    return rgb
 
-            if green:
-                green += 7
 
-            # blue is 5 bits
-            blue = int(rgb_data[10:15] + '000', 2)
+def _triplets(rgb: np.ndarray) -> Iterator[tuple[int, int, int]]:
+    """Yield the rows of an RGB array as tuples.
 
-            # last bit is ignored or used for alpha.
+    Yields:
+        tuple[int, int, int]: An (R, G, B) color tuple for each pixel.
 
-            if blue:
-                blue += 7
+    """
+    for row in rgb.tolist():
+        yield cast('tuple[int, int, int]', tuple(row))
 
-            LOG.info('Packed RGB: %s', rgb_data)
-            LOG.info('Red: %s', red)
-            LOG.info('Green: %s', green)
-            LOG.info('Blue: %s', blue)
 
-            yield (red, green, blue)
-    except StopIteration:
-        pass
+def decode_indexed(
+    index_data: bytes | bytearray | memoryview,
+    palette: Sequence[Sequence[int]],
+) -> np.ndarray:
+    """Decode 8-bit palette indexes into RGB.
 
+    Args:
+        index_data: One palette index per byte
+        palette: The palette colors (RGB or RGBA; alpha is dropped)
 
-def rgb_565_triplet_generator(
-    pixel_data: Iterable[tuple[int, ...]],
-) -> Iterator[tuple[int, int, int]]:
-    """Yield (R, G, B) tuples for 565 formatted color data.
+    Returns:
+        np.ndarray: A (pixels, 3) uint8 array.
 
-    Yields:
-        tuple[int, int, int]: An (R, G, B) color tuple extracted from 565 packed data.
+    Raises:
+        ValueError: If an index is outside the palette.
 
     """
-    try:
-        # Construct RGB triplets.
-        for packed_rgb_triplet in pixel_data:
-            # struct unpacks as a 1 element tuple.
-            rgb_data = bin(packed_rgb_triplet[0])
-
-            # binary conversions start with 0b, so chop that off.
-            rgb_data = rgb_data[2:]
-
-            # Pad the data out.
-            pad_bits = 16 - len(rgb_data)
-            pad_data = '0' * pad_bits
+    indexes = np.frombuffer(index_data, dtype=np.uint8)
+    colors = np.array([tuple(color)[:3] for color in palette], dtype=np.uint8).reshape(-1, 3)
+    if indexes.size and int(indexes.max()) >= len(colors):
+        message = f'Palette index {int(indexes.max())} is out of range for {len(colors)} colors'
+        raise ValueError(message)
+    return colors[indexes]
 
-            rgb_data = pad_data + rgb_data
 
-            LOG.info('Padded %s bits (now %s)', pad_bits, rgb_data)
+def decode_rgb_555(pixel_data: PackedPixelData) -> np.ndarray:
+    """Decode 555 packed 16-bit pixels into RGB.
 
-            # red is 5 bits
-            red = int(rgb_data[0:5] + '000', 2)
+    Args:
+        pixel_data: Little-endian 16-bit raw data, or struct.iter_unpack 1-tuples
 
-            if red:
-                red += 7
+    Returns:
+        np.ndarray: A (pixels, 3) uint8 array.
 
-            # green is 6 bits
-            green = int(rgb_data[5:11] + '00', 2)
+    """
+    return _expand_channels(_packed_values(pixel_data), RGB_555_LAYOUT)
 
-            if green:
-                green += 3
 
-            # blue is 5 bits
-            blue = int(rgb_data[11:] + '000', 2)
+def decode_rgb_565(pixel_data: PackedPixelData) -> np.ndarray:
+    """Decode 565 packed 16-bit pixels into RGB.
 
-            if blue:
-                blue += 7
+    Args:
+        pixel_data: Little-endian 16-bit raw data, or struct.iter_unpack 1-tuples
 
-            LOG.info('Packed RGB: %s', rgb_data)
-            LOG.info('Red: %s', red)
-            LOG.info('Green: %s', green)
-            LOG.info('Blue: %s', blue)
+    Returns:
+        np.ndarray: A (pixels, 3) uint8 array.
 
-            yield (red, green, blue)
-    except StopIteration:
-        pass
+    """
+    return _expand_channels(_packed_values(pixel_data), RGB_565_LAYOUT)
 
 
-def rgb_triplet_generator(pixel_data: bytes) -> Iterator[tuple[int, int, int]]:
-    """Generate RGB triplets from pixel data.
+def decode_rgb_888(pixel_data: bytes | bytearray | memoryview) -> np.ndarray:
+    """Decode 24-bit RGB raw data.
 
     Args:
-        pixel_data: Raw pixel data as bytes
+        pixel_data: Raw pixel data, three bytes per pixel
 
-    Yields:
-        Tuples of (r,g,b) values
+    Returns:
+        np.ndarray: A (pixels, 3) uint8 array.
 
     Raises:
         ValueError: If pixel data is empty or its length is not divisible by 3.
 
     """
-    # Validate input
     if not pixel_data:
         message = 'Empty pixel data'
         raise ValueError(message)
@@ -168,45 +158,117 @@ def rgb_triplet_generator(pixel_data: bytes) -> Iterator[tuple[int, int, int]]:
         message = f'Pixel data length ({len(pixel_data)}) is not divisible by 3'
         raise ValueError(message)
 
-    # Convert bytes to integers
-    pixels = [int(b) for b in pixel_data]
+    return np.frombuffer(pixel_data, dtype=np.uint8).reshape(-1, 3)
+
+
+def surface_from_rgb(rgb: np.ndarray, width: int, height: int) -> pygame.Surface:
+    """Blit a (pixels, 3) RGB array into a new surface, row by row.
+
+    Missing pixels stay black and pixels past width * height are ignored.
+
+    Args:
+        rgb: The pixel colors in row-major order
+        width: The surface width
+        height: The surface height
+
+    Returns:
+        pygame.Surface: The result.
+
+    """
+    image = pygame.Surface((width, height))
+    count = min(len(rgb), width * height)
+    if not count:
+        return image
+
+    grid = np.zeros((height * width, 3), dtype=np.uint8)
+    grid[:count] = rgb[:count]
+    # surfarray indexes surfaces as [x][y]
+    pygame.surfarray.blit_array(image, grid.reshape(height, width, 3).transpose(1, 0, 2))
+    return image
+
+
+def indexed_rgb_triplet_generator(
+    pixel_data: Iterable[tuple[tuple[int, int, int], ...]],
+) -> Iterator[tuple[int, int, int]]:
+    """Yield (R, G, B) pixel tuples from a buffer of pixel tuples.
+
+    Use decode_indexed() to look raw palette indexes up in bulk.
+
+    Yields:
+        tuple[int, int, int]: An (R, G, B) color tuple for each pixel datum.
+
+    """
+    for datum in pixel_data:
+        yield datum[0]
+
+
+def rgb_555_triplet_generator(
+    pixel_data: Iterable[tuple[int, ...]],
+) -> Iterator[tuple[int, int, int]]:
+    """Yield (R, G, B) pixel tuples for 555 formated color data.
+
+    Yields:
+        tuple[int, int, int]: An (R, G, B) color tuple extracted from 555 packed data.
+
+    """
+    yield from _triplets(decode_rgb_555(pixel_data))
+
 
-    # Yield RGB triplets
-    for i in range(0, len(pixels), 3):
-        try:
-            r = pixels[i]
-            g = pixels[i + 1]
-            b = pixels[i + 2]
-            yield (r, g, b)
-        except IndexError as e:
-            message = f'Not enough data for RGB triplet at index {i}'
-            raise ValueError(message) from e
+def rgb_565_triplet_generator(
+    pixel_data: Iterable[tuple[int, ...]],
+) -> Iterator[tuple[int, int, int]]:
+    """Yield (R, G, B) tuples for 565 formatted color data.
+
+    Yields:
+        tuple[int, int, int]: An (R, G, B) color tuple extracted from 565 packed data.
+
+    """
+    yield from _triplets(decode_rgb_565(pixel_data))
+
+
+def rgb_triplet_generator(pixel_data: bytes) -> Iterator[tuple[int, int, int]]:
+    """Generate RGB triplets from pixel data.
+
+    Args:
+        pixel_data: Raw pixel data as bytes
+
+    Yields:
+        Tuples of (r,g,b) values
+
+    """
+    yield from _triplets(decode_rgb_888(pixel_data))
 
 
 def image_from_pixels(
-    pixels: list[tuple[int, int, int]],
+    pixels: Sequence[tuple[int, int, int]] | np.ndarray,
     width: int,
     height: int,
 ) -> pygame.Surface:
     """Produce a pygame.image object for the specified [(R, G, B), ...] pixel data.
 
+    Pixels may be RGB or RGBA, mixed freely; alpha is ignored.
+
     Returns:
         pygame.Surface: The result.
 
-    """
-    image = pygame.Surface((width, height))
-    y = 0
-    x = 0
-    for pixel in pixels:
-        image.fill(pixel, ((x, y), (1, 1)))
-
-        if (x + 1) % width == 0:
-            x = 0
-            y += 1
-        else:
-            x += 1
+    Raises:
+        ValueError: If a pixel has fewer than three (R, G, B) components.
 
-    return image
+    """
+    if not len(pixels):
+        return pygame.Surface((width, height))
+    rgb: np.ndarray | None
+    try:
+        rgb = np.asarray(pixels, dtype=np.uint8).reshape(len(pixels), -1)[:, :3]
+    except ValueError:
+        # Mixed RGB and RGBA tuples are not one rectangular array; trim each first
+        trimmed = [tuple(pixel)[:3] for pixel in pixels]
+        uniform = len({len(pixel) for pixel in trimmed}) == 1
+        rgb = np.array(trimmed, dtype=np.uint8) if uniform else None
+    if rgb is None or rgb.shape[1] != RGB_COMPONENT_COUNT:
+        message = 'Every pixel needs at least three (R, G, B) components'
+        raise ValueError(message)
+    return surface_from_rgb(rgb, width, height)
 
 
 def pixels_from_data(pixel_data: bytes) -> list[tuple[int, int, int]]:
@@ -216,14 +278,7 @@ def pixels_from_data(pixel_data: bytes) -> list[tuple[int, int, int]]:
         list: The result.
 
     """
-    pixels = rgb_triplet_generator(
-        pixel_data=pixel_data,
-    )
-
-    # We are converting the data from a generator to
-    # a list of data so that it can be referenced
-    # multiple times.
-    return list(pixels)
+    return list(_triplets(decode_rgb_888(pixel_data)))
 
 
 def pixels_from_path(path: str) -> list[tuple[int, int, int]]:
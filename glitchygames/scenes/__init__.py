@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Glitchy Games Engine scenes module."""
 
+from glitchygames.scenes.fixed_timestep import FixedTimestep, PositionInterpolator
 from glitchygames.scenes.scene import (
     JITTER_SAMPLE_BUFFER_MAX_SIZE,
     LOG,
@@ -11,6 +12,8 @@ from glitchygames.scenes.scene import (
 __all__ = [
     'JITTER_SAMPLE_BUFFER_MAX_SIZE',
     'LOG',
+    'FixedTimestep',
+    'PositionInterpolator',
     'Scene',
     'SceneManager',
 ]
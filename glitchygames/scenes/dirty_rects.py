@@ -0,0 +1,136 @@
+"""Dirty-rectangle coalescing for display updates.
+
+LayeredDirty.draw() returns one rect per changed sprite, so a frame full of
+particles or canvas pixels can hand pygame.display.update() hundreds of tiny,
+overlapping rects. SDL pays a fixed cost for every rect on top of the cost of
+copying its pixels, so a few merged regions are usually cheaper to push than
+many fragments. The coalescer models each rect as its area plus a fixed
+per-rect overhead, merges neighbors whenever the union is no more expensive
+than the parts, and falls back to a single bounding rect or a full-screen
+update when that beats the merged list.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Fixed cost of pushing one rect to the display, in pixel-equivalents
+DEFAULT_RECT_COST = 1024
+
+# Rects closer than this many pixels are considered for merging even if they
+# do not overlap
+DEFAULT_MERGE_MARGIN = 8
+
+# Rects above the sweep line are only set aside once this many are in reach,
+# which keeps the bookkeeping cheap when there are few rects
+ACTIVE_PRUNE_SIZE = 32
+
+
+def _area(rect: pygame.Rect) -> int:
+    """Return the number of pixels a rect covers.
+
+    Returns:
+        int: The rect's area.
+
+    """
+    return rect.width * rect.height
+
+
+def _merge_neighbors(
+    rects: list[pygame.Rect], rect_cost: int, merge_margin: int
+) -> list[pygame.Rect]:
+    """Merge rects with their neighbors wherever the union is no more expensive.
+
+    Rects are swept top to bottom. Each one repeatedly absorbs the nearby
+    rects still in reach while that is cheaper, so clusters collapse in a
+    single pass; rects that end above the sweep line can no longer be reached
+    and are set aside. Merging two rects saves one rect_cost and pays for the
+    extra area of the union, so it is worth it when the union adds at most
+    rect_cost pixels.
+
+    Args:
+        rects (list[pygame.Rect]): Non-empty, clipped rects.
+        rect_cost (int): The per-rect overhead in pixel-equivalents.
+        merge_margin (int): How far apart rects may be and still be merged.
+
+    Returns:
+        list[pygame.Rect]: The merged rects.
+
+    """
+    margin = merge_margin * 2
+    finished: list[pygame.Rect] = []
+    active: list[pygame.Rect] = []
+    for rect in sorted(rects, key=attrgetter('top')):
+        if len(active) > ACTIVE_PRUNE_SIZE:
+            reach = rect.top - merge_margin
+            finished.extend(other for other in active if other.bottom < reach)
+            active = [other for other in active if other.bottom >= reach]
+
+        current = rect
+        while hits := current.inflate(margin, margin).collidelistall(active):
+            budget = _area(current) + rect_cost
+            absorbed = [
+                index
+                for index in hits
+                if _area(current.union(active[index])) <= budget + _area(active[index])
+            ]
+            if not absorbed:
+                break
+            current = current.unionall([active[index] for index in absorbed])
+            for index in reversed(absorbed):
+                del active[index]
+        active.append(current)
+    return finished + active
+
+
+def coalesce_dirty_rects(
+    rects: Iterable[pygame.Rect | None],
+    bounds: pygame.Rect | None = None,
+    *,
+    rect_cost: int = DEFAULT_RECT_COST,
+    merge_margin: int = DEFAULT_MERGE_MARGIN,
+) -> list[pygame.Rect]:
+    """Clip and merge dirty rects into the cheapest list to push to the display.
+
+    Args:
+        rects (Iterable[pygame.Rect | None]): The dirty rects, e.g. the return
+            value of LayeredDirty.draw(). None entries are skipped.
+        bounds (pygame.Rect | None): The display area to clip to. If None, the
+            rects are merged without clipping and never widened to full screen.
+        rect_cost (int): The per-rect overhead in pixel-equivalents. Larger
+            values merge more aggressively.
+        merge_margin (int): How far apart rects may be and still be merged.
+
+    Returns:
+        list[pygame.Rect]: The rects to update. Empty if nothing visible
+            changed; equal to [bounds] when a full-screen update is cheapest.
+
+    """
+    if bounds is None:
+        clipped = [pygame.Rect(rect) for rect in rects if rect]
+    else:
+        clipped = [clip for rect in rects if rect and (clip := bounds.clip(rect))]
+
+    if len(clipped) <= 1:
+        return clipped
+
+    bounding = clipped[0].unionall(clipped[1:])
+    bounding_cost = _area(bounding) + rect_cost
+    rects_cost = sum(map(_area, clipped)) + len(clipped) * rect_cost
+    # Fragments that already cost more than their bounding rect are not worth
+    # merging one by one
+    if rects_cost < bounding_cost:
+        clipped = _merge_neighbors(clipped, rect_cost, merge_margin)
+        rects_cost = sum(map(_area, clipped)) + len(clipped) * rect_cost
+
+    if bounds is not None and _area(bounds) + rect_cost <= min(rects_cost, bounding_cost):
+        return [pygame.Rect(bounds)]
+    if bounding_cost <= rects_cost:
+        return [bounding]
+    return clipped
@@ -0,0 +1,187 @@
+"""Fixed-timestep simulation with interpolated rendering.
+
+With a variable timestep every frame advances the game by however long the
+previous frame took, so one slow frame can carry a fast ball straight through a
+paddle, and no two runs step the physics the same way. A FixedTimestep instead
+collects frame time in an accumulator and releases it in steps of exactly
+``1 / rate`` seconds: a slow frame runs several steps, a fast frame may run
+none. Simulation cost per second stays constant under load and a given input
+sequence always produces the same states.
+
+Frames are then drawn between the last two simulation states. Sprites that opt
+in with ``INTERPOLATE = True`` are drawn at
+``previous + (current - previous) * alpha``, where alpha is the fraction of a
+step still waiting in the accumulator, so motion stays smooth when the frame
+rate and the simulation rate differ.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+LOG = logging.getLogger('game.scenes.fixed_timestep')
+LOG.addHandler(logging.NullHandler())
+
+# After a long stall (a breakpoint, a dragged window) the backlog beyond this
+# many steps is dropped rather than simulated, or catching up would make the
+# next frame slower still
+DEFAULT_MAX_STEPS_PER_FRAME = 5
+
+# Absorbs float error so a frame of exactly N steps is not counted as N - 1
+_STEP_EPSILON = 1e-9
+
+
+class FixedTimestep:
+    """Turn variable frame times into a whole number of fixed simulation steps."""
+
+    def __init__(
+        self: Self,
+        rate: float,
+        *,
+        max_steps_per_frame: int = DEFAULT_MAX_STEPS_PER_FRAME,
+    ) -> None:
+        """Initialize the timestep.
+
+        Args:
+            rate (float): Simulation steps per second.
+            max_steps_per_frame (int): Most steps one frame may run.
+
+        Raises:
+            ValueError: If the rate is not positive or max_steps_per_frame is below 1.
+
+        """
+        if rate <= 0:
+            message = f'Simulation rate must be positive, got {rate}'
+            raise ValueError(message)
+        if max_steps_per_frame < 1:
+            message = f'max_steps_per_frame must be at least 1, got {max_steps_per_frame}'
+            raise ValueError(message)
+
+        self.rate = rate
+        self.step = 1.0 / rate
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self: Self) -> float:
+        """Return how far the frame is between the last two simulation states.
+
+        Returns:
+            float: The fraction of a step in the accumulator, in [0, 1).
+
+        """
+        return self.accumulator / self.step
+
+    def advance(self: Self, frame_dt: float) -> int:
+        """Add a frame's time to the accumulator and take out whole steps.
+
+        Args:
+            frame_dt (float): Seconds since the previous frame.
+
+        Returns:
+            int: How many fixed steps to simulate this frame.
+
+        """
+        self.accumulator += max(frame_dt, 0.0)
+        steps = int(self.accumulator / self.step + _STEP_EPSILON)
+        if steps > self.max_steps_per_frame:
+            LOG.debug(
+                'Dropping %.1fms of simulation backlog',
+                (steps - self.max_steps_per_frame) * self.step * 1000,
+            )
+            steps = self.max_steps_per_frame
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= steps * self.step
+        self.accumulator = max(self.accumulator, 0.0)
+        return steps
+
+    def reset(self: Self) -> None:
+        """Discard accumulated time, e.g. when a new scene starts."""
+        self.accumulator = 0.0
+
+
+class PositionInterpolator:
+    """Draw opted-in sprites between their last two simulation positions."""
+
+    def __init__(self: Self) -> None:
+        """Initialize the interpolator."""
+        self.sprites: list[Any] = []
+        # Sprites drawn away from their simulated position last frame
+        self._displaced: set[Any] = set()
+        # The sprites and membership version self.sprites was collected from
+        self._source: Iterable[Any] | None = None
+        self._version: int | None = None
+
+    def collect(self: Self, sprites: Iterable[Any]) -> None:
+        """Pick out the sprites that want to be interpolated.
+
+        Args:
+            sprites (Iterable[Any]): The scene's sprites.
+
+        """
+        self.sprites = [sprite for sprite in sprites if getattr(sprite, 'INTERPOLATE', False)]
+
+    def refresh(self: Self, sprites: Iterable[Any], version: int) -> None:
+        """Re-collect the sprites only if they or their membership changed.
+
+        Args:
+            sprites (Iterable[Any]): The scene's sprites.
+            version (int): A counter that changes whenever an interpolated
+                sprite joins or leaves a group.
+
+        """
+        if sprites is self._source and version == self._version:
+            return
+        self.collect(sprites)
+        self._source = sprites
+        self._version = version
+
+    def store_positions(self: Self) -> None:
+        """Remember every interpolated sprite's position before a simulation step."""
+        for sprite in self.sprites:
+            sprite.store_previous_position()
+
+    @contextlib.contextmanager
+    def interpolated(self: Self, alpha: float) -> Iterator[None]:
+        """Move the sprites to their interpolated positions for drawing.
+
+        Their simulated positions are restored on exit, so collisions and game
+        logic never see the interpolated ones.
+
+        Args:
+            alpha (float): How far the frame is between the last two states.
+
+        Yields:
+            None: While the sprites are at their interpolated positions.
+
+        """
+        displaced: list[tuple[Any, tuple[int, int]]] = []
+        for sprite in self.sprites:
+            simulated = sprite.rect.topleft
+            position = sprite.interpolated_position(alpha)
+            if position != simulated:
+                displaced.append((sprite, simulated))
+                sprite.rect.topleft = position
+                sprite.dirty = sprite.dirty or 1
+            elif sprite in self._displaced:
+                # Last drawn off its simulated position; draw it where it is now
+                sprite.dirty = sprite.dirty or 1
+        try:
+            yield
+        finally:
+            for sprite, simulated in displaced:
+                sprite.rect.topleft = simulated
+            self._displaced = {sprite for sprite, _ in displaced}
+
+    def reset(self: Self) -> None:
+        """Forget the collected sprites, e.g. when a new scene starts."""
+        self.sprites = []
+        self._displaced = set()
+        self._source = None
+        self._version = None
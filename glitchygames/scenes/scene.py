@@ -12,6 +12,13 @@ from glitchygames import events
 from glitchygames.color import BLACK, RGB_COMPONENT_COUNT
 from glitchygames.events.mouse import MousePointer
 from glitchygames.interfaces import SceneInterface, SpriteInterface
+from glitchygames.performance.tracing import tracer
+from glitchygames.scenes.dirty_rects import coalesce_dirty_rects
+from glitchygames.scenes.fixed_timestep import FixedTimestep, PositionInterpolator
+from glitchygames.sprites.animation_clock import AnimationClock
+from glitchygames.sprites.root_sprite import RootSprite
+from glitchygames.sprites.scheduler import update_scheduler
+from glitchygames.sprites.sprite import Sprite
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -63,6 +70,9 @@ class SceneManager(SceneInterface, events.EventManager):
         self.target_fps: int = 0
         self.dt: float = 0.0
         self.timer: Any = 0
+        # Set from the simulation_hz option; None runs one variable step per frame
+        self.fixed_timestep: FixedTimestep | None = None
+        self.interpolator = PositionInterpolator()
         self._game_engine: GameEngine | None = None
         self.active_scene: Scene | None = None
         self.next_scene: Scene | None = self.active_scene
@@ -117,9 +127,13 @@ class SceneManager(SceneInterface, events.EventManager):
             self.update_type = self.OPTIONS['update_type']
             self.fps_log_interval_ms = self.OPTIONS['fps_log_interval_ms']
             self.target_fps = self.OPTIONS.get('target_fps', 60)
+            simulation_hz = self.OPTIONS.get('simulation_hz', 0)
+            self.fixed_timestep = FixedTimestep(simulation_hz) if simulation_hz else None
         self.log.info(f'Screen update type: {self.update_type}')
         self.log.info(f'FPS Log Interval: {self.fps_log_interval_ms}ms')
         self.log.info(f'Target FPS: {self.target_fps}')
+        if self.fixed_timestep is not None:
+            self.log.info(f'Simulation rate: {self.fixed_timestep.rate} Hz')
 
         # Configure performance manager with the same log interval and target FPS
         try:
@@ -127,6 +141,9 @@ class SceneManager(SceneInterface, events.EventManager):
 
             performance_manager.set_fps_log_interval(self.fps_log_interval_ms)
             performance_manager.set_target_fps(self.target_fps)
+            performance_manager.set_fixed_timestep(
+                self.fixed_timestep.step if self.fixed_timestep is not None else None,
+            )
         except ImportError:
             pass  # Performance module not available
 
@@ -328,10 +345,14 @@ class SceneManager(SceneInterface, events.EventManager):
             # Start timing ONLY the actual processing (after tick_clock)
             processing_start = time.perf_counter()
 
-            self._update_scene()
-            self._process_events()
-            self._render_scene()
-            self._update_display()
+            with tracer.span('frames', 'update'):
+                self._update_scene()
+            with tracer.span('frames', 'events'):
+                self._process_events()
+            with tracer.span('frames', 'render'):
+                self._render_scene()
+            with tracer.span('frames', 'display'):
+                self._update_display()
 
             self._handle_frame_pacing(timer, period_ns, prev_deadline_ns, frame_start_ns)
 
@@ -390,11 +411,11 @@ class SceneManager(SceneInterface, events.EventManager):
         self.log.info('POSTING QUIT EVENT')
         pygame.event.post(pygame.event.Event(pygame.QUIT, {}))
 
-    def on_quit_event(self: Self, _event: events.HashableEvent) -> None:
+    def on_quit_event(self: Self, event: events.HashableEvent) -> None:  # noqa: ARG002
         """Handle quit events.
 
         Args:
-            _event (pygame.event.Event): The event to handle (unused).
+            event (pygame.event.Event): The event to handle (unused).
 
         """
         # QUIT             none
@@ -539,16 +560,31 @@ class SceneManager(SceneInterface, events.EventManager):
             current_fps = self.clock.get_fps()
             # Calculate actual frame time for spare time calculation
             frame_time = self.dt if hasattr(self, 'dt') else 0.0
-            if frame_time > 0:
-                LOG.debug('frame_time=%.1fms, fps=%.1f', frame_time * 1000, current_fps)
+            if tracer.frames and frame_time > 0:
+                tracer.emit('frames', 'frame_time=%.1fms, fps=%.1f', frame_time * 1000, current_fps)
             performance_manager.track_fps_from_event(current_fps, frame_time)
         except ImportError:
             pass  # Performance module not available
 
     def _update_scene(self) -> None:
-        """Update the active scene."""
+        """Update the active scene.
+
+        With a fixed timestep the frame's time is spent in zero or more steps
+        of exactly fixed_timestep.step seconds; otherwise the scene gets one
+        step of the frame's dt.
+        """
         assert self.active_scene is not None
-        self.active_scene.dt_tick(self.dt)
+        if self.fixed_timestep is None:
+            self.active_scene.dt_tick(self.dt)
+            return
+
+        steps = self.fixed_timestep.advance(self.dt)
+        self.interpolator.refresh(
+            self.active_scene.all_sprites, Sprite.interpolated_membership_version
+        )
+        for _ in range(steps):
+            self.interpolator.store_positions()
+            self.active_scene.dt_tick(self.fixed_timestep.step)
 
     def _process_events(self) -> None:
         """Process game engine events."""
@@ -561,18 +597,36 @@ class SceneManager(SceneInterface, events.EventManager):
         # Update screen reference if needed
         self.update_screen()
         self.active_scene.update()
-        if self.screen is not None:
+        if self.screen is None:
+            return
+        if self.fixed_timestep is None:
+            self.active_scene.render(self.screen)
+            return
+
+        # Draw between the last two simulation states
+        with self.interpolator.interpolated(self.fixed_timestep.alpha):
             self.active_scene.render(self.screen)
 
     def _update_display(self) -> None:
-        """Update the display based on update type."""
+        """Update the display based on update type.
+
+        In 'update' mode the scene's dirty rects are coalesced first, so many
+        small fragments reach SDL as a few merged regions or a single
+        full-screen update, whichever is cheaper.
+        """
         assert self.active_scene is not None
         if self.update_type == 'update':
             # If no dirty rects, update the entire screen to show background
             if not self.active_scene.rects:
                 pygame.display.update()
-            else:
-                pygame.display.update(self.active_scene.rects)
+                return
+
+            bounds = self.screen.get_rect() if self.screen is not None else None
+            rects = coalesce_dirty_rects(self.active_scene.rects, bounds)
+            if bounds is not None and rects == [bounds]:
+                pygame.display.update()
+            elif rects:
+                pygame.display.update(rects)
         elif self.update_type == 'flip':
             pygame.display.flip()
 
@@ -587,6 +641,9 @@ class SceneManager(SceneInterface, events.EventManager):
         """Reset scene timers."""
         self.dt = 0.0
         self.timer = 0
+        if self.fixed_timestep is not None:
+            self.fixed_timestep.reset()
+        self.interpolator.reset()
 
     def _log_scene_switch(self, next_scene: Scene | None) -> None:
         """Log scene switch information."""
@@ -746,6 +803,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         self.fps: float = 0.0
         self.dt: float = 0.0
         self.dt_timer: float = 0.0
+        # Drives every AnimatedSprite in all_sprites
+        self.animation_clock = AnimationClock()
         self.dirty = 1
         self.options = options
         self.scene_manager = SceneManager()
@@ -763,6 +822,9 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         # http://n0nick.github.io/blog/2012/06/03/quick-dirty-using-pygames-dirtysprite-layered/
         self.all_sprites = groups
+        # Only pygame groups tell their sprites when they join or leave
+        if isinstance(groups, pygame.sprite.AbstractGroup):
+            self.animation_clock.drive_group(groups)
 
         # Initial screen state.
 
@@ -827,7 +889,7 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         """Cleanup the scene."""
 
     def dt_tick(self: Self, dt: float) -> None:
-        """Update the scene's delta time.
+        """Update the scene's delta time and advance its animation clock.
 
         Args:
             dt (float): The delta time to update.
@@ -835,23 +897,63 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         """
         self.dt = dt
         self.dt_timer += self.dt
+        self.animation_clock.tick(dt)
 
     @override
     def update(self: Self) -> None:
-        """Update the active scene."""
-        # Tweak to enable compound sprites to manage their own subsprites dirty states
-        #
-        # Ideally we'd just make dirty a property with a setter and getter on each
-        # sprite object, but that doesn't work for some reason.
-        [sprite.update_nested_sprites() for sprite in self.all_sprites]
+        """Update the active scene.
 
-        # Update all sprites that are dirty
-        [sprite.update() for sprite in self.all_sprites if sprite.dirty]
+        Only sprites that scheduled themselves by becoming dirty are visited,
+        so idle sprites cost nothing per frame. Sprites that are not
+        RootSprites (e.g. a plain pygame DirtySprite) cannot schedule
+        themselves, so those are visited whenever their dirty flag is set.
+        While the scene itself is dirty (e.g. right after it becomes active)
+        every sprite is visited and redrawn once instead.
+        """
+        if self.dirty:
+            sprites = list(self.all_sprites)
+            # Everything is visited below, so drop what was scheduled
+            update_scheduler.drain(self.all_sprites)
+        else:
+            unscheduled = [
+                sprite
+                for sprite in self.all_sprites
+                if sprite.dirty and not isinstance(sprite, RootSprite)
+            ]
+            sprites = list(dict.fromkeys([*update_scheduler.drain(self.all_sprites), *unscheduled]))
+
+        self._update_sprites(sprites)
 
         # Make all of the new scene's sprites dirty to force a redraw
         if self.dirty:
-            for sprite in self.all_sprites:
+            for sprite in sprites:
                 sprite.dirty = 1 if not sprite.dirty else sprite.dirty
+            self.dirty = 0
+
+    def _update_sprites(self: Self, sprites: list[Any]) -> None:
+        """Sync nested sprites and update the dirty ones.
+
+        Args:
+            sprites (list[Any]): The sprites to visit.
+
+        """
+        # Tweak to enable compound sprites to manage their own subsprites dirty states
+        for sprite in sprites:
+            # Plain pygame sprites have no nested sprites to sync
+            if hasattr(sprite, 'update_nested_sprites'):
+                sprite.update_nested_sprites()
+
+        # Nested syncs may have dirtied child sprites, which scheduled themselves
+        sprites = list(dict.fromkeys([*sprites, *update_scheduler.drain(self.all_sprites)]))
+
+        # Update all sprites that are dirty
+        for sprite in sprites:
+            if sprite.dirty:
+                sprite.update()
+
+        # Sprites that are still dirty (always-dirty sprites in particular)
+        # need another visit next frame
+        update_scheduler.schedule_all(sprite for sprite in sprites if sprite.dirty)
 
     @override
     def render(self: Self, screen: pygame.Surface) -> None:
@@ -891,6 +993,31 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         """
         return self.sprites_at_position(pos=position)
 
+    def _trace_click(
+        self,
+        label: str,
+        position: tuple[int, int],
+        collided_sprites: list[Any],
+        focused_sprites: list[Any],
+    ) -> None:
+        """Trace which sprites a click landed on.
+
+        Args:
+            label (str): The kind of click.
+            position (tuple[int, int]): The click position.
+            collided_sprites (list[Any]): The sprites under the click.
+            focused_sprites (list[Any]): The sprites that currently have focus.
+
+        """
+        tracer.emit('events', '=== Scene: %s === at %s', label, position)
+        tracer.emit('events', 'Collided sprites: %s', [type(s).__name__ for s in collided_sprites])
+        tracer.emit(
+            'events', 'Focusable sprites: %s', self._get_focusable_sprites(collided_sprites)
+        )
+        tracer.emit(
+            'events', 'Currently focused sprites: %s', [type(s).__name__ for s in focused_sprites]
+        )
+
     def _get_focusable_sprites(self, collided_sprites: list[Any]) -> list[Any]:
         """Get focusable sprites from the collided sprites.
 
@@ -971,7 +1098,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # AUDIODEVICEADDED which, iscapture
-        self.log.debug(f'{type(self)}: On Audio Device Added Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Audio Device Added Event %s', type(self), event)
 
     @override
     def on_audio_device_removed_event(self: Self, event: events.HashableEvent) -> None:
@@ -982,7 +1110,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # AUDIODEVICEREMOVED which, iscapture
-        self.log.debug(f'{type(self)}: On Audio Device Removed Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Audio Device Removed Event %s', type(self), event)
 
     @override
     def on_controller_button_down_event(self: Self, event: events.HashableEvent) -> None:
@@ -993,7 +1122,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # CONTROLLERBUTTONDOWN which, button
-        self.log.debug(f'{type(self)}: On Controller Button Down Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Controller Button Down Event %s', type(self), event)
 
     @override
     def on_controller_button_up_event(self: Self, event: events.HashableEvent) -> None:
@@ -1004,7 +1134,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # CONTROLLERBUTTONUP which, button
-        self.log.debug(f'{type(self)}: On Controller Button Up Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Controller Button Up Event %s', type(self), event)
 
     @override
     def on_joy_button_down_event(self: Self, event: events.HashableEvent) -> None:
@@ -1015,7 +1146,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # JOYBUTTONDOWN    joy, button
-        self.log.debug(f'{type(self)}: On Joy Button Down Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Joy Button Down Event %s', type(self), event)
 
     @override
     def on_joy_button_up_event(self: Self, event: events.HashableEvent) -> None:
@@ -1026,7 +1158,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # JOYBUTTONUP      joy, button
-        self.log.debug(f'{type(self)}: On Joy Button Up Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Joy Button Up Event %s', type(self), event)
 
     @override
     def on_key_up_event(self, event: events.HashableEvent) -> None:
@@ -1036,7 +1169,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug(f'{type(self)}: On Key Up Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Key Up Event %s', type(self), event)
 
         # Check for focused sprites first
         focused_sprites = self._get_focused_sprites()
@@ -1055,7 +1189,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # MENUITEM         menu, item
-        self.log.debug(f'{type(self)}: On Menu Item Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Menu Item Event %s', type(self), event)
 
     @override
     def on_mouse_button_down_event(self: Self, event: events.HashableEvent) -> None:
@@ -1065,27 +1200,26 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug('=== Scene: Mouse Button Down ===')
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
-        self.log.debug('Click position: %s', event_pos)
 
         # Get sprites at click position
         collided_sprites = self._get_collided_sprites(event_pos)
-        self.log.debug(f'Collided sprites: {[type(s).__name__ for s in collided_sprites]}')
-        focusable_sprites = self._get_focusable_sprites(collided_sprites)
-        self.log.debug('Focusable sprites: %s', focusable_sprites)
-
-        # Diagnostics: log the top-most collided sprite and its active state
-        if collided_sprites:
-            top_sprite = collided_sprites[-1]
-            self.log.debug(
-                f'Top sprite @ DOWN: {type(top_sprite).__name__}, '
-                f'active={getattr(top_sprite, "active", None)}, pos={event_pos}',
-            )
 
         # Find currently focused sprites
         focused_sprites = self._get_focused_sprites()
-        self.log.debug(f'Currently focused sprites: {[type(s).__name__ for s in focused_sprites]}')
+
+        if tracer.events:
+            self._trace_click('Mouse Button Down', event_pos, collided_sprites, focused_sprites)
+            # Diagnostics: log the top-most collided sprite and its active state
+            if collided_sprites:
+                top_sprite = collided_sprites[-1]
+                tracer.emit(
+                    'events',
+                    'Top sprite @ DOWN: %s, active=%s, pos=%s',
+                    type(top_sprite).__name__,
+                    getattr(top_sprite, 'active', None),
+                    event_pos,
+                )
 
         # Handle focus management
         self._handle_focus_management(collided_sprites)
@@ -1104,7 +1238,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             trigger (object): The event trigger.
 
         """
-        self.log.debug(f'{type(self)}: Mouse Drag Event: {event} {trigger}')
+        if tracer.events:
+            tracer.emit('events', '%s: Mouse Drag Event: %s %s', type(self), event, trigger)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
         # Optimized: Skip expensive collision detection for drag events
         # Most drag handling is done by specific sprite drag handlers
@@ -1132,7 +1267,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             trigger (object): The event trigger.
 
         """
-        self.log.debug(f'{type(self)}: Mouse Drop Event: {event} {trigger}')
+        if tracer.events:
+            tracer.emit('events', '%s: Mouse Drop Event: %s %s', type(self), event, trigger)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
         collided_sprites = self.sprites_at_position(pos=event_pos)
 
@@ -1148,7 +1284,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             trigger (object): The event trigger.
 
         """
-        self.log.debug(f'{type(self)}: Left Mouse Drag Event: {event} {trigger}')
+        if tracer.events:
+            tracer.emit('events', '%s: Left Mouse Drag Event: %s %s', type(self), event, trigger)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
         collided_sprites: list[Any] | None = self.sprites_at_position(pos=event_pos)
 
@@ -1164,7 +1301,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             trigger (object): The event trigger.
 
         """
-        self.log.debug(f'{type(self)}: Left Mouse Drop Event: {event} {trigger}')
+        if tracer.events:
+            tracer.emit('events', '%s: Left Mouse Drop Event: %s %s', type(self), event, trigger)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
         collided_sprites = self.sprites_at_position(pos=event_pos)
 
@@ -1252,7 +1390,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # MOUSEBUTTONUP    pos, button
-        self.log.debug(f'{type(self)}: Left Mouse Button Up Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Left Mouse Button Up Event: %s', type(self), event)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
 
         collided_sprites = self.sprites_at_position(pos=event_pos)
@@ -1269,7 +1408,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # MOUSEBUTTONUP    pos, button
-        self.log.debug(f'{type(self)}: Middle Mouse Button Up Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Middle Mouse Button Up Event: %s', type(self), event)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
 
         collided_sprites = self.sprites_at_position(pos=event_pos)
@@ -1302,19 +1442,18 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug('=== Scene: Left Mouse Button Down ===')
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
-        self.log.debug('Click position: %s', event_pos)
 
         # Get sprites at click position
         collided_sprites = self._get_collided_sprites(event_pos)
-        self.log.debug(f'Collided sprites: {[type(s).__name__ for s in collided_sprites]}')
-        focusable_sprites = self._get_focusable_sprites(collided_sprites)
-        self.log.debug('Focusable sprites: %s', focusable_sprites)
 
         # Find currently focused sprites
         focused_sprites = self._get_focused_sprites()
-        self.log.debug(f'Currently focused sprites: {[type(s).__name__ for s in focused_sprites]}')
+
+        if tracer.events:
+            self._trace_click(
+                'Left Mouse Button Down', event_pos, collided_sprites, focused_sprites
+            )
 
         # Handle focus management
         self._handle_focus_management(collided_sprites)
@@ -1333,7 +1472,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # MOUSEBUTTONDOWN    pos, button
-        self.log.debug(f'{type(self)}: Middle Mouse Button Down Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Middle Mouse Button Down Event: %s', type(self), event)
         event_pos: tuple[int, int] = getattr(event, 'pos', (0, 0))
 
         collided_sprites = self.sprites_at_position(pos=event_pos)
@@ -1366,7 +1506,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug(f'{type(self)}: Sys WM Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Sys WM Event: %s', type(self), event)
 
     @override
     def on_text_editing_event(self: Self, event: events.HashableEvent) -> None:
@@ -1376,7 +1517,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug(f'{type(self)}: Text Editing Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Text Editing Event: %s', type(self), event)
 
     @override
     def on_text_input_event(self: Self, event: events.HashableEvent) -> None:
@@ -1386,7 +1528,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
             event (pygame.event.Event): The event to handle.
 
         """
-        self.log.debug(f'{type(self)}: Text Input Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Text Input Event: %s', type(self), event)
 
     @override
     def on_touch_down_event(self: Self, event: events.HashableEvent) -> None:
@@ -1397,7 +1540,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # TOUCHBUTTONDOWN  touch, pos, button
-        self.log.debug(f'{type(self)}: Touch Down Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Touch Down Event: %s', type(self), event)
 
     @override
     def on_touch_motion_event(self: Self, event: events.HashableEvent) -> None:
@@ -1408,7 +1552,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # TOUCHMOTION      touch, pos
-        self.log.debug(f'{type(self)}: Touch Motion Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Touch Motion Event: %s', type(self), event)
 
     @override
     def on_touch_up_event(self: Self, event: events.HashableEvent) -> None:
@@ -1419,7 +1564,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # TOUCHBUTTONUP    touch, pos
-        self.log.debug(f'{type(self)}: Touch Up Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Touch Up Event: %s', type(self), event)
 
     @override
     def on_user_event(self: Self, event: events.HashableEvent) -> None:
@@ -1430,7 +1576,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # USEREVENT        code
-        self.log.debug(f'{type(self)}: User Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: User Event: %s', type(self), event)
 
     @override
     def on_video_expose_event(self: Self, event: events.HashableEvent) -> None:
@@ -1441,7 +1588,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # VIDEOEXPOSE      none
-        self.log.debug(f'{type(self)}: Video Expose Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Video Expose Event: %s', type(self), event)
 
     @override
     def on_video_resize_event(self: Self, event: events.HashableEvent) -> None:
@@ -1452,7 +1600,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # VIDEORESIZE      size, w, h
-        self.log.debug(f'{type(self)}: Video Resize Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Video Resize Event: %s', type(self), event)
 
     @override
     def on_window_close_event(self: Self, event: events.HashableEvent) -> None:
@@ -1463,7 +1612,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWCLOSE      none
-        self.log.debug(f'{type(self)}: Window Close Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Close Event: %s', type(self), event)
 
     @override
     def on_window_enter_event(self: Self, event: events.HashableEvent) -> None:
@@ -1474,7 +1624,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWENTER      none
-        self.log.debug(f'{type(self)}: Window Enter Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Enter Event: %s', type(self), event)
 
     @override
     def on_window_exposed_event(self: Self, event: events.HashableEvent) -> None:
@@ -1485,7 +1636,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWEXPOSED    none
-        self.log.debug(f'{type(self)}: Window Exposed Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Exposed Event: %s', type(self), event)
 
     @override
     def on_window_focus_gained_event(self: Self, event: events.HashableEvent) -> None:
@@ -1496,7 +1648,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWFOCUSGAINED none
-        self.log.debug(f'{type(self)}: Window Focus Gained Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Focus Gained Event: %s', type(self), event)
 
     @override
     def on_window_focus_lost_event(self: Self, event: events.HashableEvent) -> None:
@@ -1507,7 +1660,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWFOCUSLOST  none
-        self.log.debug(f'{type(self)}: Window Focus Lost Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Focus Lost Event: %s', type(self), event)
 
     @override
     def on_window_hidden_event(self: Self, event: events.HashableEvent) -> None:
@@ -1518,7 +1672,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWHIDDEN     none
-        self.log.debug(f'{type(self)}: Window Hidden Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Hidden Event: %s', type(self), event)
 
     @override
     def on_window_hit_test_event(self: Self, event: events.HashableEvent) -> None:
@@ -1529,7 +1684,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWHITTEST    pos
-        self.log.debug(f'{type(self)}: Window Hit Test Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Hit Test Event: %s', type(self), event)
 
     @override
     def on_window_leave_event(self: Self, event: events.HashableEvent) -> None:
@@ -1540,7 +1696,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWLEAVE      none
-        self.log.debug(f'{type(self)}: Window Leave Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Leave Event: %s', type(self), event)
 
     @override
     def on_window_maximized_event(self: Self, event: events.HashableEvent) -> None:
@@ -1551,7 +1708,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWMAXIMIZED  none
-        self.log.debug(f'{type(self)}: Window Maximized Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Maximized Event: %s', type(self), event)
 
     @override
     def on_window_minimized_event(self: Self, event: events.HashableEvent) -> None:
@@ -1562,7 +1720,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWMINIMIZED  none
-        self.log.debug(f'{type(self)}: Window Minimized Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Minimized Event: %s', type(self), event)
 
     @override
     def on_window_moved_event(self: Self, event: events.HashableEvent) -> None:
@@ -1573,7 +1732,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWMOVED      pos
-        self.log.debug(f'{type(self)}: Window Moved Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Moved Event: %s', type(self), event)
 
     @override
     def on_window_resized_event(self: Self, event: events.HashableEvent) -> None:
@@ -1584,7 +1744,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWRESIZED    size, w, h
-        self.log.debug(f'{type(self)}: Window Resized Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Resized Event: %s', type(self), event)
 
     @override
     def on_window_restored_event(self: Self, event: events.HashableEvent) -> None:
@@ -1595,7 +1756,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWRESTORED   none
-        self.log.debug(f'{type(self)}: Window Restored Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Restored Event: %s', type(self), event)
 
     @override
     def on_window_shown_event(self: Self, event: events.HashableEvent) -> None:
@@ -1606,7 +1768,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWSHOWN      none
-        self.log.debug(f'{type(self)}: Window Shown Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Shown Event: %s', type(self), event)
 
     @override
     def on_window_size_changed_event(self: Self, event: events.HashableEvent) -> None:
@@ -1617,7 +1780,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWSIZECHANGED size, w, h
-        self.log.debug(f'{type(self)}: Window Size Changed Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Size Changed Event: %s', type(self), event)
 
     @override
     def on_window_take_focus_event(self: Self, event: events.HashableEvent) -> None:
@@ -1628,7 +1792,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # WINDOWTAKEFOCUS  none
-        self.log.debug(f'{type(self)}: Window Take Focus Event: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: Window Take Focus Event: %s', type(self), event)
 
     @override
     def on_quit_event(self: Self, event: events.HashableEvent) -> None:
@@ -1639,7 +1804,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
 
         """
         # QUIT             none
-        self.log.debug(f'{type(self)}: {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: %s', type(self), event)
 
     @override
     def on_fps_event(self: Self, event: events.HashableEvent) -> None:
@@ -1669,7 +1835,8 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
     @override
     def on_key_down_event(self, event: events.HashableEvent) -> None:
         """Handle key down events."""
-        self.log.debug(f'{type(self)}: On Key Down Event {event}')
+        if tracer.events:
+            tracer.emit('events', '%s: On Key Down Event %s', type(self), event)
 
         # Check if focused sprites handle the event
         if self._handle_focused_sprite_events(event):
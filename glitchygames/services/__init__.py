@@ -11,11 +11,18 @@ from glitchygames.services.exceptions import (
     SpriteServiceError,
     ValidationError,
 )
-from glitchygames.services.renderer_service import RenderedFrame, RendererService
+from glitchygames.services.renderer_service import (
+    AtlasFrame,
+    AtlasResult,
+    RenderedFrame,
+    RendererService,
+)
 from glitchygames.services.sprite_generation_service import SpriteGenerationService
 
 __all__ = [
     'AIProviderError',
+    'AtlasFrame',
+    'AtlasResult',
     'RenderedFrame',
     'RendererService',
     'RenderingError',
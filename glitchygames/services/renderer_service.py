@@ -8,22 +8,33 @@ from __future__ import annotations
 
 import base64
 import io
+import json
 import logging
+import math
 import os
 import tempfile
-from dataclasses import dataclass, field
+import warnings
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from glitchygames.services.config import ServiceConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pygame
+    from PIL import Image
 
     from glitchygames.sprites.animated import AnimatedSprite, SpriteFrame
 
+    # A frame's animation index and name, its index, the frame and its surface
+    type FrameSurface = tuple[int, str, int, SpriteFrame, pygame.Surface]
+
 LOG = logging.getLogger('glitchygames.services.renderer')
 
+ATLAS_MANIFEST_VERSION = 1
+
 
 @dataclass
 class RenderedFrame:
@@ -32,13 +43,15 @@ class RenderedFrame:
     Attributes:
         animation_index: Index of the animation (film strip) this frame belongs to
         frame_index: Index of the frame within its animation
-        png_base64: Base64-encoded PNG data for this frame
+        png_base64: Base64-encoded PNG data for this frame (None if not encoded)
+        png_bytes: Raw PNG data for this frame
 
     """
 
     animation_index: int
     frame_index: int
-    png_base64: str
+    png_base64: str | None
+    png_bytes: bytes = b''
 
 
 @dataclass
@@ -48,11 +61,10 @@ class RenderResult:
     Attributes:
         success: Whether rendering was successful
         png_bytes: PNG image bytes (if successful)
-        png_base64: Base64-encoded PNG (if successful)
+        png_base64: Base64-encoded PNG (if successful and base64 encoding was requested)
         width: Sprite width in pixels
         height: Sprite height in pixels
         frame_count: Number of frames rendered
-        all_frames_png_base64: List of base64-encoded PNGs for each frame (if animated)
         rendered_frames: List of RenderedFrame with animation/frame indices (if animated)
         error: Error message (if unsuccessful)
 
@@ -64,10 +76,171 @@ class RenderResult:
     width: int = 0
     height: int = 0
     frame_count: int = 1
-    all_frames_png_base64: list[str] = field(default_factory=list)
     rendered_frames: list[RenderedFrame] = field(default_factory=list)
     error: str | None = None
 
+    @property
+    def all_frames_png_base64(self) -> list[str]:
+        """Base64-encoded PNGs for each frame (deprecated).
+
+        Each frame's data now lives only in rendered_frames; this list is
+        rebuilt from it for callers that still read the old attribute.
+
+        Returns:
+            The base64 PNG of every encoded frame, in rendering order
+
+        """
+        warnings.warn(
+            'RenderResult.all_frames_png_base64 is deprecated; '
+            'read png_base64 from rendered_frames instead',
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return [frame.png_base64 for frame in self.rendered_frames if frame.png_base64 is not None]
+
+
+@dataclass
+class AtlasFrame:
+    """Where one sprite frame lives in a packed atlas.
+
+    Attributes:
+        animation: Name of the animation this frame belongs to
+        animation_index: Index of the animation (film strip) this frame belongs to
+        frame_index: Index of the frame within its animation
+        x: Left edge of the frame in the atlas
+        y: Top edge of the frame in the atlas
+        width: Frame width in the atlas
+        height: Frame height in the atlas
+        duration: How long the frame is displayed, in seconds
+
+    """
+
+    animation: str
+    animation_index: int
+    frame_index: int
+    x: int
+    y: int
+    width: int
+    height: int
+    duration: float
+
+
+@dataclass
+class AtlasResult:
+    """Result of rendering a sprite into a packed atlas.
+
+    Attributes:
+        success: Whether rendering was successful
+        png_bytes: Atlas PNG bytes (if successful)
+        width: Atlas width in pixels
+        height: Atlas height in pixels
+        scale: Scale factor the frames were rendered at
+        frames: Atlas rectangle of every frame, in animation order
+        unique_frame_count: Number of distinct frames stored in the atlas
+        error: Error message (if unsuccessful)
+
+    """
+
+    success: bool
+    png_bytes: bytes | None = None
+    width: int = 0
+    height: int = 0
+    scale: int = 1
+    frames: list[AtlasFrame] = field(default_factory=list)
+    unique_frame_count: int = 0
+    error: str | None = None
+
+    @property
+    def manifest(self) -> dict[str, object]:
+        """The frame-rect manifest describing the atlas.
+
+        Returns:
+            JSON-serializable manifest of the atlas size and frame rectangles
+
+        """
+        return {
+            'version': ATLAS_MANIFEST_VERSION,
+            'width': self.width,
+            'height': self.height,
+            'scale': self.scale,
+            'frames': [asdict(frame) for frame in self.frames],
+        }
+
+    def manifest_json(self) -> str:
+        """Serialize the manifest as JSON.
+
+        Returns:
+            The manifest as a JSON string
+
+        """
+        return json.dumps(self.manifest, indent=2)
+
+
+def _dedupe_frame_images(
+    frame_surfaces: list[FrameSurface],
+    scale: int,
+) -> tuple[list[Image.Image], list[int]]:
+    """Convert frame surfaces to scaled images, keeping one image per distinct frame.
+
+    Args:
+        frame_surfaces: Frames as collected by RendererService._collect_frame_surfaces
+        scale: Scale factor for the images
+
+    Returns:
+        Tuple of (distinct images, index into them for each frame)
+
+    """
+    import pygame
+    from PIL import Image
+
+    # Key each frame by its size and pixels so repeated frames share an image
+    unique_index: dict[tuple[int, int, bytes], int] = {}
+    unique_images: list[Image.Image] = []
+    frame_slots: list[int] = []
+    for _, _, _, _, frame_surface in frame_surfaces:
+        size = frame_surface.get_size()
+        pixels = pygame.image.tobytes(frame_surface, 'RGBA')
+        key = (*size, pixels)
+        slot = unique_index.get(key)
+        if slot is None:
+            slot = unique_index[key] = len(unique_images)
+            image = Image.frombytes('RGBA', size, pixels)
+            if scale != 1:
+                image = image.resize((size[0] * scale, size[1] * scale), Image.Resampling.NEAREST)
+            unique_images.append(image)
+        frame_slots.append(slot)
+    return unique_images, frame_slots
+
+
+def _pack_shelves(sizes: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], int, int]:
+    """Pack rectangles into rows (shelves) of a roughly square atlas.
+
+    Rectangles are placed tallest first, left to right, starting a new shelf
+    when a row would exceed the width of ceil(sqrt(n)) of the widest ones.
+
+    Args:
+        sizes: (width, height) of each rectangle
+
+    Returns:
+        Tuple of ((x, y) for each rectangle in input order, atlas width, atlas height)
+
+    """
+    row_limit = math.ceil(math.sqrt(len(sizes))) * max(width for width, _ in sizes)
+    positions = [(0, 0)] * len(sizes)
+    x = y = shelf_height = atlas_width = 0
+
+    for index in sorted(range(len(sizes)), key=lambda index: -sizes[index][1]):
+        width, height = sizes[index]
+        if x + width > row_limit:
+            y += shelf_height
+            x = shelf_height = 0
+        positions[index] = (x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, x)
+
+    return positions, atlas_width, y + shelf_height
+
 
 class RendererService:
     """Service for rendering sprites to PNG format headlessly.
@@ -116,6 +289,7 @@ class RendererService:
         scale: int = 1,
         *,
         render_all_frames: bool = False,
+        encode_base64: bool = True,
     ) -> RenderResult:
         """Render a sprite from TOML content to PNG.
 
@@ -123,33 +297,15 @@ class RendererService:
             toml_content: TOML sprite content
             scale: Scale factor for output PNG (1 = original size)
             render_all_frames: If True, render all frames for animated sprites
+            encode_base64: If False, only raw PNG bytes are produced (e.g. for a
+                frame bundle) and every png_base64 is left as None
 
         Returns:
             RenderResult with PNG data or error
 
         """
-        # Write TOML to a temporary file
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.toml',
-                delete=False,
-                encoding='utf-8',
-            ) as temp_file:
-                temp_file.write(toml_content)
-                temp_path = temp_file.name
-        except OSError as e:
-            LOG.exception('Failed to create temporary file')
-            return RenderResult(
-                success=False,
-                error=f'Failed to create temporary file: {e}',
-            )
-
         try:
-            # Load sprite using SpriteFactory
-            from glitchygames.sprites import SpriteFactory
-
-            sprite = SpriteFactory.load_sprite(filename=temp_path)
+            sprite = self._load_sprite(toml_content)
 
             # Get sprite dimensions
             current_frame = sprite.get_current_frame()
@@ -163,11 +319,12 @@ class RendererService:
             LOG.info(f'Loaded sprite: {width}x{height}')
 
             # Render first frame (or current frame)
-            png_bytes, png_base64 = self._render_frame_to_png(current_frame.image, scale)
+            png_bytes, png_base64 = self._render_frame_to_png(
+                current_frame.image, scale, encode_base64=encode_base64
+            )
 
             # Get frame count - use get_total_frame_count() method on AnimatedSprite
             frame_count = 1
-            all_frames_base64 = []
 
             # Log sprite type for debugging
             LOG.info(f'Loaded sprite type: {type(sprite).__name__}')
@@ -187,8 +344,10 @@ class RendererService:
             rendered_frames = []
             LOG.info(f'render_all_frames={render_all_frames}, frame_count={frame_count}')
             if render_all_frames and frame_count > 1:
-                all_frames_base64, rendered_frames = self._render_all_frames(sprite, scale)
-                LOG.info(f'Rendered {len(all_frames_base64)} frames')
+                rendered_frames = self._render_all_frames(
+                    sprite, scale, encode_base64=encode_base64
+                )
+                LOG.info(f'Rendered {len(rendered_frames)} frames')
             else:
                 LOG.info(
                     f'Skipping frame rendering: render_all_frames={render_all_frames}, '
@@ -202,7 +361,6 @@ class RendererService:
                 width=width * scale,
                 height=height * scale,
                 frame_count=frame_count,
-                all_frames_png_base64=all_frames_base64,
                 rendered_frames=rendered_frames,
             )
 
@@ -212,22 +370,23 @@ class RendererService:
                 success=False,
                 error=f'Failed to render sprite: {e}',
             )
-        finally:
-            # Clean up temporary file
-            try:
-                Path(temp_path).unlink()
-            except OSError as unlink_error:
-                LOG.debug('Failed to clean up temporary file %s: %s', temp_path, unlink_error)
 
-    def _render_frame_to_png(self, surface: pygame.Surface, scale: int = 1) -> tuple[bytes, str]:
+    def _render_frame_to_png(
+        self,
+        surface: pygame.Surface,
+        scale: int = 1,
+        *,
+        encode_base64: bool = True,
+    ) -> tuple[bytes, str | None]:
         """Render a pygame surface to PNG bytes with no compression.
 
         Args:
             surface: Pygame surface to render
             scale: Scale factor (1 = original size)
+            encode_base64: If False, skip the base64 encoding
 
         Returns:
-            Tuple of (png_bytes, png_base64)
+            Tuple of (png_bytes, png_base64), png_base64 being None if not encoded
 
         """
         import pygame
@@ -250,9 +409,9 @@ class RendererService:
         buffer = io.BytesIO()
         pil_image.save(buffer, format='PNG', compress_level=0)
         png_bytes = buffer.getvalue()
-        png_base64 = base64.b64encode(png_bytes).decode('utf-8')
-
-        return png_bytes, png_base64
+        if not encode_base64:
+            return png_bytes, None
+        return png_bytes, base64.b64encode(png_bytes).decode('utf-8')
 
     def _get_frame_surface(
         self,
@@ -288,29 +447,24 @@ class RendererService:
 
         return frame_surface
 
-    def _render_animation_frames(
+    def _iter_frame_surfaces(
         self,
         sprite: AnimatedSprite,
         all_animations: dict[str, list[SpriteFrame]],
-        scale: int,
         *,
         has_frame_manager: bool,
-    ) -> tuple[list[str], list[RenderedFrame]]:
-        """Render frames from all animations of a sprite.
+    ) -> Iterator[FrameSurface]:
+        """Yield the surface of every frame in every animation of a sprite.
 
         Args:
             sprite: The animated sprite
             all_animations: Dictionary of animation name to frame lists
-            scale: Scale factor for output
             has_frame_manager: Whether the sprite has a frame_manager
 
-        Returns:
-            Tuple of (flat list of base64 PNGs, list of RenderedFrame with indices)
+        Yields:
+            Tuple of (animation_index, animation_name, frame_index, frame, surface)
 
         """
-        frames_base64: list[str] = []
-        rendered_frames: list[RenderedFrame] = []
-
         for animation_index, (animation_name, frames) in enumerate(all_animations.items()):
             LOG.debug(f"Animation '{animation_name}' has {len(frames)} frames")
 
@@ -330,36 +484,23 @@ class RendererService:
                 )
 
                 if frame_surface is not None:
-                    _, png_base64 = self._render_frame_to_png(frame_surface, scale)
-                    frames_base64.append(png_base64)
-                    rendered_frames.append(
-                        RenderedFrame(
-                            animation_index=animation_index,
-                            frame_index=frame_index,
-                            png_base64=png_base64,
-                        ),
-                    )
+                    yield animation_index, animation_name, frame_index, sprite_frame, frame_surface
                 else:
                     LOG.warning(
                         f'Could not get surface for frame {frame_index} '
                         f"of animation '{animation_name}'",
                     )
 
-        return frames_base64, rendered_frames
+    def _collect_frame_surfaces(self, sprite: AnimatedSprite) -> list[FrameSurface]:
+        """Collect the surfaces of all frames of an animated sprite.
 
-    def _render_all_frames(
-        self,
-        sprite: AnimatedSprite,
-        scale: int = 1,
-    ) -> tuple[list[str], list[RenderedFrame]]:
-        """Render all frames of an animated sprite to PNG.
+        The sprite's current animation and frame are restored afterwards.
 
         Args:
-            sprite: AnimatedSprite to render
-            scale: Scale factor for output
+            sprite: AnimatedSprite to collect frames from
 
         Returns:
-            Tuple of (flat list of base64 PNGs, list of RenderedFrame with indices)
+            List of (animation_index, animation_name, frame_index, frame, surface)
 
         """
         # Use public 'frames' property if available, fallback to animation_data
@@ -369,11 +510,11 @@ class RendererService:
             all_animations = sprite.animation_data
         else:
             LOG.debug('Sprite has no frames or _animations attribute')
-            return [], []
+            return []
 
         if not all_animations:
             LOG.debug('Sprite has empty animations dict')
-            return [], []
+            return []
 
         LOG.debug(f'Rendering {len(all_animations)} animations')
 
@@ -387,11 +528,12 @@ class RendererService:
             original_frame = sprite.frame_manager.current_frame
 
         try:
-            frames_base64, rendered_frames = self._render_animation_frames(
-                sprite,
-                all_animations,
-                scale,
-                has_frame_manager=has_frame_manager,
+            return list(
+                self._iter_frame_surfaces(
+                    sprite,
+                    all_animations,
+                    has_frame_manager=has_frame_manager,
+                ),
             )
         finally:
             # Restore original state
@@ -400,8 +542,186 @@ class RendererService:
                 assert original_frame is not None
                 sprite.frame_manager.current_frame = original_frame
 
-        LOG.debug(f'Rendered {len(frames_base64)} total frames')
-        return frames_base64, rendered_frames
+    def _render_all_frames(
+        self,
+        sprite: AnimatedSprite,
+        scale: int = 1,
+        *,
+        encode_base64: bool = True,
+    ) -> list[RenderedFrame]:
+        """Render all frames of an animated sprite to PNG.
+
+        Args:
+            sprite: AnimatedSprite to render
+            scale: Scale factor for output
+            encode_base64: If False, the frames only carry raw PNG bytes
+
+        Returns:
+            List of RenderedFrame with indices, in animation order
+
+        """
+        rendered_frames: list[RenderedFrame] = []
+
+        for animation_index, _, frame_index, _, frame_surface in self._collect_frame_surfaces(
+            sprite,
+        ):
+            png_bytes, png_base64 = self._render_frame_to_png(
+                frame_surface, scale, encode_base64=encode_base64
+            )
+            rendered_frames.append(
+                RenderedFrame(
+                    animation_index=animation_index,
+                    frame_index=frame_index,
+                    png_base64=png_base64,
+                    png_bytes=png_bytes,
+                ),
+            )
+
+        LOG.debug(f'Rendered {len(rendered_frames)} total frames')
+        return rendered_frames
+
+    def render_atlas_from_toml(self, toml_content: str, scale: int = 1) -> AtlasResult:
+        """Render every frame of a sprite into one packed atlas PNG.
+
+        Identical frames are stored once in the atlas; the manifest points all
+        of them at the same rectangle. The atlas is encoded as a single PNG, so
+        the PNG overhead is paid once instead of per frame.
+
+        Args:
+            toml_content: TOML sprite content
+            scale: Scale factor for the frames in the atlas (1 = original size)
+
+        Returns:
+            AtlasResult with the atlas PNG and frame rectangles, or error
+
+        """
+        try:
+            sprite = self._load_sprite(toml_content)
+            frame_surfaces = self._collect_frame_surfaces(sprite)
+            if not frame_surfaces:
+                return AtlasResult(success=False, error='Sprite has no frames to render')
+            return self._pack_atlas(frame_surfaces, scale)
+        except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+            LOG.exception('Failed to render sprite atlas')
+            return AtlasResult(
+                success=False,
+                error=f'Failed to render sprite atlas: {e}',
+            )
+
+    def render_atlas_from_file(self, file_path: str, scale: int = 1) -> AtlasResult:
+        """Render every frame of a sprite file into one packed atlas PNG.
+
+        Args:
+            file_path: Path to sprite file (TOML)
+            scale: Scale factor for the frames in the atlas
+
+        Returns:
+            AtlasResult with the atlas PNG and frame rectangles, or error
+
+        """
+        try:
+            toml_content = Path(file_path).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return AtlasResult(
+                success=False,
+                error=f'File not found: {file_path}',
+            )
+        except OSError as e:
+            return AtlasResult(
+                success=False,
+                error=f'Failed to read file: {e}',
+            )
+        return self.render_atlas_from_toml(toml_content, scale)
+
+    @staticmethod
+    def _load_sprite(toml_content: str) -> AnimatedSprite:
+        """Load a sprite from TOML content through a temporary file.
+
+        Args:
+            toml_content: TOML sprite content
+
+        Returns:
+            The loaded sprite
+
+        """
+        from glitchygames.sprites import SpriteFactory
+
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.toml',
+            delete=False,
+            encoding='utf-8',
+        ) as temp_file:
+            temp_file.write(toml_content)
+            temp_path = temp_file.name
+
+        try:
+            return SpriteFactory.load_sprite(filename=temp_path)
+        finally:
+            try:
+                Path(temp_path).unlink()
+            except OSError as unlink_error:
+                LOG.debug('Failed to clean up temporary file %s: %s', temp_path, unlink_error)
+
+    @staticmethod
+    def _pack_atlas(frame_surfaces: list[FrameSurface], scale: int) -> AtlasResult:
+        """Deduplicate frame surfaces and pack them into one atlas PNG.
+
+        Args:
+            frame_surfaces: Frames as collected by _collect_frame_surfaces
+            scale: Scale factor for the frames in the atlas
+
+        Returns:
+            AtlasResult with the atlas PNG and frame rectangles
+
+        """
+        from PIL import Image
+
+        unique_images, frame_slots = _dedupe_frame_images(frame_surfaces, scale)
+        positions, atlas_width, atlas_height = _pack_shelves(
+            [image.size for image in unique_images],
+        )
+        atlas = Image.new('RGBA', (atlas_width, atlas_height), (0, 0, 0, 0))
+        for image, position in zip(unique_images, positions, strict=True):
+            atlas.paste(image, position)
+
+        buffer = io.BytesIO()
+        atlas.save(buffer, format='PNG', compress_level=0)
+
+        frames = []
+        for (animation_index, animation_name, frame_index, sprite_frame, _), slot in zip(
+            frame_surfaces,
+            frame_slots,
+            strict=True,
+        ):
+            x, y = positions[slot]
+            width, height = unique_images[slot].size
+            frames.append(
+                AtlasFrame(
+                    animation=animation_name,
+                    animation_index=animation_index,
+                    frame_index=frame_index,
+                    x=x,
+                    y=y,
+                    width=width,
+                    height=height,
+                    duration=getattr(sprite_frame, 'duration', 0.0),
+                ),
+            )
+
+        LOG.debug(
+            f'Packed {len(frames)} frames ({len(unique_images)} unique) '
+            f'into a {atlas_width}x{atlas_height} atlas',
+        )
+        return AtlasResult(
+            success=True,
+            png_bytes=buffer.getvalue(),
+            width=atlas_width,
+            height=atlas_height,
+            scale=scale,
+            frames=frames,
+            unique_frame_count=len(unique_images),
+        )
 
     def render_from_file(
         self,
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from .animated import AnimatedSprite
 from .animated_interface import AnimatedSpriteInterface
+from .animation_clock import AnimationClock, FrameSchedule
 from .bitmappy_sprite import (
     BitmappySprite,
     FocusableSingletonBitmappySprite,
@@ -24,8 +25,10 @@ __all__ = [
     'SPRITE_GLYPHS',
     'AnimatedSprite',
     'AnimatedSpriteInterface',
+    'AnimationClock',
     'BitmappySprite',
     'FocusableSingletonBitmappySprite',
+    'FrameSchedule',
     'RootSprite',
     'Singleton',
     'SingletonBitmappySprite',
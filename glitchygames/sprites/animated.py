@@ -12,12 +12,14 @@ import logging
 import tomllib
 from collections import Counter
 from pathlib import Path
-from typing import IO, Any, Self, cast, override
+from typing import IO, TYPE_CHECKING, Any, Self, cast, override
 
+import numpy as np
 import pygame
 
 # YAML support removed - TOML only
 # Import constants
+from glitchygames.atomic_io import atomic_text_file
 from glitchygames.color import (
     MAGENTA_TRANSPARENCY_KEY,
     MAX_COLOR_CHANNEL_VALUE,
@@ -26,6 +28,7 @@ from glitchygames.color import (
 )
 
 from .animated_interface import AnimatedSpriteInterface
+from .animation_clock import AnimationClock
 from .constants import DEFAULT_FILE_FORMAT, SPRITE_GLYPHS
 from .frame import FrameManager, SpriteFrame
 from .pixel_utils import (
@@ -35,11 +38,16 @@ from .pixel_utils import (
     create_alpha_surface,
     create_indexed_surface,
     extract_pixel_colors,
+    index_pixel_colors,
     lookup_pixel_char,
     needs_alpha_channel,
     normalize_pixel_for_color_map,
 )
 
+if TYPE_CHECKING:
+    # A frame's distinct colors and the index into them for every pixel
+    type FrameColors = tuple[list[tuple[int, ...]], np.ndarray]
+
 # Import detect_file_format function
 try:
     from glitchygames.bitmappy import detect_file_format
@@ -82,6 +90,26 @@ ERR_INCONSISTENT_LINE_LENGTH = (
 ERR_TOO_MANY_COLORS = 'Too many colors (max {})'
 
 
+def _glyph_rows(glyphs: list[str], inverse: np.ndarray, width: int, height: int) -> list[str]:
+    """Assemble the character rows of a frame from its per-pixel color index.
+
+    Pixels missing from a short pixel list are written as '.'.
+
+    Args:
+        glyphs: Character for each distinct color
+        inverse: Index into glyphs for every pixel
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        One string of characters per row.
+
+    """
+    chars: list[str] = np.array(glyphs, dtype=object)[inverse[: width * height]].tolist()
+    chars.extend('.' * (width * height - len(chars)))
+    return [''.join(chars[row * width : (row + 1) * width]) for row in range(height)]
+
+
 class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noqa: PLR0904
     """A prototype Sprite Animation class with proper dirty sprite integration."""
 
@@ -119,10 +147,11 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         """Initialize the Sprite Animation prototype."""
         super().__init__()
 
-        # Initialize pygame.sprite.DirtySprite
+        # Initialize pygame.sprite.DirtySprite; the groups are joined once the
+        # animation state exists, since joining may attach an AnimationClock
         if groups is None:
             groups = pygame.sprite.LayeredDirty()  # type: ignore[type-arg]
-        pygame.sprite.DirtySprite.__init__(self, groups)  # type: ignore[arg-type]
+        pygame.sprite.DirtySprite.__init__(self)
 
         # Animation state
         self.name = 'animated_sprite'  # Default name
@@ -131,6 +160,8 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         self._is_playing: bool = False
         self._is_looping: bool = False
         self._frame_timer: float = 0.0
+        # Set by AnimationClock.add() while a shared clock drives the sprite
+        self._animation_clock: AnimationClock | None = None
         self._color_map: dict[str, tuple[int, ...]] = {}
 
         # Initialize frame manager as the single source of truth
@@ -148,6 +179,44 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         if filename:
             self.load(filename)
 
+        self.add(groups)  # type: ignore[arg-type]
+
+    @override
+    def add_internal(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> None:
+        """Join a group, attaching to the AnimationClock that drives it, if any.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group being joined.
+
+        """
+        super().add_internal(group)
+        clock = AnimationClock.for_group(group)
+        if clock is not None:
+            clock.add(self)
+
+    @override
+    def remove_internal(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> None:
+        """Leave a group, detaching from the AnimationClock that drives it.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group being left.
+
+        """
+        super().remove_internal(group)
+        clock = AnimationClock.for_group(group)
+        if clock is not None and clock is self._animation_clock:
+            clock.remove(self)
+
+    @override
+    def kill(self: Self) -> None:
+        """Leave every group and detach from the AnimationClock driving the sprite.
+
+        pygame's kill() empties the sprite's groups without remove_internal().
+        """
+        if self._animation_clock is not None:
+            self._animation_clock.remove(self)
+        super().kill()
+
     def __getitem__(self: Self, animation_name: str) -> SpriteFrame | None:
         """Return the current frame of the specified animation.
 
@@ -359,6 +428,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             self.set_animation(animation_name)
         self._is_playing = True
         self._frame_timer = 0.0
+        self._sync_clock()
 
     def play_animation(self: Self, animation_name: str | None = None) -> None:
         """Alias for play method for backwards compatibility."""
@@ -368,6 +438,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
     def pause(self: Self) -> None:
         """Pause the current animation."""
         self._is_playing = False
+        self._sync_clock()
 
     @override
     def stop(self: Self) -> None:
@@ -375,6 +446,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         self._is_playing = False
         self.frame_manager.current_frame = 0
         self._frame_timer = 0.0
+        self._sync_clock()
 
     @override
     def set_frame(self: Self, frame_index: int) -> None:
@@ -399,6 +471,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             )
 
         self._frame_timer = 0.0
+        self._sync_clock()
         self._update_surface_and_mark_dirty()
 
     @override
@@ -419,6 +492,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             raise ValueError(ERR_FAILED_TO_SET_ANIMATION.format(animation_name))
 
         self._frame_timer = 0.0
+        self._sync_clock()
         self._update_surface_and_mark_dirty()
 
     # Animation data methods
@@ -1135,35 +1209,22 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         frame = self._animations[animation_name][0]
 
         # Build color map for the single frame
-        color_map = self._build_toml_color_map()
+        frame_colors = self._index_frame_colors()
+        color_map = self._build_toml_color_map(frame_colors)
 
-        # Get frame dimensions and pixel data
+        # Convert pixels to character representation; colors missing from the
+        # map are written as '.'
+        colors, inverse = frame_colors[animation_name][0]
         width, height = frame.get_size()
-        pixels = frame.get_pixel_data()
-
-        # Convert pixels to character representation
-        pixel_rows: list[str] = []
-        for y in range(height):
-            row = ''
-            for x in range(width):
-                pixel_index = y * width + x
-                if pixel_index < len(pixels):
-                    pixel = pixels[pixel_index]
-                    # Find the character for this color
-                    char = None
-                    for color, char_val in color_map.items():
-                        if color == pixel:
-                            char = char_val
-                            break
-                    if char is None:
-                        char = '.'  # Default character
-                    row += char
-                else:
-                    row += '.'  # Default character
-            pixel_rows.append(row)
+        pixel_rows = _glyph_rows(
+            [color_map.get(color, '.') for color in colors],
+            inverse,
+            width,
+            height,
+        )
 
         # Write TOML file with proper block string format
-        with Path(filename).open('w', encoding='utf-8') as f:
+        with atomic_text_file(filename) as f:
             f.write('[sprite]\n')
             f.write(f'name = "{self.name}"\n')
             f.write('pixels = """\n')
@@ -1189,18 +1250,40 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         3. Add save logic in save() method
         4. Update tests
         See LOADER_README.md for detailed implementation guide.
+
+        Each frame's pixels are indexed once into distinct colors, which the
+        color map and glyph rows are built from. The file is written to a
+        temporary file and renamed over the target, so an interrupted save
+        leaves the previous file intact.
         """
-        color_map = self._build_toml_color_map()
-        data = self._build_toml_data_structure(color_map)
+        frame_colors = self._index_frame_colors()
+        color_map = self._build_toml_color_map(frame_colors)
+        data = self._build_toml_data_structure(color_map, frame_colors)
 
-        with Path(filename).open('w', encoding='utf-8') as f:
+        with atomic_text_file(filename) as f:
             AnimatedSprite._write_toml_sprite_section(f, data)
             AnimatedSprite._write_toml_animations(f, data)
             # Use original color order if available to preserve file format
             color_order = getattr(self, '_color_order', None)
             AnimatedSprite._write_toml_colors(f, data, color_order)
 
-    def _build_toml_color_map(self: Self) -> dict[tuple[int, ...], str]:
+    def _index_frame_colors(self: Self) -> dict[str, list[FrameColors]]:
+        """Index the distinct colors of every frame.
+
+        Returns:
+            Mapping of animation name to (distinct colors, per-pixel color index)
+            for each of its frames.
+
+        """
+        return {
+            animation_name: [index_pixel_colors(frame.get_pixel_data()) for frame in frames]
+            for animation_name, frames in self._animations.items()
+        }
+
+    def _build_toml_color_map(
+        self: Self,
+        frame_colors: dict[str, list[FrameColors]] | None = None,
+    ) -> dict[tuple[int, ...], str]:
         """Build color map for TOML format.
 
         This method creates a mapping from RGB/RGBA colors to characters for TOML format.
@@ -1209,6 +1292,10 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         _build_xml_color_map()
         See LOADER_README.md for detailed implementation guide.
 
+        Args:
+            frame_colors: Frame color indexes from _index_frame_colors(), computed
+                if not given.
+
         Returns:
             dict: The result.
 
@@ -1216,6 +1303,9 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             ValueError: If there are too many unique colors to map to characters.
 
         """
+        if frame_colors is None:
+            frame_colors = self._index_frame_colors()
+
         color_map: dict[tuple[int, ...], str] = {}
         universal_chars = SPRITE_GLYPHS
         char_index = 0
@@ -1224,7 +1314,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         original_color_to_char, used_chars = self._build_reverse_color_map()
 
         # Reserve \u2588 for (255, 0, 255) - always use RGBA format (255, 0, 255, 255)
-        has_magenta = self._any_pixel_is_magenta()
+        has_magenta = self._any_pixel_is_magenta(frame_colors)
 
         if has_magenta:
             # Always store magenta as RGBA with alpha=255
@@ -1232,13 +1322,12 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             color_map[255, 0, 255, 255] = original_color_to_char.get((255, 0, 255, 255), '\u2588')
             universal_chars = [c for c in universal_chars if c != '\u2588']
 
-        for frames in self._animations.values():
-            for frame in frames:
-                pixels = frame.get_pixel_data()
-                needs_alpha = needs_alpha_channel(pixels)
+        for frames in frame_colors.values():
+            for colors, _ in frames:
+                needs_alpha = needs_alpha_channel(colors)
 
-                for pixel in pixels:
-                    color_tuple = normalize_pixel_for_color_map(pixel, needs_alpha=needs_alpha)
+                for color in colors:
+                    color_tuple = normalize_pixel_for_color_map(color, needs_alpha=needs_alpha)
 
                     if color_tuple in color_map:
                         continue
@@ -1302,24 +1391,29 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
 
         return original_color_to_char, used_chars
 
-    def _any_pixel_is_magenta(self: Self) -> bool:
+    def _any_pixel_is_magenta(
+        self: Self,
+        frame_colors: dict[str, list[FrameColors]] | None = None,
+    ) -> bool:
         """Check if any pixel across all animations is magenta.
 
+        Args:
+            frame_colors: Frame color indexes from _index_frame_colors(), computed
+                if not given.
+
         Returns:
             True if any pixel is the magenta transparency key.
 
         """
-        for frames in self._animations.values():
-            for frame in frames:
-                pixels = frame.get_pixel_data()
-                for pixel in pixels:
-                    if len(pixel) == RGBA_COMPONENT_COUNT:
-                        r, g, b, _a = pixel
-                        if (r, g, b) == MAGENTA_TRANSPARENCY_KEY:
-                            return True
-                    elif pixel == MAGENTA_TRANSPARENCY_KEY:
-                        return True
-        return False
+        if frame_colors is None:
+            frame_colors = self._index_frame_colors()
+
+        return any(
+            color[:3] == MAGENTA_TRANSPARENCY_KEY
+            for frames in frame_colors.values()
+            for colors, _ in frames
+            for color in colors
+        )
 
     def _build_toml_color_definitions(
         self: Self,
@@ -1373,9 +1467,15 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
     def _build_toml_data_structure(
         self: Self,
         color_map: dict[tuple[int, ...], str],
+        frame_colors: dict[str, list[FrameColors]] | None = None,
     ) -> dict[str, Any]:
         """Build TOML data structure.
 
+        Args:
+            color_map: Mapping of colors to characters from _build_toml_color_map()
+            frame_colors: Frame color indexes from _index_frame_colors(), computed
+                if not given.
+
         Returns:
             dict: The result.
 
@@ -1389,17 +1489,14 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             'animation': [],
         }
 
+        if frame_colors is None:
+            frame_colors = self._index_frame_colors()
+
         # Check if sprite needs per-pixel alpha by examining pixel data
         # Use presence of alpha 0-254 in pixels to determine if we need per-pixel alpha
-        needs_per_pixel_alpha = False
-        for frames in self._animations.values():
-            for frame in frames:
-                pixels = frame.get_pixel_data()
-                if needs_alpha_channel(pixels):
-                    needs_per_pixel_alpha = True
-                    break
-            if needs_per_pixel_alpha:
-                break
+        needs_per_pixel_alpha = any(
+            needs_alpha_channel(colors) for frames in frame_colors.values() for colors, _ in frames
+        )
 
         # Add color definitions - preserve original alpha format
         data['colors'] = self._build_toml_color_definitions(
@@ -1409,7 +1506,11 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
 
         # Add animations
         for anim_name, frames in self._animations.items():
-            animation_frames = AnimatedSprite._create_toml_animation_frames(frames, color_map)
+            animation_frames = AnimatedSprite._create_toml_animation_frames(
+                frames,
+                color_map,
+                frame_colors[anim_name],
+            )
             animation_entry = {
                 'namespace': anim_name,
                 'frame_interval': 0.5,
@@ -1425,6 +1526,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
     def _create_toml_animation_frames(
         frames: list[SpriteFrame],
         color_map: dict[tuple[int, ...], str],
+        frame_colors: list[FrameColors] | None = None,
     ) -> list[dict[str, Any]]:
         """Create TOML animation frames.
 
@@ -1434,7 +1536,12 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         """
         animation_frames: list[dict[str, Any]] = []
         for i, frame in enumerate(frames):
-            frame_data = AnimatedSprite._create_toml_frame_data(frame, i, color_map)
+            frame_data = AnimatedSprite._create_toml_frame_data(
+                frame,
+                i,
+                color_map,
+                frame_colors[i] if frame_colors is not None else None,
+            )
             animation_frames.append(frame_data)
         return animation_frames
 
@@ -1443,6 +1550,7 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
         frame: SpriteFrame,
         frame_index: int,
         color_map: dict[tuple[int, ...], str],
+        frame_colors: FrameColors | None = None,
     ) -> dict[str, Any]:
         """Create TOML frame data.
 
@@ -1450,9 +1558,15 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             dict: The result.
 
         """
-        pixels = frame.get_pixel_data()
         width, height = frame.get_size()
-        pixel_chars = AnimatedSprite._convert_pixels_to_toml_chars(pixels, width, height, color_map)
+        if frame_colors is None:
+            frame_colors = index_pixel_colors(frame.get_pixel_data())
+        pixel_chars = AnimatedSprite._convert_colors_to_toml_chars(
+            frame_colors,
+            width,
+            height,
+            color_map,
+        )
         return {'frame_index': frame_index, 'pixels': '\n'.join(pixel_chars)}
 
     @staticmethod
@@ -1468,24 +1582,39 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
             list: The result.
 
         """
-        pixel_chars: list[str] = []
+        return AnimatedSprite._convert_colors_to_toml_chars(
+            index_pixel_colors(pixels),
+            width,
+            height,
+            color_map,
+        )
+
+    @staticmethod
+    def _convert_colors_to_toml_chars(
+        frame_colors: FrameColors,
+        width: int,
+        height: int,
+        color_map: dict[tuple[int, ...], str],
+    ) -> list[str]:
+        """Convert an indexed frame to TOML character rows.
+
+        Each distinct color is looked up in the color map once; the rows are
+        then assembled from the per-pixel color index.
+
+        Returns:
+            list: The result.
+
+        """
+        colors, inverse = frame_colors
         # Determine whether the color map expects RGBA or RGB tuples
         # If any key in the color_map has length 4, we assume alpha-aware mapping
         map_uses_alpha = (
             any(len(k) == RGBA_COMPONENT_COUNT for k in color_map) if color_map else False
         )
-        for y in range(height):
-            row_chars: list[str] = []
-            for x in range(width):
-                pixel_idx = y * width + x
-                if pixel_idx < len(pixels):
-                    pixel = pixels[pixel_idx]
-                    color_char = lookup_pixel_char(pixel, color_map, map_uses_alpha=map_uses_alpha)
-                    row_chars.append(color_char)
-                else:
-                    row_chars.append('.')
-            pixel_chars.append(''.join(row_chars))
-        return pixel_chars
+        glyphs = [
+            lookup_pixel_char(color, color_map, map_uses_alpha=map_uses_alpha) for color in colors
+        ]
+        return _glyph_rows(glyphs, inverse, width, height)
 
     @staticmethod
     def _write_toml_sprite_section(f: IO[str], data: dict[str, Any]) -> None:
@@ -1566,41 +1695,79 @@ class AnimatedSprite(AnimatedSpriteInterface, pygame.sprite.DirtySprite):  # noq
 
     @override
     def update(self: Self, dt: float = 0.016) -> None:
-        """Update animation timing."""
-        if not self._is_playing or not self.frame_manager.current_animation:
-            return
+        """Update animation timing.
 
-        if self.frame_manager.current_animation not in self._animations:
+        Advances as many frames as dt spans and carries the time left over
+        into the next frame. Sprites attached to an AnimationClock are moved
+        by the clock instead.
+        """
+        if not self._is_playing or self._animation_clock is not None:
             return
 
-        frames = self._animations[self.frame_manager.current_animation]
+        frames = self._animations.get(self.frame_manager.current_animation)
+        if frames is None:
+            return
         if not frames:
             # No frames available, stop animation
             self._is_playing = False
             return
 
-        # Update frame timer
         self._frame_timer += dt
 
-        # Use the current frame's duration for timing
         # Ensure current frame index is within bounds
-        if self.frame_manager.current_frame >= len(frames):
-            self.frame_manager.current_frame = max(0, len(frames) - 1)
+        frame_index = self.frame_manager.current_frame
+        if not 0 <= frame_index < len(frames):
+            frame_index = min(max(frame_index, 0), len(frames) - 1)
+            self.frame_manager.current_frame = frame_index
+
+        if self._frame_timer >= frames[frame_index].duration:
+            self._catch_up(frames)
+
+    def _catch_up(self: Self, frames: list[SpriteFrame]) -> None:
+        """Advance through every frame whose duration the frame timer covers."""
+        if self._is_looping:
+            # Whole cycles land back on the same frame
+            cycle = sum(frame.duration for frame in frames)
+            if cycle > 0 and self._frame_timer >= cycle:
+                self._frame_timer %= cycle
+
+        # Bounded so zero-duration frames cannot spin forever
+        for _ in range(len(frames)):
+            frame_interval = frames[self.frame_manager.current_frame].duration
+            if self._frame_timer < frame_interval:
+                break
+            self._frame_timer -= frame_interval
+            self._advance_frame(frames)
+            if not self._is_playing:
+                self._frame_timer = 0.0
+                break
 
-        self.frame_manager.current_frame = max(self.frame_manager.current_frame, 0)
+        self._update_surface_and_mark_dirty()
+        self._debug_frame_info(frames)
 
-        current_frame = frames[self.frame_manager.current_frame]
-        frame_interval = current_frame.duration
+    def show_clock_frame(self: Self, frame_index: int, *, finished: bool = False) -> None:
+        """Show the frame an AnimationClock computed for this sprite.
 
-        if self._frame_timer >= frame_interval:
-            self._advance_frame(frames)
+        Args:
+            frame_index (int): The frame of the current animation to show.
+            finished (bool): Whether a non-looping animation reached its end.
+
+        """
+        if finished:
+            self._is_playing = False
+            self._frame_timer = 0.0
+        if frame_index != self.frame_manager.current_frame:
+            self.frame_manager.current_frame = frame_index
             self._update_surface_and_mark_dirty()
-            self._debug_frame_info(frames)
+
+    def _sync_clock(self: Self) -> None:
+        """Re-pin the sprite to its AnimationClock after a playback change."""
+        if self._animation_clock is not None:
+            self._animation_clock.sync(self)
 
     def _advance_frame(self: Self, frames: list[SpriteFrame]) -> None:
         """Advance to the next frame in the animation."""
         old_frame = self.frame_manager.current_frame
-        self._frame_timer = 0.0
         self.frame_manager.current_frame += 1
 
         # Log only on frame transitions
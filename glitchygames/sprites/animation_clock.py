@@ -0,0 +1,292 @@
+"""Shared animation timeline.
+
+An AnimationClock keeps one elapsed time for every AnimatedSprite attached to
+it, so the sprites stay in step with each other instead of each accumulating
+its own frame timer. Each sprite is pinned to the clock time at which its
+current animation started; a tick looks the frame up from the elapsed time,
+which skips as many frames as the tick spans. Sprites whose animations have
+the same frame durations share a FrameSchedule, and sprites that also started
+at the same time are looked up once per tick as a group.
+
+A clock can also drive a sprite group, e.g. a scene's all_sprites: every
+AnimatedSprite attaches itself when it joins the group and detaches when it
+leaves it or is killed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    import pygame
+
+    from .animated import AnimatedSprite
+    from .frame import SpriteFrame
+
+
+class FrameSchedule:
+    """When each frame of an animation ends, for one sequence of frame durations."""
+
+    __slots__ = ('durations', 'ends', 'total')
+
+    def __init__(self: Self, durations: Iterable[float]) -> None:
+        """Initialize the schedule.
+
+        Args:
+            durations (Iterable[float]): The duration of each frame, in seconds.
+
+        """
+        self.durations: tuple[float, ...] = tuple(durations)
+        self.ends: list[float] = list(itertools.accumulate(self.durations))
+        self.total: float = self.ends[-1] if self.ends else 0.0
+
+    def __len__(self: Self) -> int:
+        """Return the number of frames.
+
+        Returns:
+            int: The frame count.
+
+        """
+        return len(self.durations)
+
+    def start_of(self: Self, frame_index: int) -> float:
+        """Get the time into the animation at which a frame starts.
+
+        Args:
+            frame_index (int): The frame index.
+
+        Returns:
+            float: Seconds from the start of the animation.
+
+        """
+        return self.ends[frame_index - 1] if frame_index > 0 else 0.0
+
+    def frame_at(self: Self, elapsed: float, *, looping: bool) -> tuple[int, bool]:
+        """Find the frame shown a given time into the animation.
+
+        Args:
+            elapsed (float): Seconds since the animation started.
+            looping (bool): Whether the animation wraps around after its last frame.
+
+        Returns:
+            tuple[int, bool]: The frame index, and whether a non-looping
+                animation has finished.
+
+        """
+        last = len(self.durations) - 1
+        if looping:
+            if self.total <= 0:
+                return 0, False
+            elapsed %= self.total
+        elif elapsed >= self.total:
+            return last, True
+        return min(bisect.bisect_right(self.ends, elapsed), last), False
+
+
+@dataclass(slots=True)
+class _ClockEntry:
+    """Where an attached sprite's current animation sits on the clock."""
+
+    frames: list[SpriteFrame]
+    frame_count: int
+    schedule: FrameSchedule
+    start: float
+
+
+class AnimationClock:
+    """Advance attached AnimatedSprites from one shared timeline.
+
+    Attached sprites ignore AnimatedSprite.update(); tick() moves them
+    instead. Sprites are held weakly, so a sprite that is dropped while
+    attached does not linger.
+    """
+
+    def __init__(self: Self) -> None:
+        """Initialize a clock at time zero with no sprites."""
+        self.time: float = 0.0
+        # None for attached sprites that are not playing
+        self._entries: weakref.WeakKeyDictionary[AnimatedSprite, _ClockEntry | None] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._schedules: dict[tuple[float, ...], FrameSchedule] = {}
+
+    def __len__(self: Self) -> int:
+        """Return the number of attached sprites.
+
+        Returns:
+            int: The sprite count.
+
+        """
+        return len(self._entries)
+
+    def __contains__(self: Self, sprite: object) -> bool:
+        """Check whether a sprite is attached.
+
+        Returns:
+            bool: True if the clock drives the sprite.
+
+        """
+        return sprite in self._entries
+
+    @staticmethod
+    def for_group(group: pygame.sprite.AbstractGroup[Any]) -> AnimationClock | None:
+        """Get the clock driving a sprite group's AnimatedSprites.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group.
+
+        Returns:
+            AnimationClock | None: The clock, or None if no clock drives the group.
+
+        """
+        try:
+            return _group_clocks.get(group)
+        except TypeError:
+            return None  # Not weakly referenceable, so never driven
+
+    def drive_group(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> None:
+        """Drive a group's AnimatedSprites, now and whenever one joins it.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group, e.g. a scene's all_sprites.
+
+        """
+        from .animated import AnimatedSprite
+
+        _group_clocks[group] = self
+        for sprite in group:
+            if isinstance(sprite, AnimatedSprite):
+                self.add(sprite)
+
+    def add(self: Self, sprite: AnimatedSprite) -> None:
+        """Attach a sprite so the clock drives its animation.
+
+        The sprite keeps its current frame and the time already spent on it.
+
+        Args:
+            sprite (AnimatedSprite): The sprite to attach.
+
+        """
+        previous = sprite._animation_clock
+        if previous is not None and previous is not self:
+            previous.remove(sprite)
+        sprite._animation_clock = self
+        self.sync(sprite)
+
+    def remove(self: Self, sprite: AnimatedSprite) -> None:
+        """Detach a sprite so AnimatedSprite.update() drives it again.
+
+        The time spent on the current frame is handed back to the sprite's
+        own frame timer.
+
+        Args:
+            sprite (AnimatedSprite): The sprite to detach.
+
+        """
+        entry = self._entries.pop(sprite, None)
+        if entry is not None:
+            elapsed = self.time - entry.start
+            if sprite.is_looping and entry.schedule.total > 0:
+                elapsed %= entry.schedule.total
+            sprite._frame_timer = max(0.0, elapsed - entry.schedule.start_of(sprite.current_frame))
+        if sprite._animation_clock is self:
+            sprite._animation_clock = None
+
+    def sync(self: Self, sprite: AnimatedSprite) -> None:
+        """Re-pin a sprite to the clock after its playback state changed.
+
+        AnimatedSprite calls this from play(), pause(), stop(), set_frame()
+        and set_animation(); the current frame starts over at the current
+        clock time, minus whatever the sprite's frame timer already holds.
+
+        Args:
+            sprite (AnimatedSprite): An attached sprite.
+
+        """
+        frames = sprite.animation_data.get(sprite.current_animation)
+        if not sprite.is_playing or not frames:
+            self._entries[sprite] = None
+            return
+
+        schedule = self.schedule_for(frame.duration for frame in frames)
+        frame_index = min(max(sprite.current_frame, 0), len(frames) - 1)
+        start = self.time - schedule.start_of(frame_index) - sprite._frame_timer
+        self._entries[sprite] = _ClockEntry(frames, len(frames), schedule, start)
+
+    def schedule_for(self: Self, durations: Iterable[float]) -> FrameSchedule:
+        """Get the shared schedule for a sequence of frame durations.
+
+        Args:
+            durations (Iterable[float]): The duration of each frame, in seconds.
+
+        Returns:
+            FrameSchedule: The schedule, created on first use.
+
+        """
+        key = tuple(durations)
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            schedule = self._schedules[key] = FrameSchedule(key)
+        return schedule
+
+    def tick(self: Self, dt: float) -> None:
+        """Advance the clock and move every playing sprite to its current frame.
+
+        Args:
+            dt (float): Seconds since the last tick.
+
+        """
+        self.time += dt
+
+        groups: dict[tuple[FrameSchedule, float, bool], list[AnimatedSprite]] = {}
+        for sprite, entry in list(self._entries.items()):
+            current = self._current_entry(sprite, entry)
+            if current is not None:
+                key = (current.schedule, current.start, sprite.is_looping)
+                groups.setdefault(key, []).append(sprite)
+
+        for (schedule, start, looping), sprites in groups.items():
+            frame_index, finished = schedule.frame_at(self.time - start, looping=looping)
+            for sprite in sprites:
+                sprite.show_clock_frame(frame_index, finished=finished)
+                if finished:
+                    self._entries[sprite] = None
+
+    def _current_entry(
+        self: Self, sprite: AnimatedSprite, entry: _ClockEntry | None
+    ) -> _ClockEntry | None:
+        """Check an attached sprite's entry against its playback state.
+
+        Args:
+            sprite (AnimatedSprite): An attached sprite.
+            entry (_ClockEntry | None): The sprite's entry.
+
+        Returns:
+            _ClockEntry | None: The entry to advance, or None if the sprite is
+                not playing.
+
+        """
+        if entry is None:
+            return None
+        if not sprite.is_playing:
+            self._entries[sprite] = None
+            return None
+        frames = sprite.animation_data.get(sprite.current_animation)
+        if frames is entry.frames and len(frames) == entry.frame_count:
+            return entry
+        # Frames were replaced or edited behind the clock's back
+        self.sync(sprite)
+        return self._entries[sprite]
+
+
+# The clock driving each group passed to AnimationClock.drive_group()
+_group_clocks: weakref.WeakKeyDictionary[pygame.sprite.AbstractGroup[Any], AnimationClock] = (
+    weakref.WeakKeyDictionary()
+)
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 import pygame
 import tomli_w
 
+from glitchygames.performance.tracing import tracer
+
 from .constants import DEFAULT_FILE_FORMAT, SPRITE_GLYPHS
 from .sprite import Sprite
 
@@ -220,19 +222,17 @@ class BitmappySprite(Sprite):
         """
         # Read the raw file content first
         raw_content = Path(filename).read_text(encoding='utf-8')
-        self.log.debug(f'Raw file content ({len(raw_content)} bytes):\n{raw_content}')
+        # Checked once; the row loop below runs per line of the file
+        trace = tracer.sprites
 
         # Parse TOML
         data = tomllib.loads(raw_content)
-        self.log.debug(f'TOML data keys: {list(data.keys())}')
 
         try:
             name = data['sprite']['name']
-            self.log.debug('Sprite name: %s', name)
 
             # Get pixel data
             pixel_text = str(data['sprite']['pixels'])
-            self.log.debug(f'Raw pixel text ({len(pixel_text)} bytes):\n{pixel_text}')
 
             # Split into rows and process each row
             rows: list[str] = []
@@ -240,14 +240,12 @@ class BitmappySprite(Sprite):
                 row = raw_row.strip()
                 if row:  # Only add non-empty rows
                     rows.append(row)
-                    self.log.debug(f"Row {i}: '{row}' (len={len(row)})")
-
-            self.log.debug(f'Total rows processed: {len(rows)}')
+                    if trace:
+                        tracer.emit('sprites', "Row %d: '%s' (len=%d)", i, row, len(row))
 
             # Calculate dimensions
             width = len(rows[0]) if rows else 0
             height = len(rows)
-            self.log.debug('Calculated dimensions: %sx%s', width, height)
 
             # Get color definitions
             color_map: dict[str, Any] = {}
@@ -257,26 +255,25 @@ class BitmappySprite(Sprite):
                     green = color_data['green']
                     blue = color_data['blue']
                     color_map[str(color_key)] = (red, green, blue)
-                    self.log.debug(
-                        "Color map entry: '%s' -> RGB(%s, %s, %s)",
-                        color_key,
-                        red,
-                        green,
-                        blue,
-                    )
-
-            self.log.debug(f'Total colors in map: {len(color_map)}')
 
             # Create image and rect
-            self.log.debug('Creating image and rect...')
             (image, rect) = self.inflate(
                 width=width,
                 height=height,
                 pixels=rows,
                 color_map=color_map,
             )
-            self.log.debug(f'Created image size: {image.get_size()}')
-            self.log.debug('Created rect: %s', rect)
+            if trace:
+                tracer.emit(
+                    'sprites',
+                    "Loaded '%s' from %s: %dx%d, rect %s, colors %s",
+                    name,
+                    filename,
+                    width,
+                    height,
+                    rect,
+                    color_map,
+                )
 
         except Exception:
             self.log.exception('Error in TOML load')
@@ -519,7 +516,8 @@ class BitmappySprite(Sprite):
                     self.log.error('Color %s not found in color_map', pixel_color)
                 row += char
             pixel_rows.append(row)
-            self.log.debug(f"Row {y}: '{row}' (len={len(row)})")
+            if tracer.sprites:
+                tracer.emit('sprites', "Row %d: '%s' (len=%d)", y, row, len(row))
         return pixel_rows
 
     def _generate_pixel_rows(
@@ -654,19 +652,17 @@ class BitmappySprite(Sprite):
         """
         # Read the raw file content first
         raw_content = Path(filename).read_text(encoding='utf-8')
-        self.log.debug(f'Raw file content ({len(raw_content)} bytes):\n{raw_content}')
+        # Checked once; the row loop below runs per line of the file
+        trace = tracer.sprites
 
         # Parse TOML
         data = tomllib.loads(raw_content)
-        self.log.debug(f'TOML data keys: {list(data.keys())}')
 
         try:
             name = data['sprite']['name']
-            self.log.debug('Sprite name: %s', name)
 
             # Get pixel data
             pixel_text = str(data['sprite']['pixels'])
-            self.log.debug(f'Raw pixel text ({len(pixel_text)} bytes):\n{pixel_text}')
 
             # Split into rows and process each row
             rows: list[str] = []
@@ -674,14 +670,12 @@ class BitmappySprite(Sprite):
                 row = raw_row.strip()
                 if row:  # Only add non-empty rows
                     rows.append(row)
-                    self.log.debug(f"Row {i}: '{row}' (len={len(row)})")
-
-            self.log.debug(f'Total rows processed: {len(rows)}')
+                    if trace:
+                        tracer.emit('sprites', "Row %d: '%s' (len=%d)", i, row, len(row))
 
             # Calculate dimensions
             width = len(rows[0]) if rows else 0
             height = len(rows)
-            self.log.debug('Calculated dimensions: %sx%s', width, height)
 
             # Get color definitions
             color_map: dict[str, Any] = {}
@@ -691,15 +685,9 @@ class BitmappySprite(Sprite):
                     green = color_data['green']
                     blue = color_data['blue']
                     color_map[str(color_key)] = (red, green, blue)
-                    self.log.debug(
-                        "Color map entry: '%s' -> RGB(%s, %s, %s)",
-                        color_key,
-                        red,
-                        green,
-                        blue,
-                    )
-
-            self.log.debug(f'Total colors in map: {len(color_map)}')
+            tracer.emit(
+                'sprites', "Inflating '%s': %dx%d, colors %s", name, width, height, color_map
+            )
 
             # Convert rows to pixels
             pixels: list[tuple[int, int, int]] = []
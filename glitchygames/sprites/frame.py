@@ -148,6 +148,9 @@ class SpriteFrame:
         self._rect = pygame.Rect((0, 0), surface.get_size())
         self.duration = duration
         self.pixels: list[tuple[int, ...]] = []
+        # Bumped whenever the image is replaced or redrawn from pixel data,
+        # so renderers can tell when a cached copy is stale
+        self.revision = 0
 
     @property
     def image(self) -> pygame.Surface:
@@ -158,6 +161,7 @@ class SpriteFrame:
     def image(self, new_image: pygame.Surface) -> None:
         """Set the image."""
         self._image = new_image
+        self.revision += 1
 
     @property
     def rect(self) -> pygame.Rect:
@@ -229,6 +233,7 @@ class SpriteFrame:
     def set_pixel_data(self, pixels: list[tuple[int, ...]]) -> None:
         """Set pixel data from a list of RGB or RGBA tuples."""
         self.pixels = pixels.copy()
+        self.revision += 1
         # Update the surface with the new pixel data
         width, height = self._image.get_size()
         for i, pixel in enumerate(pixels):
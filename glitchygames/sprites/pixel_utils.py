@@ -6,11 +6,13 @@ detection, and color map lookups used by the animation system.
 
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+import numpy as np
 import pygame
 
 from glitchygames.color import (
@@ -23,6 +25,9 @@ from glitchygames.color import (
 # Constants
 PIXEL_ARRAY_SHAPE_DIMENSIONS = 3
 
+# Bits per channel when packing a pixel into one integer key (room for 4 channels)
+_PACKED_CHANNEL_BITS = 16
+
 # Error message templates
 ERR_COLOR_NOT_FOUND = 'Color {} not found in color map. Available colors: {}'
 ERR_COLOR_NOT_FOUND_WITH_RGBA = 'Color {} (or RGBA {}) not found in color map. Available colors: {}'
@@ -227,6 +232,57 @@ def normalize_pixel_for_color_map(pixel: tuple[int, ...], *, needs_alpha: bool)
     return pixel
 
 
+def index_pixel_colors(
+    pixels: Sequence[tuple[int, ...]],
+) -> tuple[list[tuple[int, ...]], np.ndarray]:
+    """Find the distinct colors of a frame and which one each pixel uses.
+
+    Frames whose pixels all have the same number of channels are indexed with
+    numpy; frames mixing RGB and RGBA tuples keep the two apart, since they
+    serialize differently.
+
+    Args:
+        pixels: List of pixel tuples (RGB or RGBA)
+
+    Returns:
+        Tuple of (distinct colors in order of first appearance, index into them
+        for every pixel)
+
+    """
+    if not pixels:
+        return [], np.empty(0, dtype=np.intp)
+
+    channel_counts = set(map(len, pixels))
+    if len(channel_counts) != 1:
+        # Mixed RGB/RGBA pixel list - index the tuples directly
+        index: dict[tuple[int, ...], int] = {}
+        inverse = np.fromiter(
+            (index.setdefault(pixel, len(index)) for pixel in pixels),
+            dtype=np.intp,
+            count=len(pixels),
+        )
+        return list(index), inverse
+
+    # Flattening is much faster than converting the list of tuples directly
+    channels = channel_counts.pop()
+    array = np.fromiter(
+        itertools.chain.from_iterable(pixels),
+        dtype=np.uint64,
+        count=len(pixels) * channels,
+    ).reshape(len(pixels), channels)
+    keys = np.zeros(len(array), dtype=np.uint64)
+    for channel in range(array.shape[1]):
+        keys = (keys << np.uint64(_PACKED_CHANNEL_BITS)) | array[:, channel]
+    _, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+    # np.unique sorts by key; renumber the colors by first appearance
+    order = np.argsort(first_index)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    colors = [tuple(color) for color in array[first_index[order]].tolist()]
+    return colors, rank[inverse.ravel()]
+
+
 def extract_pixel_colors(
     pixel_lines: list[str],
     width: int,
@@ -13,6 +13,7 @@ import pygame
 
 from glitchygames.events import MouseEvents
 from glitchygames.interfaces import SpriteInterface
+from glitchygames.sprites.scheduler import update_scheduler
 
 LOG = logging.getLogger('game.sprites')
 
@@ -47,6 +48,22 @@ class RootSprite(MouseEvents, SpriteInterface, pygame.sprite.DirtySprite):
     def rect(self, value: pygame.FRect | pygame.Rect | None) -> None:
         self._gg_rect = cast('pygame.FRect | pygame.Rect', value)
 
+    # Backing store for dirty; a class default so the setter works before __init__ runs
+    _gg_dirty: int = 0
+
+    @property
+    def dirty(self) -> int:
+        """Return the dirty flag (0 clean, 1 redraw once, 2 always redraw)."""
+        return self._gg_dirty
+
+    @dirty.setter
+    def dirty(self, value: int) -> None:
+        # Schedule on the clean -> dirty transition; Scene.update keeps
+        # still-dirty sprites scheduled itself
+        if value and not self._gg_dirty:
+            update_scheduler.schedule(self)
+        self._gg_dirty = value
+
     def __init__(self: Self, groups: pygame.sprite.LayeredDirty[Any] | None = None) -> None:
         """Initialize a RootSprite.
 
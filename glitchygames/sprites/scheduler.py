@@ -0,0 +1,89 @@
+"""Dirty-sprite update scheduling.
+
+Sprites schedule themselves here when their dirty flag turns on, so
+Scene.update() only visits sprites that changed instead of walking the whole
+sprite group every frame. Scheduled sprites are held weakly, so a sprite that
+is dropped while scheduled does not linger.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pygame
+
+
+class UpdateScheduler:
+    """The set of sprites awaiting a Scene.update() visit, in scheduling order."""
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty schedule."""
+        self._pending: weakref.WeakKeyDictionary[Any, None] = weakref.WeakKeyDictionary()
+
+    def __len__(self: Self) -> int:
+        """Return the number of scheduled sprites.
+
+        Returns:
+            int: The sprite count.
+
+        """
+        return len(self._pending)
+
+    def __contains__(self: Self, sprite: object) -> bool:
+        """Check whether a sprite is scheduled.
+
+        Returns:
+            bool: True if the sprite will be visited by the next update.
+
+        """
+        return sprite in self._pending
+
+    def schedule(self: Self, sprite: object) -> None:
+        """Schedule a sprite for the next update.
+
+        Args:
+            sprite (object): The sprite that needs work.
+
+        """
+        self._pending[sprite] = None
+
+    def schedule_all(self: Self, sprites: Iterable[object]) -> None:
+        """Schedule several sprites for the next update.
+
+        Args:
+            sprites (Iterable[object]): The sprites that need work.
+
+        """
+        for sprite in sprites:
+            self._pending[sprite] = None
+
+    def drain(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> list[Any]:
+        """Take the scheduled sprites that belong to a group and clear the schedule.
+
+        Sprites outside the group are dropped rather than kept: a scene visits
+        all of its sprites whenever it is marked dirty, which happens when it
+        becomes active, so nothing scheduled for an inactive scene is lost.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group being updated, e.g. a
+                scene's all_sprites.
+
+        Returns:
+            list[Any]: The group's scheduled sprites, in scheduling order.
+
+        """
+        scheduled = [sprite for sprite in list(self._pending) if sprite in group]
+        self._pending.clear()
+        return scheduled
+
+    def clear(self: Self) -> None:
+        """Unschedule every sprite."""
+        self._pending.clear()
+
+
+# Process-wide schedule shared by every sprite and scene
+update_scheduler = UpdateScheduler()
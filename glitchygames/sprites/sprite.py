@@ -35,6 +35,11 @@ class Sprite(RootSprite):  # noqa: PLR0904
         collections.OrderedDict()
     )
     SPRITE_COUNT = 0
+    # Drawn between its last two positions when the scene runs a fixed timestep
+    INTERPOLATE: ClassVar[bool] = False
+    # Bumped whenever an interpolated sprite joins or leaves a group, so the
+    # scene manager only re-collects interpolated sprites when it changes
+    interpolated_membership_version: ClassVar[int] = 0
 
     @classmethod
     def break_when(cls: type[Sprite], sprite_type: object | None = None) -> None:
@@ -90,6 +95,8 @@ class Sprite(RootSprite):  # noqa: PLR0904
 
         self.dt = 0
         self.dt_timer = 0
+        # Position before the latest fixed simulation step (see INTERPOLATE)
+        self.previous_position: tuple[int, int] | None = None
 
         self.rect.x = x
         self.rect.y = y
@@ -209,6 +216,66 @@ class Sprite(RootSprite):  # noqa: PLR0904
         self.dt = dt
         self.dt_timer += self.dt
 
+    @override
+    def add_internal(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> None:
+        """Join a group, noting the change if this sprite is interpolated.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group being joined.
+
+        """
+        super().add_internal(group)
+        if self.INTERPOLATE:
+            Sprite.interpolated_membership_version += 1
+
+    @override
+    def remove_internal(self: Self, group: pygame.sprite.AbstractGroup[Any]) -> None:
+        """Leave a group, noting the change if this sprite is interpolated.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group being left.
+
+        """
+        super().remove_internal(group)
+        if self.INTERPOLATE:
+            Sprite.interpolated_membership_version += 1
+
+    @override
+    def kill(self: Self) -> None:
+        """Leave every group, noting the change if this sprite is interpolated.
+
+        pygame's kill() empties the sprite's groups without remove_internal().
+        """
+        if self.INTERPOLATE and self.alive():
+            Sprite.interpolated_membership_version += 1
+        super().kill()
+
+    def store_previous_position(self: Self) -> None:
+        """Remember the current position as the start of the next simulation step.
+
+        Also call this after teleporting the sprite, so it is not drawn
+        sliding to its new position.
+        """
+        self.previous_position = self.rect.topleft
+
+    def interpolated_position(self: Self, alpha: float) -> tuple[int, int]:
+        """Get the position to draw at between the last two simulation steps.
+
+        Args:
+            alpha (float): How far between the previous (0) and current (1) positions.
+
+        Returns:
+            tuple[int, int]: The top-left corner to draw at.
+
+        """
+        if self.previous_position is None:
+            return self.rect.topleft
+        previous_x, previous_y = self.previous_position
+        return (
+            round(previous_x + (self.rect.x - previous_x) * alpha),
+            round(previous_y + (self.rect.y - previous_y) * alpha),
+        )
+
     @override
     def update(self: Self) -> None:
         """Update the sprite."""
@@ -113,6 +113,8 @@ class ASCIIRenderer:
     def colorize_pixels(self, pixels: str, colors: dict[str, tuple[int, int, int, int]]) -> str:
         """Colorize pixels string with terminal colors and alpha channel support.
 
+        Each distinct glyph is styled once and then looked up for every pixel.
+
         Args:
             pixels: Raw pixels string
             colors: Color mapping dictionary with RGBA tuples
@@ -125,49 +127,57 @@ class ASCIIRenderer:
             return pixels
 
         lines = pixels.strip().split('\n')
-        colorized_lines: list[str] = []
-
-        for line in lines:
-            colorized_line = ''
-            for char in line:
-                if char in colors:
-                    r, g, b, a = colors[char]
-
-                    # Handle alpha transparency
-                    if a == 0:
-                        # Fully transparent - draw as light grey for contrast
-                        display_char = self._get_transparency_char()
-                        # Use light grey background (192, 192, 192) for better contrast
-                        color_code = self.color_mapper.get_color_code(192, 192, 192)
-                    elif a < MAX_COLOR_CHANNEL_VALUE:
-                        # Semi-transparent - use a lighter version or special character
-                        if a < ALPHA_TRANSPARENCY_THRESHOLD:  # Very transparent
-                            display_char = self._get_transparency_char()
-                        else:  # Semi-transparent
-                            display_char = self._get_pixel_char(char)
-
-                        # Adjust color intensity based on alpha
-                        adjusted_r = int(r * (a / 255))
-                        adjusted_g = int(g * (a / 255))
-                        adjusted_b = int(b * (a / 255))
-                        color_code = self.color_mapper.get_color_code(
-                            adjusted_r,
-                            adjusted_g,
-                            adjusted_b,
-                        )
-                    else:
-                        # Fully opaque
-                        color_code = self.color_mapper.get_color_code(r, g, b)
-                        display_char = self._get_pixel_char(char)
+        reset_code = self.color_mapper.get_reset_code()
+        styled: dict[str, str] = {}
+        for char in set(''.join(lines)):
+            style = self.cell_style(char, colors)
+            styled[char] = char if style is None else f'{style[0]}{style[1]}{reset_code}'
+
+        return '\n'.join(''.join(map(styled.__getitem__, line)) for line in lines)
+
+    def cell_style(
+        self,
+        char: str,
+        colors: dict[str, tuple[int, int, int, int]],
+    ) -> tuple[str, str] | None:
+        """Get the color code and display character for one pixel glyph.
 
-                    reset_code = self.color_mapper.get_reset_code()
-                    colorized_line += f'{color_code}{display_char}{reset_code}'
-                else:
-                    colorized_line += self._colorize_non_mapped_char(char, colors)
+        Args:
+            char: The glyph from the sprite pixels
+            colors: Color mapping dictionary with RGBA tuples
 
-            colorized_lines.append(colorized_line)
+        Returns:
+            tuple[str, str] | None: The color code and display character, or
+                None if the glyph is shown as it is.
 
-        return '\n'.join(colorized_lines)
+        """
+        if char not in colors:
+            return self._unmapped_cell_style(char, colors)
+
+        r, g, b, a = colors[char]
+
+        # Handle alpha transparency
+        if a == 0:
+            # Fully transparent - draw as light grey for contrast
+            return self.color_mapper.get_color_code(192, 192, 192), self._get_transparency_char()
+
+        if a < MAX_COLOR_CHANNEL_VALUE:
+            # Semi-transparent - use a lighter version or special character
+            if a < ALPHA_TRANSPARENCY_THRESHOLD:  # Very transparent
+                display_char = self._get_transparency_char()
+            else:  # Semi-transparent
+                display_char = self._get_pixel_char(char)
+
+            # Adjust color intensity based on alpha
+            color_code = self.color_mapper.get_color_code(
+                int(r * (a / 255)),
+                int(g * (a / 255)),
+                int(b * (a / 255)),
+            )
+            return color_code, display_char
+
+        # Fully opaque
+        return self.color_mapper.get_color_code(r, g, b), self._get_pixel_char(char)
 
     def _colorize_non_mapped_char(
         self,
@@ -186,16 +196,33 @@ class ASCIIRenderer:
         Returns:
             str: Colorized character string or raw character
 
+        """
+        style = self._unmapped_cell_style(char, colors)
+        if style is None:
+            return char
+        return f'{style[0]}{style[1]}{self.color_mapper.get_reset_code()}'
+
+    def _unmapped_cell_style(
+        self,
+        char: str,
+        colors: dict[str, tuple[int, int, int, int]],
+    ) -> tuple[str, str] | None:
+        """Get the style of a glyph that is not in the color map.
+
+        Args:
+            char: The glyph from the sprite pixels
+            colors: Color mapping dictionary with RGBA tuples
+
+        Returns:
+            tuple[str, str] | None: The color code and display character for
+                '.' transparency, or None if the glyph is shown as it is.
+
         """
         # Handle transparency (magenta) or unknown characters
         if char == '.' and any(rgb[:3] == (255, 0, 255) for rgb in colors.values()):
             # This is transparency - draw as light grey for contrast
-            display_char = self._get_transparency_char()
-            # Use light grey background (192, 192, 192) for better contrast
-            color_code = self.color_mapper.get_color_code(192, 192, 192)
-            reset_code = self.color_mapper.get_reset_code()
-            return f'{color_code}{display_char}{reset_code}'
-        return char
+            return self.color_mapper.get_color_code(192, 192, 192), self._get_transparency_char()
+        return None
 
     def _colorize_colors_section(self, colors: dict[str, tuple[int, int, int]]) -> str:
         """Colorize the colors section output using proper Bitmappy format.
@@ -0,0 +1,232 @@
+"""In-place terminal playback of sprite animations.
+
+The preview draws the first frame once and then moves the cursor with ANSI
+escape sequences to rewrite only the character cells that differ from the
+frame on screen, so a looping animation costs a few bytes per frame instead
+of a full colorized redraw.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING, TextIO
+
+from .ascii_renderer import ASCIIRenderer
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# A character cell: (color code, display character)
+type Cell = tuple[str, str]
+
+CSI = '\033['
+CLEAR_TO_END_OF_SCREEN = f'{CSI}J'
+
+
+class TerminalAnimationPreview:
+    """Play animation frames in place, redrawing only the cells that changed.
+
+    The preview is anchored at the cursor position when the first frame is
+    drawn, so nothing else may write to the stream until close() is called.
+    """
+
+    def __init__(self, renderer: ASCIIRenderer | None = None, stream: TextIO | None = None) -> None:
+        """Initialize the preview.
+
+        Args:
+            renderer: Styles pixel glyphs; a new ASCIIRenderer if not given
+            stream: Where the preview is written; stdout if not given
+
+        """
+        self.renderer = renderer or ASCIIRenderer()
+        self.stream = stream or sys.stdout
+        self.bytes_written = 0
+        self._screen: list[list[Cell]] | None = None
+        # Cursor position relative to the preview's top-left cell
+        self._row = 0
+        self._col = 0
+        self._styles: dict[str, Cell] = {}
+        self._styled_colors: dict[str, tuple[int, int, int, int]] | None = None
+
+    def frame_cells(
+        self,
+        pixels: str,
+        colors: dict[str, tuple[int, int, int, int]],
+    ) -> list[list[Cell]]:
+        """Style a frame's glyphs into character cells.
+
+        Args:
+            pixels: The frame's pixel glyphs, one line per row
+            colors: Color mapping dictionary with RGBA tuples
+
+        Returns:
+            list[list[Cell]]: One list of cells per row.
+
+        """
+        if colors is not self._styled_colors:
+            self._styles.clear()
+            self._styled_colors = colors
+        styles = self._styles
+        color_support = self.renderer.detector.has_color_support()
+
+        rows: list[list[Cell]] = []
+        for line in pixels.strip().split('\n'):
+            row: list[Cell] = []
+            for char in line:
+                cell = styles.get(char)
+                if cell is None:
+                    style = self.renderer.cell_style(char, colors) if color_support else None
+                    cell = styles[char] = style or ('', char)
+                row.append(cell)
+            rows.append(row)
+        return rows
+
+    def draw(self, pixels: str, colors: dict[str, tuple[int, int, int, int]]) -> str:
+        """Show a frame, rewriting only the cells that differ from the screen.
+
+        Args:
+            pixels: The frame's pixel glyphs, one line per row
+            colors: Color mapping dictionary with RGBA tuples
+
+        Returns:
+            str: The output written to the stream.
+
+        """
+        cells = self.frame_cells(pixels, colors)
+        screen = self._screen
+        if screen is None or [len(row) for row in screen] != [len(row) for row in cells]:
+            output = self._full_redraw(cells)
+        else:
+            output = self._diff_redraw(screen, cells)
+
+        self._screen = cells
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+            self.bytes_written += len(output.encode('utf-8'))
+        return output
+
+    def play(
+        self,
+        frames: Sequence[tuple[str, float]],
+        colors: dict[str, tuple[int, int, int, int]],
+        loops: int = 1,
+    ) -> None:
+        """Play frames in place, holding each for its duration.
+
+        Args:
+            frames: (pixels, duration in seconds) for each frame
+            colors: Color mapping dictionary with RGBA tuples
+            loops: How many times to play the frames
+
+        """
+        for _ in range(loops):
+            for pixels, duration in frames:
+                started = time.monotonic()
+                self.draw(pixels, colors)
+                remaining = duration - (time.monotonic() - started)
+                if remaining > 0:
+                    time.sleep(remaining)
+
+    def close(self) -> None:
+        """Leave the cursor on the line below the preview."""
+        if self._screen is None:
+            return
+        output = self._move_to(len(self._screen), 0)
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+            self.bytes_written += len(output.encode('utf-8'))
+        self._screen = None
+        self._row = self._col = 0
+
+    def _full_redraw(self, cells: list[list[Cell]]) -> str:
+        """Build output that draws every cell from the preview's top-left.
+
+        Returns:
+            str: The escape sequences and characters to write.
+
+        """
+        parts: list[str] = []
+        if self._screen is not None:
+            # The frame changed shape; wipe the old one first
+            parts.extend((self._move_to(0, 0), CLEAR_TO_END_OF_SCREEN))
+
+        current_color = ''
+        for row in cells:
+            for color_code, char in row:
+                if color_code != current_color:
+                    parts.append(color_code or self._reset_code())
+                    current_color = color_code
+                parts.append(char)
+            if current_color:
+                parts.append(self._reset_code())
+                current_color = ''
+            parts.append('\n')
+
+        self._row, self._col = len(cells), 0
+        return ''.join(parts)
+
+    def _diff_redraw(self, screen: list[list[Cell]], cells: list[list[Cell]]) -> str:
+        """Build output that rewrites the runs of cells that changed.
+
+        Returns:
+            str: The escape sequences and characters to write.
+
+        """
+        parts: list[str] = []
+        current_color = ''
+        for row_index, (old_row, new_row) in enumerate(zip(screen, cells, strict=True)):
+            if old_row == new_row:
+                continue
+            col = 0
+            width = len(new_row)
+            while col < width:
+                if old_row[col] == new_row[col]:
+                    col += 1
+                    continue
+                parts.append(self._move_to(row_index, col))
+                while col < width and old_row[col] != new_row[col]:
+                    color_code, char = new_row[col]
+                    if color_code != current_color:
+                        parts.append(color_code or self._reset_code())
+                        current_color = color_code
+                    parts.append(char)
+                    col += 1
+                self._col = col
+
+        if current_color:
+            parts.append(self._reset_code())
+        return ''.join(parts)
+
+    def _move_to(self, row: int, col: int) -> str:
+        """Build the cursor movement from the tracked position to a cell.
+
+        Returns:
+            str: The escape sequence, empty if the cursor is already there.
+
+        """
+        parts: list[str] = []
+        if row > self._row:
+            parts.append(f'{CSI}{row - self._row}B')
+        elif row < self._row:
+            parts.append(f'{CSI}{self._row - row}A')
+        if col != self._col:
+            if col == 0:
+                parts.append('\r')
+            elif col > self._col:
+                parts.append(f'{CSI}{col - self._col}C')
+            else:
+                parts.append(f'{CSI}{self._col - col}D')
+        self._row, self._col = row, col
+        return ''.join(parts)
+
+    def _reset_code(self) -> str:
+        """Get the code that returns to the terminal's default colors.
+
+        Returns:
+            str: The reset escape sequence, or '' without color support.
+
+        """
+        return self.renderer.color_mapper.get_reset_code()
@@ -56,6 +56,10 @@ class SliderSprite(BitmappySprite):
 
     log = logging.getLogger('game')
 
+    # Rendered gradient and the (name, width, height) it was rendered for
+    _gradient: pygame.Surface | None = None
+    _gradient_key: tuple[str | None, int, int] | None = None
+
     class SliderKnobSprite(BitmappySprite):
         """A slider knob sprite class."""
 
@@ -367,7 +371,28 @@ class SliderSprite(BitmappySprite):
         self.text_sprite.dirty = 2
 
     def update_slider_appearance(self) -> None:
-        """Update the slider's gradient appearance based on its color."""
+        """Update the slider's gradient appearance based on its color.
+
+        The gradient only depends on the slider's name and size, so it is
+        rendered once and blitted back under the indicator overlay.
+        """
+        gradient_key = (self.name, int(self.width), int(self.height))
+        if self._gradient is None or self._gradient_key != gradient_key:
+            self._gradient = self._render_gradient()
+            self._gradient_key = gradient_key
+        self.image.blit(self._gradient, (0, 0))
+
+        # Draw visual indicators for multi-controller system
+        self._draw_slider_visual_indicators()
+
+    def _render_gradient(self) -> pygame.Surface:
+        """Render the slider's color gradient.
+
+        Returns:
+            pygame.Surface: The gradient, one color per pixel column.
+
+        """
+        gradient = pygame.Surface((int(self.width), int(self.height)))
         for x in range(int(self.width)):
             intensity = int((x / self.width) * 255)
             if self.name == 'R':
@@ -378,10 +403,8 @@ class SliderSprite(BitmappySprite):
                 color = (0, 0, intensity)
             else:
                 color = (intensity, intensity, intensity)
-            pygame.draw.line(self.image, color, (x, 0), (x, self.height))
-
-        # Draw visual indicators for multi-controller system
-        self._draw_slider_visual_indicators()
+            pygame.draw.line(gradient, color, (x, 0), (x, self.height))
+        return gradient
 
     def _draw_slider_visual_indicators(self) -> None:
         """Draw visual indicators for multi-controller system on sliders."""
@@ -595,6 +618,9 @@ class ColorWellSprite(BitmappySprite):
         # Override the surface to support alpha
         self.image = pygame.Surface((width, height), pygame.SRCALPHA)
 
+        # The frame never changes, so draw it once; update() only refills the inside
+        pygame.draw.rect(self.image, (128, 128, 255), Rect(0, 0, width, height), 1)
+
         self.red = 0
         self.green = 0
         self.blue = 0
@@ -676,9 +702,7 @@ class ColorWellSprite(BitmappySprite):
             None
 
         """
-        pygame.draw.rect(self.image, (128, 128, 255), Rect(0, 0, self.width, self.height), 1)
-
-        # Draw the color directly on the alpha-compatible surface
+        # Draw the color directly on the alpha-compatible surface, inside the frame
         pygame.draw.rect(self.image, self.active_color, Rect(1, 1, self.width - 2, self.height - 2))
 
 
@@ -732,6 +756,10 @@ class TabControlSprite(BitmappySprite):
         self.inactive_color = (100, 100, 100)
         self.text_color = (0, 0, 0)
 
+        # Rendered tab strips keyed by everything that affects their artwork
+        self._tab_images: dict[tuple[Any, ...], pygame.Surface] = {}
+        self._label_font: pygame.font.Font | None = None
+
     @override
     def on_left_mouse_button_down_event(self: Self, event: HashableEvent) -> None:
         """Handle left mouse button down event.
@@ -763,27 +791,57 @@ class TabControlSprite(BitmappySprite):
 
         """
         if self.dirty:
+            tab_key = (
+                tuple(self.tabs),
+                self.active_tab,
+                self.width,
+                self.height,
+                self.border_color,
+                self.active_color,
+                self.inactive_color,
+                self.text_color,
+            )
+            tab_image = self._tab_images.get(tab_key)
+            if tab_image is None:
+                tab_image = self._render_tabs()
+                # Keep rendering until the labels could be drawn
+                if self._label_font is not None:
+                    self._tab_images[tab_key] = tab_image
+
             # Clear the surface
             self.image.fill((0, 0, 0, 0))  # Transparent background
+            self.image.blit(tab_image, (0, 0))
+
+    def _render_tabs(self: Self) -> pygame.Surface:
+        """Render the tab backgrounds and labels for the current state.
 
-            # Draw tabs
-            for i, tab_text in enumerate(self.tabs):
-                tab_x = i * self.tab_width
-                tab_rect = pygame.Rect(tab_x, 0, self.tab_width, self.tab_height)
-
-                # Choose colors based on active state
-                bg_color = self.active_color if i == self.active_tab else self.inactive_color
-
-                # Draw tab background
-                pygame.draw.rect(self.image, bg_color, tab_rect)
-                pygame.draw.rect(self.image, self.border_color, tab_rect, 1)
-
-                # Draw tab text
-                try:
-                    font = pygame.font.Font(None, 16)
-                    text_surface = font.render(tab_text, True, self.text_color)  # noqa: FBT003
-                    text_rect = text_surface.get_rect(center=tab_rect.center)
-                    self.image.blit(text_surface, text_rect)
-                except pygame.error, AttributeError:
-                    # Handle font loading errors gracefully
-                    pass
+        Returns:
+            pygame.Surface: The tab strip artwork.
+
+        """
+        tab_image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+
+        # Draw tabs
+        for i, tab_text in enumerate(self.tabs):
+            tab_x = i * self.tab_width
+            tab_rect = pygame.Rect(tab_x, 0, self.tab_width, self.tab_height)
+
+            # Choose colors based on active state
+            bg_color = self.active_color if i == self.active_tab else self.inactive_color
+
+            # Draw tab background
+            pygame.draw.rect(tab_image, bg_color, tab_rect)
+            pygame.draw.rect(tab_image, self.border_color, tab_rect, 1)
+
+            # Draw tab text
+            try:
+                if self._label_font is None:
+                    self._label_font = pygame.font.Font(None, 16)
+                text_surface = self._label_font.render(tab_text, True, self.text_color)  # noqa: FBT003
+                text_rect = text_surface.get_rect(center=tab_rect.center)
+                tab_image.blit(text_surface, text_rect)
+            except pygame.error, AttributeError:
+                # Handle font loading errors gracefully
+                pass
+
+        return tab_image
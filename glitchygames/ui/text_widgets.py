@@ -118,6 +118,9 @@ class TextSprite(BitmappySprite):
         self._cursor_timer = 0
         self._cursor_visible = True
 
+        # Inputs of the last update_text() call, used to skip redundant redraws
+        self._rendered_state: tuple[Any, ...] | None = None
+
         self.update_text(text)
 
     @property
@@ -177,11 +180,31 @@ class TextSprite(BitmappySprite):
             # Reset dirty flag when not active
             self.dirty = 1
 
-        if self.dirty:
+        if self.dirty and self._render_state(self._text) != self._rendered_state:
             self.update_text(self._text)
 
+    def _render_state(self, text: str) -> tuple[Any, ...]:
+        """Collect everything that affects the rendered image.
+
+        Returns:
+            tuple: The text, font, colors, size and cursor state.
+
+        """
+        return (
+            text,
+            FontManager.get_font(),
+            self.text_color,
+            self.background_color,
+            self.width,
+            self.height,
+            self.is_active,
+            self._cursor_visible,
+        )
+
     def update_text(self, text: str) -> None:
         """Update the text surface."""
+        self._rendered_state = self._render_state(text)
+
         # Check if background is transparent (alpha = 0)
         rgba_length = 4
         is_transparent = len(self.background_color) == rgba_length and self.background_color[3] == 0
@@ -243,31 +266,17 @@ class TextSprite(BitmappySprite):
         if hasattr(font, 'render_to'):
             # This is a pygame.freetype.Font
             try:
-                if is_transparent:
-                    text_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                    text_surface.fill((0, 0, 0, 0))
-                    text_rect = font.render_to(text_surface, (0, 0), str(text), text_color)
-                else:
-                    render_result = font.render(str(text), text_color, self.background_color)
-                    if isinstance(render_result, tuple):
-                        text_surface, text_rect = render_result
-                    else:
-                        text_surface = render_result
-            except TypeError, ValueError:
-                # Fall back to pygame.font style (returns surface)
-                text_surface = self._render_with_pygame_font(
+                text_surface = FontManager.render_text(
                     font,
-                    text,
+                    str(text),
                     text_color,
-                    is_transparent=is_transparent,
+                    background=None if is_transparent else self.background_color,
                 )
+            except TypeError, ValueError:
+                # Fall back to pygame.font style (returns surface)
+                text_surface = self._render_with_pygame_font(font, text, text_color)
         else:
-            text_surface = self._render_with_pygame_font(
-                font,
-                text,
-                text_color,
-                is_transparent=is_transparent,
-            )
+            text_surface = self._render_with_pygame_font(font, text, text_color)
 
         return text_surface, text_rect  # ty: ignore[invalid-return-type]
 
@@ -276,8 +285,6 @@ class TextSprite(BitmappySprite):
         font: GameFont,
         text: str,
         text_color: tuple[int, ...],
-        *,
-        is_transparent: bool,
     ) -> pygame.Surface:
         """Render text using pygame.font.Font.
 
@@ -285,17 +292,9 @@ class TextSprite(BitmappySprite):
             The rendered text surface.
 
         """
-        if is_transparent:
-            return (  # pyright: ignore[reportReturnType, reportUnknownVariableType]
-                font.render(str(text), True, text_color)[0]  # noqa: FBT003  # pyright: ignore[reportIndexIssue, reportArgumentType]  # ty: ignore[invalid-return-type, not-subscriptable, invalid-argument-type]
-                if isinstance(font.render(str(text), True, text_color), tuple)  # noqa: FBT003  # pyright: ignore[reportArgumentType]  # ty: ignore[invalid-argument-type]
-                else font.render(str(text), True, text_color)  # noqa: FBT003  # pyright: ignore[reportArgumentType]  # ty: ignore[invalid-argument-type]
-            )
-        return (  # pyright: ignore[reportReturnType, reportUnknownVariableType]
-            font.render(str(text), True, text_color)[0]  # noqa: FBT003  # pyright: ignore[reportIndexIssue, reportArgumentType]  # ty: ignore[invalid-return-type, not-subscriptable, invalid-argument-type]
-            if isinstance(font.render(str(text), True, text_color), tuple)  # noqa: FBT003  # pyright: ignore[reportArgumentType]  # ty: ignore[invalid-argument-type]
-            else font.render(str(text), True, text_color)  # noqa: FBT003  # pyright: ignore[reportArgumentType]  # ty: ignore[invalid-argument-type]
-        )
+        # pygame.font text is rendered without a background whether or not the
+        # sprite is transparent; the sprite's own fill shows through
+        return FontManager.render_text(font, str(text), text_color)
 
     def _draw_cursor(self, text_rect: pygame.Rect, _font: GameFont) -> None:
         """Draw a blinking cursor at the end of the text."""
@@ -763,11 +762,7 @@ class MultiLineTextBox(BitmappySprite):
             int: The text width.
 
         """
-        if hasattr(self.font, 'get_rect'):
-            # pygame.freetype.Font - use get_rect() method
-            return self.font.get_rect(text).width
-        # pygame.font.Font - size() is a method
-        return self.font.size(text)[0]
+        return FontManager.text_width(self.font, text)
 
     def _wrap_text(self, text: str, max_width: float) -> str:
         """Wrap text to fit within the specified width.
@@ -792,22 +787,36 @@ class MultiLineTextBox(BitmappySprite):
                 wrapped_lines.append(line)
                 continue
 
-            # Split line into words and wrap
+            # Split line into words and wrap, estimating the growing line's
+            # width from per-word widths. Kerning makes the estimate differ
+            # from the joined line's real width, so near the limit the
+            # candidate line is measured instead.
             words = line.split(' ')
+            space_width = self._get_text_width(' ')
             current_line = ''
+            current_width = 0
 
             for word in words:
-                test_line = current_line + (' ' if current_line else '') + word
-                if self._get_text_width(test_line) <= max_width:
-                    current_line = test_line
+                word_width = self._get_text_width(word)
+                candidate = current_line + (' ' if current_line else '') + word
+                test_width = (
+                    current_width + space_width + word_width if current_line else word_width
+                )
+                if current_line and test_width > max_width - space_width:
+                    test_width = self._get_text_width(candidate)
+                if test_width <= max_width:
+                    current_line = candidate
+                    current_width = test_width
                 elif current_line:
                     # Current line is full, start a new one
                     wrapped_lines.append(current_line)
                     current_line = word
+                    current_width = word_width
                 else:
                     # Single word is too long, force it on its own line
                     wrapped_lines.append(word)
                     current_line = ''
+                    current_width = 0
 
             # Add the last line if there's content
             if current_line:
@@ -1020,15 +1029,7 @@ class MultiLineTextBox(BitmappySprite):
         y_offset = 5
         for line in visible_lines:
             if line:  # Only render non-empty lines
-                if hasattr(self.font, 'get_rect'):
-                    render_result = self.font.render(line, text_color)
-                    if isinstance(render_result, tuple):
-                        text_surface = render_result[0]
-                    else:
-                        text_surface = render_result
-                else:
-                    font_result = self.font.render(line, True, text_color)  # type: ignore[arg-type]  # noqa: FBT003
-                    text_surface = font_result[0] if isinstance(font_result, tuple) else font_result
+                text_surface = FontManager.render_text(self.font, line, text_color)
                 self.image.blit(text_surface, (5, y_offset))  # ty: ignore[invalid-argument-type]
             y_offset += line_height
 
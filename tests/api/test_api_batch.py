@@ -0,0 +1,262 @@
+"""Tests for concurrent batch submission against an in-process ASGI app."""
+
+import asyncio
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+pytest.importorskip('fastapi')
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from glitchygames.api.batch import BatchJob, RetryPolicy, submit_batch
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, encode_frame_bundle
+
+SERVER_URL = 'http://testserver'
+NO_BACKOFF = RetryPolicy(attempts=3, backoff=0.0)
+
+
+def _make_app(*, failures=0, failure_status=503, delay=0.01):
+    """Build an app whose generate endpoint fails each prompt's first requests.
+
+    Returns:
+        tuple: The app and a dict tracking calls per prompt and peak concurrency.
+
+    """
+    app = FastAPI()
+    stats = {'calls': Counter(), 'in_flight': 0, 'peak': 0}
+
+    @app.post('/sprites/generate')
+    async def generate(payload: dict):
+        prompt = payload['prompt']
+        stats['calls'][prompt] += 1
+        if stats['calls'][prompt] <= failures:
+            return JSONResponse({'detail': 'busy'}, status_code=failure_status)
+
+        stats['in_flight'] += 1
+        stats['peak'] = max(stats['peak'], stats['in_flight'])
+        await asyncio.sleep(delay)
+        stats['in_flight'] -= 1
+        return {'success': True, 'sprite_name': prompt}
+
+    return app, stats
+
+
+def _jobs(count):
+    return [
+        BatchJob(f'sprite {index}', '/sprites/generate', {'prompt': f'sprite {index}'}, 5.0)
+        for index in range(count)
+    ]
+
+
+def _run(app, jobs, **kwargs):
+    kwargs.setdefault('retry', NO_BACKOFF)
+    transport = httpx.ASGITransport(app=app)
+    return asyncio.run(submit_batch(jobs, SERVER_URL, transport=transport, **kwargs))
+
+
+class TestSubmitBatch:
+    """Test pooled, bounded, retried batch submission."""
+
+    def test_results_follow_job_order(self):
+        app, _ = _make_app()
+        jobs = _jobs(5)
+
+        results = _run(app, jobs)
+
+        assert [result.job for result in results] == jobs
+        assert [result.response['sprite_name'] for result in results] == [job.label for job in jobs]
+        assert all(result.ok and result.attempts == 1 for result in results)
+
+    def test_concurrency_is_bounded(self):
+        app, stats = _make_app()
+
+        _run(app, _jobs(8), concurrency=3)
+
+        assert stats['peak'] == 3
+
+    def test_transient_failures_are_retried(self):
+        app, stats = _make_app(failures=1)
+
+        results = _run(app, _jobs(3))
+
+        assert all(result.ok and result.attempts == 2 for result in results)
+        assert set(stats['calls'].values()) == {2}
+
+    def test_exhausted_retries_are_reported(self):
+        app, _ = _make_app(failures=5)
+
+        (result,) = _run(app, _jobs(1))
+
+        assert not result.ok
+        assert result.response is None
+        assert result.error == 'HTTP 503'
+        assert result.attempts == NO_BACKOFF.attempts
+
+    def test_client_errors_are_not_retried(self):
+        app, stats = _make_app(failures=1, failure_status=400)
+
+        (result,) = _run(app, _jobs(1))
+
+        assert result.error.startswith('HTTP 400')
+        assert result.attempts == 1
+        assert stats['calls']['sprite 0'] == 1
+
+    def test_connection_errors_are_retried(self):
+        attempts = Counter()
+
+        def refuse_first(request):
+            attempts[request.url.path] += 1
+            if attempts[request.url.path] == 1:
+                message = 'connection refused'
+                raise httpx.ConnectError(message, request=request)
+            return httpx.Response(200, json={'success': True})
+
+        jobs = _jobs(1)
+        results = asyncio.run(
+            submit_batch(
+                jobs, SERVER_URL, retry=NO_BACKOFF, transport=httpx.MockTransport(refuse_first)
+            ),
+        )
+
+        assert results[0].ok
+        assert results[0].attempts == 2
+
+    def test_one_failing_job_does_not_abort_the_batch(self):
+        def reject_second(request):
+            if b'sprite 1' in request.content:
+                return httpx.Response(200, content=b'not json')
+            return httpx.Response(200, json={'success': True})
+
+        results = asyncio.run(
+            submit_batch(
+                _jobs(3), SERVER_URL, retry=NO_BACKOFF, transport=httpx.MockTransport(reject_second)
+            ),
+        )
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].error.startswith('Invalid JSON response')
+
+    def test_non_idempotent_jobs_are_not_retried_after_a_server_error(self):
+        app, stats = _make_app(failures=1, failure_status=500)
+        jobs = [
+            BatchJob('sprite 0', '/sprites/generate', {'prompt': 'sprite 0'}, 5.0, idempotent=False)
+        ]
+
+        (result,) = _run(app, jobs)
+
+        assert result.error.startswith('HTTP 500')
+        assert stats['calls']['sprite 0'] == 1
+
+    def test_non_idempotent_jobs_are_retried_when_turned_away(self):
+        app, stats = _make_app(failures=1, failure_status=429)
+        jobs = [
+            BatchJob('sprite 0', '/sprites/generate', {'prompt': 'sprite 0'}, 5.0, idempotent=False)
+        ]
+
+        (result,) = _run(app, jobs)
+
+        assert result.ok
+        assert stats['calls']['sprite 0'] == 2
+
+    @pytest.mark.parametrize(
+        ('error', 'attempts'), [(httpx.ConnectError, 2), (httpx.ReadTimeout, 1)]
+    )
+    def test_non_idempotent_jobs_retry_only_unsent_requests(self, error, attempts):
+        calls = Counter()
+
+        def fail_first(request):
+            calls[request.url.path] += 1
+            if calls[request.url.path] == 1:
+                message = 'no response'
+                raise error(message, request=request)
+            return httpx.Response(200, json={'success': True})
+
+        jobs = [BatchJob('sprite 0', '/sprites/generate', {}, 5.0, idempotent=False)]
+        (result,) = asyncio.run(
+            submit_batch(
+                jobs, SERVER_URL, retry=NO_BACKOFF, transport=httpx.MockTransport(fail_first)
+            ),
+        )
+
+        assert result.ok is (attempts == 2)
+        assert result.attempts == attempts
+
+    def test_unreadable_payload_fails_only_its_job(self):
+        def unreadable():
+            message = 'No such file'
+            raise FileNotFoundError(message)
+
+        app, _ = _make_app()
+        jobs = [BatchJob('missing.apng', '/sprites/generate', unreadable, 5.0), *_jobs(1)]
+
+        results = _run(app, jobs)
+
+        assert results[0].error == 'FileNotFoundError: No such file'
+        assert results[0].attempts == 0
+        assert results[1].ok
+
+    def test_frame_bundle_responses_keep_raw_pngs(self):
+        def bundle(request):
+            content = encode_frame_bundle(
+                {'success': True, 'rendered_frames': [{'frame_index': 0}]}, b'png', [b'frame']
+            )
+            return httpx.Response(
+                200, content=content, headers={'content-type': FRAME_BUNDLE_MEDIA_TYPE}
+            )
+
+        results = asyncio.run(
+            submit_batch(
+                _jobs(1), SERVER_URL, retry=NO_BACKOFF, transport=httpx.MockTransport(bundle)
+            ),
+        )
+
+        assert results[0].response['success'] is True
+        assert results[0].response['png_bytes'] == b'png'
+        assert results[0].response['all_frames_png'] == [b'frame']
+
+    def test_results_are_reported_as_jobs_finish(self):
+        async def respond(request):
+            prompt = json.loads(request.content)['prompt']
+            # The first job finishes last
+            await asyncio.sleep(0.05 if prompt == 'sprite 0' else 0.0)
+            return httpx.Response(200, json={'success': True, 'sprite_name': prompt})
+
+        finished = []
+
+        results = asyncio.run(
+            submit_batch(
+                _jobs(3),
+                SERVER_URL,
+                retry=NO_BACKOFF,
+                transport=httpx.MockTransport(respond),
+                on_result=lambda result: finished.append(result.job.label),
+            ),
+        )
+
+        assert finished[-1] == 'sprite 0'
+        assert sorted(finished) == [result.job.label for result in results]
+
+    def test_invalid_concurrency_raises(self):
+        app, _ = _make_app()
+
+        with pytest.raises(ValueError, match='concurrency'):
+            _run(app, _jobs(1), concurrency=0)
+
+
+class TestRetryPolicy:
+    """Test backoff delays."""
+
+    def test_delay_doubles_up_to_the_cap(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=5.0)
+
+        assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_after_lengthens_the_delay(self):
+        policy = RetryPolicy(backoff=1.0)
+
+        assert policy.delay(1, '3') == 3.0
+        assert policy.delay(1, 'Wed, 21 Oct 2026 07:28:00 GMT') == 1.0
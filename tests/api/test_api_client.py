@@ -2,8 +2,10 @@
 
 import argparse
 import base64
+import json
 from pathlib import Path
 
+import httpx
 import pytest
 
 from glitchygames.api.client import (
@@ -22,6 +24,7 @@ from glitchygames.api.client import (
     main,
     save_files_locally,
 )
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, encode_frame_bundle
 
 
 class TestCreateParser:
@@ -52,6 +55,10 @@ class TestCreateParser:
         assert parsed_args.animation_duration is None
         assert parsed_args.png_scale == 1
         assert parsed_args.extract_scale == 8
+        assert parsed_args.batch is None
+        assert parsed_args.batch_extract is None
+        assert parsed_args.concurrency == 4
+        assert parsed_args.retries == 2
         assert parsed_args.verbose is False
         assert parsed_args.quiet is False
 
@@ -190,6 +197,7 @@ class TestGenerateSprite:
         assert payload['animation_duration'] == pytest.approx(2.0)
         assert payload['model'] == 'anthropic:claude-sonnet-4-5'
         assert payload['output_path'] == output_path
+        assert payload['frame_encoding'] == 'bundle'
 
     def test_generate_sprite_url_trailing_slash(self, mocker):
         """Test that trailing slashes in server URL are handled."""
@@ -214,6 +222,30 @@ class TestGenerateSprite:
         url = call_args.args[0] if call_args.args else call_args[0][0]
         assert url == 'http://localhost:8000/sprites/generate'
 
+    def test_generate_sprite_decodes_frame_bundle(self, mocker):
+        """Test that a frame bundle response keeps its PNGs as raw bytes."""
+        mock_response = mocker.Mock()
+        mock_response.headers = {'content-type': FRAME_BUNDLE_MEDIA_TYPE}
+        mock_response.content = encode_frame_bundle(
+            {'success': True, 'toml_content': 'x = 1', 'rendered_frames': [{'frame_index': 0}]},
+            b'sprite png',
+            [b'frame png'],
+        )
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+
+        response = generate_sprite(
+            server_url='http://localhost:8000',
+            prompt='test',
+            output_formats=['png'],
+            client=mock_client,
+        )
+
+        assert response['toml_content'] == 'x = 1'
+        assert response['png_bytes'] == b'sprite png'
+        assert response['all_frames_png'] == [b'frame png']
+        mock_response.json.assert_not_called()
+
 
 class TestExtractApngFrames:
     """Tests for the extract_apng_frames function."""
@@ -252,6 +284,30 @@ class TestExtractApngFrames:
         assert 'apng_base64' in payload
 
 
+class TestSharedClient:
+    """Tests for reusing one keep-alive client across API calls."""
+
+    def test_calls_reuse_the_given_client(self, tmp_path):
+        """Test that generate and extract calls are sent on the caller's client."""
+        apng_file = tmp_path / 'test.apng'
+        apng_file.write_bytes(b'\x89PNG\r\n\x1a\n')
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'success': True})
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            generate_sprite('http://localhost:8000', 'a red heart', ['toml'], client=client)
+            extract_apng_frames('http://localhost:8000', str(apng_file), client=client)
+            assert not client.is_closed
+
+        assert [request.url.path for request in requests] == [
+            '/sprites/generate',
+            '/sprites/extract-frames',
+        ]
+
+
 class TestFindAvailablePath:
     """Tests for the find_available_path function."""
 
@@ -359,6 +415,30 @@ pixels = "##"
         captured = capsys.readouterr()
         assert 'Animation: walk' in captured.out
 
+    def test_display_animated_sprite_in_place(self, mocker, capsys):
+        """Test that animate plays each animation through the in-place preview."""
+        mock_preview = mocker.patch('glitchygames.api.client.TerminalAnimationPreview')
+
+        toml_content = """
+[[animation]]
+namespace = "walk"
+frame_interval = 0.25
+
+[[animation.frame]]
+pixels = "#."
+
+[[animation.frame]]
+pixels = ".#"
+frame_interval = 0.1
+"""
+        display_sprite_ascii(toml_content, animate=True)
+
+        preview = mock_preview.return_value
+        frames = preview.play.call_args.args[0]
+        assert frames == [('#.', 0.25), ('.#', 0.1)]
+        preview.close.assert_called_once()
+        assert 'Frame 0' not in capsys.readouterr().out
+
 
 class TestCreateApngFromFrames:
     """Tests for the create_apng_from_frames function."""
@@ -457,6 +537,26 @@ class TestSaveFilesLocally:
         # Should use 'sprite' as fallback
         assert 'sprite' in saved[0]
 
+    def test_save_atlas_and_manifest(self, tmp_path):
+        """Test saving the frame atlas PNG and its manifest."""
+        manifest = {'version': 1, 'width': 2, 'height': 1, 'scale': 1, 'frames': []}
+        response = {
+            'sprite_name': 'walker',
+            'atlas_png_base64': base64.b64encode(b'atlas png').decode('utf-8'),
+            'atlas_manifest': manifest,
+        }
+
+        saved = save_files_locally(
+            response=response,
+            output_path=str(tmp_path),
+            output_formats=['atlas'],
+        )
+
+        atlas_path, manifest_path = (Path(path) for path in saved)
+        assert atlas_path.name == 'walker.atlas.png'
+        assert atlas_path.read_bytes() == b'atlas png'
+        assert json.loads(manifest_path.read_text(encoding='utf-8')) == manifest
+
 
 class TestMainCli:
     """Tests for the main CLI entrypoint."""
@@ -788,6 +888,59 @@ class TestSaveFilesLocallyAnimatedFrames:
         call_kwargs = mock_save_extracted.call_args.kwargs
         assert call_kwargs['frame_delay_ms'] == 250  # 500ms / 2 frames
 
+    def test_save_animated_frames_with_index_only_rendered_frames(self, tmp_path, mocker):
+        """Test that frame data is taken from all_frames_png_base64 when not repeated."""
+        mocker.patch('glitchygames.api.client.create_apng_from_frames', return_value=b'apng')
+        mock_save_extracted = mocker.patch(
+            'glitchygames.api.client._save_extracted_frames',
+            return_value=[],
+        )
+
+        frame_data = [base64.b64encode(b'png %d' % index).decode('utf-8') for index in range(2)]
+        response = {
+            'sprite_name': 'animated_sprite',
+            'all_frames_png_base64': frame_data,
+            'rendered_frames': [
+                {'animation_index': 1, 'frame_index': 0, 'png_base64': None},
+                {'animation_index': 1, 'frame_index': 1, 'png_base64': None},
+            ],
+        }
+
+        save_files_locally(response=response, output_path=str(tmp_path), output_formats=['png'])
+
+        frame_entries = mock_save_extracted.call_args.kwargs['frame_entries']
+        assert frame_entries == [
+            ('animation-1-frame-0', '1', '0', frame_data[0]),
+            ('animation-1-frame-1', '1', '1', frame_data[1]),
+        ]
+
+    def test_save_animated_frames_from_frame_bundle(self, tmp_path, mocker):
+        """Test that raw PNG bytes from a frame bundle are saved without base64."""
+        mock_apng_creator = mocker.patch(
+            'glitchygames.api.client.create_apng_from_frames', return_value=b'apng'
+        )
+        mock_save_extracted = mocker.patch(
+            'glitchygames.api.client._save_extracted_frames',
+            return_value=[],
+        )
+        mock_b64decode = mocker.patch('glitchygames.api.client.base64.b64decode')
+        response = {
+            'sprite_name': 'animated_sprite',
+            'all_frames_png_base64': None,
+            'all_frames_png': [b'png 0', b'png 1'],
+            'rendered_frames': [
+                {'animation_index': 0, 'frame_index': 0, 'png_base64': None},
+                {'animation_index': 0, 'frame_index': 1, 'png_base64': None},
+            ],
+        }
+
+        save_files_locally(response=response, output_path=str(tmp_path), output_formats=['png'])
+
+        mock_apng_creator.assert_called_once_with([b'png 0', b'png 1'], frame_delay_ms=100)
+        frame_entries = mock_save_extracted.call_args.kwargs['frame_entries']
+        assert [entry[3] for entry in frame_entries] == [b'png 0', b'png 1']
+        mock_b64decode.assert_not_called()
+
     def test_save_animated_frames_without_rendered_frames_fallback(self, tmp_path, mocker):
         """Test saving animated sprite falls back to old naming without rendered_frames."""
         mock_apng_creator = mocker.patch('glitchygames.api.client.create_apng_from_frames')
@@ -1075,6 +1228,7 @@ class TestHandleGenerateSprite:
             'film_strip_count': None,
             'animation_duration': None,
             'png_scale': 1,
+            'animate_preview': False,
             'extract_scale': 8,
             'animation_language_model': None,
             'verbose': False,
@@ -1320,3 +1474,177 @@ class TestRunEntryPoint:
         run()
 
         mock_exit.assert_called_once_with(1)
+
+
+@pytest.fixture
+def asgi_server(mocker):
+    """Route batch requests to an in-process ASGI app.
+
+    Returns:
+        callable: Takes the app to serve.
+
+    """
+    real_async_client = httpx.AsyncClient
+
+    def serve(app):
+        transport = httpx.ASGITransport(app=app)
+        mocker.patch(
+            'glitchygames.api.batch.httpx.AsyncClient',
+            side_effect=lambda **kwargs: real_async_client(**{**kwargs, 'transport': transport}),
+        )
+
+    return serve
+
+
+class TestBatchCli:
+    """Tests for the --batch and --batch-extract commands."""
+
+    @pytest.fixture(autouse=True)
+    def require_fastapi(self):
+        """Skip when FastAPI is not installed."""
+        pytest.importorskip('fastapi')
+
+    def _generate_app(self):
+        from fastapi import FastAPI
+
+        app = FastAPI()
+
+        @app.post('/sprites/generate')
+        async def generate(payload: dict):
+            if payload['prompt'] == 'impossible':
+                return {'success': False, 'error': 'Could not draw that'}
+            return {'success': True, 'sprite_name': payload['prompt'].replace(' ', '_')}
+
+        return app
+
+    def test_batch_generates_each_prompt(self, mocker, tmp_path, asgi_server):
+        """Test that every prompt in the file is generated and saved."""
+        asgi_server(self._generate_app())
+        prompts_file = tmp_path / 'prompts.txt'
+        prompts_file.write_text('red heart\n\n# skipped\nblue gem\n')
+        mock_save = mocker.patch('glitchygames.api.client.save_files_locally', return_value=[])
+
+        result = main(['--batch', str(prompts_file), '-o', str(tmp_path / 'out'), '-q'])
+
+        assert result == 0
+        saved = [call.kwargs['response']['sprite_name'] for call in mock_save.call_args_list]
+        assert sorted(saved) == ['blue_gem', 'red_heart']
+
+    def test_batch_reports_failed_prompts(self, mocker, tmp_path, asgi_server):
+        """Test that a failed generation makes the batch exit with an error."""
+        asgi_server(self._generate_app())
+        prompts_file = tmp_path / 'prompts.txt'
+        prompts_file.write_text('red heart\nimpossible\n')
+        mock_save = mocker.patch('glitchygames.api.client.save_files_locally', return_value=[])
+
+        result = main(['--batch', str(prompts_file), '-o', str(tmp_path / 'out'), '-q'])
+
+        assert result == 1
+        mock_save.assert_called_once()
+
+    def test_batch_extract_saves_frames_per_file(self, tmp_path, asgi_server):
+        """Test that frames from every APNG are saved under the file's name."""
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        frame = base64.b64encode(b'frame').decode('utf-8')
+
+        @app.post('/sprites/extract-frames')
+        async def extract(payload: dict):
+            assert base64.b64decode(payload['apng_base64'])
+            return {'success': True, 'frames': [{'index': 0, 'png_base64': frame}]}
+
+        asgi_server(app)
+        apng_paths = []
+        for name in ('walk', 'jump'):
+            apng_file = tmp_path / f'{name}.apng'
+            apng_file.write_bytes(b'\x89PNG\r\n\x1a\n')
+            apng_paths.append(str(apng_file))
+        output_dir = tmp_path / 'frames'
+
+        result = main(['--batch-extract', *apng_paths, '-o', str(output_dir), '-q'])
+
+        assert result == 0
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            'jump_frame_000.png',
+            'walk_frame_000.png',
+        ]
+
+    def test_batch_extract_reports_unreadable_files(self, tmp_path, asgi_server):
+        """Test that a missing APNG fails its own job and the rest are still saved."""
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        frame = base64.b64encode(b'frame').decode('utf-8')
+
+        @app.post('/sprites/extract-frames')
+        async def extract(payload: dict):
+            return {'success': True, 'frames': [{'index': 0, 'png_base64': frame}]}
+
+        asgi_server(app)
+        apng_file = tmp_path / 'walk.apng'
+        apng_file.write_bytes(b'\x89PNG\r\n\x1a\n')
+        output_dir = tmp_path / 'frames'
+
+        result = main([
+            '--batch-extract',
+            str(tmp_path / 'missing.apng'),
+            str(apng_file),
+            '-o',
+            str(output_dir),
+            '-q',
+        ])
+
+        assert result == 1
+        assert [path.name for path in output_dir.iterdir()] == ['walk_frame_000.png']
+
+    def test_batch_saves_each_result_before_the_batch_ends(self, mocker, tmp_path, asgi_server):
+        """Test that a result is saved even if a later job interrupts the batch."""
+        import asyncio
+
+        from fastapi import FastAPI
+
+        app = FastAPI()
+
+        @app.post('/sprites/generate')
+        async def generate(payload: dict):
+            if payload['prompt'] == 'slow':
+                await asyncio.sleep(0.05)
+                raise KeyboardInterrupt
+            return {'success': True, 'sprite_name': payload['prompt']}
+
+        asgi_server(app)
+        prompts_file = tmp_path / 'prompts.txt'
+        prompts_file.write_text('slow\nfast\n')
+        mock_save = mocker.patch('glitchygames.api.client.save_files_locally', return_value=[])
+
+        with pytest.raises(KeyboardInterrupt):
+            main(['--batch', str(prompts_file), '-o', str(tmp_path / 'out'), '-q'])
+
+        mock_save.assert_called_once()
+        assert mock_save.call_args.kwargs['response']['sprite_name'] == 'fast'
+
+    def test_batch_modes_are_mutually_exclusive(self, tmp_path):
+        """Test that --batch and --batch-extract cannot be combined."""
+        prompts_file = tmp_path / 'prompts.txt'
+        prompts_file.write_text('red heart\n')
+
+        with pytest.raises(SystemExit) as exc_info:
+            main([
+                '--batch',
+                str(prompts_file),
+                '--batch-extract',
+                str(tmp_path / 'walk.apng'),
+                '-o',
+                str(tmp_path),
+            ])
+        assert exc_info.value.code != 0
+
+    def test_batch_requires_output_path(self, tmp_path):
+        """Test that batch mode refuses to run without an output directory."""
+        prompts_file = tmp_path / 'prompts.txt'
+        prompts_file.write_text('red heart\n')
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(['--batch', str(prompts_file)])
+        assert exc_info.value.code != 0
@@ -2,11 +2,12 @@
 
 Tests cover: _save_sprite_files edge cases, _extract_png_dimensions,
 _extract_single_frame, generate/refine with AI provider errors,
-PNG render failure paths, and path traversal protection.
+PNG render failure paths, atlas output, and path traversal protection.
 """
 # pyright: reportMissingImports=false
 
 import base64
+import json
 import struct
 import tempfile
 from pathlib import Path
@@ -18,6 +19,7 @@ pytest.importorskip('fastapi')
 
 from fastapi.testclient import TestClient
 
+from glitchygames.api.frame_bundle import FRAME_BUNDLE_MEDIA_TYPE, decode_frame_bundle
 from glitchygames.api.main import app
 from glitchygames.api.routes.sprites import (
     _extract_png_dimensions,
@@ -25,7 +27,12 @@ from glitchygames.api.routes.sprites import (
     _save_sprite_files,
 )
 from glitchygames.services.exceptions import AIProviderError
-from glitchygames.services.renderer_service import RenderResult
+from glitchygames.services.renderer_service import (
+    AtlasFrame,
+    AtlasResult,
+    RenderedFrame,
+    RenderResult,
+)
 from glitchygames.services.sprite_generation_service import GenerationResult
 
 MOCK_TOML = (
@@ -67,6 +74,51 @@ def successful_generation_result():
     )
 
 
+@pytest.fixture
+def animated_generation_result():
+    """Provide a successful animated generation result fixture.
+
+    Returns:
+        object: GenerationResult instance.
+
+    """
+    return GenerationResult(
+        success=True,
+        toml_content=MOCK_TOML,
+        sprite_name='walker',
+        is_animated=True,
+        frame_count=2,
+    )
+
+
+@pytest.fixture
+def animated_render_result():
+    """Provide a render result with two animation frames.
+
+    Returns:
+        object: RenderResult instance.
+
+    """
+    frames = [b'frame zero png', b'frame one png']
+    return RenderResult(
+        success=True,
+        png_bytes=frames[0],
+        png_base64=base64.b64encode(frames[0]).decode('utf-8'),
+        width=16,
+        height=16,
+        frame_count=2,
+        rendered_frames=[
+            RenderedFrame(
+                animation_index=0,
+                frame_index=index,
+                png_base64=base64.b64encode(frame).decode('utf-8'),
+                png_bytes=frame,
+            )
+            for index, frame in enumerate(frames)
+        ],
+    )
+
+
 @pytest.fixture
 def successful_render_result():
     """Provide a successful render result fixture.
@@ -259,16 +311,13 @@ class TestSaveSpritFilesEdgeCases:
 
     def test_save_rendered_frames(self, mocker):
         """Test saving rendered animation frames."""
-        from glitchygames.api.models import RenderedFrameInfo
-
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_root = Path(temp_dir).resolve()
             mocker.patch('glitchygames.api.routes.sprites.ALLOWED_OUTPUT_ROOT', temp_root)
 
-            frame_data = base64.b64encode(b'fake frame png').decode('utf-8')
             frames = [
-                RenderedFrameInfo(animation_index=0, frame_index=0, png_base64=frame_data),
-                RenderedFrameInfo(animation_index=0, frame_index=1, png_base64=frame_data),
+                RenderedFrame(0, 0, png_base64='', png_bytes=b'fake frame png 0'),
+                RenderedFrame(0, 1, png_base64='', png_bytes=b'fake frame png 1'),
             ]
 
             saved_files = _save_sprite_files(
@@ -283,6 +332,7 @@ class TestSaveSpritFilesEdgeCases:
             assert len(saved_files) == 2
             assert 'animation-0-frame-0.png' in saved_files[0]
             assert 'animation-0-frame-1.png' in saved_files[1]
+            assert Path(saved_files[1]).read_bytes() == b'fake frame png 1'
 
 
 class TestGenerateSpriteAIProviderError:
@@ -502,3 +552,207 @@ class TestGenerateWithModelOverride:
         assert response.status_code == 200
         call_kwargs = mock_gen_service.generate_sprite.call_args.kwargs
         assert call_kwargs['model'] == 'openai:gpt-4o'
+
+
+class TestFramePayloads:
+    """Test that rendered frames are sent once, as base64 JSON or a binary bundle."""
+
+    @staticmethod
+    def _mock_services(mocker, generation_result, render_result):
+        mock_services = mocker.patch('glitchygames.api.routes.sprites._get_services')
+        mock_gen_service = mocker.MagicMock()
+        mock_gen_service.generate_sprite.return_value = generation_result
+        mock_gen_service.refine_sprite.return_value = generation_result
+        mock_render_service = mocker.MagicMock()
+        mock_render_service.render_from_toml.return_value = render_result
+        mock_services.return_value = (mock_gen_service, mock_render_service)
+        return mock_render_service
+
+    def test_json_rendered_frames_keep_their_png_data(
+        self,
+        client,
+        animated_generation_result,
+        animated_render_result,
+        mocker,
+    ):
+        """Test that the default encoding keeps base64 data in every rendered frame."""
+        self._mock_services(mocker, animated_generation_result, animated_render_result)
+
+        response = client.post('/sprites/generate', json={'prompt': 'walker', 'frame_count': 2})
+
+        data = response.json()
+        assert data['all_frames_png_base64'] == [
+            frame.png_base64 for frame in animated_render_result.rendered_frames
+        ]
+        assert data['rendered_frames'] == [
+            {
+                'animation_index': 0,
+                'frame_index': index,
+                'png_base64': frame.png_base64,
+            }
+            for index, frame in enumerate(animated_render_result.rendered_frames)
+        ]
+
+    @pytest.mark.parametrize('endpoint', ['generate', 'refine'])
+    def test_bundle_encoding_returns_raw_frames(
+        self,
+        client,
+        animated_generation_result,
+        animated_render_result,
+        mocker,
+        endpoint,
+    ):
+        """Test that the bundle encoding sends each frame's PNG bytes once."""
+        render_service = self._mock_services(
+            mocker, animated_generation_result, animated_render_result
+        )
+
+        response = client.post(
+            f'/sprites/{endpoint}',
+            json={'prompt': 'walker', 'current_toml': MOCK_TOML, 'frame_encoding': 'bundle'},
+        )
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == FRAME_BUNDLE_MEDIA_TYPE
+        bundle = decode_frame_bundle(response.content)
+        assert bundle.header['success'] is True
+        assert bundle.header['toml_content'] == MOCK_TOML
+        assert bundle.header['png_base64'] is None
+        assert bundle.header['all_frames_png_base64'] is None
+        assert [info['frame_index'] for info in bundle.header['rendered_frames']] == [0, 1]
+        assert bundle.png_bytes == b'frame zero png'
+        assert bundle.frames == [b'frame zero png', b'frame one png']
+        assert render_service.render_from_toml.call_args.kwargs['encode_base64'] is False
+
+    def test_bundle_encoding_toml_only(self, client, successful_generation_result, mocker):
+        """Test that a bundle without rendered PNGs still carries the response."""
+        self._mock_services(mocker, successful_generation_result, None)
+
+        response = client.post(
+            '/sprites/generate',
+            json={'prompt': 'heart', 'output_format': ['toml'], 'frame_encoding': 'bundle'},
+        )
+
+        bundle = decode_frame_bundle(response.content)
+        assert bundle.header['toml_content'] == MOCK_TOML
+        assert bundle.png_bytes is None
+        assert bundle.frames == []
+
+    def test_saved_frames_written_from_raw_bytes(
+        self,
+        client,
+        animated_generation_result,
+        animated_render_result,
+        mocker,
+    ):
+        """Test that saved frame files hold the rendered bytes without a base64 round trip."""
+        self._mock_services(mocker, animated_generation_result, animated_render_result)
+        mock_b64decode = mocker.patch('glitchygames.api.routes.sprites.base64.b64decode')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_root = Path(temp_dir).resolve()
+            mocker.patch('glitchygames.api.routes.sprites.ALLOWED_OUTPUT_ROOT', temp_root)
+
+            response = client.post(
+                '/sprites/generate',
+                json={'prompt': 'walker', 'output_format': ['png'], 'output_path': 'out'},
+            )
+
+            saved_files = response.json()['saved_files']
+            assert Path(saved_files[-1]).name == 'animation-0-frame-1.png'
+            assert Path(saved_files[-1]).read_bytes() == b'frame one png'
+        mock_b64decode.assert_not_called()
+
+
+class TestAtlasOutput:
+    """Test the atlas output format."""
+
+    @staticmethod
+    def _mock_services(mocker, generation_result, atlas_result):
+        mock_services = mocker.patch('glitchygames.api.routes.sprites._get_services')
+        mock_gen_service = mocker.MagicMock()
+        mock_gen_service.generate_sprite.return_value = generation_result
+        mock_gen_service.refine_sprite.return_value = generation_result
+        mock_render_service = mocker.MagicMock()
+        mock_render_service.render_atlas_from_toml.return_value = atlas_result
+        mock_services.return_value = (mock_gen_service, mock_render_service)
+        return mock_render_service
+
+    @pytest.fixture
+    def atlas_result(self):
+        """Provide a rendered two-frame atlas.
+
+        Returns:
+            object: AtlasResult instance.
+
+        """
+        return AtlasResult(
+            success=True,
+            png_bytes=b'atlas png',
+            width=2,
+            height=1,
+            frames=[
+                AtlasFrame('walk', 0, 0, x=0, y=0, width=1, height=1, duration=0.5),
+                AtlasFrame('walk', 0, 1, x=1, y=0, width=1, height=1, duration=0.5),
+            ],
+            unique_frame_count=2,
+        )
+
+    @pytest.mark.parametrize('endpoint', ['generate', 'refine'])
+    def test_atlas_is_returned_with_its_manifest(
+        self, client, animated_generation_result, atlas_result, mocker, endpoint
+    ):
+        """Test that the atlas PNG and its manifest are included in the response."""
+        render_service = self._mock_services(mocker, animated_generation_result, atlas_result)
+
+        response = client.post(
+            f'/sprites/{endpoint}',
+            json={
+                'prompt': 'walker',
+                'current_toml': MOCK_TOML,
+                'output_format': ['atlas'],
+                'png_scale': 2,
+            },
+        )
+
+        data = response.json()
+        assert data['success'] is True
+        assert base64.b64decode(data['atlas_png_base64']) == b'atlas png'
+        assert data['atlas_manifest'] == atlas_result.manifest
+        assert data['png_base64'] is None
+        render_service.render_atlas_from_toml.assert_called_once_with(MOCK_TOML, scale=2)
+        render_service.render_from_toml.assert_not_called()
+
+    def test_atlas_only_render_failure(self, client, animated_generation_result, mocker):
+        """Test that an atlas-only request fails when the atlas cannot be rendered."""
+        self._mock_services(
+            mocker, animated_generation_result, AtlasResult(success=False, error='no frames')
+        )
+
+        response = client.post(
+            '/sprites/generate', json={'prompt': 'walker', 'output_format': ['atlas']}
+        )
+
+        data = response.json()
+        assert data['success'] is False
+        assert 'Atlas rendering failed' in data['error']
+
+    def test_saved_atlas_and_manifest(
+        self, client, animated_generation_result, atlas_result, mocker
+    ):
+        """Test that the atlas and its manifest are saved next to the sprite."""
+        self._mock_services(mocker, animated_generation_result, atlas_result)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_root = Path(temp_dir).resolve()
+            mocker.patch('glitchygames.api.routes.sprites.ALLOWED_OUTPUT_ROOT', temp_root)
+
+            response = client.post(
+                '/sprites/generate',
+                json={'prompt': 'walker', 'output_format': ['atlas'], 'output_path': 'out'},
+            )
+
+            atlas_path, manifest_path = (Path(path) for path in response.json()['saved_files'])
+            assert atlas_path.name == 'walker.atlas.png'
+            assert atlas_path.read_bytes() == b'atlas png'
+            assert json.loads(manifest_path.read_text(encoding='utf-8')) == atlas_result.manifest
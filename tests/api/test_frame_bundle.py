@@ -0,0 +1,91 @@
+"""Tests for the binary frame bundle encoding."""
+
+import struct
+
+import pytest
+
+from glitchygames.api.frame_bundle import (
+    FRAME_BUNDLE_MAGIC,
+    FrameBundle,
+    decode_frame_bundle,
+    encode_frame_bundle,
+)
+
+
+class TestFrameBundle:
+    """Test encoding and decoding frame bundles."""
+
+    def test_round_trip(self):
+        """Test that the header and every PNG survive a round trip."""
+        header = {'success': True, 'rendered_frames': [{'frame_index': 0}, {'frame_index': 1}]}
+
+        data = encode_frame_bundle(header, b'sprite png', [b'frame 0', b'frame 1'])
+
+        assert decode_frame_bundle(data) == FrameBundle(
+            header=header,
+            png_bytes=b'sprite png',
+            frames=[b'frame 0', b'frame 1'],
+        )
+
+    def test_frames_are_not_base64_encoded(self):
+        """Test that each frame is stored once as raw bytes."""
+        frame = bytes(range(256))
+
+        data = encode_frame_bundle({}, frame, [frame])
+
+        assert data.count(frame) == 2
+        assert data.endswith(struct.pack('>I', len(frame)) + frame)
+
+    def test_missing_sprite_png(self):
+        """Test that a bundle without a sprite PNG decodes to None."""
+        bundle = decode_frame_bundle(encode_frame_bundle({'success': False}, None, []))
+
+        assert bundle.png_bytes is None
+        assert bundle.frames == []
+
+    def test_bad_magic_rejected(self):
+        """Test that data that is not a bundle is rejected."""
+        data = encode_frame_bundle({}, None, []).replace(FRAME_BUNDLE_MAGIC, b'XXXX', 1)
+
+        with pytest.raises(ValueError, match='Not a frame bundle'):
+            decode_frame_bundle(data)
+
+    def test_unsupported_version_rejected(self):
+        """Test that bundles from a newer format version are rejected."""
+        data = bytearray(encode_frame_bundle({}, None, []))
+        data[len(FRAME_BUNDLE_MAGIC)] = 99
+
+        with pytest.raises(ValueError, match='version 99'):
+            decode_frame_bundle(bytes(data))
+
+    @pytest.mark.parametrize('length', [3, 12, -1])
+    def test_truncated_bundle_rejected(self, length):
+        """Test that a bundle cut short anywhere is rejected."""
+        header = {'success': True, 'rendered_frames': [{'frame_index': 0}]}
+        data = encode_frame_bundle(header, b'sprite png', [b'frame 0'])
+
+        with pytest.raises(ValueError, match='truncated'):
+            decode_frame_bundle(data[:length])
+
+    def test_missing_frames_rejected(self):
+        """Test that a bundle with fewer frames than its header lists is rejected."""
+        header = {'success': True, 'rendered_frames': [{'frame_index': 0}, {'frame_index': 1}]}
+        data = encode_frame_bundle(header, b'sprite png', [b'frame 0'])
+
+        with pytest.raises(ValueError, match='1 frames but its header lists 2'):
+            decode_frame_bundle(data)
+
+    def test_extra_frames_rejected(self):
+        """Test that frames the header does not list are rejected."""
+        header = {'success': True, 'rendered_frames': [{'frame_index': 0}]}
+        data = encode_frame_bundle(header, b'sprite png', [b'frame 0', b'frame 1'])
+
+        with pytest.raises(ValueError, match='data after the 1 frames'):
+            decode_frame_bundle(data)
+
+    def test_trailing_bytes_rejected(self):
+        """Test that padding after the last frame is rejected."""
+        data = encode_frame_bundle({'success': True}, b'sprite png', []) + b'\0'
+
+        with pytest.raises(ValueError, match='data after'):
+            decode_frame_bundle(data)
@@ -0,0 +1,29 @@
+"""Headless benchmarks of whole-scene reference workloads.
+
+Each workload runs a real scene under the SceneManager with the dummy SDL
+drivers, a fixed-step clock, and a deterministic event stream, so results are
+comparable between runs and machines. Per-phase frame timings are attached to
+the benchmark's extra_info.
+
+Run benchmarks:
+    pytest tests/benchmarks/test_workload_benchmarks.py --benchmark-only
+    nox -s performance_test
+"""
+
+import pytest
+
+from glitchygames.performance.scene_benchmark import REFERENCE_WORKLOADS
+
+
+@pytest.mark.parametrize('workload_name', sorted(REFERENCE_WORKLOADS))
+def test_reference_workload(benchmark, workload_name):
+    """Benchmark a full run of a reference workload."""
+    workload = REFERENCE_WORKLOADS[workload_name]()
+
+    with workload.create() as harness:
+        timings = benchmark.pedantic(
+            harness.run, kwargs={'frames': workload.frames}, rounds=1, iterations=1
+        )
+        benchmark.extra_info.update(workload=workload.name, **harness.report())
+
+    assert len(timings) == workload.frames
@@ -21,6 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from glitchygames.events import ResourceManager
 from glitchygames.fonts import FontManager
+from glitchygames.game_objects import sound_bank
+from glitchygames.performance import performance_manager, tracer
 from glitchygames.scenes import Scene, SceneManager
 from glitchygames.sprites import (
     FocusableSingletonBitmappySprite,
@@ -83,8 +85,19 @@ def _reset_all_singleton_instances():
 
     # Reset FontManager class-level caches that may hold mock objects
     FontManager._font_cache.clear()
+    FontManager.clear_render_cache()
     FontManager.OPTIONS.clear()
 
+    # Turn tracing back off; initialize_arguments() enables it for DEBUG runs
+    tracer.configure(())
+    tracer.reset()
+
+    # Go back to smoothing variable dt if a test enabled a fixed timestep
+    performance_manager.set_fixed_timestep(None)
+
+    # Drop sounds decoded under another test's mixer mocks
+    sound_bank.clear()
+
     # Reset all singleton base classes and their subclasses
     for singleton_base in (Singleton, SingletonBitmappySprite, FocusableSingletonBitmappySprite):
         singleton_base.__instance__ = None
@@ -35,6 +35,7 @@ Covers:
 - quit_game class method
 """
 
+import json
 import sys
 from collections import OrderedDict
 from pathlib import Path
@@ -795,6 +796,18 @@ class TestProcessGameEvent:
         assert result is True
         engine.game_manager.on_menu_item_event.assert_called_once_with(event)
 
+    def test_voice_event(self, mock_pygame_patches, mock_game_args, mocker):
+        """Test process_game_event dispatches VOICEEVENT."""
+        engine = _make_engine(mocker, mock_pygame_patches, mock_game_args)
+        engine.game_manager = mocker.Mock()
+
+        event = mocker.Mock()
+        event.type = events.VOICEEVENT
+
+        result = engine.process_game_event(event)
+        assert result is True
+        engine.game_manager.on_voice_command_event.assert_called_once_with(event)
+
     def test_active_event(self, mock_pygame_patches, mock_game_args, mocker):
         """Test process_game_event dispatches ACTIVEEVENT."""
         engine = _make_engine(mocker, mock_pygame_patches, mock_game_args)
@@ -1082,6 +1095,29 @@ class TestProcessEvents:
         engine.process_unimplemented_event.assert_called_once()
         assert result is False
 
+    def test_process_events_coalesces_axis_motion(
+        self,
+        mock_pygame_patches,
+        mock_game_args,
+        mocker,
+    ):
+        """Test only the latest axis value per device and axis is dispatched."""
+        engine = _make_engine(mocker, mock_pygame_patches, mock_game_args)
+        engine._active_scene = mocker.Mock(spec=[])  # No process_event
+
+        stick_events = [
+            events.HashableEvent(pygame.CONTROLLERAXISMOTION, instance_id=0, axis=0, value=value)
+            for value in (4000, 9000, 16000)
+        ]
+        mocker.patch('pygame.event.get', return_value=stick_events)
+        mock_handler = mocker.Mock(return_value=True)
+        mocker.patch.dict(GameEngine.EVENT_HANDLERS, {pygame.CONTROLLERAXISMOTION: mock_handler})
+
+        assert engine.process_events() is True
+        mock_handler.assert_called_once()
+        assert mock_handler.call_args.args[0].value == 16000
+        assert engine.axis_conditioner.get_axis(0, 0) == pytest.approx(16000 / 32767)
+
 
 class TestHandleEventAdditionalPaths:
     """Test GameEngine.handle_event additional code paths."""
@@ -2163,3 +2199,33 @@ class TestGameEnginePerformanceImportError:
 
         # _shutdown should handle the ImportError gracefully
         engine._shutdown()
+
+
+class TestGameEngineEventRecording:
+    """Test --record-events capture of the raw event stream."""
+
+    def test_recording_is_off_by_default(self, mock_pygame_patches, mock_game_args, mocker):
+        """Test no recorder is attached without --record-events."""
+        engine = _make_engine(mocker, mock_pygame_patches, mock_game_args)
+        GameEngine.OPTIONS = {'record_events': None}
+
+        assert engine._start_event_recording() is None
+        engine._save_event_recording(None)
+
+    def test_recorded_events_are_saved(self, mock_pygame_patches, mock_game_args, mocker, tmp_path):
+        """Test pumped events are written to the --record-events file."""
+        engine = _make_engine(mocker, mock_pygame_patches, mock_game_args)
+        path = tmp_path / 'session.json'
+        GameEngine.OPTIONS = {'record_events': str(path)}
+        mocker.patch.object(
+            engine,
+            '_pump_events',
+            return_value=[mocker.Mock(type=768, dict={'key': 97})],
+        )
+
+        recorder = engine._start_event_recording()
+        engine._pump_events()
+        engine._save_event_recording(recorder)
+
+        saved = json.loads(path.read_text(encoding='utf-8'))
+        assert saved['frames'] == [[{'type': 768, 'attributes': {'key': 97}}]]
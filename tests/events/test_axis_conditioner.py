@@ -0,0 +1,113 @@
+"""Tests for axis-motion coalescing, deadzone and quantization."""
+
+import pygame
+import pytest
+
+from glitchygames.events.axis import AxisConditioner
+
+
+def _controller_axis(value, axis=0, instance_id=0):
+    return pygame.event.Event(
+        pygame.CONTROLLERAXISMOTION, instance_id=instance_id, axis=axis, value=value
+    )
+
+
+def _joy_axis(value, axis=0, instance_id=0):
+    return pygame.event.Event(pygame.JOYAXISMOTION, instance_id=instance_id, axis=axis, value=value)
+
+
+class TestAxisConditioner:
+    """Test AxisConditioner.condition() and the polled axis state."""
+
+    def test_coalesces_to_latest_value_per_axis(self):
+        """Only the last event for each device and axis is dispatched."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.0)
+        first_x = _controller_axis(10000, axis=0)
+        only_y = _controller_axis(-12000, axis=1)
+        last_x = _controller_axis(20000, axis=0)
+        other_pad = _controller_axis(5000, axis=0, instance_id=1)
+
+        result = conditioner.condition([first_x, only_y, last_x, other_pad])
+
+        assert result == [only_y, last_x, other_pad]
+        assert first_x not in result
+
+    def test_keeps_order_relative_to_other_events(self):
+        """The surviving axis event stays where its last occurrence was."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.0)
+        early = _controller_axis(1000)
+        button = pygame.event.Event(pygame.CONTROLLERBUTTONDOWN, instance_id=0, button=0)
+        late = _controller_axis(30000)
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+
+        assert conditioner.condition([early, button, late, key]) == [button, late, key]
+
+    def test_deadzone_snaps_to_rest_once(self):
+        """Values inside the deadzone are reported as 0, and only once."""
+        conditioner = AxisConditioner(deadzone=0.1, quantum=0.0)
+        conditioner.condition([_controller_axis(20000)])
+
+        (rest,) = conditioner.condition([_controller_axis(1500)])
+        assert rest.value == 0
+        assert isinstance(rest.value, int)
+        assert conditioner.condition([_controller_axis(-800)]) == []
+
+    def test_deadzone_does_not_modify_the_raw_event(self):
+        """Snapping to rest builds a new event instead of mutating the raw one."""
+        conditioner = AxisConditioner(deadzone=0.1)
+        raw = _joy_axis(0.05)
+
+        (rest,) = conditioner.condition([raw])
+
+        assert rest is not raw
+        assert rest.value == 0.0
+        assert raw.value == pytest.approx(0.05)
+
+    def test_drops_changes_below_quantum(self):
+        """Changes smaller than the quantum are not dispatched."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.01)
+        assert len(conditioner.condition([_joy_axis(0.5)])) == 1
+        assert conditioner.condition([_joy_axis(0.505)]) == []
+        # Small steps add up against the last dispatched value
+        assert len(conditioner.condition([_joy_axis(0.512)])) == 1
+
+    def test_full_deflection_is_always_reported(self):
+        """Reaching the end of travel is dispatched even within one quantum."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.01)
+        conditioner.condition([_controller_axis(32600)])
+
+        assert len(conditioner.condition([_controller_axis(32767)])) == 1
+
+    def test_polled_state_is_normalized_per_family(self):
+        """get_axis() returns the dispatched value normalized to [-1, 1]."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.0)
+        conditioner.condition([_controller_axis(-32767, axis=1, instance_id=3), _joy_axis(0.25)])
+
+        assert conditioner.get_axis(3, 1) == pytest.approx(-1.0)
+        assert conditioner.get_axis(0, 0, pygame.JOYAXISMOTION) == pytest.approx(0.25)
+        assert conditioner.get_axis(0, 0) == 0.0
+
+    def test_device_removal_clears_state(self):
+        """A removed device's axes read as rest and report again when it returns."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.0)
+        conditioner.condition([_controller_axis(16000, instance_id=2)])
+        removed = pygame.event.Event(pygame.CONTROLLERDEVICEREMOVED, instance_id=2)
+
+        assert conditioner.condition([removed]) == [removed]
+        assert conditioner.get_axis(2, 0) == 0.0
+        assert len(conditioner.condition([_controller_axis(16000, instance_id=2)])) == 1
+
+    def test_joy_index_fallback(self):
+        """Events without an instance_id are keyed by their joy index."""
+        conditioner = AxisConditioner(deadzone=0.0, quantum=0.0)
+        first = pygame.event.Event(pygame.JOYAXISMOTION, joy=1, axis=0, value=0.2)
+        last = pygame.event.Event(pygame.JOYAXISMOTION, joy=1, axis=0, value=0.4)
+
+        assert conditioner.condition([first, last]) == [last]
+        assert conditioner.get_axis(1, 0, pygame.JOYAXISMOTION) == pytest.approx(0.4)
+
+    @pytest.mark.parametrize(('deadzone', 'quantum'), [(-0.1, 0.0), (1.0, 0.0), (0.0, 1.5)])
+    def test_rejects_out_of_range_settings(self, deadzone, quantum):
+        """Deadzone and quantum must be fractions of full scale."""
+        with pytest.raises(ValueError, match='Axis'):
+            AxisConditioner(deadzone=deadzone, quantum=quantum)
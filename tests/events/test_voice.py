@@ -3,10 +3,12 @@
 import contextlib
 import threading
 
+import pygame
 import pytest
 
 from glitchygames.bitmappy.editor import BitmapEditorScene
 from glitchygames.bitmappy.editor_setup import EditorSetup
+from glitchygames.events import VOICEEVENT, HashableEvent
 from glitchygames.events.voice import SPEECH_RECOGNITION_AVAILABLE, VoiceEventManager
 
 pytestmark = pytest.mark.usefixtures('mock_pygame_patches')
@@ -274,8 +276,8 @@ class TestListenLoop:
         # Should exit immediately without error
         manager._listen_loop()
 
-    def test_listen_loop_recognizes_speech_and_processes_command(self, mocker):
-        """Test _listen_loop recognizes speech and calls _process_command."""
+    def test_listen_loop_recognizes_speech_and_posts_command(self, mocker):
+        """Test _listen_loop recognizes speech and posts it instead of running callbacks."""
         mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=True)
         mock_sr = mocker.patch('glitchygames.events.voice.sr')
 
@@ -298,6 +300,7 @@ class TestListenLoop:
         manager.microphone = mock_microphone
         manager.recognizer = mock_recognizer
         manager.is_listening = True
+        mock_post_command = mocker.patch.object(manager, '_post_command')
         mock_process_command = mocker.patch.object(manager, '_process_command')
 
         mock_audio = mocker.Mock()
@@ -316,7 +319,8 @@ class TestListenLoop:
 
         manager._listen_loop()
 
-        mock_process_command.assert_called_with('hello world')
+        mock_post_command.assert_called_with('hello world')
+        mock_process_command.assert_not_called()
 
     def test_listen_loop_handles_unknown_value_error(self, mocker):
         """Test _listen_loop handles UnknownValueError from recognizer."""
@@ -354,7 +358,7 @@ class TestListenLoop:
         manager._listen_loop()
 
     def test_listen_loop_handles_request_error(self, mocker):
-        """Test _listen_loop handles RequestError and waits before retrying."""
+        """Test _listen_loop backs off after RequestError, waking early if stopped."""
         mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=True)
         mock_sr = mocker.patch('glitchygames.events.voice.sr')
 
@@ -379,21 +383,21 @@ class TestListenLoop:
         mock_audio = mocker.Mock()
         mock_recognizer.recognize_google.side_effect = mock_sr.RequestError('service unavailable')
 
-        mock_sleep = mocker.patch('glitchygames.events.voice.time.sleep')
+        mock_wait = mocker.patch.object(manager.stop_listening_event, 'wait')
 
         call_count = [0]
 
-        def stop_after_first(*args, **kwargs):
+        def stop_after_third(*args, **kwargs):
             call_count[0] += 1
-            if call_count[0] > 1:
+            if call_count[0] > 3:
                 manager.is_listening = False
             return mock_audio
 
-        mock_recognizer.listen.side_effect = stop_after_first
+        mock_recognizer.listen.side_effect = stop_after_third
 
         manager._listen_loop()
 
-        mock_sleep.assert_called_with(2)
+        assert [call.args[0] for call in mock_wait.call_args_list] == [0.5, 1.0, 2.0, 4.0]
 
     def test_listen_loop_handles_wait_timeout_error(self, mocker):
         """Test _listen_loop handles WaitTimeoutError by continuing."""
@@ -430,7 +434,7 @@ class TestListenLoop:
         manager._listen_loop()
 
     def test_listen_loop_handles_oserror(self, mocker):
-        """Test _listen_loop handles OSError and sleeps before retrying."""
+        """Test _listen_loop handles OSError and waits before retrying."""
         mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=True)
         mock_sr = mocker.patch('glitchygames.events.voice.sr')
 
@@ -452,7 +456,7 @@ class TestListenLoop:
         manager.microphone = mock_microphone
         manager.recognizer = mock_recognizer
         manager.is_listening = True
-        mock_sleep = mocker.patch('glitchygames.events.voice.time.sleep')
+        mock_wait = mocker.patch.object(manager.stop_listening_event, 'wait')
 
         call_count = [0]
 
@@ -467,7 +471,7 @@ class TestListenLoop:
 
         manager._listen_loop()
 
-        mock_sleep.assert_called_with(1)
+        mock_wait.assert_called_with(1.0)
 
     def test_listen_loop_stops_when_stop_event_set(self, mocker):
         """Test _listen_loop stops when stop_listening_event is set."""
@@ -781,6 +785,99 @@ class TestProcessCommandEdgeCases:
         partial_callback.assert_not_called()
 
 
+class TestVoiceCommandDispatch:
+    """Test that commands are queued by the listener and run on the main thread."""
+
+    def test_post_command_queues_voice_event(self, mocker):
+        """Test _post_command posts a VOICEEVENT instead of running the callback."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        mock_post = mocker.patch('glitchygames.events.voice.pygame.event.post')
+        mock_event = mocker.patch('glitchygames.events.voice.pygame.event.Event')
+        manager = VoiceEventManager()
+        callback = mocker.Mock()
+        manager.register_command('save', callback)
+
+        manager._post_command('save')
+
+        mock_event.assert_called_once_with(VOICEEVENT, text='save')
+        mock_post.assert_called_once_with(mock_event.return_value)
+        callback.assert_not_called()
+
+    def test_post_command_logs_pygame_error(self, mocker):
+        """Test _post_command survives the event queue being unavailable."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        mocker.patch(
+            'glitchygames.events.voice.pygame.event.post',
+            side_effect=pygame.error('video system not initialized'),
+        )
+        mock_get_logger = mocker.patch('glitchygames.events.voice.logging.getLogger')
+        mock_log = mock_get_logger.return_value
+        manager = VoiceEventManager()
+
+        manager._post_command('save')
+
+        mock_log.exception.assert_called_once()
+
+    def test_on_voice_command_event_runs_callback(self, mocker):
+        """Test on_voice_command_event runs the matching callback."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        manager = VoiceEventManager()
+        callback = mocker.Mock()
+        manager.register_command('undo', callback)
+
+        manager.on_voice_command_event(HashableEvent(VOICEEVENT, text='please undo that'))
+
+        callback.assert_called_once()
+
+    def test_partial_match_prefers_earliest_then_longest_phrase(self, mocker):
+        """Test partial matching picks the first phrase heard, most specific first."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        manager = VoiceEventManager()
+        manager.register_command('clear', mocker.Mock())
+        manager.register_command('clear ai box', mocker.Mock())
+        manager.register_command('undo', mocker.Mock())
+
+        assert manager._match_command('undo and clear') == 'undo'
+        assert manager._match_command('now clear ai box please') == 'clear ai box'
+        assert manager._match_command('clear the canvas') == 'clear'
+        assert manager._match_command('redo') is None
+
+    def test_match_command_with_no_commands(self, mocker):
+        """Test _match_command returns None before any command is registered."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        manager = VoiceEventManager()
+
+        assert manager._match_command('anything') is None
+
+    def test_phrases_snapshot_tracks_registrations(self, mocker):
+        """Test the listener's phrase snapshot follows register_command."""
+        mocker.patch('glitchygames.events.voice.SPEECH_RECOGNITION_AVAILABLE', new=False)
+        manager = VoiceEventManager()
+        manager.register_command('Save', mocker.Mock())
+        manager.register_command('load', mocker.Mock())
+
+        assert manager._phrases == ('save', 'load')
+
+    def test_editor_forwards_voice_command_event(self, mocker):
+        """Test the bitmap editor forwards VOICEEVENTs to its voice manager."""
+        mocker.patch.object(BitmapEditorScene, '__init__', return_value=None)
+        scene = BitmapEditorScene({})
+        scene.voice_manager = mocker.Mock()
+        event = HashableEvent(VOICEEVENT, text='clear ai box')
+
+        scene.on_voice_command_event(event)
+
+        scene.voice_manager.on_voice_command_event.assert_called_once_with(event)
+
+    def test_editor_ignores_voice_command_event_without_manager(self, mocker):
+        """Test the bitmap editor ignores VOICEEVENTs when voice is disabled."""
+        mocker.patch.object(BitmapEditorScene, '__init__', return_value=None)
+        scene = BitmapEditorScene({})
+        scene.voice_manager = None
+
+        scene.on_voice_command_event(HashableEvent(VOICEEVENT, text='clear ai box'))
+
+
 class TestVoiceEventManagerInitialization:
     """Test VoiceEventManager initialization paths."""
 
@@ -1,6 +1,17 @@
 """Tests for voice backends registry module."""
 
-from glitchygames.events.voice_backends import get_microphone_backend
+import io
+import wave
+
+import pytest
+import speech_recognition as sr
+
+from glitchygames.events.voice_backends import (
+    GoogleRecognizer,
+    KeywordRecognizer,
+    get_microphone_backend,
+    get_recognizer_backend,
+)
 from glitchygames.events.voice_backends.registry import (
     _probe_backend,
     _try_import_miniaudio,
@@ -202,3 +213,97 @@ class TestGetMicrophoneBackend:
         mock_cls.return_value = mocker.Mock()
         result = _probe_backend(mock_cls, 'TestBackend')
         assert result is mock_cls
+
+
+def _recorded_audio():
+    """Return a short recorded clip as a speech_recognition AudioFile.
+
+    Returns:
+        sr.AudioFile: Half a second of 16 kHz mono audio.
+
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(2)
+        clip.setframerate(16000)
+        clip.writeframes(b'\x00\x01' * 8000)
+    buffer.seek(0)
+    return sr.AudioFile(buffer)
+
+
+class TestGetRecognizerBackend:
+    """Test get_recognizer_backend selection."""
+
+    def test_prefers_offline_keyword_backend(self, mocker):
+        """Test the keyword backend is chosen when pocketsphinx is installed."""
+        mocker.patch.object(KeywordRecognizer, 'available', return_value=True)
+
+        assert isinstance(get_recognizer_backend(), KeywordRecognizer)
+
+    def test_falls_back_to_google(self, mocker):
+        """Test the web API is used when no offline backend is installed."""
+        mocker.patch.object(KeywordRecognizer, 'available', return_value=False)
+
+        assert isinstance(get_recognizer_backend(), GoogleRecognizer)
+
+    def test_selects_backend_by_name(self, mocker):
+        """Test a backend can be requested by name."""
+        mocker.patch.object(KeywordRecognizer, 'available', return_value=True)
+
+        assert isinstance(get_recognizer_backend('google'), GoogleRecognizer)
+
+    def test_unknown_name_raises(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match='Unknown recognizer backend'):
+            get_recognizer_backend('cloud')
+
+    def test_unavailable_name_raises(self, mocker):
+        """Test requesting a backend that is not installed is rejected."""
+        mocker.patch.object(KeywordRecognizer, 'available', return_value=False)
+
+        with pytest.raises(ValueError, match='not installed'):
+            get_recognizer_backend('keyword')
+
+
+class TestRecognizerBackends:
+    """Test recognizer backends against recorded audio."""
+
+    def test_keyword_recognizer_spots_registered_phrases(self, mocker):
+        """Test the keyword backend listens only for the registered phrases."""
+        recognizer = sr.Recognizer()
+        with _recorded_audio() as source:
+            audio = recognizer.record(source)
+        mock_sphinx = mocker.patch.object(
+            recognizer, 'recognize_sphinx', return_value='clear ai box '
+        )
+
+        text = KeywordRecognizer(sensitivity=0.5).recognize(
+            recognizer, audio, ('clear ai box', 'undo')
+        )
+
+        assert text == 'clear ai box '
+        mock_sphinx.assert_called_once_with(
+            audio, keyword_entries=[('clear ai box', 0.5), ('undo', 0.5)]
+        )
+
+    def test_keyword_recognizer_without_phrases_decodes_freely(self, mocker):
+        """Test the keyword backend falls back to free-form decoding."""
+        recognizer = sr.Recognizer()
+        with _recorded_audio() as source:
+            audio = recognizer.record(source)
+        mock_sphinx = mocker.patch.object(recognizer, 'recognize_sphinx', return_value='hello')
+
+        KeywordRecognizer().recognize(recognizer, audio, ())
+
+        mock_sphinx.assert_called_once_with(audio, keyword_entries=None)
+
+    def test_google_recognizer_uses_web_api(self, mocker):
+        """Test the Google backend transcribes through recognize_google."""
+        recognizer = sr.Recognizer()
+        with _recorded_audio() as source:
+            audio = recognizer.record(source)
+        mock_google = mocker.patch.object(recognizer, 'recognize_google', return_value='undo')
+
+        assert GoogleRecognizer().recognize(recognizer, audio, ('undo',)) == 'undo'
+        mock_google.assert_called_once_with(audio)
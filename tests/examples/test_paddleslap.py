@@ -147,3 +147,41 @@ class TestPaddleslapExample:
         actions = [action.dest for action in parser._actions]
         assert 'balls' in actions
         assert 'version' in actions
+
+    def test_paddleslap_balls_use_paddle_broad_phase(self):
+        """Test that balls query the scene's paddle grid instead of scanning groups."""
+        game = Game(options=self.mock_options)
+        game.dt_tick(1.0 / 60.0)
+
+        assert game.balls[0].paddle_broad_phase is game.paddle_grid
+        assert game.player1 in game.paddle_grid
+        assert game.player2 in game.paddle_grid
+        assert len(game.paddle_grid) == 2
+
+    def test_paddleslap_distant_balls_are_not_tested(self, mocker):
+        """Test that only balls sharing a broad-phase cell reach the narrow phase."""
+        multi_ball_options = self.mock_options.copy()
+        multi_ball_options['balls'] = 3
+        game = Game(options=multi_ball_options)
+        near1, near2, far = game.balls
+        near1.rect.topleft = (100, 100)
+        near2.rect.topleft = (110, 100)
+        far.rect.topleft = (600, 400)
+        distance = mocker.spy(game, '_calculate_ball_distance')
+
+        game._handle_ball_collisions()
+
+        assert [call.args for call in distance.call_args_list] == [(near1, near2)]
+
+    def test_paddleslap_ball_collisions_run_every_simulation_step(self, mocker):
+        """Test that ball pairs are resolved, and their cooldown counted, per step."""
+        game = Game(options=self.mock_options)
+        collisions = mocker.spy(game, '_handle_ball_collisions')
+        game._ball_collision_cooldowns[1, 2] = 2
+
+        game.dt_tick(1.0 / 120.0)
+        game.dt_tick(1.0 / 120.0)
+        game.update()
+
+        assert collisions.call_count == 2
+        assert (1, 2) not in game._ball_collision_cooldowns
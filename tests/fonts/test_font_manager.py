@@ -14,6 +14,7 @@ import argparse
 import sys
 from pathlib import Path
 
+import pygame
 import pytest
 
 # Add project root so direct imports work in isolated runs
@@ -246,3 +247,97 @@ class TestFontManagerArgs:
 
         args = result.parse_args(['--font-dpi', '96'])
         assert args.font_dpi == 96
+
+
+class TestFontManagerRenderCache:
+    """Test the shared rendered-text and measurement caches."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Clear render caches before and after each test."""
+        FontManager.clear_render_cache()
+        yield
+        FontManager.clear_render_cache()
+
+    @staticmethod
+    def _pygame_style_font(mocker, advance=8):
+        """Build a pygame.font-style mock font with a fixed advance per character.
+
+        Returns:
+            Mock: A font whose render() returns real surfaces.
+
+        """
+        font = mocker.Mock(spec=['render', 'size', 'get_linesize'])
+        font.size.side_effect = lambda text: (advance * len(text), 16)
+        font.get_linesize.return_value = 16
+        font.render.side_effect = lambda text, *_args: pygame.Surface((advance * len(text), 16))
+        return font
+
+    def test_render_text_is_cached(self, mocker):
+        font = self._pygame_style_font(mocker)
+
+        first = FontManager.render_text(font, 'Hello', (255, 255, 255))
+        second = FontManager.render_text(font, 'Hello', (255, 255, 255))
+
+        assert first is second
+        font.render.assert_called_once_with('Hello', True, (255, 255, 255), None)  # noqa: FBT003
+
+    def test_render_text_key_includes_color_and_background(self, mocker):
+        font = self._pygame_style_font(mocker)
+
+        FontManager.render_text(font, 'Hello', (255, 255, 255))
+        FontManager.render_text(font, 'Hello', (255, 0, 0))
+        FontManager.render_text(font, 'Hello', (255, 0, 0), background=(0, 0, 0))
+        FontManager.render_text(font, 'Hello', (255, 0, 0), antialias=False)
+
+        assert font.render.call_count == 4
+
+    def test_render_text_freetype_style_font(self, mocker):
+        font = mocker.Mock(spec=['render', 'render_to', 'get_rect', 'size'])
+        font.size = 14.0
+        surface = pygame.Surface((10, 10))
+        font.render.return_value = (surface, pygame.Rect(0, 0, 10, 10))
+
+        assert FontManager.render_text(font, 'Hi', (1, 2, 3), background=(4, 5, 6)) is surface
+        font.render.assert_called_once_with('Hi', (1, 2, 3), (4, 5, 6))
+
+        # Resizing a freetype font invalidates its cached surfaces
+        font.size = 20.0
+        FontManager.render_text(font, 'Hi', (1, 2, 3), background=(4, 5, 6))
+        assert font.render.call_count == 2
+
+    def test_render_cache_evicts_least_recently_used(self, mocker):
+        mocker.patch('glitchygames.fonts.font_manager.RENDER_CACHE_SIZE', 2)
+        font = self._pygame_style_font(mocker)
+
+        FontManager.render_text(font, 'a', (255, 255, 255))
+        FontManager.render_text(font, 'b', (255, 255, 255))
+        FontManager.render_text(font, 'a', (255, 255, 255))
+        FontManager.render_text(font, 'c', (255, 255, 255))
+
+        cached_strings = [key[2] for key in FontManager.RENDER_CACHE]
+        assert cached_strings == ['a', 'c']
+
+    def test_text_width_is_cached(self, mocker):
+        font = self._pygame_style_font(mocker)
+
+        assert FontManager.text_width(font, 'abc') == 24
+        assert FontManager.text_width(font, 'abc') == 24
+        font.size.assert_called_once_with('abc')
+
+    def test_glyph_atlas_assembles_monospace_text(self, mocker):
+        font = self._pygame_style_font(mocker)
+
+        surface = FontManager.render_text(font, 'abab', (255, 255, 255), monospace=True)
+
+        assert surface.get_size() == (32, 16)
+        rendered = [call.args[0] for call in font.render.call_args_list]
+        assert sorted(rendered) == ['a', 'b']
+
+    def test_glyph_atlas_skips_proportional_fonts(self, mocker):
+        font = self._pygame_style_font(mocker)
+        font.size.side_effect = lambda text: (4 * len(text) if text == 'i' else 8 * len(text), 16)
+
+        assert FontManager.glyph_atlas(font, (255, 255, 255)) is None
+        FontManager.render_text(font, 'iW', (255, 255, 255), monospace=True)
+        font.render.assert_called_once_with('iW', True, (255, 255, 255), None)  # noqa: FBT003
@@ -104,7 +104,19 @@ class TestBallSpriteInitialization:
 
         mock_sound_class.assert_called_once()
         assert hasattr(ball, 'snd')
-        assert ball.snd == mock_sound
+        assert ball.snd.sound == mock_sound
+
+    def test_balls_share_decoded_collision_sound(self, mocker):
+        """Spawning more balls reuses the sound decoded for the first one."""
+        mock_sound_class = mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.Sound',
+            return_value=mocker.Mock(),
+        )
+
+        balls = [BallSprite(collision_sound='bounce.wav') for _ in range(3)]
+
+        mock_sound_class.assert_called_once()
+        assert balls[0].snd is balls[2].snd
 
     def test_ball_sprite_initialization_without_collision_sound(self):
         """Test BallSprite initialization without collision sound."""
@@ -441,7 +453,7 @@ class TestBallSpriteIntegration:
         mocker.patch('pygame.draw.circle')
         mock_sound = mocker.Mock()
         mocker.patch(
-            'glitchygames.game_objects.ball.game_objects.load_sound',
+            'glitchygames.game_objects.ball.game_objects.sound_bank.get',
             return_value=mock_sound,
         )
 
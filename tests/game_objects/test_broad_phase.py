@@ -0,0 +1,82 @@
+"""Test the uniform-grid collision broad phase."""
+
+import pygame
+import pytest
+
+from glitchygames.game_objects.broad_phase import UniformGrid
+from glitchygames.sprites import Sprite
+from tests.mocks.test_mock_factory import MockFactory
+
+
+class TestUniformGrid:
+    """Test UniformGrid queries and candidate pairs."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker):
+        """Set up pygame mocks for testing."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+
+    @staticmethod
+    def _sprite(x, y, size=20):
+        return Sprite(x=x, y=y, width=size, height=size)
+
+    def test_rejects_non_positive_cell_size(self):
+        with pytest.raises(ValueError, match='cell_size'):
+            UniformGrid(cell_size=0)
+
+    def test_query_finds_overlapping_sprite(self):
+        grid = UniformGrid(cell_size=32)
+        sprite = self._sprite(40, 40)
+        grid.insert(sprite)
+
+        assert grid.query(pygame.Rect(50, 50, 5, 5)) == [sprite]
+
+    def test_query_skips_distant_sprite(self):
+        grid = UniformGrid(cell_size=32)
+        grid.insert(self._sprite(400, 400))
+
+        assert grid.query(pygame.Rect(0, 0, 20, 20)) == []
+
+    def test_query_returns_each_sprite_once_in_insertion_order(self):
+        grid = UniformGrid(cell_size=16)
+        first = self._sprite(0, 0, size=40)
+        second = self._sprite(10, 10, size=40)
+        grid.rebuild([first, second])
+
+        assert grid.query(pygame.Rect(0, 0, 64, 64)) == [first, second]
+
+    def test_touching_sprites_share_a_cell(self):
+        grid = UniformGrid(cell_size=64)
+        left = self._sprite(108, 0)
+        right = self._sprite(128, 0)
+        grid.rebuild([left, right])
+
+        assert grid.candidate_pairs() == [(left, right)]
+
+    def test_candidate_pairs_only_include_neighbours(self):
+        grid = UniformGrid(cell_size=64)
+        near1 = self._sprite(10, 10)
+        near2 = self._sprite(30, 10)
+        far = self._sprite(500, 500)
+        grid.rebuild([near1, far, near2])
+
+        assert grid.candidate_pairs() == [(near1, near2)]
+
+    def test_pair_spanning_several_cells_is_reported_once(self):
+        grid = UniformGrid(cell_size=16)
+        first = self._sprite(0, 0, size=40)
+        second = self._sprite(5, 5, size=40)
+        grid.rebuild([first, second])
+
+        assert grid.candidate_pairs() == [(first, second)]
+
+    def test_rebuild_replaces_contents(self):
+        grid = UniformGrid()
+        old = self._sprite(0, 0)
+        new = self._sprite(0, 0)
+        grid.rebuild([old])
+        grid.rebuild([new])
+
+        assert old not in grid
+        assert new in grid
+        assert len(grid) == 1
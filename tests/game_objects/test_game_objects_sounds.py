@@ -12,7 +12,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from glitchygames.game_objects import load_sound
-from glitchygames.game_objects.sounds import SFX
+from glitchygames.game_objects.sounds import SFX, SoundBank
 from tests.mocks.test_mock_factory import MockFactory
 
 
@@ -78,3 +78,113 @@ class TestGameObjectsSounds:
 
         with pytest.raises(FileNotFoundError):
             load_sound('nonexistent.wav')
+
+
+class TestSoundBank:
+    """Test shared sound decoding and voice limiting."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker):
+        """Set up pygame mocks and a mixer with idle channels."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+        self.sound_class = mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.Sound',
+            side_effect=lambda _path: mocker.Mock(),
+        )
+        self.channels = {}
+
+        def make_channel(index):
+            channel = mocker.Mock()
+            channel.get_busy.return_value = False
+            self.channels[index] = channel
+            return channel
+
+        mocker.patch('glitchygames.game_objects.sounds.pygame.mixer.get_init', return_value=True)
+        mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.get_num_channels', return_value=8
+        )
+        self.set_num_channels = mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.set_num_channels'
+        )
+        self.set_reserved = mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.set_reserved'
+        )
+        mocker.patch(
+            'glitchygames.game_objects.sounds.pygame.mixer.Channel', side_effect=make_channel
+        )
+
+    def _start(self, channel, sound):
+        channel.get_busy.return_value = True
+        channel.get_sound.return_value = sound
+
+    def test_get_decodes_each_sound_once(self):
+        """Repeated gets share one decoded sound per file and volume."""
+        bank = SoundBank()
+
+        first = bank.get(SFX.BOUNCE)
+        assert bank.get(SFX.BOUNCE) is first
+        assert bank.get(SFX.BOUNCE, volume=0.5) is not first
+        assert self.sound_class.call_count == 2
+
+    def test_get_keeps_categories_apart(self):
+        """The same file requested for another category plays on that category."""
+        bank = SoundBank({'sfx': 2, 'ui': 1})
+
+        sfx = bank.get(SFX.BOUNCE)
+        ui = bank.get(SFX.BOUNCE, category='ui')
+
+        assert ui is not sfx
+        assert ui.category == 'ui'
+        assert bank.get(SFX.BOUNCE, category='ui') is ui
+
+    def test_get_rejects_unknown_category(self):
+        """Sounds must play in a category with reserved channels."""
+        with pytest.raises(ValueError, match='music'):
+            SoundBank().get(SFX.BOUNCE, category='music')
+
+    def test_channels_are_reserved_per_category(self):
+        """Each category gets its own block of reserved channels."""
+        bank = SoundBank({'sfx': 2, 'ui': 1}, retrigger_interval=0.0)
+
+        channel = bank.get(SFX.SLAP, category='ui').play()
+
+        self.set_num_channels.assert_called_once_with(11)
+        self.set_reserved.assert_called_once_with(3)
+        assert channel is self.channels[2]
+        assert [len(channels) for channels in bank.channels.values()] == [2, 1]
+
+    def test_same_frame_retriggers_are_dropped(self):
+        """A sound triggered again within the retrigger interval does not stack."""
+        bank = SoundBank(retrigger_interval=60.0)
+        bounce = bank.get(SFX.BOUNCE)
+
+        assert bounce.play() is not None
+        assert bounce.play() is None
+
+    def test_voice_cap_limits_copies_of_a_sound(self):
+        """A sound already playing on max_voices channels is not started again."""
+        bank = SoundBank({'sfx': 4}, max_voices=2, retrigger_interval=0.0)
+        bounce = bank.get(SFX.BOUNCE)
+        slap = bank.get(SFX.SLAP)
+
+        for _ in range(2):
+            self._start(bounce.play(), bounce.sound)
+
+        assert bounce.play() is None
+        assert slap.play() is not None
+
+    def test_full_category_drops_trigger(self):
+        """With every channel of the category busy, the trigger is dropped."""
+        bank = SoundBank({'sfx': 1}, retrigger_interval=0.0)
+        bounce = bank.get(SFX.BOUNCE)
+        self._start(bounce.play(), bounce.sound)
+
+        assert bank.get(SFX.SLAP).play() is None
+
+    def test_play_without_mixer_is_silent(self, mocker):
+        """Nothing is reserved or played before the mixer is initialized."""
+        mocker.patch('glitchygames.game_objects.sounds.pygame.mixer.get_init', return_value=None)
+        bank = SoundBank()
+
+        assert bank.get(SFX.BOUNCE).play() is None
+        assert bank.channels == {}
@@ -97,7 +97,7 @@ class TestPaddleBasicFunctionality(BasePaddleTest):
 
     def test_base_paddle_initialization_with_collision_sound(self, mock_pygame_patches, mocker):
         """Test BasePaddle initialization with collision sound."""
-        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.load_sound')
+        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.sound_bank.get')
         mock_sound = MockFactory.create_pygame_surface_mock()
         mock_load_sound.return_value = mock_sound
 
@@ -341,7 +341,7 @@ class TestHorizontalPaddle(BasePaddleTest):
         mocker,
     ):
         """Test HorizontalPaddle initialization with collision sound."""
-        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.load_sound')
+        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.sound_bank.get')
         mock_sound = MockFactory.create_pygame_surface_mock()
         mock_load_sound.return_value = mock_sound
 
@@ -394,7 +394,7 @@ class TestVerticalPaddle(BasePaddleTest):
 
     def test_vertical_paddle_initialization_with_collision_sound(self, mock_pygame_patches, mocker):
         """Test VerticalPaddle initialization with collision sound."""
-        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.load_sound')
+        mock_load_sound = mocker.patch('glitchygames.game_objects.paddle.sound_bank.get')
         mock_sound = MockFactory.create_pygame_surface_mock()
         mock_load_sound.return_value = mock_sound
 
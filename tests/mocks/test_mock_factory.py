@@ -1600,6 +1600,7 @@ class MockFactory:  # noqa: PLR0904
         mixer_mock = Mock()
         mixer_mock.Sound.return_value = Mock()
         mixer_mock.get_init.return_value = (22050, -16, 2)  # frequency, format, channels
+        mixer_mock.get_num_channels.return_value = 8
 
         # Keyboard mocking
         key_mock = Mock()
@@ -446,6 +446,14 @@ class TestAdaptiveDeltaTime:
         assert not math.isclose(result, 0.016)  # Should be adjusted
         assert result > 0.016  # Should be closer to target
 
+    def test_get_adaptive_dt_passes_fixed_steps_through(self):
+        """Test that a fixed simulation step is not smoothed toward 60 FPS."""
+        self.instance.set_fixed_timestep(1 / 120)
+
+        results = [self.instance.get_adaptive_dt(1 / 120) for _ in range(20)]
+
+        assert all(math.isclose(result, 1 / 120) for result in results)
+
     def test_get_adaptive_dt_history_limit(self):
         """Test that dt history is limited to 60 entries."""
         # Add 61 frames
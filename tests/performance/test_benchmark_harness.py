@@ -0,0 +1,180 @@
+"""Tests for the headless scene benchmark harness."""
+
+import json
+
+import pygame
+import pytest
+
+from glitchygames.performance.scene_benchmark import (
+    EventPlayer,
+    EventRecorder,
+    EventStream,
+    FixedStepClock,
+    SceneBenchmark,
+    bitmappy_stroke_workload,
+    deserialize_event,
+    serialize_event,
+    stroke_session,
+)
+from glitchygames.scenes import Scene
+
+
+class CountingScene(Scene):
+    """A scene that counts ticks and mouse presses."""
+
+    NAME = 'Counting Scene'
+    VERSION = '1.0'
+
+    def __init__(self, options=None, groups=None):
+        """Initialize the counters."""
+        super().__init__(options=options, groups=groups)
+        self.ticks = []
+        self.presses = []
+
+    def dt_tick(self, dt):
+        """Record the delta time."""
+        super().dt_tick(dt)
+        self.ticks.append(dt)
+
+    def on_left_mouse_button_down_event(self, event):
+        """Record the press position."""
+        self.presses.append(event.pos)
+
+
+class TestEventSerialization:
+    """Test event round-tripping through JSON."""
+
+    def test_round_trip_restores_tuples(self):
+        event = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (3, 4), 'buttons': (1, 0, 0)})
+
+        restored = deserialize_event(json.loads(json.dumps(serialize_event(event))))
+
+        assert restored.type == pygame.MOUSEMOTION
+        assert restored.pos == (3, 4)
+        assert restored.buttons == (1, 0, 0)
+
+    def test_unserializable_attributes_are_dropped(self):
+        event = pygame.event.Event(pygame.USEREVENT, {'menu': object(), 'subtype': 2})
+
+        assert serialize_event(event)['attributes'] == {'subtype': 2}
+
+    def test_stream_save_and_load(self, tmp_path):
+        stream = EventStream()
+        stream.append_frame([pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_a})])
+        stream.append_frame([])
+        path = tmp_path / 'session.json'
+
+        stream.save(path)
+        loaded = EventStream.load(path)
+
+        assert len(loaded) == 2
+        assert loaded.events_for_frame(0)[0].key == pygame.K_a
+        assert loaded.events_for_frame(1) == []
+        assert loaded.events_for_frame(5) == []
+
+    def test_unsupported_version_is_rejected(self):
+        with pytest.raises(ValueError, match='version'):
+            EventStream.from_json(json.dumps({'version': 99, 'frames': []}))
+
+
+class TestRecordAndReplay:
+    """Test capturing and feeding the engine's event source."""
+
+    def test_recorder_captures_each_pump(self, mocker):
+        engine = mocker.Mock()
+        batches = [[pygame.event.Event(pygame.KEYUP, {'key': 1})], []]
+        engine._pump_events.side_effect = batches
+        recorder = EventRecorder()
+
+        recorder.attach(engine)
+        assert engine._pump_events() == batches[0]
+        assert engine._pump_events() == batches[1]
+
+        assert len(recorder.stream) == 2
+        assert recorder.stream.frames[0][0]['attributes'] == {'key': 1}
+
+    def test_player_replays_frames_and_drops_live_events(self, mocker):
+        stream = EventStream()
+        stream.append_frame([pygame.event.Event(pygame.KEYUP, {'key': 1})])
+        engine = mocker.Mock()
+        player = EventPlayer(stream)
+        player.attach(engine)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {'key': 2}))
+
+        first = engine._pump_events()
+        second = engine._pump_events()
+
+        assert [event.type for event in first] == [pygame.KEYUP]
+        assert second == []
+        assert not pygame.event.peek(pygame.KEYDOWN)
+
+    def test_fixed_step_clock(self):
+        clock = FixedStepClock(dt=0.5)
+
+        assert clock.tick() == pytest.approx(0.5)
+        assert clock.tick() == pytest.approx(0.5)
+        assert clock.frame == 2
+        assert clock.elapsed == pytest.approx(1.0)
+
+    def test_stroke_session_stays_inside_area(self):
+        area = pygame.Rect(10, 20, 100, 50)
+
+        stream = stroke_session(area, strokes=2, steps=4)
+
+        assert len(stream) == 2 * (4 + 2)
+        for frame in range(len(stream)):
+            for event in stream.events_for_frame(frame):
+                assert area.collidepoint(event.pos)
+
+
+class TestSceneBenchmark:
+    """Test running a scene through the harness."""
+
+    def test_run_replays_events_with_fixed_dt(self):
+        stream = EventStream()
+        stream.append_frame([])
+        stream.append_frame([
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': (5, 6), 'button': 1})
+        ])
+
+        with SceneBenchmark(CountingScene, dt=0.25, events=stream) as harness:
+            timings = harness.run(frames=3)
+            scene = harness.scene
+            report = harness.report()
+
+        assert len(timings) == 3
+        assert scene.ticks == [0.25, 0.25, 0.25]
+        assert scene.presses == [(5, 6)]
+        assert report['frames'] == 3
+        assert set(report) == {'frames', 'update', 'events', 'render', 'display', 'total'}
+        assert report['total']['max_ms'] >= report['total']['mean_ms']
+
+    def test_run_stops_when_game_quits(self):
+        stream = EventStream()
+        stream.append_frame([pygame.event.Event(pygame.QUIT, {})])
+
+        with SceneBenchmark(CountingScene, events=stream) as harness:
+            timings = harness.run(frames=10)
+
+        assert len(timings) == 1
+
+    def test_prepare_runs_before_first_frame(self, mocker):
+        prepare = mocker.Mock()
+
+        with SceneBenchmark(CountingScene, prepare=prepare) as harness:
+            prepare.assert_called_once_with(harness.scene)
+            assert harness.report() == {'frames': 0}
+
+
+class TestReferenceWorkloads:
+    """Test the reference workloads' setup."""
+
+    def test_bitmappy_workload_starts_no_ai_workers(self, mocker):
+        process = mocker.patch('glitchygames.bitmappy.ai_manager.multiprocessing.Process')
+        workload = bitmappy_stroke_workload('16x16')
+
+        with workload.create() as harness:
+            ai_manager = harness.scene._ai_integration
+
+        process.assert_not_called()
+        assert ai_manager.ai_request_queue is None
@@ -0,0 +1,143 @@
+"""Tests for the category-gated hot-path tracer."""
+
+import argparse
+import logging
+
+import pytest
+
+from glitchygames.engine import GameEngine
+from glitchygames.performance.tracing import (
+    TRACE_CATEGORIES,
+    Tracer,
+    lazy,
+    parse_trace_categories,
+    tracer,
+)
+
+
+class TestTracer:
+    """Test Tracer gating, spans and reporting."""
+
+    def test_categories_start_disabled(self):
+        """A new tracer traces nothing."""
+        new_tracer = Tracer()
+
+        assert new_tracer.enabled_categories == []
+        assert all(getattr(new_tracer, category) is False for category in TRACE_CATEGORIES)
+
+    def test_configure_enables_exactly_the_given_categories(self):
+        """configure() replaces the enabled set."""
+        new_tracer = Tracer()
+        new_tracer.configure(['sprites', 'frames'])
+        assert new_tracer.enabled_categories == ['frames', 'sprites']
+
+        new_tracer.configure(['ai'])
+        assert new_tracer.enabled_categories == ['ai']
+        assert new_tracer.sprites is False
+
+    def test_configure_rejects_unknown_categories(self):
+        """Unknown category names are an error."""
+        with pytest.raises(ValueError, match='Unknown trace category'):
+            Tracer().configure(['physics'])
+
+    def test_disabled_emit_does_not_evaluate_lazy_arguments(self, caplog):
+        """Nothing is computed or logged for a disabled category."""
+        new_tracer = Tracer()
+        calls = []
+
+        with caplog.at_level(logging.DEBUG, logger='game.trace'):
+            new_tracer.emit('sprites', 'payload %s', lazy(lambda: calls.append(1)))
+
+        assert calls == []
+        assert caplog.records == []
+
+    def test_enabled_emit_logs_to_the_category_logger(self, caplog):
+        """Enabled messages go to game.trace.<category> with their arguments formatted."""
+        new_tracer = Tracer()
+        new_tracer.configure(['canvas'])
+
+        with caplog.at_level(logging.DEBUG, logger='game.trace'):
+            new_tracer.emit('canvas', 'panned %s', lazy(lambda: (1, 2)))
+
+        (record,) = [record for record in caplog.records if record.name == 'game.trace.canvas']
+        assert record.getMessage() == 'panned (1, 2)'
+
+    def test_disabled_span_records_nothing(self):
+        """Spans for disabled categories are shared no-op contexts."""
+        new_tracer = Tracer()
+
+        with new_tracer.span('frames', 'render'):
+            pass
+
+        assert new_tracer.span('frames', 'render') is new_tracer.span('events', 'dispatch')
+        assert new_tracer.spans == {}
+        assert new_tracer.report() == []
+
+    def test_enabled_span_accumulates_and_reports(self):
+        """Enabled spans count calls and are reported most expensive first."""
+        new_tracer = Tracer()
+        new_tracer.configure(['frames'])
+
+        for _ in range(3):
+            with new_tracer.span('frames', 'render'):
+                sum(range(1000))
+        with new_tracer.span('frames', 'display'):
+            pass
+
+        assert new_tracer.spans['frames', 'render'].count == 3
+        report = new_tracer.report()
+        assert len(report) == 2
+        assert report[0].startswith('frames.render: calls=3')
+
+        new_tracer.reset()
+        assert new_tracer.report() == []
+
+
+class TestParseTraceCategories:
+    """Test the --trace argument parser."""
+
+    def test_comma_separated(self):
+        """Categories are split on commas and stripped."""
+        assert parse_trace_categories('events, sprites') == ['events', 'sprites']
+
+    def test_all(self):
+        """'all' enables every category."""
+        assert parse_trace_categories('all') == list(TRACE_CATEGORIES)
+
+    def test_unknown_category(self):
+        """Unknown categories are reported as argparse errors."""
+        with pytest.raises(argparse.ArgumentTypeError, match='physics'):
+            parse_trace_categories('events,physics')
+
+
+class TestEngineTraceOptions:
+    """Test how GameEngine.initialize_arguments() configures the shared tracer."""
+
+    @staticmethod
+    def _initialize(mocker, **options):
+        game = mocker.Mock(spec=[])
+        game.NAME = 'TraceGame'
+        game.VERSION = '1.0'
+        args = argparse.Namespace(**{'log_level': 'info', 'profile': False, **options})
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=args)
+        GameEngine.initialize_arguments(game)
+
+    def test_trace_option_selects_categories(self, mocker):
+        """--trace enables just the listed categories."""
+        self._initialize(mocker, trace=['events'], profile=True)
+        assert tracer.enabled_categories == ['events']
+
+    def test_profile_traces_everything(self, mocker):
+        """--profile without --trace enables every category."""
+        self._initialize(mocker, profile=True)
+        assert tracer.enabled_categories == list(TRACE_CATEGORIES)
+
+    def test_debug_log_level_traces_everything(self, mocker):
+        """A debug log level without --trace enables every category."""
+        self._initialize(mocker, log_level='debug')
+        assert tracer.enabled_categories == list(TRACE_CATEGORIES)
+
+    def test_default_traces_nothing(self, mocker):
+        """Without --trace, --profile or debug logging nothing is traced."""
+        self._initialize(mocker, trace=None)
+        assert tracer.enabled_categories == []
@@ -1,5 +1,6 @@
 """Comprehensive test coverage for Pixels module."""
 
+import struct
 import sys
 from pathlib import Path
 from typing import cast
@@ -11,6 +12,10 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from glitchygames.pixels import (
+    decode_indexed,
+    decode_rgb_555,
+    decode_rgb_565,
+    decode_rgb_888,
     image_from_pixels,
     indexed_rgb_triplet_generator,
     pixels_from_data,
@@ -18,6 +23,7 @@ from glitchygames.pixels import (
     rgb_555_triplet_generator,
     rgb_565_triplet_generator,
     rgb_triplet_generator,
+    surface_from_rgb,
 )
 from tests.mocks import MockFactory
 
@@ -146,28 +152,21 @@ class TestPixelsCoverage:
         assert len(result) == 1
         assert result[0] == (128, 64, 32)
 
-    def test_image_from_pixels(self, mocker):
+    def test_image_from_pixels(self):
         """Test image_from_pixels function."""
-        mock_surface = mocker.patch('pygame.Surface')
-        # Mock the surface
-        mock_surface_instance = self._create_mock_surface()
-        mock_surface.return_value = mock_surface_instance
-
         # Test with valid pixel data
         pixels = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
         width, height = 2, 2
 
-        image_from_pixels(pixels, width, height)
+        image = image_from_pixels(pixels, width, height)
 
-        # Verify pygame.Surface was called with correct parameters
-        mock_surface.assert_called_once_with((width, height))
-
-        # Verify image.fill was called for each pixel
-        assert mock_surface_instance.fill.call_count == len(pixels)
+        # Pixels are laid out row by row
+        assert image.get_size() == (width, height)
+        assert tuple(image.get_at((1, 0)))[:3] == (0, 255, 0)
+        assert tuple(image.get_at((0, 1)))[:3] == (0, 0, 255)
 
         # Test with empty pixels
-        image_from_pixels([], 0, 0)
-        mock_surface.assert_called_with((0, 0))
+        assert image_from_pixels([], 0, 0).get_size() == (0, 0)
 
     def test_pixels_from_data(self):
         """Test pixels_from_data function."""
@@ -469,3 +468,88 @@ class TestImageFromPixels:
         pixels = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
         surface = image_from_pixels(pixels, width=1, height=3)
         assert surface.get_size() == (1, 3)
+
+    def test_mixed_rgb_and_rgba(self):
+        pixels = [(255, 0, 0), (0, 255, 0, 128), (0, 0, 255), (255, 255, 0, 0)]
+        surface = image_from_pixels(pixels, width=2, height=2)
+        assert surface.get_at((1, 0))[:3] == (0, 255, 0)
+        assert surface.get_at((1, 1))[:3] == (255, 255, 0)
+
+    def test_short_pixel_is_rejected(self):
+        with pytest.raises(ValueError, match='three'):
+            image_from_pixels([(255, 0, 0), (0, 255)], width=2, height=1)
+
+
+def _bit_string_decode(packed, fields):
+    """Decode a packed pixel the way the original string-slicing decoders did.
+
+    Returns:
+        tuple[int, ...]: The (R, G, B) channels.
+
+    """
+    bits = format(packed, '016b')
+    channels = []
+    for start, stop in fields:
+        width = stop - start
+        value = int(bits[start:stop] + '0' * (8 - width), 2)
+        channels.append(value + (1 << (8 - width)) - 1 if value else 0)
+    return tuple(channels)
+
+
+class TestVectorizedDecoders:
+    """Test the numpy decoders against the per-pixel reference decoding."""
+
+    def test_rgb_555_matches_reference_for_every_value(self):
+        values = list(range(0x10000))
+        expected = [_bit_string_decode(v, ((0, 5), (5, 10), (10, 15))) for v in values]
+        assert [tuple(rgb) for rgb in decode_rgb_555([(v,) for v in values]).tolist()] == expected
+
+    def test_rgb_565_matches_reference_for_every_value(self):
+        values = list(range(0x10000))
+        expected = [_bit_string_decode(v, ((0, 5), (5, 11), (11, 16))) for v in values]
+        assert [tuple(rgb) for rgb in decode_rgb_565([(v,) for v in values]).tolist()] == expected
+
+    def test_packed_decoders_accept_raw_little_endian_bytes(self):
+        data = struct.pack('<3H', 0xF800, 0x07E0, 0x001F)
+        assert decode_rgb_565(data).tolist() == [[255, 0, 0], [0, 255, 0], [0, 0, 255]]
+        assert (
+            decode_rgb_555(data).tolist() == decode_rgb_555(struct.iter_unpack('<H', data)).tolist()
+        )
+
+    def test_packed_decoders_reject_odd_byte_counts(self):
+        with pytest.raises(ValueError, match='not divisible by 2'):
+            decode_rgb_565(b'\x00\x00\x00')
+
+    def test_rgb_888(self):
+        assert decode_rgb_888(bytes([1, 2, 3, 4, 5, 6])).tolist() == [[1, 2, 3], [4, 5, 6]]
+        with pytest.raises(ValueError, match='Empty pixel data'):
+            decode_rgb_888(b'')
+
+    def test_indexed_looks_up_the_palette(self):
+        palette = [(0, 0, 0), (255, 0, 0, 255), pygame.Color(0, 0, 255)]
+        assert decode_indexed(bytes([2, 1, 0]), palette).tolist() == [
+            [0, 0, 255],
+            [255, 0, 0],
+            [0, 0, 0],
+        ]
+
+    def test_indexed_rejects_indexes_outside_the_palette(self):
+        with pytest.raises(ValueError, match='out of range'):
+            decode_indexed(bytes([0, 3]), [(0, 0, 0)])
+
+
+class TestSurfaceFromRgb:
+    """Test blitting decoded pixels into a surface."""
+
+    def test_rows_are_laid_out_left_to_right(self):
+        rgb = decode_rgb_888(bytes([255, 0, 0, 0, 255, 0, 0, 0, 255, 9, 9, 9, 8, 8, 8, 7, 7, 7]))
+        surface = surface_from_rgb(rgb, width=3, height=2)
+        assert tuple(surface.get_at((2, 0)))[:3] == (0, 0, 255)
+        assert tuple(surface.get_at((0, 1)))[:3] == (9, 9, 9)
+
+    def test_missing_pixels_stay_black_and_extra_pixels_are_ignored(self):
+        short = surface_from_rgb(decode_rgb_888(bytes([10, 20, 30])), width=2, height=1)
+        assert tuple(short.get_at((1, 0)))[:3] == (0, 0, 0)
+
+        extra = surface_from_rgb(decode_rgb_888(bytes(range(12))), width=1, height=1)
+        assert tuple(extra.get_at((0, 0)))[:3] == (0, 1, 2)
@@ -0,0 +1,53 @@
+"""Tests for dirty-rectangle coalescing."""
+
+import pygame
+
+from glitchygames.scenes.dirty_rects import coalesce_dirty_rects
+
+SCREEN = pygame.Rect(0, 0, 640, 480)
+
+
+class TestCoalesceDirtyRects:
+    """Test clipping and merging of dirty rects."""
+
+    def test_empty_and_offscreen_rects_are_dropped(self):
+        rects = [pygame.Rect(700, 10, 5, 5), None, pygame.Rect(0, 0, 0, 0)]
+
+        assert coalesce_dirty_rects(rects, SCREEN) == []
+
+    def test_rects_are_clipped_to_bounds(self):
+        rects = [pygame.Rect(-10, -10, 20, 20)]
+
+        assert coalesce_dirty_rects(rects, SCREEN) == [pygame.Rect(0, 0, 10, 10)]
+
+    def test_overlapping_fragments_merge(self):
+        rects = [pygame.Rect(x, 100, 4, 4) for x in range(100, 140, 2)]
+
+        assert coalesce_dirty_rects(rects, SCREEN) == [pygame.Rect(100, 100, 42, 4)]
+
+    def test_distant_large_rects_stay_separate(self):
+        rects = [pygame.Rect(0, 0, 100, 100), pygame.Rect(500, 350, 100, 100)]
+
+        assert coalesce_dirty_rects(rects, SCREEN) == rects
+
+    def test_scattered_fragments_collapse_to_bounding_rect(self):
+        rects = [pygame.Rect(x, y, 2, 2) for x in range(0, 60, 20) for y in range(0, 60, 20)]
+
+        assert coalesce_dirty_rects(rects, SCREEN) == [pygame.Rect(0, 0, 42, 42)]
+
+    def test_full_screen_when_cheaper(self):
+        rects = [pygame.Rect(x, y, 2, 2) for x in range(0, 640, 20) for y in range(0, 480, 20)]
+        rects.append(pygame.Rect(638, 478, 2, 2))
+
+        assert coalesce_dirty_rects(rects, SCREEN) == [SCREEN]
+
+    def test_rect_cost_controls_aggressiveness(self):
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 0, 10, 10)]
+
+        assert coalesce_dirty_rects(rects, SCREEN, rect_cost=0) == rects
+        assert coalesce_dirty_rects(rects, SCREEN, rect_cost=1000) == [pygame.Rect(0, 0, 40, 10)]
+
+    def test_without_bounds_rects_are_only_merged(self):
+        rects = [pygame.Rect(-5, 0, 4, 4), pygame.Rect(-3, 0, 4, 4)]
+
+        assert coalesce_dirty_rects(rects) == [pygame.Rect(-5, 0, 6, 4)]
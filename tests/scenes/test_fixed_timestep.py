@@ -0,0 +1,187 @@
+"""Tests for fixed-timestep simulation and render interpolation."""
+
+import math
+
+import pygame
+import pytest
+
+from glitchygames.scenes import FixedTimestep, PositionInterpolator, SceneManager
+from glitchygames.sprites import Sprite
+
+RATE = 100
+STEP = 1 / RATE
+
+
+class _Mover:
+    """A sprite stand-in that moves at a constant speed each simulation step."""
+
+    INTERPOLATE = True
+    store_previous_position = Sprite.store_previous_position
+    interpolated_position = Sprite.interpolated_position
+
+    def __init__(self, speed=1000):
+        self.rect = pygame.Rect(0, 0, 4, 4)
+        self.previous_position = None
+        self.dirty = 0
+        self.speed = speed
+
+    def dt_tick(self, dt):
+        self.rect.x += round(self.speed * dt)
+
+
+class _Scene:
+    """The slice of a Scene the SceneManager's update and render phases use."""
+
+    def __init__(self, *sprites):
+        self.all_sprites = list(sprites)
+        self.steps = []
+        self.drawn = []
+
+    def dt_tick(self, dt):
+        self.steps.append(dt)
+        for sprite in self.all_sprites:
+            sprite.dt_tick(dt)
+
+    def update(self):
+        pass
+
+    def render(self, screen):
+        self.drawn.append([sprite.rect.x for sprite in self.all_sprites])
+
+
+class TestFixedTimestep:
+    """Test the accumulator."""
+
+    def test_frame_time_is_released_in_whole_steps(self):
+        timestep = FixedTimestep(RATE)
+
+        assert timestep.advance(0.025) == 2
+        assert math.isclose(timestep.alpha, 0.5)
+        assert timestep.advance(0.005) == 1
+        assert math.isclose(timestep.alpha, 0.0, abs_tol=1e-9)
+
+    def test_exact_multiples_are_not_lost_to_rounding(self):
+        timestep = FixedTimestep(120)
+
+        assert [timestep.advance(1 / 60) for _ in range(600)] == [2] * 600
+
+    def test_backlog_beyond_the_step_limit_is_dropped(self):
+        timestep = FixedTimestep(RATE, max_steps_per_frame=3)
+
+        assert timestep.advance(1.0 + STEP / 4) == 3
+        assert math.isclose(timestep.alpha, 0.25)
+        assert timestep.advance(0.0) == 0
+
+    def test_invalid_settings_raise(self):
+        with pytest.raises(ValueError, match='rate'):
+            FixedTimestep(0)
+        with pytest.raises(ValueError, match='max_steps_per_frame'):
+            FixedTimestep(RATE, max_steps_per_frame=0)
+
+
+class TestPositionInterpolator:
+    """Test drawing sprites between simulation states."""
+
+    def test_sprites_are_drawn_between_states_and_restored(self):
+        sprite = _Mover()
+        interpolator = PositionInterpolator()
+        interpolator.collect([sprite, object()])
+        interpolator.store_positions()
+        sprite.dt_tick(STEP)
+
+        with interpolator.interpolated(0.25):
+            assert sprite.rect.topleft == (2, 0)
+            assert sprite.dirty
+
+        assert sprite.rect.topleft == (10, 0)
+        assert interpolator.sprites == [sprite]
+
+    def test_sprite_drawn_off_its_position_is_redrawn_at_rest(self):
+        sprite = _Mover()
+        interpolator = PositionInterpolator()
+        interpolator.collect([sprite])
+        interpolator.store_positions()
+        sprite.dt_tick(STEP)
+        with interpolator.interpolated(0.5):
+            pass
+        sprite.dirty = 0
+
+        interpolator.store_positions()
+        with interpolator.interpolated(0.5):
+            assert sprite.rect.topleft == (10, 0)
+            assert sprite.dirty
+
+    def test_refresh_only_recollects_when_membership_changes(self, mocker):
+        sprites = [_Mover()]
+        interpolator = PositionInterpolator()
+        collect = mocker.spy(interpolator, 'collect')
+
+        interpolator.refresh(sprites, version=1)
+        interpolator.refresh(sprites, version=1)
+        sprites.append(_Mover())
+        interpolator.refresh(sprites, version=2)
+        interpolator.refresh(list(sprites), version=2)
+
+        assert collect.call_count == 3
+        assert interpolator.sprites == sprites
+
+
+class TestSceneManagerFixedTimestep:
+    """Test the SceneManager's fixed-step update and interpolated render."""
+
+    @pytest.fixture
+    def scene_manager(self, mocker):
+        scene_manager = SceneManager()
+        engine = mocker.Mock()
+        engine.OPTIONS = {
+            'update_type': 'update',
+            'fps_log_interval_ms': 1000,
+            'target_fps': 0,
+            'simulation_hz': RATE,
+        }
+        scene_manager.game_engine = engine
+        return scene_manager
+
+    def _run(self, scene_manager, frame_times):
+        for frame_dt in frame_times:
+            scene_manager.dt = frame_dt
+            scene_manager._update_scene()
+            scene_manager._render_scene()
+
+    def test_scene_ticks_in_fixed_steps(self, scene_manager):
+        scene_manager.active_scene = _Scene(_Mover())
+
+        self._run(scene_manager, [0.035, 0.001, 0.004])
+
+        assert scene_manager.active_scene.steps == [STEP] * 4
+
+    def test_simulation_does_not_depend_on_frame_rate(self, scene_manager):
+        fast, slow = _Mover(), _Mover()
+        scene_manager.active_scene = _Scene(fast)
+        self._run(scene_manager, [1 / 250] * 250)
+        scene_manager._reset_scene_timers()
+        scene_manager.active_scene = _Scene(slow)
+        self._run(scene_manager, [1 / 25] * 25)
+
+        assert fast.rect.x == slow.rect.x == 1000
+
+    def test_render_sees_interpolated_positions(self, scene_manager):
+        sprite = _Mover()
+        scene = _Scene(sprite)
+        scene_manager.active_scene = scene
+
+        self._run(scene_manager, [0.015, 0.003])
+
+        assert scene.drawn == [[5], [8]]
+        assert sprite.rect.x == 10
+
+    def test_without_simulation_rate_frames_tick_once(self, scene_manager, mocker):
+        engine = mocker.Mock()
+        engine.OPTIONS = {'update_type': 'update', 'fps_log_interval_ms': 1000}
+        scene_manager.game_engine = engine
+        scene_manager.active_scene = _Scene()
+
+        self._run(scene_manager, [0.035])
+
+        assert scene_manager.fixed_timestep is None
+        assert scene_manager.active_scene.steps == [0.035]
@@ -9,6 +9,11 @@ import pytest
 from glitchygames.color import BLUE, RED
 from glitchygames.scenes import Scene, SceneManager
 from glitchygames.scenes.scene import JITTER_SAMPLE_BUFFER_MAX_SIZE
+from glitchygames.sprites import AnimatedSprite, SpriteFrame
+from glitchygames.sprites.scheduler import update_scheduler
+
+# Kept before the pygame mocks replace pygame.sprite.LayeredDirty
+LayeredDirty = pygame.sprite.LayeredDirty
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -623,6 +628,32 @@ class TestSceneDtTick:
         assert abs(scene.dt - 0.017) < 1e-9
         assert abs(scene.dt_timer - 0.033) < 0.001
 
+    def test_dt_tick_advances_animation_clock(self, mock_pygame_patches):
+        """Test dt_tick advances the scene's animation clock."""
+        scene = Scene()
+        scene.dt_tick(0.016)
+        scene.dt_tick(0.017)
+        assert abs(scene.animation_clock.time - 0.033) < 0.001
+
+    def test_dt_tick_advances_animated_sprites_in_the_scene(self, mock_pygame_patches, mocker):
+        """Test an AnimatedSprite added to the scene is driven by its clock."""
+        scene = Scene(groups=LayeredDirty())
+        sprite = AnimatedSprite()
+        frames = [SpriteFrame(pygame.Surface((4, 4)), duration=0.125) for _ in range(4)]
+        sprite.add_animation('walk', frames)
+        sprite.set_animation('walk')
+        sprite.is_looping = True
+        mocker.patch.object(sprite, '_update_surface_and_mark_dirty')
+        sprite.play()
+        scene.all_sprites.add(sprite)
+        tick = mocker.spy(scene.animation_clock, 'tick')
+
+        scene.dt_tick(0.3)
+
+        tick.assert_called_once_with(0.3)
+        assert sprite in scene.animation_clock
+        assert sprite.current_frame == 2
+
 
 class TestSceneCleanup:
     """Test Scene.cleanup() method."""
@@ -1881,6 +1912,34 @@ class TestSceneManagerUpdateDisplay:
         # Empty rects triggers full display update
         manager._update_display()
 
+    def test_update_display_coalesces_rects(self, mock_pygame_patches, mocker):
+        """Test overlapping dirty rects reach the display merged."""
+        manager = SceneManager()
+        manager.update_type = 'update'
+        manager.screen = mocker.Mock(get_rect=lambda: pygame.Rect(0, 0, 640, 480))
+        manager.active_scene = mocker.Mock()
+        manager.active_scene.rects = [pygame.Rect(10, 10, 8, 8), pygame.Rect(14, 10, 8, 8)]
+        mock_update = mocker.patch.object(pygame.display, 'update')
+
+        manager._update_display()
+
+        mock_update.assert_called_once_with([pygame.Rect(10, 10, 12, 8)])
+
+    def test_update_display_full_screen_when_fragmented(self, mock_pygame_patches, mocker):
+        """Test heavily fragmented dirty rects become a full-screen update."""
+        manager = SceneManager()
+        manager.update_type = 'update'
+        manager.screen = mocker.Mock(get_rect=lambda: pygame.Rect(0, 0, 64, 64))
+        manager.active_scene = mocker.Mock()
+        manager.active_scene.rects = [
+            pygame.Rect(x, y, 1, 1) for x in range(0, 64, 21) for y in range(0, 64, 21)
+        ]
+        mock_update = mocker.patch.object(pygame.display, 'update')
+
+        manager._update_display()
+
+        mock_update.assert_called_once_with()
+
     def test_update_display_flip(self, mock_pygame_patches, mocker):
         """Test _update_display with 'flip' type."""
         manager = SceneManager()
@@ -2025,6 +2084,104 @@ class TestSceneUpdate:
         assert mock_sprite.dirty == 1
 
 
+class TestSceneUpdateScheduling:
+    """Test Scene.update() only visiting scheduled sprites."""
+
+    def _idle_scene(self, mocker, *sprites):
+        scene = Scene()
+        for sprite in sprites:
+            sprite.update_nested_sprites = mocker.Mock()
+            sprite.update = mocker.Mock()
+            scene.all_sprites.add(sprite)
+        # The first update is a full pass because a new scene is dirty
+        scene.update()
+        for sprite in sprites:
+            sprite.dirty = 0
+            sprite.update.reset_mock()
+            sprite.update_nested_sprites.reset_mock()
+        update_scheduler.clear()
+        return scene
+
+    def test_full_pass_clears_scene_dirty(self, mock_pygame_patches, mocker):
+        """Test the forced redraw of a new scene happens once."""
+        scene = self._idle_scene(mocker, mocker.Mock(dirty=0))
+
+        assert scene.dirty == 0
+
+    def test_idle_sprites_are_not_visited(self, mock_pygame_patches, mocker):
+        """Test sprites that were not scheduled are skipped."""
+        sprite = mocker.Mock(dirty=0)
+        scene = self._idle_scene(mocker, sprite)
+
+        scene.update()
+
+        sprite.update_nested_sprites.assert_not_called()
+        sprite.update.assert_not_called()
+
+    def test_scheduled_dirty_sprite_is_updated(self, mock_pygame_patches, mocker):
+        """Test a scheduled dirty sprite is synced and updated."""
+        idle, busy = mocker.Mock(dirty=0), mocker.Mock(dirty=0)
+        scene = self._idle_scene(mocker, idle, busy)
+        busy.dirty = 1
+        update_scheduler.schedule(busy)
+
+        scene.update()
+
+        busy.update_nested_sprites.assert_called_once()
+        busy.update.assert_called_once()
+        idle.update.assert_not_called()
+
+    def test_still_dirty_sprite_stays_scheduled(self, mock_pygame_patches, mocker):
+        """Test always-dirty sprites are visited again next frame."""
+        sprite = mocker.Mock(dirty=0)
+        scene = self._idle_scene(mocker, sprite)
+        sprite.dirty = 2
+        update_scheduler.schedule(sprite)
+
+        scene.update()
+        scene.update()
+
+        assert sprite.update.call_count == 2
+
+    def test_marking_scene_dirty_visits_every_sprite(self, mock_pygame_patches, mocker):
+        """Test a dirty scene syncs every sprite and forces a redraw."""
+        sprite = mocker.Mock(dirty=0)
+        scene = self._idle_scene(mocker, sprite)
+        scene.dirty = 1
+
+        scene.update()
+
+        sprite.update_nested_sprites.assert_called_once()
+        assert sprite.dirty == 1
+
+    def test_plain_dirty_sprite_is_updated(self, mock_pygame_patches):
+        """Test a DirtySprite that cannot schedule itself is still updated when dirty."""
+
+        class PlainSprite(pygame.sprite.DirtySprite):
+            updates = 0
+
+            def update(self):
+                self.updates += 1
+
+        sprite = PlainSprite()
+        sprite.rect = pygame.Rect(0, 0, 4, 4)
+        sprite.dirty = 0
+        scene = Scene()
+        scene.all_sprites.add(sprite)
+        # The first update is a full pass; drawing would then clear dirty
+        scene.update()
+        sprite.dirty = 0
+        sprite.updates = 0
+        update_scheduler.clear()
+
+        scene.update()
+        assert sprite.updates == 0
+
+        sprite.dirty = 1
+        scene.update()
+        assert sprite.updates == 1
+
+
 class TestSceneRender:
     """Test Scene.render() method."""
 
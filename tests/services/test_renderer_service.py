@@ -1,10 +1,18 @@
 """Tests for renderer service."""
 
+import io
+import json
 import os
 
 import pytest
+from PIL import Image
 
-from glitchygames.services.renderer_service import RendererService, RenderResult
+from glitchygames.services.renderer_service import (
+    RenderedFrame,
+    RendererService,
+    RenderResult,
+    _pack_shelves,
+)
 
 
 class TestRenderResult:
@@ -36,6 +44,19 @@ class TestRenderResult:
         assert result.png_bytes is None
         assert result.error == 'Sprite loading failed'
 
+    def test_all_frames_png_base64_is_deprecated(self):
+        """Test the old per-frame list is rebuilt from rendered_frames with a warning."""
+        result = RenderResult(
+            success=True,
+            rendered_frames=[
+                RenderedFrame(animation_index=0, frame_index=0, png_base64='QQ=='),
+                RenderedFrame(animation_index=0, frame_index=1, png_base64='Qg=='),
+            ],
+        )
+
+        with pytest.warns(DeprecationWarning, match='all_frames_png_base64'):
+            assert result.all_frames_png_base64 == ['QQ==', 'Qg==']
+
 
 class TestRendererService:
     """Test suite for RendererService."""
@@ -167,9 +188,34 @@ blue = 0
         # Animated sprites return successfully - the test verifies rendering works
         # The frame count depends on how the frame_manager tracks frames
         # For simple animations, even with render_all_frames=True, we may get
-        # all_frames_png_base64 populated only when frame_count > 1
+        # rendered_frames populated only when frame_count > 1
         assert result.png_base64 is not None
 
+    def test_render_from_toml_uses_shared_loader(self, sample_static_toml, mocker):
+        """Test that rendering loads the sprite through the same loader as the atlas."""
+        service = RendererService()
+        load_sprite = mocker.spy(RendererService, '_load_sprite')
+
+        result = service.render_from_toml(sample_static_toml)
+
+        assert result.success is True
+        load_sprite.assert_called_once_with(sample_static_toml)
+
+    def test_render_without_base64(self, sample_animated_toml, mocker):
+        """Test that raw-bytes rendering for frame bundles skips base64 entirely."""
+        service = RendererService()
+        b64encode = mocker.patch('glitchygames.services.renderer_service.base64.b64encode')
+
+        result = service.render_from_toml(
+            sample_animated_toml, render_all_frames=True, encode_base64=False
+        )
+
+        assert result.success is True
+        assert result.png_bytes is not None
+        assert result.png_base64 is None
+        assert all(frame.png_base64 is None for frame in result.rendered_frames)
+        b64encode.assert_not_called()
+
     def test_render_from_toml_invalid(self):
         """Test rendering with invalid TOML."""
         service = RendererService()
@@ -188,3 +234,136 @@ blue = 0
         assert result.success is False
         assert result.error is not None
         assert 'not found' in result.error.lower() or 'no such file' in result.error.lower()
+
+
+class TestRenderAtlas:
+    """Test suite for packed atlas rendering."""
+
+    @pytest.fixture
+    def repeating_toml(self):
+        """Provide an animated sprite TOML whose first and last frames are identical.
+
+        Returns:
+            object: The result.
+
+        """
+        frames = ['##\n#.', '..\n..', '##\n#.']
+        frame_tables = ''.join(
+            f"""
+[[animation.frame]]
+namespace = "blink"
+frame_index = {index}
+pixels = \"\"\"
+{pixels}
+\"\"\"
+"""
+            for index, pixels in enumerate(frames)
+        )
+        return f"""
+[sprite]
+name = "test_blink"
+
+[[animation]]
+namespace = "blink"
+frame_interval = 0.25
+loop = true
+{frame_tables}
+[colors."#"]
+red = 255
+green = 255
+blue = 255
+
+[colors."."]
+red = 0
+green = 0
+blue = 0
+"""
+
+    def test_identical_frames_share_a_rect(self, repeating_toml):
+        """Test that repeated frames are stored once and point at the same rect."""
+        result = RendererService().render_atlas_from_toml(repeating_toml)
+
+        assert result.success is True
+        assert len(result.frames) == 3
+        assert result.unique_frame_count == 2
+        first, second, third = result.frames
+        assert (first.x, first.y) == (third.x, third.y)
+        assert (first.x, first.y) != (second.x, second.y)
+        assert [frame.frame_index for frame in result.frames] == [0, 1, 2]
+        assert {frame.animation for frame in result.frames} == {'blink'}
+
+    def test_atlas_png_holds_frame_pixels(self, repeating_toml):
+        """Test that the atlas PNG decodes to the frame pixels at the manifest rects."""
+        result = RendererService().render_atlas_from_toml(repeating_toml, scale=3)
+
+        assert result.png_bytes is not None
+        atlas = Image.open(io.BytesIO(result.png_bytes)).convert('RGBA')
+        assert atlas.size == (result.width, result.height)
+        first, second, _ = result.frames
+        assert (first.width, first.height) == (6, 6)
+        assert atlas.getpixel((first.x, first.y)) == (255, 255, 255, 255)
+        assert atlas.getpixel((first.x + 5, first.y + 5)) == (0, 0, 0, 255)
+        assert atlas.getpixel((second.x, second.y)) == (0, 0, 0, 255)
+
+    def test_manifest_json(self, repeating_toml):
+        """Test that the manifest serializes the atlas size and every frame rect."""
+        result = RendererService().render_atlas_from_toml(repeating_toml)
+
+        manifest = json.loads(result.manifest_json())
+        assert manifest['width'] == result.width
+        assert manifest['height'] == result.height
+        assert manifest['scale'] == 1
+        assert manifest['frames'][1] == {
+            'animation': 'blink',
+            'animation_index': 0,
+            'frame_index': 1,
+            'x': result.frames[1].x,
+            'y': result.frames[1].y,
+            'width': 2,
+            'height': 2,
+            'duration': result.frames[1].duration,
+        }
+
+    def test_render_atlas_invalid_toml(self):
+        """Test that invalid TOML produces a failed result."""
+        result = RendererService().render_atlas_from_toml('invalid { toml content')
+
+        assert result.success is False
+        assert result.error is not None
+
+    def test_render_atlas_from_file_not_found(self):
+        """Test rendering an atlas from a non-existent file."""
+        result = RendererService().render_atlas_from_file('/nonexistent/path/sprite.toml')
+
+        assert result.success is False
+        assert 'not found' in result.error.lower()
+
+
+class TestPackShelves:
+    """Test suite for the atlas shelf packer."""
+
+    def test_uniform_frames_form_a_grid(self):
+        """Test that equal-size frames pack into a near-square grid."""
+        positions, width, height = _pack_shelves([(16, 16)] * 5)
+
+        assert (width, height) == (48, 32)
+        assert positions == [(0, 0), (16, 0), (32, 0), (0, 16), (16, 16)]
+
+    def test_mixed_sizes_do_not_overlap(self):
+        """Test that differently sized rects stay inside the atlas without overlapping."""
+        sizes = [(4, 2), (8, 8), (3, 5), (8, 1)]
+
+        positions, width, height = _pack_shelves(sizes)
+
+        rects = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(positions, sizes, strict=True)]
+        for left, top, right, bottom in rects:
+            assert 0 <= left < right <= width
+            assert 0 <= top < bottom <= height
+        for index, first in enumerate(rects):
+            for second in rects[index + 1 :]:
+                assert (
+                    first[2] <= second[0]
+                    or second[2] <= first[0]
+                    or first[3] <= second[1]
+                    or second[3] <= first[1]
+                )
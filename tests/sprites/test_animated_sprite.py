@@ -29,6 +29,7 @@ from glitchygames.sprites.pixel_utils import (
     create_alpha_surface,
     create_indexed_surface,
     extract_pixel_colors,
+    index_pixel_colors,
     lookup_in_map,
     lookup_pixel_char,
     lookup_rgba_pixel_char,
@@ -1379,6 +1380,45 @@ class TestAnimatedSpriteUpdate:
         sprite._is_playing = True
         sprite.update(1.0)  # Should not raise
 
+    def test_update_skips_every_frame_dt_spans(self, animated_sprite, mocker):
+        """Test one update advances several frames when dt spans them."""
+        surface = pygame.Surface((SURFACE_SIZE, SURFACE_SIZE))
+        animated_sprite.add_animation('run', [SpriteFrame(surface, duration=0.1) for _ in range(4)])
+        animated_sprite.play('run')
+        animated_sprite.update(0.25)
+        assert animated_sprite.current_frame == 2
+        assert animated_sprite._frame_timer == pytest.approx(0.05)
+
+    def test_update_carries_leftover_time(self, animated_sprite):
+        """Test time past a frame's duration counts toward the next frame."""
+        animated_sprite.update(FRAME_DURATION_FAST + 0.1)
+        animated_sprite.update(FRAME_DURATION_FAST - 0.05)
+        assert animated_sprite.current_frame == 0
+
+    def test_update_wraps_whole_cycles_when_looping(self, animated_sprite):
+        """Test a dt of several whole cycles lands on the right frame."""
+        animated_sprite.update(FRAME_DURATION_FAST * 7 + 0.01)
+        assert animated_sprite.current_frame == 1
+        assert animated_sprite._frame_timer == pytest.approx(0.01)
+
+    def test_update_stops_within_one_call_when_not_looping(self, animated_sprite):
+        """Test a long dt finishes a non-looping animation on its last frame."""
+        animated_sprite.is_looping = False
+        animated_sprite.update(10.0)
+        assert animated_sprite.current_frame == 1
+        assert animated_sprite.is_playing is False
+        assert animated_sprite._frame_timer == 0.0
+
+    def test_update_with_zero_duration_frames_terminates(self, animated_sprite):
+        """Test zero-duration frames cannot make update spin forever."""
+        surface = pygame.Surface((SURFACE_SIZE, SURFACE_SIZE))
+        animated_sprite.add_animation(
+            'flash', [SpriteFrame(surface, duration=0.0) for _ in range(3)]
+        )
+        animated_sprite.play('flash')
+        animated_sprite.update(0.1)
+        assert 0 <= animated_sprite.current_frame < 3
+
 
 class TestAnimatedSpriteGetCurrentSurface:
     """Test AnimatedSprite._get_current_surface method."""
@@ -2254,6 +2294,98 @@ class TestAnimatedSpriteWriteTomlHelpers:
         assert not content
 
 
+class TestIndexPixelColors:
+    """Test index_pixel_colors."""
+
+    def test_colors_in_order_of_first_appearance(self):
+        """Test distinct colors keep first-appearance order and each pixel maps back."""
+        pixels = [(9, 9, 9), (1, 2, 3), (9, 9, 9), (0, 0, 0), (1, 2, 3)]
+
+        colors, inverse = index_pixel_colors(pixels)
+
+        assert colors == [(9, 9, 9), (1, 2, 3), (0, 0, 0)]
+        assert [colors[index] for index in inverse.tolist()] == pixels
+
+    def test_rgb_and_rgba_pixels_stay_distinct(self):
+        """Test a ragged pixel list keeps RGB and opaque RGBA tuples apart."""
+        pixels = [(1, 2, 3), (1, 2, 3, 255), (1, 2, 3)]
+
+        colors, inverse = index_pixel_colors(pixels)
+
+        assert colors == [(1, 2, 3), (1, 2, 3, 255)]
+        assert inverse.tolist() == [0, 1, 0]
+
+    def test_empty_pixels(self):
+        """Test an empty pixel list has no colors."""
+        colors, inverse = index_pixel_colors([])
+
+        assert colors == []
+        assert inverse.size == 0
+
+
+class TestAnimatedSpriteTomlSave:
+    """Test AnimatedSprite._save_toml output and atomic writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker):
+        """Set up pygame mocks for testing."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+
+    @staticmethod
+    def _make_sprite():
+        sprite = AnimatedSprite()
+        frames = []
+        for pixels in (
+            [(255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 255)],
+            [(0, 0, 255), (255, 0, 0), (255, 0, 0), (255, 0, 0)],
+        ):
+            frame = MockFactory.create_sprite_frame_mock()
+            frame.pixels = pixels
+            frame.get_pixel_data.return_value = pixels
+            frame.get_size.return_value = (2, 2)
+            frames.append(frame)
+        sprite._animations = {'blink': frames}
+        sprite.name = 'blinker'
+        return sprite
+
+    def test_glyph_rows_follow_pixels(self, tmp_path):
+        """Test each frame's rows use one glyph per distinct color."""
+        sprite = self._make_sprite()
+        path = tmp_path / 'blinker.toml'
+
+        sprite._save_toml(str(path))
+
+        content = path.read_text(encoding='utf-8')
+        color_map = sprite._build_toml_color_map()
+        red, blue, magenta = color_map[255, 0, 0], color_map[0, 0, 255], color_map[255, 0, 255, 255]
+        assert f'"""\n{red}{blue}\n{blue}{magenta}\n"""' in content
+        assert f'"""\n{blue}{red}\n{red}{red}\n"""' in content
+
+    def test_short_pixel_list_padded(self):
+        """Test missing pixels at the end of a frame are written as '.'."""
+        rows = AnimatedSprite._convert_pixels_to_toml_chars(
+            [(1, 1, 1)] * 3,
+            2,
+            2,
+            {(1, 1, 1): '#'},
+        )
+
+        assert rows == ['##', '#.']
+
+    def test_failed_save_keeps_existing_file(self, tmp_path, mocker):
+        """Test an error while writing leaves the previous file and no temp file."""
+        sprite = self._make_sprite()
+        path = tmp_path / 'blinker.toml'
+        path.write_text('previous contents', encoding='utf-8')
+        mocker.patch.object(AnimatedSprite, '_write_toml_colors', side_effect=OSError('disk full'))
+
+        with pytest.raises(OSError, match='disk full'):
+            sprite._save_toml(str(path))
+
+        assert path.read_text(encoding='utf-8') == 'previous contents'
+        assert [entry.name for entry in tmp_path.iterdir()] == ['blinker.toml']
+
+
 class TestConvertStaticSpriteInconsistentWidths:
     """Test AnimatedSprite._convert_static_sprite with inconsistent row widths."""
 
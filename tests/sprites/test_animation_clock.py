@@ -0,0 +1,225 @@
+"""Tests for the shared animation clock."""
+
+import gc
+
+import pygame
+import pytest
+
+from glitchygames.sprites import AnimatedSprite, AnimationClock, FrameSchedule, SpriteFrame
+from tests.mocks.test_mock_factory import MockFactory
+
+# Binary fractions keep the elapsed-time arithmetic exact
+FRAME_DURATION = 0.125
+FRAME_COUNT = 4
+
+# Kept before MockFactory replaces pygame.sprite.LayeredDirty with a mock
+LayeredDirty = pygame.sprite.LayeredDirty
+
+
+def _make_sprite(mocker, durations=(FRAME_DURATION,) * FRAME_COUNT, *, looping=True):
+    sprite = AnimatedSprite()
+    surface = pygame.Surface((4, 4))
+    sprite.add_animation('walk', [SpriteFrame(surface, duration=d) for d in durations])
+    sprite.set_animation('walk')
+    sprite.is_looping = looping
+    # The surface swap and frame dump use surfarray, which mock surfaces do not support
+    mocker.patch.object(sprite, '_update_surface_and_mark_dirty')
+    mocker.patch.object(sprite, '_debug_frame_info')
+    sprite.play()
+    return sprite
+
+
+class TestFrameSchedule:
+    """Test frame lookup by elapsed time."""
+
+    def test_frame_at_finds_the_frame_containing_the_time(self):
+        schedule = FrameSchedule([0.1, 0.2, 0.3])
+
+        assert schedule.frame_at(0.0, looping=True) == (0, False)
+        assert schedule.frame_at(0.15, looping=True) == (1, False)
+        assert schedule.frame_at(0.45, looping=True) == (2, False)
+
+    def test_frame_at_wraps_when_looping(self):
+        schedule = FrameSchedule([0.1, 0.2, 0.3])
+
+        assert schedule.frame_at(0.6 * 3 + 0.15, looping=True) == (1, False)
+
+    def test_frame_at_finishes_when_not_looping(self):
+        schedule = FrameSchedule([0.1, 0.2])
+
+        assert schedule.frame_at(5.0, looping=False) == (1, True)
+
+    def test_start_of(self):
+        schedule = FrameSchedule([0.1, 0.2, 0.3])
+
+        assert schedule.start_of(0) == 0.0
+        assert schedule.start_of(2) == pytest.approx(0.3)
+
+
+class TestAnimationClock:
+    """Test driving AnimatedSprites from one timeline."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker):
+        """Set up pygame mocks for testing."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+
+    def test_tick_skips_every_frame_dt_spans(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+
+        clock.tick(FRAME_DURATION * 2.5)
+
+        assert sprite.current_frame == 2
+
+    def test_attached_sprites_ignore_update(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+
+        sprite.update(FRAME_DURATION * 2.5)
+
+        assert sprite.current_frame == 0
+
+    def test_sprites_started_together_stay_in_step(self, mocker):
+        clock = AnimationClock()
+        sprites = [_make_sprite(mocker) for _ in range(3)]
+        for sprite in sprites:
+            clock.add(sprite)
+
+        for _ in range(7):
+            clock.tick(0.033)
+
+        assert {sprite.current_frame for sprite in sprites} == {1}
+
+    def test_sprites_with_equal_durations_share_a_schedule(self, mocker):
+        clock = AnimationClock()
+        first, second = _make_sprite(mocker), _make_sprite(mocker)
+
+        assert clock.schedule_for(
+            frame.duration for frame in first.animation_data['walk']
+        ) is clock.schedule_for(frame.duration for frame in second.animation_data['walk'])
+
+    def test_play_restarts_the_sprite_at_the_current_clock_time(self, mocker):
+        clock = AnimationClock()
+        early, late = _make_sprite(mocker), _make_sprite(mocker)
+        clock.add(early)
+        clock.tick(FRAME_DURATION * 2.5)
+        clock.add(late)
+        late.stop()
+        late.play()
+
+        clock.tick(FRAME_DURATION)
+
+        assert early.current_frame == 3
+        assert late.current_frame == 1
+
+    def test_set_frame_repins_the_sprite(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+        clock.tick(FRAME_DURATION * 0.5)
+
+        sprite.set_frame(3)
+        clock.tick(FRAME_DURATION * 0.9)
+
+        assert sprite.current_frame == 3
+
+    def test_non_looping_sprite_stops_on_its_last_frame(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker, looping=False)
+        clock.add(sprite)
+
+        clock.tick(10.0)
+
+        assert sprite.current_frame == FRAME_COUNT - 1
+        assert sprite.is_playing is False
+
+    def test_paused_sprite_holds_its_frame(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+        clock.tick(FRAME_DURATION * 1.5)
+
+        sprite.pause()
+        clock.tick(FRAME_DURATION * 2)
+
+        assert sprite.current_frame == 1
+
+    def test_replaced_frames_are_picked_up(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+        surface = pygame.Surface((4, 4))
+        sprite.add_animation('walk', [SpriteFrame(surface, duration=1.0) for _ in range(2)])
+
+        clock.tick(FRAME_DURATION * 2.5)
+
+        assert sprite.current_frame == 0
+
+    def test_remove_hands_the_frame_time_back_to_the_sprite(self, mocker):
+        clock = AnimationClock()
+        sprite = _make_sprite(mocker)
+        clock.add(sprite)
+        clock.tick(FRAME_DURATION * 1.5)
+
+        clock.remove(sprite)
+        sprite.update(FRAME_DURATION * 0.6)
+
+        assert sprite not in clock
+        assert sprite.current_frame == 2
+
+    def test_dropped_sprites_are_detached(self):
+        clock = AnimationClock()
+        clock.add(AnimatedSprite())
+
+        gc.collect()
+
+        assert len(clock) == 0
+
+
+class TestDrivenGroup:
+    """Test attaching AnimatedSprites through the groups a clock drives."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker):
+        """Set up pygame mocks for testing."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+
+    def test_sprites_in_the_group_are_attached(self, mocker):
+        clock = AnimationClock()
+        group = LayeredDirty()
+        existing = _make_sprite(mocker)
+        group.add(existing)
+
+        clock.drive_group(group)
+        joined = _make_sprite(mocker)
+        group.add(joined)
+
+        assert existing in clock
+        assert joined in clock
+        assert AnimationClock.for_group(group) is clock
+
+    def test_sprites_created_in_the_group_are_attached(self):
+        clock = AnimationClock()
+        group = LayeredDirty()
+        clock.drive_group(group)
+
+        sprite = AnimatedSprite(groups=group)
+
+        assert sprite in clock
+
+    def test_leaving_the_group_detaches(self, mocker):
+        clock = AnimationClock()
+        group = LayeredDirty()
+        clock.drive_group(group)
+        removed, killed = _make_sprite(mocker), _make_sprite(mocker)
+        group.add(removed, killed)
+
+        group.remove(removed)
+        killed.kill()
+
+        assert removed not in clock
+        assert killed not in clock
+        assert len(clock) == 0
@@ -279,14 +279,16 @@ class TestAnimatedSprite:
         assert sprite.name == 'idle'
         assert sprite.current_animation is not None
 
-    def test_animated_sprite_save_load_functionality(self, mocker):
+    def test_animated_sprite_save_load_functionality(self, tmp_path):
         """Test save and load functionality."""
         sprite = AnimatedSprite(filename=STATIC_TOML)
 
         # Test save functionality
-        mock_open = mocker.patch('pathlib.Path.open')
-        sprite.save('test.toml')
-        mock_open.assert_called_once()
+        saved_path = tmp_path / 'test.toml'
+        sprite.save(str(saved_path))
+        assert [path.name for path in tmp_path.iterdir()] == ['test.toml']
+        reloaded = AnimatedSprite(filename=str(saved_path))
+        assert reloaded.get_current_frame().get_size() == sprite.get_current_frame().get_size()
 
     def test_animated_sprite_file_format_detection(self):
         """Test file format detection."""
@@ -2399,3 +2399,28 @@ class TestBitmappySpriteGeneratePixelRowsWithColorMap:
         # Rows should use 'R' and 'G' characters
         assert 'R' in rows[0]
         assert 'G' in rows[0]
+
+
+class TestSpriteInterpolatedMembership:
+    """Test that interpolated sprites report group membership changes."""
+
+    def test_joining_and_leaving_a_group_bumps_the_version(self):
+        class Interpolated(Sprite):
+            INTERPOLATE = True
+
+        sprite = Interpolated(0, 0, 4, 4)
+        group = pygame.sprite.LayeredDirty()
+        version = Sprite.interpolated_membership_version
+
+        group.add(sprite)
+        assert Sprite.interpolated_membership_version == version + 1
+        sprite.kill()
+        assert Sprite.interpolated_membership_version == version + 2
+
+    def test_other_sprites_leave_the_version_alone(self):
+        sprite = Sprite(0, 0, 4, 4)
+        version = Sprite.interpolated_membership_version
+
+        pygame.sprite.LayeredDirty().add(sprite)
+
+        assert Sprite.interpolated_membership_version == version
@@ -0,0 +1,64 @@
+"""Tests for dirty-sprite update scheduling."""
+
+import gc
+
+import pygame
+
+from glitchygames.sprites import Sprite
+from glitchygames.sprites.scheduler import UpdateScheduler, update_scheduler
+
+
+class TestUpdateScheduler:
+    """Test the UpdateScheduler bookkeeping."""
+
+    def test_drain_returns_group_members_in_scheduling_order(self):
+        scheduler = UpdateScheduler()
+        group = pygame.sprite.LayeredDirty()
+        first, second = pygame.sprite.DirtySprite(), pygame.sprite.DirtySprite()
+        group.add(first, second)
+
+        scheduler.schedule(second)
+        scheduler.schedule(first)
+
+        assert scheduler.drain(group) == [second, first]
+        assert len(scheduler) == 0
+
+    def test_drain_drops_sprites_outside_the_group(self):
+        scheduler = UpdateScheduler()
+        group = pygame.sprite.LayeredDirty()
+        outsider = pygame.sprite.DirtySprite()
+
+        scheduler.schedule(outsider)
+
+        assert scheduler.drain(group) == []
+        assert outsider not in scheduler
+
+    def test_dropped_sprites_are_unscheduled(self):
+        scheduler = UpdateScheduler()
+        scheduler.schedule_all([pygame.sprite.DirtySprite()])
+
+        gc.collect()
+
+        assert len(scheduler) == 0
+
+
+class TestRootSpriteScheduling:
+    """Test that RootSprite schedules itself when it becomes dirty."""
+
+    def test_becoming_dirty_schedules_the_sprite(self):
+        sprite = Sprite(x=0, y=0, width=4, height=4)
+        sprite.dirty = 0
+        update_scheduler.clear()
+
+        sprite.dirty = 1
+
+        assert sprite in update_scheduler
+        assert sprite.dirty == 1
+
+    def test_clean_sprite_is_not_scheduled(self):
+        sprite = Sprite(x=0, y=0, width=4, height=4)
+        update_scheduler.clear()
+
+        sprite.dirty = 0
+
+        assert sprite not in update_scheduler
@@ -0,0 +1,51 @@
+"""Tests for crash-safe file replacement."""
+
+import os
+import stat
+
+import pytest
+
+from glitchygames.atomic_io import atomic_text_file
+
+
+class TestAtomicTextFile:
+    """Test writing through a temporary file."""
+
+    def test_contents_are_synced_before_the_rename(self, tmp_path, mocker):
+        path = tmp_path / 'entry.json'
+        path.write_text('old', encoding='utf-8')
+        fsync = mocker.spy(os, 'fsync')
+
+        with atomic_text_file(path) as temp_file:
+            temp_file.write('new')
+            assert path.read_text(encoding='utf-8') == 'old'
+
+        fsync.assert_called_once()
+        assert path.read_text(encoding='utf-8') == 'new'
+        assert [entry.name for entry in tmp_path.iterdir()] == ['entry.json']
+
+    def test_failed_write_keeps_the_old_file(self, tmp_path):
+        path = tmp_path / 'entry.json'
+        path.write_text('old', encoding='utf-8')
+
+        def write_partially():
+            with atomic_text_file(path) as temp_file:
+                temp_file.write('partial')
+                message = 'disk full'
+                raise OSError(message)
+
+        with pytest.raises(OSError, match='disk full'):
+            write_partially()
+
+        assert path.read_text(encoding='utf-8') == 'old'
+        assert [entry.name for entry in tmp_path.iterdir()] == ['entry.json']
+
+    def test_existing_permissions_are_kept(self, tmp_path):
+        path = tmp_path / 'entry.json'
+        path.write_text('old', encoding='utf-8')
+        path.chmod(0o640)
+
+        with atomic_text_file(str(path)) as temp_file:
+            temp_file.write('new')
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
@@ -851,12 +851,12 @@ class TestUpdate:
         canvas.update()
         mock_renderer.force_redraw.assert_called()
 
-    def test_update_clears_dirty_flag(self, mocker):
-        """Test update clears dirty flag after redraw."""
+    def test_update_leaves_dirty_flag_for_draw(self, mocker):
+        """Test update keeps the dirty flag so the redrawn image gets blitted."""
         canvas, _ = _make_canvas(mocker)
         canvas.dirty = 1
         canvas.update()
-        assert canvas.dirty == 0
+        assert canvas.dirty == 1
 
     def test_update_does_nothing_when_clean(self, mocker):
         """Test update does not call force_redraw when clean."""
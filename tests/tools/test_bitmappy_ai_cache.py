@@ -0,0 +1,232 @@
+"""Tests for the Bitmappy AI response cache and request coalescing."""
+
+from queue import Empty
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from glitchygames.bitmappy.ai_cache import AIResponseCache, make_cache_key
+from glitchygames.bitmappy.ai_manager import AIManager
+from glitchygames.bitmappy.ai_worker import _process_ai_request_cached, run_ai_worker
+from glitchygames.bitmappy.models import AIRequest, AIRequestPriority, AIResponse
+
+MESSAGES = [{'role': 'user', 'content': 'a red ball'}]
+EXAMPLES = [{'name': 'ball', 'sprite_type': 'static', 'pixels': '..'}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache rooted in a temporary directory.
+
+    Returns:
+        AIResponseCache: An empty cache.
+
+    """
+    return AIResponseCache(tmp_path / 'ai_cache')
+
+
+@pytest.fixture
+def ai_manager(mocker, cache):
+    """Create an AIManager with a mocked editor and request queue.
+
+    Returns:
+        AIManager: A manager whose sprite loading is stubbed out.
+
+    """
+    manager = AIManager.__new__(AIManager)
+    manager.editor = mocker.Mock()
+    manager.log = mocker.Mock()
+    manager.pending_ai_requests = {}
+    manager.ai_request_queue = mocker.Mock()
+    manager.ai_response_queue = None
+    manager.ai_processes = []
+    manager.ai_background_queue = None
+    manager.ai_control_queues = []
+    manager.outstanding_requests = {}
+    manager.cancelled_requests = set()
+    manager.pool_size = 1
+    manager.last_successful_sprite_content = None
+    manager.last_conversation_history = None
+    manager.response_cache = cache
+    manager.in_flight_requests = {}
+    manager.coalesced_requests = {}
+    mocker.patch.object(manager, '_load_ai_sprite')
+    mocker.patch(
+        'glitchygames.bitmappy.ai_manager.validate_ai_response',
+        return_value=(True, ''),
+    )
+    return manager
+
+
+class TestMakeCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_is_deterministic(self):
+        assert make_cache_key('m', MESSAGES, EXAMPLES) == make_cache_key('m', MESSAGES, EXAMPLES)
+
+    def test_key_depends_on_model(self):
+        assert make_cache_key('a', MESSAGES, EXAMPLES) != make_cache_key('b', MESSAGES, EXAMPLES)
+
+    def test_key_depends_on_messages(self):
+        other = [{'role': 'user', 'content': 'a blue ball'}]
+        assert make_cache_key('m', MESSAGES, EXAMPLES) != make_cache_key('m', other, EXAMPLES)
+
+    def test_key_depends_on_training_examples(self):
+        assert make_cache_key('m', MESSAGES, EXAMPLES) != make_cache_key('m', MESSAGES, [])
+
+    def test_dict_ordering_does_not_matter(self):
+        reordered = [{'content': 'a red ball', 'role': 'user'}]
+        assert make_cache_key('m', MESSAGES) == make_cache_key('m', reordered)
+
+
+class TestAIResponseCache:
+    """Test the on-disk response store."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get('deadbeef') is None
+        assert cache.misses == 1
+
+    def test_put_then_get_round_trips(self, cache):
+        assert cache.put('abc123', AIResponse(content='[sprite]'), model='m')
+        response = cache.get('abc123')
+        assert response is not None
+        assert response.content == '[sprite]'
+        assert cache.hits == 1
+        assert 'abc123' in cache
+
+    def test_persists_across_instances(self, cache):
+        cache.put('abc123', AIResponse(content='[sprite]'))
+        reopened = AIResponseCache(cache.cache_dir)
+        response = reopened.get('abc123')
+        assert response is not None
+        assert response.content == '[sprite]'
+
+    def test_error_responses_are_not_cached(self, cache):
+        assert not cache.put('abc123', AIResponse(content=None, error='boom'))
+        assert not cache.put('abc123', AIResponse(content='AI features not available'))
+        assert 'abc123' not in cache
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        cache.put('abc123', AIResponse(content='[sprite]'))
+        cache._entry_path('abc123').write_text('{not json', encoding='utf-8')
+        assert cache.get('abc123') is None
+        assert 'abc123' not in cache
+
+    def test_discard_removes_entry(self, cache):
+        cache.put('abc123', AIResponse(content='[sprite]'))
+        cache.discard('abc123')
+        assert 'abc123' not in cache
+
+
+class TestWorkerCache:
+    """Test cache integration in the AI worker."""
+
+    def test_cache_hit_skips_model(self, mocker, cache):
+        cache.put('key1', AIResponse(content='[sprite]'))
+        process = mocker.patch('glitchygames.bitmappy.ai_worker._process_ai_request')
+        request = AIRequest(prompt='p', request_id='r1', messages=MESSAGES, cache_key='key1')
+
+        response = _process_ai_request_cached(request, None, mocker.Mock(), cache)
+
+        assert response.content == '[sprite]'
+        process.assert_not_called()
+
+    def test_cache_miss_stores_response(self, mocker, cache):
+        mocker.patch(
+            'glitchygames.bitmappy.ai_worker._process_ai_request',
+            return_value=AIResponse(content='[sprite]'),
+        )
+        request = AIRequest(prompt='p', request_id='r1', messages=MESSAGES, cache_key='key1')
+
+        _process_ai_request_cached(request, MagicMock(), mocker.Mock(), cache)
+
+        assert 'key1' in cache
+
+    def test_run_ai_worker_serves_from_cache_dir(self, mocker, cache):
+        cache.put('key1', AIResponse(content='[sprite]'))
+        mocker.patch('glitchygames.bitmappy.ai_worker._setup_ai_worker_logging')
+        mocker.patch('glitchygames.bitmappy.ai_worker._initialize_ai_client')
+        process = mocker.patch('glitchygames.bitmappy.ai_worker._process_ai_request')
+        request_queue = MagicMock()
+        response_queue = MagicMock()
+        request = AIRequest(prompt='p', request_id='r1', messages=MESSAGES, cache_key='key1')
+        request_queue.get.side_effect = [request, None]
+
+        run_ai_worker(request_queue, response_queue, cache.cache_dir)
+
+        process.assert_not_called()
+        request_id, response = response_queue.put.call_args[0][0]
+        assert request_id == 'r1'
+        assert response.content == '[sprite]'
+
+
+class TestAIManagerCaching:
+    """Test cache hits and request coalescing in AIManager."""
+
+    def test_cache_hit_does_not_enqueue(self, ai_manager, cache, mocker):
+        mocker.patch('glitchygames.bitmappy.ai_manager.AI_MODEL', 'm')
+        cache.put(make_cache_key('m', MESSAGES, EXAMPLES), AIResponse(content='[sprite]'))
+
+        ai_manager._submit_ai_request('a red ball', MESSAGES, EXAMPLES, None, None)
+
+        ai_manager.ai_request_queue.put.assert_not_called()
+        ai_manager._load_ai_sprite.assert_called_once()
+        assert ai_manager._load_ai_sprite.call_args[0][1] == '[sprite]'
+
+    def test_identical_in_flight_requests_are_coalesced(self, ai_manager, mocker):
+        mocker.patch(
+            'glitchygames.bitmappy.ai_manager.uuid.uuid4',
+            side_effect=[SimpleNamespace(hex='1.0'), SimpleNamespace(hex='2.0')],
+        )
+
+        ai_manager._submit_ai_request('a red ball', MESSAGES, EXAMPLES, None, None)
+        ai_manager._submit_ai_request('a red ball', MESSAGES, EXAMPLES, None, None)
+
+        ai_manager.ai_request_queue.put.assert_called_once()
+        assert ai_manager.coalesced_requests == {'1.0': ['2.0']}
+
+    def test_coalesced_requests_receive_leader_response(self, ai_manager, mocker):
+        mocker.patch(
+            'glitchygames.bitmappy.ai_manager.uuid.uuid4',
+            side_effect=[SimpleNamespace(hex='1.0'), SimpleNamespace(hex='2.0')],
+        )
+        ai_manager._submit_ai_request('a red ball', MESSAGES, EXAMPLES, None, None)
+        ai_manager._submit_ai_request('a red ball', MESSAGES, EXAMPLES, None, None)
+        response_queue = MagicMock()
+        response_queue.get_nowait.side_effect = [('1.0', AIResponse(content='[sprite]')), Empty()]
+        ai_manager.ai_response_queue = response_queue
+
+        ai_manager.check_responses()
+
+        loaded_ids = [call.args[0] for call in ai_manager._load_ai_sprite.call_args_list]
+        assert loaded_ids == ['1.0', '2.0']
+        assert not ai_manager.in_flight_requests
+        assert not ai_manager.coalesced_requests
+        assert not ai_manager.pending_ai_requests
+
+    def test_invalid_response_is_evicted_from_cache(self, ai_manager, cache, mocker):
+        mocker.patch(
+            'glitchygames.bitmappy.ai_manager.validate_ai_response',
+            return_value=(False, 'Missing [sprite] section'),
+        )
+        mocker.patch(
+            'glitchygames.bitmappy.ai_manager.build_sprite_generation_messages',
+            return_value=MESSAGES,
+        )
+        key = make_cache_key('m', MESSAGES, EXAMPLES)
+        cache.put(key, AIResponse(content='garbage'))
+        ai_manager.pending_ai_requests['r1'] = mocker.Mock(
+            cache_key=key,
+            retry_count=0,
+            original_prompt='a red ball',
+            training_examples=EXAMPLES,
+            priority=AIRequestPriority.INTERACTIVE,
+        )
+
+        ai_manager._process_ai_response('r1', AIResponse(content='garbage'))
+
+        assert key not in cache
+        retry_request = ai_manager.ai_request_queue.put.call_args[0][0]
+        assert retry_request.request_id == 'r1'
+        assert retry_request.cache_key is not None
@@ -0,0 +1,269 @@
+"""Tests for the Bitmappy AI worker pool, priority lanes, and cancellation."""
+
+from queue import Empty
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from glitchygames.bitmappy.ai_manager import AIManager
+from glitchygames.bitmappy.ai_worker import (
+    _drain_cancellations,
+    _next_ai_request,
+    run_ai_worker,
+)
+from glitchygames.bitmappy.constants import (
+    AI_CONTROL_CANCEL,
+    AI_CONTROL_FORGET,
+    AI_REQUEST_CANCELLED,
+)
+from glitchygames.bitmappy.models import AIRequest, AIRequestPriority, AIResponse
+
+MESSAGES = [{'role': 'user', 'content': 'a red ball'}]
+OTHER_MESSAGES = [{'role': 'user', 'content': 'a blue ball'}]
+
+
+@pytest.fixture
+def ai_manager(mocker):
+    """Create an AIManager with mocked queues and no response cache.
+
+    Returns:
+        AIManager: A manager whose sprite loading is stubbed out.
+
+    """
+    manager = AIManager.__new__(AIManager)
+    manager.editor = mocker.Mock()
+    manager.log = mocker.Mock()
+    manager.pending_ai_requests = {}
+    manager.ai_request_queue = mocker.Mock()
+    manager.ai_background_queue = mocker.Mock()
+    manager.ai_response_queue = None
+    manager.ai_control_queues = [mocker.Mock(), mocker.Mock()]
+    manager.ai_processes = []
+    manager.pool_size = 2
+    manager.outstanding_requests = {}
+    manager.cancelled_requests = set()
+    manager.last_successful_sprite_content = None
+    manager.last_conversation_history = None
+    manager.response_cache = None
+    manager.in_flight_requests = {}
+    manager.coalesced_requests = {}
+    mocker.patch.object(manager, '_load_ai_sprite')
+    mocker.patch(
+        'glitchygames.bitmappy.ai_manager.validate_ai_response',
+        return_value=(True, ''),
+    )
+    mocker.patch(
+        'glitchygames.bitmappy.ai_manager.uuid.uuid4',
+        side_effect=[SimpleNamespace(hex=request_id) for request_id in ('1.0', '2.0', '3.0')],
+    )
+    return manager
+
+
+def _response_queue(*items):
+    """Build a mock response queue that yields items and then reports empty.
+
+    Returns:
+        MagicMock: A queue whose get_nowait() returns each item in turn.
+
+    """
+    queue = MagicMock()
+    queue.get_nowait.side_effect = [*items, Empty()]
+    return queue
+
+
+class TestWorkerLanes:
+    """Test request selection and cancellation inside the worker."""
+
+    def test_interactive_only_worker_blocks_on_request_queue(self):
+        request_queue = MagicMock()
+        request_queue.get.return_value = 'interactive'
+
+        assert _next_ai_request(request_queue, None) == 'interactive'
+        request_queue.get.assert_called_once_with()
+
+    def test_interactive_lane_is_preferred(self):
+        request_queue = MagicMock()
+        background_queue = MagicMock()
+        request_queue.get.return_value = 'interactive'
+
+        assert _next_ai_request(request_queue, background_queue) == 'interactive'
+        background_queue.get_nowait.assert_not_called()
+
+    def test_background_lane_is_used_when_interactive_is_idle(self):
+        request_queue = MagicMock()
+        background_queue = MagicMock()
+        request_queue.get.side_effect = Empty()
+        background_queue.get_nowait.return_value = 'background'
+
+        assert _next_ai_request(request_queue, background_queue) == 'background'
+
+    def test_cancelled_request_is_skipped(self, mocker):
+        mocker.patch('glitchygames.bitmappy.ai_worker._setup_ai_worker_logging')
+        mocker.patch('glitchygames.bitmappy.ai_worker._initialize_ai_client')
+        process = mocker.patch(
+            'glitchygames.bitmappy.ai_worker._process_ai_request',
+            return_value=AIResponse(content='[sprite]'),
+        )
+        request_queue = MagicMock()
+        response_queue = MagicMock()
+        control_queue = MagicMock()
+        request_queue.get.side_effect = [
+            AIRequest(prompt='p', request_id='r1', messages=MESSAGES),
+            AIRequest(prompt='p', request_id='r2', messages=MESSAGES),
+            None,
+        ]
+        control_queue.get_nowait.side_effect = [(AI_CONTROL_CANCEL, 'r1'), Empty(), Empty()]
+
+        run_ai_worker(request_queue, response_queue, control_queue=control_queue)
+
+        process.assert_called_once()
+        responses = [call.args[0] for call in response_queue.put.call_args_list]
+        assert responses[0][0] == 'r1'
+        assert responses[0][1].error == AI_REQUEST_CANCELLED
+        assert responses[1][0] == 'r2'
+        assert responses[1][1].content == '[sprite]'
+
+    def test_forget_notice_clears_a_cancellation(self):
+        control_queue = MagicMock()
+        control_queue.get_nowait.side_effect = [
+            (AI_CONTROL_CANCEL, 'r1'),
+            (AI_CONTROL_CANCEL, 'r2'),
+            (AI_CONTROL_FORGET, 'r1'),
+            Empty(),
+        ]
+        cancelled = set()
+
+        _drain_cancellations(control_queue, cancelled)
+
+        assert cancelled == {'r2'}
+
+    def test_cancellation_is_kept_until_forgotten(self, mocker):
+        """A worker that never saw the request still skips it until told to forget."""
+        mocker.patch('glitchygames.bitmappy.ai_worker._setup_ai_worker_logging')
+        mocker.patch('glitchygames.bitmappy.ai_worker._initialize_ai_client')
+        process = mocker.patch(
+            'glitchygames.bitmappy.ai_worker._process_ai_request',
+            return_value=AIResponse(content='[sprite]'),
+        )
+        request_queue = MagicMock()
+        control_queue = MagicMock()
+        request_queue.get.side_effect = [
+            AIRequest(prompt='p', request_id='r1', messages=MESSAGES),
+            AIRequest(prompt='p', request_id='r1', messages=MESSAGES),
+            AIRequest(prompt='p', request_id='r1', messages=MESSAGES),
+            None,
+        ]
+        control_queue.get_nowait.side_effect = [
+            (AI_CONTROL_CANCEL, 'r1'),
+            Empty(),
+            Empty(),
+            (AI_CONTROL_FORGET, 'r1'),
+            Empty(),
+        ]
+
+        run_ai_worker(request_queue, MagicMock(), control_queue=control_queue)
+
+        process.assert_called_once()
+
+
+class TestAIManagerPool:
+    """Test priority lanes, superseding, and queue depth in AIManager."""
+
+    def test_interactive_request_uses_interactive_lane(self, ai_manager):
+        ai_manager._submit_ai_request('a red ball', MESSAGES, [], None, None)
+
+        ai_manager.ai_request_queue.put.assert_called_once()
+        ai_manager.ai_background_queue.put.assert_not_called()
+        assert ai_manager.get_queue_depth() == {'interactive': 1, 'background': 0}
+
+    def test_background_request_uses_background_lane(self, ai_manager):
+        ai_manager._submit_ai_request(
+            'a red ball', MESSAGES, [], None, None, priority=AIRequestPriority.BACKGROUND
+        )
+
+        ai_manager.ai_background_queue.put.assert_called_once()
+        ai_manager.ai_request_queue.put.assert_not_called()
+        assert ai_manager.get_queue_depth() == {'interactive': 0, 'background': 1}
+
+    def test_new_prompt_cancels_superseded_request(self, ai_manager):
+        ai_manager._submit_ai_request('a red ball', MESSAGES, [], None, None)
+        ai_manager._submit_ai_request('a blue ball', OTHER_MESSAGES, [], None, None)
+
+        assert ai_manager.cancelled_requests == {'1.0'}
+        assert list(ai_manager.pending_ai_requests) == ['2.0']
+        for control_queue in ai_manager.ai_control_queues:
+            control_queue.put.assert_called_once_with((AI_CONTROL_CANCEL, '1.0'))
+
+    def test_new_prompt_does_not_cancel_background_work(self, ai_manager):
+        ai_manager._submit_ai_request(
+            'a red ball', MESSAGES, [], None, None, priority=AIRequestPriority.BACKGROUND
+        )
+        ai_manager._submit_ai_request('a blue ball', OTHER_MESSAGES, [], None, None)
+
+        assert not ai_manager.cancelled_requests
+        assert set(ai_manager.pending_ai_requests) == {'1.0', '2.0'}
+
+    def test_interactive_request_is_not_coalesced_onto_background(self, ai_manager):
+        ai_manager._submit_ai_request(
+            'a red ball', MESSAGES, [], None, None, priority=AIRequestPriority.BACKGROUND
+        )
+        ai_manager._submit_ai_request('a red ball', MESSAGES, [], None, None)
+
+        ai_manager.ai_request_queue.put.assert_called_once()
+        assert not ai_manager.coalesced_requests
+
+    def test_cancelled_response_is_discarded(self, ai_manager):
+        ai_manager._submit_ai_request('a red ball', MESSAGES, [], None, None)
+        ai_manager._submit_ai_request('a blue ball', OTHER_MESSAGES, [], None, None)
+        ai_manager.ai_response_queue = _response_queue(
+            ('1.0', AIResponse(content='[sprite] old')),
+            ('2.0', AIResponse(content='[sprite] new')),
+        )
+
+        ai_manager.check_responses()
+
+        ai_manager._load_ai_sprite.assert_called_once_with('2.0', '[sprite] new')
+        assert not ai_manager.cancelled_requests
+        for control_queue in ai_manager.ai_control_queues:
+            assert control_queue.put.call_args_list[-1].args == ((AI_CONTROL_FORGET, '1.0'),)
+        assert ai_manager.get_queue_depth() == {'interactive': 0, 'background': 0}
+
+    def test_background_response_does_not_load_sprite(self, ai_manager):
+        ai_manager._submit_ai_request(
+            'a red ball', MESSAGES, [], None, None, priority=AIRequestPriority.BACKGROUND
+        )
+        ai_manager.ai_response_queue = _response_queue(('1.0', AIResponse(content='[sprite]')))
+
+        ai_manager.check_responses()
+
+        ai_manager._load_ai_sprite.assert_not_called()
+        assert not ai_manager.pending_ai_requests
+
+    def test_prefetch_prompts_are_queued_on_the_background_lane(self, ai_manager, tmp_path):
+        prompts = tmp_path / 'prompts.txt'
+        prompts.write_text('a red ball\n\n# not a prompt\n  a blue ball  \n', encoding='utf-8')
+        submit = MagicMock()
+        ai_manager.submit_background_request = submit
+
+        ai_manager.prefetch_prompts(prompts)
+
+        assert [call.args for call in submit.call_args_list] == [('a red ball',), ('a blue ball',)]
+
+    def test_missing_prefetch_file_is_logged(self, ai_manager, tmp_path):
+        submit = MagicMock()
+        ai_manager.submit_background_request = submit
+
+        ai_manager.prefetch_prompts(tmp_path / 'missing.txt')
+
+        submit.assert_not_called()
+        ai_manager.log.exception.assert_called_once()
+
+    def test_zero_pool_size_starts_no_workers(self, mocker):
+        process = mocker.patch('glitchygames.bitmappy.ai_manager.multiprocessing.Process')
+        manager = AIManager(mocker.Mock(), pool_size=0)
+
+        manager.setup()
+
+        process.assert_not_called()
+        assert manager.ai_request_queue is None
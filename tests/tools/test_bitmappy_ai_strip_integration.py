@@ -41,9 +41,17 @@ class TestAISStripIntegration:
         ai_manager.pending_ai_requests = {}
         ai_manager.ai_request_queue = None
         ai_manager.ai_response_queue = None
-        ai_manager.ai_process = None
+        ai_manager.ai_processes = []
+        ai_manager.ai_background_queue = None
+        ai_manager.ai_control_queues = []
+        ai_manager.outstanding_requests = {}
+        ai_manager.cancelled_requests = set()
+        ai_manager.pool_size = 1
         ai_manager.last_successful_sprite_content = None
         ai_manager.last_conversation_history = None
+        ai_manager.response_cache = None
+        ai_manager.in_flight_requests = {}
+        ai_manager.coalesced_requests = {}
         scene._ai_integration = ai_manager  # type: ignore[attr-defined]
 
     def test_save_current_strip_to_temp_toml(self, mocker):
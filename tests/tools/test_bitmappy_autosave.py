@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Tests for the Bitmappy crash-recovery journal and autosave manager."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from glitchygames.bitmappy.autosave import AutosaveManager
+from glitchygames.bitmappy.history import (
+    BrushStrokeCommand,
+    EditJournal,
+    FloodFillCommand,
+    FrameAddCommand,
+    FrameReorderCommand,
+    FrameSelectionCommand,
+    UndoRedoManager,
+    apply_record,
+    command_record,
+    recover_document,
+)
+from glitchygames.bitmappy.history.journal import JOURNAL_FILENAME, SNAPSHOT_FILENAME
+from glitchygames.bitmappy.history.undo_redo import OperationType
+
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+
+
+def _document(width=2, height=2, frames=1):
+    return {
+        'width': width,
+        'height': height,
+        'animations': {
+            'idle': [
+                {'duration': 0.5, 'pixels': [BLACK] * (width * height)} for _ in range(frames)
+            ],
+        },
+    }
+
+
+def _frame_data(color):
+    return {'duration': 0.25, 'pixels': [color] * 4, 'width': 2, 'height': 2}
+
+
+def _stroke(x, y, old, new):
+    return BrushStrokeCommand(None, [(x, y, old, new)], OperationType.CANVAS_PIXEL_CHANGE)
+
+
+def _pixels(document, frame=0):
+    """Get a frame's pixels as tuples, however the document was decoded.
+
+    Returns:
+        list: The frame's colors.
+
+    """
+    return [tuple(color) for color in document['animations']['idle'][frame]['pixels']]
+
+
+def _replay(document, *records):
+    for record in records:
+        apply_record(document, record)
+    return document
+
+
+class TestCommandRecords:
+    """Test reducing commands to journal records and applying them."""
+
+    def test_brush_stroke_and_its_undo(self):
+        command = _stroke(1, 0, BLACK, RED)
+        document = _document()
+
+        _replay(document, command_record(command, frame=('idle', 0)))
+        assert document['animations']['idle'][0]['pixels'][1] == RED
+
+        _replay(document, command_record(command, undo=True, frame=('idle', 0)))
+        assert document['animations']['idle'][0]['pixels'] == [BLACK] * 4
+
+    def test_flood_fill_uses_row_major_pixels(self):
+        command = FloodFillCommand(
+            None,
+            start_x=0,
+            start_y=1,
+            old_color=BLACK,
+            new_color=GREEN,
+            affected_pixels=[(0, 1), (1, 1)],
+        )
+
+        document = _replay(_document(), command_record(command, frame=('idle', 0)))
+
+        assert document['animations']['idle'][0]['pixels'] == [BLACK, BLACK, GREEN, GREEN]
+
+    def test_pixel_edit_without_a_frame_is_not_journaled(self):
+        assert command_record(_stroke(0, 0, BLACK, RED)) is None
+
+    def test_frame_add_and_reorder(self):
+        add = FrameAddCommand(None, 1, 'idle', _frame_data(RED))
+        reorder = FrameReorderCommand(None, 1, 0, 'idle')
+        document = _replay(_document(), command_record(add), command_record(reorder))
+
+        frames = document['animations']['idle']
+        assert [frame['pixels'][0] for frame in frames] == [RED, BLACK]
+
+        _replay(document, command_record(reorder, undo=True), command_record(add, undo=True))
+        assert len(frames) == 1
+        assert frames[0]['pixels'][0] == BLACK
+
+    def test_non_editing_commands_are_not_journaled(self):
+        assert command_record(FrameSelectionCommand(None, 'idle', 0, 'idle', 1)) is None
+
+    def test_unknown_operation_raises(self):
+        with pytest.raises(ValueError, match='Unknown journal operation'):
+            apply_record(_document(), {'op': 'explode'})
+
+
+class TestEditJournal:
+    """Test writing, compacting, and recovering the journal."""
+
+    def test_recover_replays_records_after_the_snapshot(self, tmp_path):
+        journal = EditJournal(tmp_path)
+        journal.start(_document())
+        journal.append(command_record(_stroke(0, 0, BLACK, RED), frame=('idle', 0)))
+        journal.append(command_record(_stroke(1, 1, BLACK, GREEN), frame=('idle', 0)))
+        journal.flush()
+
+        document = recover_document(tmp_path)
+
+        assert _pixels(document) == [RED, BLACK, BLACK, GREEN]
+        journal.close()
+
+    def test_torn_final_record_is_ignored(self, tmp_path):
+        journal = EditJournal(tmp_path)
+        journal.start(_document())
+        journal.append(command_record(_stroke(0, 0, BLACK, RED), frame=('idle', 0)))
+        journal.close()
+        with (tmp_path / JOURNAL_FILENAME).open('a', encoding='utf-8') as journal_file:
+            journal_file.write('{"sequence": 2, "op": "pix')
+
+        document = recover_document(tmp_path)
+
+        assert _pixels(document) == [RED, BLACK, BLACK, BLACK]
+
+    def test_snapshot_truncates_the_journal(self, tmp_path):
+        journal = EditJournal(tmp_path, snapshot_every=2)
+        document = _document()
+        journal.start(document)
+        for x in range(2):
+            record = command_record(_stroke(x, 0, BLACK, RED), frame=('idle', 0))
+            apply_record(document, record)
+            journal.append(record)
+        assert journal.snapshot_due
+
+        journal.snapshot(json.loads(json.dumps(document)))
+        journal.flush()
+
+        assert not journal.snapshot_due
+        assert not (tmp_path / JOURNAL_FILENAME).read_text(encoding='utf-8')
+        snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text(encoding='utf-8'))
+        assert snapshot['sequence'] == 2
+        assert _pixels(recover_document(tmp_path))[:2] == [RED, RED]
+        journal.close()
+
+    def test_sequence_continues_across_sessions(self, tmp_path):
+        journal = EditJournal(tmp_path)
+        journal.start(_document())
+        journal.append(command_record(_stroke(0, 0, BLACK, RED), frame=('idle', 0)))
+        journal.close()
+
+        # A new session must not reuse sequence numbers the snapshot could skip
+        restarted = EditJournal(tmp_path)
+        restarted.start(recover_document(tmp_path))
+        restarted.append(command_record(_stroke(1, 0, BLACK, GREEN), frame=('idle', 0)))
+        restarted.flush()
+
+        assert restarted.sequence == 2
+        assert _pixels(recover_document(tmp_path))[:2] == [RED, GREEN]
+        restarted.close()
+
+    def test_close_with_discard_removes_the_files(self, tmp_path):
+        journal = EditJournal(tmp_path)
+        journal.start(_document())
+        journal.close(discard=True)
+
+        assert recover_document(tmp_path) is None
+        assert not (tmp_path / JOURNAL_FILENAME).exists()
+
+
+class TestCommandCallback:
+    """Test the UndoRedoManager command observer."""
+
+    def test_callback_sees_pushes_undos_and_redos(self, mocker):
+        manager = UndoRedoManager()
+        callback = mocker.Mock()
+        manager.set_command_callback(callback)
+        command = _stroke(0, 0, BLACK, RED)
+        mocker.patch.object(command, 'undo', return_value=True)
+        mocker.patch.object(command, 'execute', return_value=True)
+
+        manager.push_frame_command('idle', 0, command)
+        manager.undo_frame('idle', 0)
+        manager.redo_frame('idle', 0)
+
+        assert [call.args for call in callback.call_args_list] == [
+            (command, False, ('idle', 0)),
+            (command, True, ('idle', 0)),
+            (command, False, ('idle', 0)),
+        ]
+
+
+class _FakeFrame:
+    def __init__(self, pixels, duration=0.5):
+        self.pixels = pixels
+        self.duration = duration
+
+    def get_pixel_data(self):
+        return list(self.pixels)
+
+
+def _fake_editor():
+    canvas = SimpleNamespace(
+        animated_sprite=SimpleNamespace(_animations={'idle': [_FakeFrame([BLACK] * 4)]}),
+        current_animation='idle',
+        current_frame=0,
+        pixels=[BLACK] * 4,
+        pixels_across=2,
+        pixels_tall=2,
+        is_panning_active=lambda: False,
+        on_load_file_event=None,
+    )
+    return SimpleNamespace(canvas=canvas, undo_redo_manager=UndoRedoManager())
+
+
+class TestAutosaveManager:
+    """Test the editor-side autosave wiring."""
+
+    def test_edits_are_journaled_for_the_canvas_frame(self, tmp_path):
+        editor = _fake_editor()
+        autosave = AutosaveManager(editor, tmp_path)
+        autosave.start()
+
+        editor.undo_redo_manager.push_command(_stroke(1, 0, BLACK, RED))
+        autosave.journal.flush()
+
+        assert _pixels(recover_document(autosave.journal.directory))[1] == RED
+        autosave.close()
+
+    def test_clean_close_leaves_nothing_to_recover(self, tmp_path):
+        editor = _fake_editor()
+        autosave = AutosaveManager(editor, tmp_path)
+        autosave.start()
+
+        autosave.close()
+
+        assert list(tmp_path.iterdir()) == []
+        assert editor.undo_redo_manager._command_callback is None
+
+    def test_unclean_exit_is_restored_on_start(self, tmp_path, mocker):
+        orphan = tmp_path / 'crashed'
+        journal = EditJournal(orphan)
+        journal.start(_document())
+        journal.append(command_record(_stroke(0, 0, BLACK, RED), frame=('idle', 0)))
+        journal.close()
+        editor = _fake_editor()
+        editor.canvas.on_load_file_event = mocker.Mock()
+
+        autosave = AutosaveManager(editor, tmp_path)
+        autosave.start()
+
+        (path,) = editor.canvas.on_load_file_event.call_args.args
+        assert path.endswith('recovered.toml')
+        assert autosave.journal.directory == orphan
+        assert (orphan / 'recovered.toml').is_file()
+        autosave.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_running_editors_do_not_share_or_recover_sessions(self, tmp_path, mocker):
+        first = AutosaveManager(_fake_editor(), tmp_path)
+        first.start()
+        first.editor.undo_redo_manager.push_command(_stroke(1, 0, BLACK, RED))
+        first.journal.flush()
+        second_editor = _fake_editor()
+        second_editor.canvas.on_load_file_event = mocker.Mock()
+
+        second = AutosaveManager(second_editor, tmp_path)
+        second.start()
+
+        second_editor.canvas.on_load_file_event.assert_not_called()
+        assert second.journal.directory != first.journal.directory
+        second.close()
+        assert _pixels(recover_document(first.journal.directory))[1] == RED
+        first.close()
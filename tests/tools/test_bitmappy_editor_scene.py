@@ -206,9 +206,17 @@ def _setup_ai_state(editor, mocker):
     ai_integration.pending_ai_requests = {}
     ai_integration.ai_request_queue = None
     ai_integration.ai_response_queue = None
-    ai_integration.ai_process = None
+    ai_integration.ai_processes = []
+    ai_integration.ai_background_queue = None
+    ai_integration.ai_control_queues = []
+    ai_integration.outstanding_requests = {}
+    ai_integration.cancelled_requests = set()
+    ai_integration.pool_size = 1
     ai_integration.last_successful_sprite_content = None
     ai_integration.last_conversation_history = None
+    ai_integration.response_cache = None
+    ai_integration.in_flight_requests = {}
+    ai_integration.coalesced_requests = {}
     editor._ai_integration = ai_integration
 
     editor.slider_input_format = '%d'
@@ -1043,6 +1051,49 @@ class TestCanvasPanning:
         mock_editor._frame_operations.handle_canvas_panning(delta_x=1, delta_y=0)
 
 
+class TestCommitPannedBuffer:
+    """Tests for FrameOperationManager.commit_panned_buffer."""
+
+    @staticmethod
+    def _setup_panned_canvas(mock_editor, mocker, film_strip_frame=None):
+        red = (255, 0, 0, 255)
+        canvas_frame = SimpleNamespace(pixels=[], image=None)
+        mock_editor.canvas.pixels = [red] * 4
+        mock_editor.canvas.pixels_across = 2
+        mock_editor.canvas.pixels_tall = 2
+        mock_editor.canvas.current_animation = 'walk'
+        mock_editor.canvas.current_frame = 0
+        mock_editor.canvas._get_current_frame_key.return_value = 'walk_0'
+        mock_editor.canvas._frame_panning = {'walk_0': {'active': True}}
+        mock_editor.canvas.animated_sprite._animations = {'walk': [canvas_frame]}
+        film_strip = mocker.Mock()
+        film_strip.animated_sprite._animations = {'walk': [film_strip_frame or canvas_frame]}
+        mock_editor.film_strips = {'walk': film_strip}
+        return canvas_frame
+
+    def test_commits_pixels_and_surface(self, mock_editor, mocker):
+        """The canvas pixels are copied to the frame and rendered once."""
+        canvas_frame = self._setup_panned_canvas(mock_editor, mocker)
+        build = mocker.spy(mock_editor._frame_operations, '_build_surface_from_canvas_pixels')
+
+        mock_editor._frame_operations.commit_panned_buffer()
+
+        assert canvas_frame.pixels == mock_editor.canvas.pixels
+        assert canvas_frame.pixels is not mock_editor.canvas.pixels
+        assert canvas_frame.image.get_at((1, 1)) == (255, 0, 0, 255)
+        assert build.call_count == 1
+
+    def test_separate_film_strip_frame_shares_the_buffer(self, mock_editor, mocker):
+        """A film strip's own frame object reuses the committed pixels and surface."""
+        film_strip_frame = SimpleNamespace(pixels=[], image=None)
+        canvas_frame = self._setup_panned_canvas(mock_editor, mocker, film_strip_frame)
+
+        mock_editor._frame_operations.commit_panned_buffer()
+
+        assert film_strip_frame.pixels is canvas_frame.pixels
+        assert film_strip_frame.image is canvas_frame.image
+
+
 # ===========================================================================
 # 18. Handle Copy/Paste Frame Operations
 # ===========================================================================
@@ -1334,6 +1385,34 @@ class TestUpdateFilmStrips:
         mock_editor.film_strip_coordinator.update_film_strips_for_animated_sprite_update()
         mock_strip.update_layout.assert_called_once()
 
+    def test_targeted_update_invalidates_one_thumbnail(self, mock_editor, mocker):
+        """Passing an animation and frame redraws only that strip's thumbnail."""
+        edited_strip = mocker.Mock()
+        other_strip = mocker.Mock()
+        mock_editor.film_strips = {'walk': edited_strip, 'idle': other_strip}
+        mock_editor.film_strip_sprites = {}
+
+        mock_editor.film_strip_coordinator.update_film_strips_for_animated_sprite_update('walk', 2)
+        mock_editor.film_strip_coordinator._update_film_strips_for_pixel_update('walk', 2)
+
+        assert edited_strip.invalidate_frame.call_args_list == [
+            mocker.call('walk', 2),
+            mocker.call('walk', 2),
+        ]
+        edited_strip.update_layout.assert_not_called()
+        other_strip.invalidate_frame.assert_not_called()
+        other_strip.mark_dirty.assert_not_called()
+
+    def test_targeted_update_falls_back_without_strip(self, mock_editor, mocker):
+        """An animation without a strip falls back to redrawing every visible strip."""
+        mock_strip = mocker.Mock()
+        mock_editor.film_strips = {'default': mock_strip}
+        mock_editor.film_strip_sprites = {}
+
+        mock_editor.film_strip_coordinator._update_film_strips_for_pixel_update('missing', 0)
+
+        mock_strip.mark_dirty.assert_called_once()
+
     def test_mark_all_film_strips_dirty(self, mock_editor, mocker):
         """Marks all film strips and sprites dirty."""
         mock_strip = mocker.Mock()
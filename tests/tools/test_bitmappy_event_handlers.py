@@ -120,6 +120,7 @@ def mock_editor(mocker, pygame_mocks):  # noqa: PLR0915
 
     # -- Visual collision manager --
     editor.visual_collision_manager = mocker.Mock()
+    editor.optimized_visual_collision_manager = mocker.Mock()
 
     # -- Undo/redo --
     editor.undo_redo_manager = mocker.Mock()
@@ -149,11 +150,22 @@ def mock_editor(mocker, pygame_mocks):  # noqa: PLR0915
     ai_integration.pending_ai_requests = {}
     ai_integration.ai_request_queue = None
     ai_integration.ai_response_queue = None
-    ai_integration.ai_process = None
+    ai_integration.ai_processes = []
+    ai_integration.ai_background_queue = None
+    ai_integration.ai_control_queues = []
+    ai_integration.outstanding_requests = {}
+    ai_integration.cancelled_requests = set()
+    ai_integration.pool_size = 1
     ai_integration.last_successful_sprite_content = None
     ai_integration.last_conversation_history = None
+    ai_integration.response_cache = None
+    ai_integration.in_flight_requests = {}
+    ai_integration.coalesced_requests = {}
     editor._ai_integration = ai_integration
 
+    # -- Autosave (disabled unless an autosave directory is configured) --
+    editor._autosave = None
+
     # -- Film strips --
     editor.film_strips = {}
     editor.film_strip_sprites = {}
@@ -2294,3 +2306,53 @@ class TestGetControllerIdFromEvent:
         # No instance_id attribute
         result = mock_editor.controller_handler._get_controller_id_from_event(event)
         assert result == 3
+
+
+# ===========================================================================
+# 31. Controller Hot-Plug
+# ===========================================================================
+
+
+class TestControllerHotPlug:
+    """Tests for device added/removed delegation to the multi-controller manager."""
+
+    def test_joy_device_added_tracks_controller(self, mock_editor):
+        """JOYDEVICEADDED hands the device index to the manager."""
+        mock_editor.on_joy_device_added_event(_make_event(device_index=1))
+        mock_editor.multi_controller_manager.handle_device_added.assert_called_once_with(1)
+
+    def test_controller_device_removed_forgets_controller(self, mock_editor):
+        """CONTROLLERDEVICEREMOVED hands the instance ID to the manager."""
+        mock_editor.on_controller_device_removed_event(_make_event(instance_id=5))
+        mock_editor.multi_controller_manager.handle_device_removed.assert_called_once_with(5)
+
+    def test_rendering_does_not_scan_for_controllers(self, mock_editor):
+        """Indicator rendering relies on device events instead of polling."""
+        mock_editor.multi_controller_manager.controllers = {}
+        mock_editor.controller_handler.render_visual_indicators()
+        mock_editor.multi_controller_manager.scan_for_controllers.assert_not_called()
+
+    def test_rendering_flushes_throttled_indicator_moves(self, mock_editor, mocker):
+        """Indicator moves held back by the throttle are applied every frame."""
+        mock_editor.multi_controller_manager.controllers = {}
+        mocker.patch('pygame.display.get_surface', return_value=mocker.Mock())
+        mock_editor.controller_handler.render_visual_indicators()
+        mock_editor.optimized_visual_collision_manager.flush_pending_updates.assert_called_once()
+
+    def test_unchanged_canvas_indicators_skip_redraw(self, mock_editor, mocker):
+        """The canvas is only redrawn when a canvas indicator changed."""
+        indicators = mock_editor.controller_handler.indicators
+        canvas_controllers = [{'controller_id': 0, 'position': (1, 2), 'color': (255, 0, 0)}]
+        mocker.patch.object(
+            indicators,
+            '_collect_canvas_controllers',
+            side_effect=lambda: [dict(controller) for controller in canvas_controllers],
+        )
+
+        indicators._update_canvas_indicators()
+        indicators._update_canvas_indicators()
+        assert mock_editor.canvas.force_redraw.call_count == 1
+
+        canvas_controllers[0]['position'] = (2, 2)
+        indicators._update_canvas_indicators()
+        assert mock_editor.canvas.force_redraw.call_count == 2
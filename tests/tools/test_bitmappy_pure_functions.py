@@ -22,6 +22,8 @@ from glitchygames.bitmappy.pixel_ops import (
     _build_color_to_glyph_map,
     _build_renderer_color_dict,
     render_frame_to_ascii,
+    shift_pixel_buffer,
+    surface_from_pixels,
 )
 from glitchygames.bitmappy.sprite_inspection import (
     _log_colorized_sprite_output,
@@ -449,6 +451,61 @@ class TestBuildAsciiGrid:
         assert result == '#'
 
 
+class TestShiftPixelBuffer:
+    """Test shift_pixel_buffer function."""
+
+    PIXELS = cast('list[tuple[int, ...]]', [(n, n, n) for n in range(9)])
+    FILL = (255, 0, 255)
+
+    def _naive_shift(self, pixels, width, height, offset_x, offset_y):
+        shifted = []
+        for y in range(height):
+            for x in range(width):
+                source_x, source_y = x - offset_x, y - offset_y
+                index = source_y * width + source_x
+                inside = 0 <= source_x < width and 0 <= source_y < height
+                shifted.append(pixels[index] if inside and index < len(pixels) else self.FILL)
+        return shifted
+
+    @pytest.mark.parametrize('offset', [(0, 0), (1, 0), (-1, 0), (0, 2), (-2, -1), (3, 0), (1, -3)])
+    def test_matches_per_pixel_shift(self, offset):
+        """Row slicing gives the same result as shifting each pixel."""
+        result = shift_pixel_buffer(self.PIXELS, 3, 3, offset)
+        assert result == self._naive_shift(self.PIXELS, 3, 3, *offset)
+
+    def test_short_source_is_padded(self):
+        """Pixels past the end of the source buffer are transparent."""
+        result = shift_pixel_buffer(self.PIXELS[:4], 3, 3, (0, 0))
+        assert result == [*self.PIXELS[:4], *[self.FILL] * 5]
+
+    def test_source_width_sets_the_stride(self):
+        """Rows are read with the source stride and cropped to the output width."""
+        result = shift_pixel_buffer(self.PIXELS, 2, 3, (0, 0), source_width=3)
+        assert result == [self.PIXELS[i] for i in (0, 1, 3, 4, 6, 7)]
+
+    def test_empty_source(self):
+        """An empty source produces a fully transparent buffer."""
+        assert shift_pixel_buffer([], 2, 2, (0, 0), source_width=0) == [self.FILL] * 4
+
+
+class TestSurfaceFromPixels:
+    """Test surface_from_pixels function."""
+
+    def test_rgb_and_rgba_pixels(self):
+        """RGB pixels are opaque and RGBA pixels keep their alpha."""
+        pixels = cast('list[tuple[int, ...]]', [(255, 0, 255), (1, 2, 3, 128)])
+        surface = surface_from_pixels(pixels, 2, 1)
+
+        assert surface.get_size() == (2, 1)
+        assert surface.get_at((0, 0)) == (255, 0, 255, 255)
+        assert surface.get_at((1, 0)) == (1, 2, 3, 128)
+
+    def test_missing_pixels_are_transparent(self):
+        """A short buffer leaves the remaining pixels fully transparent."""
+        surface = surface_from_pixels([(9, 9, 9)], 2, 1)
+        assert surface.get_at((1, 0)).a == 0
+
+
 class TestBuildRendererColorDict:
     """Test _build_renderer_color_dict function."""
 
@@ -1029,6 +1029,53 @@ class TestFilmStripMarkDirty:
         assert widget.force_redraw is True
 
 
+class TestFilmStripThumbnailCache:
+    """Test the renderer's per-frame thumbnail cache."""
+
+    @staticmethod
+    def _render(widget, frame_index=0):
+        frame = widget.animated_sprite._animations['idle'][frame_index]
+        widget.renderer.render_frame_thumbnail(
+            frame, frame_index=frame_index, animation_name='idle'
+        )
+
+    def test_unchanged_frame_reuses_thumbnail(self, mocker):
+        """Rendering an unchanged frame again skips scaling and conversion."""
+        widget, _ = _make_widget_with_sprite()
+        convert = mocker.spy(widget.renderer, 'convert_magenta_to_transparent')
+
+        self._render(widget)
+        self._render(widget)
+
+        assert convert.call_count == 1
+
+    def test_redrawn_frame_rebuilds_thumbnail(self, mocker):
+        """Replacing a frame's image or invalidating it rebuilds the thumbnail."""
+        widget, sprite = _make_widget_with_sprite()
+        convert = mocker.spy(widget.renderer, 'convert_magenta_to_transparent')
+        self._render(widget)
+
+        sprite._animations['idle'][0].image = pygame.Surface((SURFACE_SIZE, SURFACE_SIZE))
+        self._render(widget)
+        widget.invalidate_frame('idle', 0)
+        self._render(widget)
+
+        assert convert.call_count == 3
+        assert widget.force_redraw is True
+
+    def test_invalidate_only_drops_that_frame(self):
+        """Invalidating one frame keeps the rest of the animation cached."""
+        widget, _ = _make_widget_with_sprite()
+        self._render(widget, 0)
+        self._render(widget, 1)
+
+        widget.invalidate_frame('idle', 1)
+        assert set(widget.renderer.thumbnail_images) == {('idle', 0)}
+
+        widget.invalidate_frame('idle')
+        assert widget.renderer.thumbnail_images == {}
+
+
 class TestFilmStripUpdateHeight:
     """Test _update_height method."""
 
@@ -253,10 +253,10 @@ class TestFilmStripIntegration(FilmStripTestBase):
         assert frame_after_long == 1
 
         # Update more to test looping
-        # Total 1.7s, should loop back
+        # Total 1.7s spans frames 1 and 2, so it should loop back to frame 0
         animated_sprite.update(1.0)
         frame_after_loop = animated_sprite.current_frame
-        assert frame_after_loop == FRAME_INDEX_2
+        assert frame_after_loop == 0
 
     def test_film_strip_animation_timing(self):
         """Test that film strip animation timing works correctly."""
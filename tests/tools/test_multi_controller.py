@@ -2,6 +2,7 @@
 
 import time
 
+import pygame
 import pytest
 
 from glitchygames.bitmappy.controllers.manager import (
@@ -796,3 +797,49 @@ class TestMultiControllerManagerQueries:
 
         # Color should now be one of the CONTROLLER_COLORS
         assert manager.controllers[100].color in MultiControllerManager.CONTROLLER_COLORS
+
+
+class TestMultiControllerManagerHotPlug:
+    """Test event-driven tracking of hot-plugged controllers."""
+
+    def setup_method(self):
+        """Reset the singleton before each test."""
+        MultiControllerManager._instance = None
+        MultiControllerManager._initialized = False
+
+    def test_device_added_tracks_controller_once(self, mocker):
+        """Test hot-plugged devices are tracked without rescanning."""
+        manager = MultiControllerManager()
+        mock_joystick = mocker.Mock()
+        mock_joystick.get_instance_id.return_value = 7
+        mock_joystick_class = mocker.patch('pygame.joystick.Joystick', return_value=mock_joystick)
+        mock_get_count = mocker.patch('pygame.joystick.get_count')
+
+        # pygame reports game controllers as both a joystick and a controller
+        assert manager.handle_device_added(2) == 7
+        assert manager.handle_device_added(2) == 7
+
+        assert list(manager.controllers) == [7]
+        assert manager.controllers[7].status == ControllerStatus.CONNECTED
+        mock_joystick_class.assert_called_with(2)
+        mock_get_count.assert_not_called()
+
+    def test_device_added_ignores_vanished_device(self, mocker):
+        """Test a device unplugged before its added event is handled is skipped."""
+        manager = MultiControllerManager()
+        mocker.patch('pygame.joystick.Joystick', side_effect=pygame.error('gone'))
+
+        assert manager.handle_device_added(0) is None
+        assert manager.controllers == {}
+
+    def test_device_removed_forgets_controller(self):
+        """Test unplugging drops the controller and its assignment."""
+        manager = MultiControllerManager()
+        manager.track_controller(3)
+        manager.assign_controller(3)
+
+        manager.handle_device_removed(3)
+        manager.handle_device_removed(3)
+
+        assert manager.controllers == {}
+        assert manager.assigned_controllers == {}
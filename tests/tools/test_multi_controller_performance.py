@@ -13,7 +13,7 @@ from glitchygames.bitmappy.controllers.performance import (
     PerformanceMonitor,
 )
 from glitchygames.bitmappy.controllers.selection import ControllerSelection
-from glitchygames.bitmappy.indicators.collision import VisualCollisionManager
+from glitchygames.bitmappy.indicators.collision import LocationType, VisualCollisionManager
 
 
 class TestPerformanceMetrics:
@@ -549,6 +549,59 @@ class TestOptimizedVisualCollisionManagerOptimize:
         assert stats.operation_count == 1
 
 
+class TestOptimizedVisualCollisionManagerPlacement:
+    """Tests for place_controller_indicator and flush_pending_updates."""
+
+    def test_place_moves_existing_indicator(self, optimized_visual_manager, mocker):
+        """An indicator already in the location is moved rather than rebuilt."""
+        base_manager = optimized_visual_manager.base_manager
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (10, 20), LocationType.CANVAS
+        )
+        indicator = base_manager.indicators[0]
+        remove = mocker.spy(base_manager, 'remove_controller_indicator')
+
+        optimized_visual_manager.last_update_time = 0
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (30, 40), LocationType.CANVAS
+        )
+
+        remove.assert_not_called()
+        assert base_manager.indicators[0] is indicator
+        assert indicator.position == (30, 40)
+
+    def test_place_replaces_indicator_for_new_location(self, optimized_visual_manager):
+        """Changing location replaces the controller's indicator."""
+        base_manager = optimized_visual_manager.base_manager
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (10, 20), LocationType.FILM_STRIP
+        )
+
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (10, 20), LocationType.SLIDER
+        )
+
+        assert base_manager.indicators[0].location_type == LocationType.SLIDER
+        assert 0 not in base_manager.film_strip_indicators
+        assert base_manager.film_strip_collision_groups == {}
+
+    def test_flush_applies_throttled_moves(self, optimized_visual_manager):
+        """Moves held back by the throttle are applied when flushed."""
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (10, 20), LocationType.CANVAS
+        )
+        optimized_visual_manager.last_update_time = time.time()
+        optimized_visual_manager.place_controller_indicator(
+            0, 0, (255, 0, 0), (30, 40), LocationType.CANVAS
+        )
+        assert optimized_visual_manager.base_manager.indicators[0].position == (10, 20)
+
+        optimized_visual_manager.flush_pending_updates()
+
+        assert optimized_visual_manager.pending_updates == {}
+        assert optimized_visual_manager.base_manager.indicators[0].position == (30, 40)
+
+
 class TestOptimizedVisualCollisionManagerStats:
     """Tests for statistics and configuration on OptimizedVisualCollisionManager."""
 
@@ -0,0 +1,143 @@
+"""Tests for terminal_preview module - in-place ANSI animation playback."""
+
+import io
+import re
+
+import pytest
+
+from glitchygames.tools.ascii_renderer import ASCIIRenderer
+from glitchygames.tools.terminal_preview import TerminalAnimationPreview
+
+COLORS = {
+    '#': (255, 0, 0, 255),
+    '@': (0, 255, 0, 255),
+    '.': (0, 0, 255, 255),
+}
+
+FRAME_A = '####\n#..#\n####'
+FRAME_B = '####\n#@.#\n####'
+
+# Cursor movement per CSI command: (rows, columns)
+_MOVES = {'A': (-1, 0), 'B': (1, 0), 'C': (0, 1), 'D': (0, -1)}
+_TOKEN = re.compile(r'\x1b\[(\d*)([ABCDJm])|\x1b\[[\d;]*m|(.)', re.DOTALL)
+
+
+def _emulate(output, screen=None, cursor=(0, 0)):
+    """Apply preview output to a grid of (color code, char) cells.
+
+    Returns:
+        tuple: The screen and the final cursor position.
+
+    """
+    screen = screen if screen is not None else {}
+    row, col = cursor
+    color = ''
+    for match in _TOKEN.finditer(output):
+        count, command, char = match.groups()
+        text = match.group(0)
+        if char is not None:
+            if char == '\n':
+                row, col = row + 1, 0
+            elif char == '\r':
+                col = 0
+            else:
+                screen[row, col] = (color, char)
+                col += 1
+        elif command in _MOVES:
+            row_step, col_step = _MOVES[command]
+            row += row_step * int(count or 1)
+            col += col_step * int(count or 1)
+        elif command == 'J':
+            for key in [key for key in screen if key >= (row, col)]:
+                del screen[key]
+        else:
+            color = '' if text == '\x1b[0m' else text
+    return screen, (row, col)
+
+
+def _expected_screen(preview, pixels):
+    return {
+        (row_index, col_index): cell
+        for row_index, row in enumerate(preview.frame_cells(pixels, COLORS))
+        for col_index, cell in enumerate(row)
+    }
+
+
+@pytest.fixture
+def preview(mocker):
+    """Create a preview with true color support that writes to a buffer.
+
+    Returns:
+        TerminalAnimationPreview: The preview.
+
+    """
+    renderer = ASCIIRenderer()
+    mocker.patch.object(renderer.detector, 'has_color_support', return_value=True)
+    mocker.patch.object(renderer.color_mapper.detector, 'has_color_support', return_value=True)
+    renderer.color_mapper._capability = 'true_color'
+    return TerminalAnimationPreview(renderer, stream=io.StringIO())
+
+
+class TestTerminalAnimationPreview:
+    """Test diff-based in-place redraws."""
+
+    def test_first_frame_is_drawn_in_full(self, preview):
+        output = preview.draw(FRAME_A, COLORS)
+
+        screen, cursor = _emulate(output)
+        assert screen == _expected_screen(preview, FRAME_A)
+        assert cursor == (3, 0)
+
+    def test_next_frame_rewrites_only_changed_cells(self, preview):
+        first = preview.draw(FRAME_A, COLORS)
+        second = preview.draw(FRAME_B, COLORS)
+
+        screen, cursor = _emulate(first)
+        screen, _ = _emulate(second, screen, cursor)
+        assert screen == _expected_screen(preview, FRAME_B)
+        assert second.count('█') == 1
+        assert len(second) < len(first) / 3
+
+    def test_unchanged_frame_writes_nothing(self, preview):
+        preview.draw(FRAME_A, COLORS)
+
+        assert not preview.draw(FRAME_A, COLORS)
+
+    def test_looping_frames_stay_correct(self, preview):
+        screen, cursor = {}, (0, 0)
+        for pixels in (FRAME_A, FRAME_B, FRAME_A, '#@@#\n@..@\n#@@#', FRAME_B):
+            screen, cursor = _emulate(preview.draw(pixels, COLORS), screen, cursor)
+            assert screen == _expected_screen(preview, pixels)
+
+    def test_resized_frame_is_redrawn_in_place(self, preview):
+        screen, cursor = _emulate(preview.draw(FRAME_A, COLORS))
+        screen, cursor = _emulate(preview.draw('##\n##', COLORS), screen, cursor)
+
+        assert screen == _expected_screen(preview, '##\n##')
+        assert cursor == (2, 0)
+
+    def test_close_leaves_the_cursor_below_the_preview(self, preview):
+        preview.draw(FRAME_A, COLORS)
+        preview.draw(FRAME_B, COLORS)
+
+        preview.close()
+
+        _, cursor = _emulate(preview.stream.getvalue())
+        assert cursor == (3, 0)
+
+    def test_play_holds_each_frame_for_its_duration(self, preview, mocker):
+        sleep = mocker.patch('glitchygames.tools.terminal_preview.time.sleep')
+
+        preview.play([(FRAME_A, 0.25), (FRAME_B, 0.5)], COLORS, loops=2)
+
+        assert sleep.call_count == 4
+        assert preview.bytes_written == len(preview.stream.getvalue().encode('utf-8'))
+
+    def test_without_color_support_glyphs_are_shown_as_they_are(self, mocker):
+        renderer = ASCIIRenderer()
+        mocker.patch.object(renderer.detector, 'has_color_support', return_value=False)
+        mocker.patch.object(renderer.color_mapper.detector, 'has_color_support', return_value=False)
+        preview = TerminalAnimationPreview(renderer, stream=io.StringIO())
+
+        assert preview.draw(FRAME_A, COLORS) == FRAME_A + '\n'
+        assert preview.draw(FRAME_B, COLORS) == '\x1b[2A\x1b[1C@'
@@ -624,3 +624,64 @@ class TestGetIndicatorsByLocationDefault:
         result = self.manager.get_indicators_by_location(None)  # type: ignore[arg-type]
 
         assert result is self.manager.indicators
+
+
+class TestIncrementalCollisionGroups:
+    """Test that moves only regroup the positions they touch."""
+
+    def setup_method(self):
+        """Set up two stacks of indicators."""
+        self.manager = VisualCollisionManager()
+        for controller_id, position in enumerate([(10, 10), (10, 10), (50, 50), (50, 50)]):
+            self.manager.add_controller_indicator(
+                controller_id=controller_id,
+                instance_id=controller_id,
+                color=(255, 0, 0),
+                position=position,
+            )
+
+    def test_move_only_lays_out_affected_groups(self, mocker):
+        """Moving a controller lays out the group it left and the group it joined."""
+        layout = mocker.spy(self.manager, '_layout_collision_group')
+
+        self.manager.update_controller_position(1, (90, 90))
+
+        laid_out = [call.args[0] for call in layout.call_args_list]
+        assert sorted(laid_out) == [(10, 10), (90, 90)]
+        assert self.manager.film_strip_collision_groups == {
+            (10, 10): [0],
+            (50, 50): [2, 3],
+            (90, 90): [1],
+        }
+        assert self.manager.indexed_positions[LocationType.FILM_STRIP][1] == (90, 90)
+
+    def test_lone_indicator_returns_to_base_position(self):
+        """The indicator left behind in a group drops its collision offset."""
+        self.manager.remove_controller_indicator(0)
+
+        assert self.manager.indicators[1].offset == (0, 0)
+        assert self.manager.film_strip_collision_groups[10, 10] == [1]
+
+    def test_hidden_indicator_leaves_its_group(self):
+        """Hiding an indicator removes it from its group until it is shown again."""
+        self.manager.set_indicator_visibility(3, visible=False)
+        assert self.manager.film_strip_collision_groups[50, 50] == [2]
+
+        self.manager.set_indicator_visibility(3, visible=True)
+        assert self.manager.film_strip_collision_groups[50, 50] == [2, 3]
+
+    def test_index_matches_full_rebuild(self):
+        """Incremental updates leave the same groups as rebuilding from scratch."""
+        self.manager.update_controller_position(0, (50, 50))
+        self.manager.remove_controller_indicator(2)
+        incremental = {
+            position: sorted(ids)
+            for position, ids in self.manager.film_strip_collision_groups.items()
+        }
+
+        self.manager._update_collision_groups(LocationType.FILM_STRIP)
+
+        assert incremental == {
+            position: sorted(ids)
+            for position, ids in self.manager.film_strip_collision_groups.items()
+        }
@@ -535,3 +535,25 @@ class TestMultiLineTextBoxMouseUpEvent:
         textbox.on_mouse_up_event(event)
 
         assert textbox.is_active is False
+
+
+class TestMultiLineTextBoxWrapText:
+    """Test _wrap_text() line measurement."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mocker, mock_pygame_patches):
+        """Set up pygame mocks for testing."""
+        MockFactory.setup_pygame_mocks_with_mocker(mocker)
+
+    def test_candidate_line_is_measured_near_the_limit(self, mocker):
+        """Test a line whose summed word widths fit but whose real width does not wraps."""
+        textbox = _create_multiline_textbox(mocker)
+
+        # A space measures 10 on its own but 15 between words, as with kerning
+        def text_width(text):
+            return 10 * len(text) + 5 * text.count(' ')
+
+        mocker.patch.object(textbox, '_get_text_width', side_effect=text_width)
+
+        assert textbox._wrap_text('aaaa bbbbb', 100) == 'aaaa\nbbbbb'
+        assert textbox._wrap_text('aaaa bbbb cc', 100) == 'aaaa bbbb\ncc'
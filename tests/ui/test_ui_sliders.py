@@ -697,3 +697,41 @@ class TestSliderColorWellIntegration:
         assert color_well.red == TEST_MAX_VALUE
         assert color_well.green == TEST_DEFAULT_VALUE
         assert color_well.blue == TEST_VALUE_64
+
+
+class TestWidgetSurfaceCaching:
+    """Test that static slider and color well artwork is drawn once."""
+
+    def test_slider_gradient_is_rendered_once(self, mocker):
+        """Test dirty updates reuse the cached gradient."""
+        slider = SliderSprite(x=TEST_X_POS, y=TEST_Y_POS, width=256, height=9, name='G')
+        render_gradient = mocker.spy(slider, '_render_gradient')
+
+        slider.dirty = 2
+        slider.update()
+        slider.update()
+
+        render_gradient.assert_not_called()
+        expected_intensity = int(TEST_VALUE_200 / 256 * 255)
+        assert slider.image.get_at((TEST_VALUE_200, 4))[:3] == (0, expected_intensity, 0)
+
+    def test_color_well_update_keeps_frame(self):
+        """Test updates refill the inside without redrawing the frame."""
+        color_well = ColorWellSprite(
+            x=TEST_COLOR_WELL_X,
+            y=TEST_COLOR_WELL_Y,
+            width=TEST_COLOR_WELL_WIDTH,
+            height=TEST_COLOR_WELL_HEIGHT,
+            name='TestColorWell',
+        )
+        color_well.active_color = (TEST_VALUE_64, TEST_VALUE_100, TEST_VALUE_150, TEST_MAX_VALUE)
+
+        color_well.update()
+
+        assert tuple(color_well.image.get_at((0, 0))) == (128, 128, 255, TEST_MAX_VALUE)
+        assert tuple(color_well.image.get_at((1, 1))) == (
+            TEST_VALUE_64,
+            TEST_VALUE_100,
+            TEST_VALUE_150,
+            TEST_MAX_VALUE,
+        )
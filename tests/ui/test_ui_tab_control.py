@@ -7,6 +7,7 @@ format changes, and integration with slider input formatting.
 import sys
 from pathlib import Path
 
+import pygame
 import pytest
 
 # Add project root so direct imports work in isolated runs
@@ -253,3 +254,24 @@ class TestTabControlSpriteFunctionality:
         # Assert - should select second tab
         assert tab_control.active_tab == 1
         parent.on_tab_change_event.assert_called_once_with('%X')
+
+
+class TestTabControlSpriteCaching:
+    """Test that tab artwork is rendered once per tab state."""
+
+    def test_tab_images_are_reused(self, mocker):
+        """Test switching tabs back and forth reuses the rendered tab strips."""
+        font_class = mocker.patch('pygame.font.Font', wraps=pygame.font.Font)
+        tab_control = TabControlSprite(x=TEST_X_POS, y=TEST_Y_POS, width=TEST_WIDTH, height=20)
+        render_tabs = mocker.spy(tab_control, '_render_tabs')
+
+        for active_tab in (0, 1, 0, 1):
+            tab_control.active_tab = active_tab
+            tab_control.dirty = 1
+            tab_control.update()
+
+        assert render_tabs.call_count == TEST_TAB_COUNT
+        font_class.assert_called_once()
+        # The active tab is drawn lighter than the inactive one
+        assert tab_control.image.get_at((75, 2))[:3] == tab_control.active_color
+        assert tab_control.image.get_at((25, 2))[:3] == tab_control.inactive_color
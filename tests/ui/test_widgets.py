@@ -3066,6 +3066,27 @@ class TestTextSpriteTransparentBackground:
         # Should not raise, transparent path is handled
         text_sprite.update_text('transparent')
 
+    def test_update_skips_render_when_nothing_changed(self, mocker):
+        """Test update only re-renders when text, colors or cursor state change."""
+        groups = _RealLayeredDirty()
+        text_sprite = TextSprite(
+            x=TEST_X,
+            y=TEST_Y,
+            width=TEST_WIDTH,
+            height=TEST_HEIGHT,
+            text='static',
+            groups=groups,
+        )
+        update_text = mocker.spy(text_sprite, 'update_text')
+
+        text_sprite.update()
+        text_sprite.update()
+        assert update_text.call_count == 0
+
+        text_sprite.text_color = (255, 0, 0)
+        text_sprite.update()
+        assert update_text.call_count == 1
+
     def test_update_text_active_background(self):
         """Test update_text with active state fills darker background."""
         groups = _RealLayeredDirty()
@@ -4257,15 +4278,19 @@ class TestTextSpiteRenderPygameFont:
             mock_font,
             'hello',
             (255, 255, 255),
-            is_transparent=False,
         )
         assert surface is not None
-        # render is called twice: once in the isinstance() check of the ternary
-        # expression, and once for the actual return value in the else branch.
-        assert mock_font.render.call_count == 2
+        # The text is rasterized once and then served from the FontManager cache
+        assert mock_font.render.call_count == 1
+        text_sprite._render_with_pygame_font(
+            mock_font,
+            'hello',
+            (255, 255, 255),
+        )
+        assert mock_font.render.call_count == 1
 
     def test_render_with_pygame_font_transparent(self, mocker):
-        """Test _render_with_pygame_font with transparent background (line 1032)."""
+        """Test _render_with_pygame_font for a sprite with a transparent background."""
         groups = _RealLayeredDirty()
         text_sprite = TextSprite(
             x=TEST_X,
@@ -4282,7 +4307,6 @@ class TestTextSpiteRenderPygameFont:
             mock_font,
             'hello',
             (255, 255, 255),
-            is_transparent=True,
         )
         assert surface is not None
 